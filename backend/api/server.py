@@ -1,4 +1,8 @@
 import sys
+import asyncio
+import json
+import threading
+import uuid
 from pathlib import Path
 import logging
 from typing import List, Optional, Dict, Any
@@ -9,16 +13,34 @@ from pydantic import BaseModel
 backend_dir = Path(__file__).resolve().parent.parent
 sys.path.append(str(backend_dir))
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Header
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from src.utils.logger import setup_logger
 from src.utils.config import Config
 from src.data.cache_manager import CacheManager
 from src.data.espn_api import ESPNAPIClient
 from src.data.models import Team, Game
-from src.simulation.monte_carlo import simulate_season, SimulationResult
+from src.simulation.monte_carlo import SimulationResult
+from src.simulation.clinch import clinch_statuses
+from src.simulation.convergence import ConvergenceCriteria
+from src.simulation.importance import ImportanceSampler, importance_sampler_from_dict
+from src.simulation.outcome_store import StaleOutcomeStoreError, load_cached_outcome_store
+from src.simulation.parallel import shutdown_worker_pools, simulate_season_parallel
+from src.simulation.result_cache import SimulationResultCache, detach_result, is_cacheable_run
+from src.simulation.scores import SAMPLING_INDEPENDENT, validate_sampling
 from src.simulation.standings import calculate_standings
-from simulation_jobs import SimulationJobManager
+from src.simulation.what_if import apply_overrides
+from src.simulation.win_probability import (
+    WinProbabilityModel,
+    win_probability_model_from_dict,
+)
+from simulation_jobs import (
+    FINISHED_STATUSES,
+    SimulationJobManager,
+    SimulationQueueFullError,
+    serialize_simulation_result,
+)
 
 # Setup logging
 logger = setup_logger(__name__)
@@ -35,7 +57,36 @@ class AppState:
         self.teams: List[Team] = []
         self.games: List[Game] = []
         self.simulation_result: Optional[SimulationResult] = None
-        self.job_manager = SimulationJobManager()
+        # Guards incremental what-if updates of simulation_result
+        self.simulation_lock = threading.Lock()
+        self.result_cache = SimulationResultCache(
+            max_entries=self.config.SIMULATION_CACHE_SIZE,
+            cache_manager=self.cache_manager,
+            max_age_seconds=self.config.SIMULATION_CACHE_MAX_AGE,
+            max_disk_entries=self.config.SIMULATION_CACHE_DISK_SIZE,
+        )
+        self.job_manager = SimulationJobManager(
+            num_workers=self.config.SIMULATION_WORKERS,
+            shard_size=self.config.SIMULATION_SHARD_SIZE,
+            retain_max_simulations=self.config.WHAT_IF_MAX_SIMULATIONS,
+            exact_max_games=self.config.EXACT_MAX_REMAINING_GAMES,
+            result_callback=self.set_simulation_result,
+            result_cache=self.result_cache,
+            max_concurrent_jobs=self.config.SIMULATION_CONCURRENT_JOBS,
+            max_queued_jobs=self.config.SIMULATION_QUEUE_SIZE,
+            max_simulations_per_job=self.config.SIMULATION_MAX_JOB_SIMULATIONS or None,
+            max_finished_jobs=self.config.SIMULATION_JOB_HISTORY,
+            outcome_cache=self.cache_manager,
+            max_outcome_stores=self.config.OUTCOME_STORE_MAX_COUNT,
+        )
+
+    def set_simulation_result(self, result: SimulationResult):
+        """Keep a copy of the latest completed run for what-if updates."""
+        # Overrides modify the run in place; the job or cache entry that
+        # produced it must keep the original
+        detached = detach_result(result)
+        with self.simulation_lock:
+            self.simulation_result = detached
 
 state = AppState()
 
@@ -79,7 +130,7 @@ async def lifespan(app: FastAPI):
 
     logger.info(f"Loaded {len(state.teams)} teams and {len(state.games)} games")
     yield
-    # Clean up resources if needed
+    shutdown_worker_pools()
 
 app = FastAPI(title="NFL Monte Carlo API", lifespan=lifespan)
 
@@ -99,7 +150,9 @@ async def health_check():
         "status": "ok", 
         "message": "NFL Monte Carlo Backend is running",
         "teams_loaded": len(state.teams),
-        "games_loaded": len(state.games)
+        "games_loaded": len(state.games),
+        "simulation_cache": state.result_cache.stats(),
+        "simulation_queue": state.job_manager.queue_length(),
     }
 
 @app.get("/standings")
@@ -109,7 +162,8 @@ async def get_standings():
         raise HTTPException(status_code=503, detail="Data not loaded")
     
     standings = calculate_standings(state.games, state.teams)
-    
+    clinching = clinch_statuses(state.games, state.teams)
+
     # Convert to list for JSON response
     standings_list = []
     for team_id, standing in standings.items():
@@ -130,6 +184,7 @@ async def get_standings():
             "points_for": standing.points_for,
             "points_against": standing.points_against,
             "net_points": standing.net_points,
+            **clinching[team_id].to_dict(),
         })
         
     return standings_list
@@ -165,9 +220,60 @@ async def get_schedule_status():
         "last_updated": last_updated.isoformat() if last_updated else None
     }
 
+def parse_win_probability_model(
+    spec: Optional[Dict[str, Any]],
+) -> Optional[WinProbabilityModel]:
+    """Build the requested win-probability model (None means 50/50)."""
+    if spec is None:
+        return None
+    try:
+        return win_probability_model_from_dict(spec)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+def parse_convergence(spec: Optional[Dict[str, Any]]) -> Optional[ConvergenceCriteria]:
+    """Build the requested early-stopping criteria (None runs every simulation)."""
+    if spec is None:
+        return None
+    try:
+        return ConvergenceCriteria(**spec)
+    except (TypeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid convergence criteria: {e}")
+
+def parse_importance(spec: Optional[Dict[str, Any]]) -> Optional[ImportanceSampler]:
+    """Build the requested importance sampler (None samples the real model)."""
+    if spec is None:
+        return None
+    try:
+        sampler = importance_sampler_from_dict(spec)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not any(team.id == sampler.target_team_id for team in state.teams):
+        raise HTTPException(status_code=400, detail="Importance sampling target team not found")
+    return sampler
+
+def parse_sampling(sampling: str) -> str:
+    """Check the requested sampling method."""
+    try:
+        return validate_sampling(sampling)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 class SimulateRequest(BaseModel):
     num_simulations: int = 10000
     random_seed: Optional[int] = None
+    num_workers: Optional[int] = None
+    profile: bool = False
+    # e.g. {"kind": "elo", "ratings": {"12": 1650, ...}}; None for 50/50
+    win_probability: Optional[Dict[str, Any]] = None
+    # e.g. {"tolerance": 0.01, "time_budget_seconds": 30}; num_simulations is then a ceiling
+    convergence: Optional[Dict[str, Any]] = None
+    # Variance reduction: "independent", "antithetic" or "stratified"
+    sampling: str = SAMPLING_INDEPENDENT
+    # e.g. {"target_team_id": "12", "tilt": 1.0} for precise long-shot odds
+    importance: Optional[Dict[str, Any]] = None
+    # Store every simulation's outcomes on disk for conditional queries
+    persist_outcomes: bool = False
 
 @app.post("/simulate")
 async def run_simulation(request: SimulateRequest, background_tasks: BackgroundTasks):
@@ -175,39 +281,103 @@ async def run_simulation(request: SimulateRequest, background_tasks: BackgroundT
     if not state.teams or not state.games:
         raise HTTPException(status_code=503, detail="Data not loaded")
 
+    model = parse_win_probability_model(request.win_probability)
+    convergence = parse_convergence(request.convergence)
+    sampling = parse_sampling(request.sampling)
+    importance = parse_importance(request.importance)
+    if importance is not None and convergence is not None:
+        raise HTTPException(
+            status_code=400, detail="Importance sampling cannot be combined with convergence"
+        )
+    if importance is not None and request.persist_outcomes:
+        raise HTTPException(
+            status_code=400, detail="Importance-sampled outcomes cannot be persisted"
+        )
+    key = state.job_manager.cache_key(
+        state.games, state.teams, request.num_simulations, request.random_seed, model,
+        convergence, sampling, importance,
+    )
+    # Unseeded and time-budgeted runs bypass the cache
+    cacheable = is_cacheable_run(request.random_seed, convergence)
+    # Profiled and persisted runs always simulate: a cached result has no
+    # profile or per-simulation outcomes
+    cached = (
+        None if request.profile or request.persist_outcomes or not cacheable
+        else state.result_cache.get(key)
+    )
+    if cached is not None:
+        state.set_simulation_result(cached)
+        return serialize_simulation_result(cached)
+
+    # Persisted runs stream their outcomes into the store as they go
+    store_id = str(uuid.uuid4()) if request.persist_outcomes else None
+
     # Run simulation synchronously for now (it's fast enough for <10k)
     # For larger sims, we might want to offload to a thread/process
     try:
-        result = simulate_season(
+        result = simulate_season_parallel(
             games=state.games,
             teams=state.teams,
             num_simulations=request.num_simulations,
             random_seed=request.random_seed,
+            num_workers=request.num_workers or state.config.SIMULATION_WORKERS,
+            shard_size=state.config.SIMULATION_SHARD_SIZE,
+            retain_outcomes=(
+                importance is None
+                and request.num_simulations <= state.config.WHAT_IF_MAX_SIMULATIONS
+            ),
+            exact_max_games=state.config.EXACT_MAX_REMAINING_GAMES,
+            profile=request.profile,
+            win_probability_model=model,
+            convergence=convergence,
+            sampling=sampling,
+            importance=importance,
+            outcome_store=(
+                state.cache_manager.outcome_store_path(store_id) if store_id else None
+            ),
         )
-        state.simulation_result = result
-        
-        # Serialize result
-        response = {
-            "num_simulations": result.num_simulations,
-            "execution_time": result.execution_time_seconds,
-            "team_stats": {}
-        }
-        
-        for team_id, stats in result.team_stats.items():
-            response["team_stats"][team_id] = {
-                "playoff_probability": stats.playoff_probability,
-                "division_win_probability": stats.division_win_probability,
-                "first_seed_probability": stats.first_seed_probability,
-                "average_wins": stats.average_wins,
-                "seed_probabilities": stats.seed_probabilities
-            }
-            
-        return response
+        if store_id is not None:
+            state.cache_manager.prune_outcome_stores(state.config.OUTCOME_STORE_MAX_COUNT)
+        state.set_simulation_result(result)
+        if cacheable:
+            state.result_cache.put(key, result)
+
+        serialized = serialize_simulation_result(result)
+        if store_id is not None:
+            serialized["outcome_store_id"] = store_id
+        return serialized
         
     except Exception as e:
         logger.error(f"Simulation failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def refresh_simulation_result() -> Dict[str, object]:
+    """
+    Update the last simulation run after overrides changed.
+
+    Overrides on games the run simulated are applied incrementally. Anything
+    else (a run without retained outcomes, or a schedule that changed since
+    the run) is left for the user to rerun; nothing is simulated here.
+
+    Returns:
+        Dict with the serialized "simulation" (or None) and whether the update
+        was "incremental"
+    """
+    with state.simulation_lock:
+        result = state.simulation_result
+        if result is None:
+            return {"simulation": None, "incremental": False}
+
+        try:
+            if apply_overrides(result, state.games, state.teams):
+                return {"simulation": serialize_simulation_result(result), "incremental": True}
+        except Exception as e:
+            # A failed update may have left the run half-modified
+            logger.error(f"Failed to update simulation after override: {e}")
+            state.simulation_result = None
+        return {"simulation": None, "incremental": False}
+
+
 class OverrideRequest(BaseModel):
     game_id: str
     home_score: Optional[int] = None
@@ -218,6 +388,20 @@ class OverrideRequest(BaseModel):
 class SimulationJobRequest(BaseModel):
     num_simulations: int = 10000
     random_seed: Optional[int] = None
+    num_workers: Optional[int] = None
+    profile: bool = False
+    win_probability: Optional[Dict[str, Any]] = None
+    convergence: Optional[Dict[str, Any]] = None
+    sampling: str = SAMPLING_INDEPENDENT
+    importance: Optional[Dict[str, Any]] = None
+    persist_outcomes: bool = False
+    # Higher values are run first when jobs are waiting
+    priority: int = 0
+
+
+class OutcomeQueryRequest(BaseModel):
+    # game_id -> winning team ID, or "tie"
+    winners: Dict[str, str] = {}
 
 
 @app.post("/simulation-jobs")
@@ -226,15 +410,27 @@ async def create_simulation_job(request: SimulationJobRequest):
     if not state.teams or not state.games:
         raise HTTPException(status_code=503, detail="Data not loaded")
 
+    model = parse_win_probability_model(request.win_probability)
+    convergence = parse_convergence(request.convergence)
     try:
         job = state.job_manager.start_job(
             games=state.games,
             teams=state.teams,
             num_simulations=request.num_simulations,
             random_seed=request.random_seed,
+            num_workers=request.num_workers,
+            profile=request.profile,
+            win_probability_model=model,
+            priority=request.priority,
+            convergence=convergence,
+            sampling=request.sampling,
+            importance=parse_importance(request.importance),
+            persist_outcomes=request.persist_outcomes,
         )
-    except RuntimeError as exc:
-        raise HTTPException(status_code=409, detail=str(exc))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    except SimulationQueueFullError as exc:
+        raise HTTPException(status_code=429, detail=str(exc))
 
     return job.to_dict()
 
@@ -249,6 +445,90 @@ async def get_simulation_job(job_id: str):
     return job.to_dict()
 
 
+# Seconds between keep-alive comments on an idle event stream
+EVENT_STREAM_KEEPALIVE = 15.0
+
+
+@app.get("/simulation-jobs/{job_id}/events")
+async def stream_simulation_job(
+    job_id: str,
+    last_event_id: Optional[int] = Header(default=None),
+):
+    """
+    Stream a job's status, progress, partial estimates and result as server-sent events.
+
+    Reconnecting clients resume after the Last-Event-ID they received. The
+    stream ends after the status event that finishes the job.
+    """
+    job = state.job_manager.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    async def event_stream():
+        # Every job publishes its first status on submission, so replaying
+        # from the start always begins with the job's state
+        next_index = last_event_id + 1 if last_event_id is not None else 0
+        # Woken from the runner thread on every publish, so no thread waits per client
+        published = job.subscribe()
+        try:
+            while True:
+                published.clear()
+                events = job.events_since(next_index, timeout=0)
+                if not events:
+                    try:
+                        await asyncio.wait_for(published.wait(), EVENT_STREAM_KEEPALIVE)
+                    except asyncio.TimeoutError:
+                        yield ": keep-alive\n\n"
+                    continue
+                for event in events:
+                    yield (
+                        f"id: {event['id']}\nevent: {event['event']}\n"
+                        f"data: {json.dumps(event['data'])}\n\n"
+                    )
+                    next_index = event["id"] + 1
+                    if event["event"] == "status" and event["data"]["status"] in FINISHED_STATUSES:
+                        return
+        finally:
+            job.unsubscribe(published)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/simulation-outcomes/{store_id}/query")
+async def query_simulation_outcomes(store_id: str, request: OutcomeQueryRequest):
+    """
+    Playoff odds over the stored simulations in which the given games went as listed.
+
+    Answers questions like "what if the Bills win week 15?" by filtering a
+    run saved with persist_outcomes instead of resimulating.
+    """
+    # Store IDs are UUIDs; anything else must not reach the file system
+    try:
+        store_id = str(uuid.UUID(store_id))
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Outcome store not found")
+    store = load_cached_outcome_store(state.cache_manager, store_id)
+    if store is None:
+        raise HTTPException(status_code=404, detail="Outcome store not found")
+
+    try:
+        result = await asyncio.to_thread(
+            store.query, request.winners, state.games, state.teams
+        )
+    except StaleOutcomeStoreError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    serialized = serialize_simulation_result(result)
+    serialized["stored_simulations"] = store.num_simulations
+    return serialized
+
+
 @app.delete("/simulation-jobs/{job_id}")
 async def cancel_simulation_job(job_id: str):
     """Cancel a running simulation job."""
@@ -282,8 +562,13 @@ async def set_override(request: OverrideRequest):
         overrides.pop(request.game_id, None)
         
     state.cache_manager.save_overrides(overrides)
-    
-    return {"status": "success", "game": state.cache_manager._serialize_game(game)}
+
+    return {
+        "status": "success",
+        "game": state.cache_manager._serialize_game(game),
+        # Incremental updates recompute standings, so keep them off the event loop
+        **await asyncio.to_thread(refresh_simulation_result),
+    }
 
 @app.post("/overrides/reset")
 async def reset_overrides():
@@ -301,7 +586,12 @@ async def reset_overrides():
             logger.error(f"Failed to reload schedule after reset: {e}")
             raise HTTPException(status_code=500, detail="Failed to reload schedule")
 
-    return {"status": "success", "message": "All overrides reset"}
+    return {
+        "status": "success",
+        "message": "All overrides reset",
+        # Incremental updates recompute standings, so keep them off the event loop
+        **await asyncio.to_thread(refresh_simulation_result),
+    }
 
 if __name__ == "__main__":
     import uvicorn
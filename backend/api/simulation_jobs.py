@@ -1,22 +1,102 @@
 from __future__ import annotations
 
+import asyncio
+import heapq
+import itertools
 import threading
 import time
 import uuid
-from dataclasses import dataclass, field
-from typing import Dict, Optional, List
+from dataclasses import dataclass, field, replace
+from typing import Callable, Dict, Optional, List, Tuple
 
+from src.data.cache_manager import CacheManager
 from src.data.models import Game, Team
 from src.simulation.monte_carlo import (
     SimulationResult,
-    simulate_season,
     SimulationCancelledError,
 )
+from src.simulation.convergence import ConvergenceCriteria
+from src.simulation.exact import DEFAULT_EXACT_MAX_GAMES
+from src.simulation.importance import ImportanceSampler
+from src.simulation.parallel import DEFAULT_SHARD_SIZE, simulate_season_parallel
+from src.simulation.scores import SAMPLING_INDEPENDENT, validate_sampling
+from src.simulation.result_cache import (
+    SimulationResultCache,
+    is_cacheable_run,
+    simulation_cache_key,
+)
+from src.simulation.win_probability import WinProbabilityModel
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
+# Jobs run at the same time; each gets an equal share of the worker processes
+DEFAULT_MAX_CONCURRENT_JOBS = 1
+# Jobs allowed to wait in the queue before new submissions are rejected
+DEFAULT_MAX_QUEUED_JOBS = 16
+# Finished jobs kept for status lookups, and for how long
+DEFAULT_MAX_FINISHED_JOBS = 50
+DEFAULT_FINISHED_JOB_TTL = 3600.0
+
+FINISHED_STATUSES = {"completed", "cancelled", "error"}
+
+# Event types published on a job's event stream
+STATUS_EVENT = "status"
+PROGRESS_EVENT = "progress"
+PARTIAL_EVENT = "partial"
+RESULT_EVENT = "result"
+
+
+class SimulationQueueFullError(RuntimeError):
+    """Raised when a job is submitted while the queue is full."""
+
+
+def serialize_simulation_result(result: SimulationResult) -> Dict[str, object]:
+    """Serialize a simulation result for API responses."""
+    serialized = {
+        "num_simulations": result.num_simulations,
+        "execution_time": result.execution_time_seconds,
+        # Enumerated runs are exact unless points-based tiebreakers used nominal scores
+        "exact": result.has_exact_probabilities,
+        "enumerated": result.exact,
+        "score_dependent_simulations": result.score_dependent_simulations,
+        "profile": result.profile.to_dict() if result.profile else None,
+        "convergence": result.convergence.to_dict() if result.convergence else None,
+        "team_stats": {},
+    }
+
+    for team_id, stats in result.team_stats.items():
+        serialized["team_stats"][team_id] = {
+            "playoff_probability": stats.playoff_probability,
+            "division_win_probability": stats.division_win_probability,
+            "first_seed_probability": stats.first_seed_probability,
+            "average_wins": stats.average_wins,
+            "seed_probabilities": stats.seed_probabilities,
+        }
+        if stats.is_weighted:
+            serialized["team_stats"][team_id]["effective_simulations"] = (
+                stats.effective_simulations
+            )
+
+    return serialized
+
+
+def serialize_partial_result(result: SimulationResult) -> Dict[str, object]:
+    """Serialize the headline probabilities of a partially finished run."""
+    return {
+        "num_simulations": result.num_simulations,
+        "team_stats": {
+            team_id: {
+                "playoff_probability": stats.playoff_probability,
+                "division_win_probability": stats.division_win_probability,
+                "first_seed_probability": stats.first_seed_probability,
+            }
+            for team_id, stats in result.team_stats.items()
+        },
+    }
+
+
 @dataclass
 class SimulationJob:
     """Represents a long-running simulation job."""
@@ -24,27 +104,67 @@ class SimulationJob:
     id: str
     num_simulations: int
     random_seed: Optional[int]
+    num_workers: int = 1
+    profile: bool = False
+    win_probability_model: Optional[WinProbabilityModel] = None
+    # Stop early once estimates converge (num_simulations is then a ceiling)
+    convergence: Optional[ConvergenceCriteria] = None
+    # independent, antithetic or stratified home-win draws
+    sampling: str = SAMPLING_INDEPENDENT
+    # Optional proposal tilted towards a team's rare outcomes (weighted results)
+    importance: Optional[ImportanceSampler] = None
+    # Write per-simulation outcomes to an on-disk store for conditional queries
+    persist_outcomes: bool = False
+    # Higher priority jobs leave the queue first; equal priorities run FIFO
+    priority: int = 0
     status: str = "pending"  # pending, running, completed, cancelled, error
+    # 1-based place in the queue while pending, None otherwise
+    queue_position: Optional[int] = None
     progress: int = 0
     message: str = ""
     result: Optional[SimulationResult] = None
+    # ID of the outcome store written for the job (persist_outcomes only)
+    outcome_store_id: Optional[str] = None
     error: Optional[str] = None
     execution_time_seconds: Optional[float] = None
     created_at: float = field(default_factory=time.time)
     started_at: Optional[float] = None
     completed_at: Optional[float] = None
-    _thread: Optional[threading.Thread] = field(default=None, repr=False)
+    _games: List[Game] = field(default_factory=list, repr=False)
+    _teams: List[Team] = field(default_factory=list, repr=False)
     _cancel_event: threading.Event = field(default_factory=threading.Event, repr=False)
+    # Ordered log of published events; list index is the event ID
+    _events: List[Dict[str, object]] = field(default_factory=list, repr=False)
+    _events_changed: threading.Condition = field(
+        default_factory=threading.Condition, repr=False
+    )
+    # (event loop, asyncio.Event) of stream readers woken on every publish
+    _subscribers: List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = field(
+        default_factory=list, repr=False
+    )
+    _serialized_result: Optional[Dict[str, object]] = field(default=None, repr=False)
 
     def to_dict(self) -> Dict[str, object]:
         """Serialize job for API responses."""
         return {
             "job_id": self.id,
             "status": self.status,
+            "queue_position": self.queue_position,
+            "priority": self.priority,
             "progress": self.progress,
             "message": self.message,
             "num_simulations": self.num_simulations,
             "random_seed": self.random_seed,
+            "num_workers": self.num_workers,
+            "profile": self.profile,
+            "win_probability": (
+                self.win_probability_model.to_dict() if self.win_probability_model else None
+            ),
+            "convergence": self.convergence.to_dict() if self.convergence else None,
+            "sampling": self.sampling,
+            "importance": self.importance.to_dict() if self.importance else None,
+            "persist_outcomes": self.persist_outcomes,
+            "outcome_store_id": self.outcome_store_id,
             "result": self._serialize_result(),
             "error": self.error,
             "created_at": self.created_at,
@@ -56,27 +176,90 @@ class SimulationJob:
     def _serialize_result(self) -> Optional[Dict[str, object]]:
         if not self.result:
             return None
+        # A job's result never changes once set, so serialize it only once
+        if self._serialized_result is None:
+            self._serialized_result = serialize_simulation_result(self.result)
+        return self._serialized_result
 
-        serialized = {
-            "num_simulations": self.result.num_simulations,
-            "execution_time": self.result.execution_time_seconds,
-            "team_stats": {},
-        }
+    def publish(self, event: str, data: Dict[str, object]) -> None:
+        """
+        Append an event to the job's stream and wake waiting readers.
 
-        for team_id, stats in self.result.team_stats.items():
-            serialized["team_stats"][team_id] = {
-                "playoff_probability": stats.playoff_probability,
-                "division_win_probability": stats.division_win_probability,
-                "first_seed_probability": stats.first_seed_probability,
-                "average_wins": stats.average_wins,
-                "seed_probabilities": stats.seed_probabilities,
-            }
+        Args:
+            event: Event type (status, progress, partial or result)
+            data: JSON-serializable payload
+        """
+        with self._events_changed:
+            self._events.append({"id": len(self._events), "event": event, "data": data})
+            self._events_changed.notify_all()
+            subscribers = list(self._subscribers)
+        for loop, waiter in subscribers:
+            try:
+                loop.call_soon_threadsafe(waiter.set)
+            except RuntimeError:
+                # The reader's loop has closed; it will not read again
+                self.unsubscribe(waiter)
 
-        return serialized
+    def subscribe(self) -> asyncio.Event:
+        """
+        Register an asyncio reader of the job's events.
+
+        Must be called from a running event loop. The returned event is set on
+        that loop whenever an event is published; clear it before reading with
+        events_since, then await it. Call unsubscribe when done.
+
+        Returns:
+            asyncio.Event set on every publish
+        """
+        waiter = asyncio.Event()
+        with self._events_changed:
+            self._subscribers.append((asyncio.get_running_loop(), waiter))
+        return waiter
+
+    def unsubscribe(self, waiter: asyncio.Event) -> None:
+        """Stop waking an event returned by subscribe."""
+        with self._events_changed:
+            self._subscribers = [
+                entry for entry in self._subscribers if entry[1] is not waiter
+            ]
+
+    def publish_status(self) -> None:
+        """Publish the job's current status, message and queue position."""
+        self.publish(STATUS_EVENT, {
+            "status": self.status,
+            "message": self.message,
+            "progress": self.progress,
+            "queue_position": self.queue_position,
+            "error": self.error,
+        })
+
+    def events_since(
+        self, index: int, timeout: Optional[float] = None
+    ) -> List[Dict[str, object]]:
+        """
+        Events from index onwards, waiting for new ones if there are none yet.
+
+        The final event of every job is a status event with a finished status.
+
+        Args:
+            index: ID of the first event wanted
+            timeout: Seconds to wait for an event (None waits indefinitely)
+
+        Returns:
+            Events as dicts with id, event and data (empty if the wait timed out)
+        """
+        with self._events_changed:
+            self._events_changed.wait_for(lambda: len(self._events) > index, timeout)
+            return self._events[index:]
+
+    @property
+    def is_finished(self) -> bool:
+        """True once the job has completed, failed or been cancelled."""
+        return self.status in FINISHED_STATUSES
 
     def cancel(self):
         """Signal cancellation for the running job."""
-        if self.status in {"completed", "cancelled", "error"}:
+        if self.is_finished:
             return
         self._cancel_event.set()
 
@@ -85,11 +268,104 @@ class SimulationJob:
 
 
 class SimulationJobManager:
-    """Manages lifecycle of simulation jobs."""
+    """
+    Queues simulation jobs and runs them on a bounded pool of runner threads.
+
+    Up to max_concurrent_jobs jobs run at once, each sharding its simulations
+    over worker processes (see simulate_season_parallel). Waiting jobs are
+    ordered by priority, then submission time. Finished jobs are kept for
+    status lookups until they expire or the history limit is reached.
+    """
+
+    def __init__(
+        self,
+        num_workers: int = 1,
+        shard_size: int = DEFAULT_SHARD_SIZE,
+        retain_max_simulations: int = 0,
+        exact_max_games: int = DEFAULT_EXACT_MAX_GAMES,
+        result_callback: Optional[Callable[[SimulationResult], None]] = None,
+        result_cache: Optional[SimulationResultCache] = None,
+        max_concurrent_jobs: int = DEFAULT_MAX_CONCURRENT_JOBS,
+        max_queued_jobs: int = DEFAULT_MAX_QUEUED_JOBS,
+        max_simulations_per_job: Optional[int] = None,
+        max_finished_jobs: int = DEFAULT_MAX_FINISHED_JOBS,
+        finished_job_ttl: float = DEFAULT_FINISHED_JOB_TTL,
+        outcome_cache: Optional[CacheManager] = None,
+        max_outcome_stores: Optional[int] = None,
+    ):
+        """
+        Args:
+            num_workers: Worker processes shared by running jobs
+            shard_size: Simulations per shard when splitting a job
+            retain_max_simulations: Largest job whose per-simulation outcomes are
+                kept on the result for what-if updates
+            exact_max_games: Most remaining games enumerated exactly instead of sampled
+            result_callback: Optional function receiving each completed result
+            result_cache: Optional cache consulted before running and filled after
+            max_concurrent_jobs: Jobs run at the same time
+            max_queued_jobs: Jobs allowed to wait before submissions are rejected
+            max_simulations_per_job: Largest accepted job (None for no limit)
+            max_finished_jobs: Finished jobs kept for status lookups
+            finished_job_ttl: Seconds a finished job is kept
+            outcome_cache: Cache manager holding outcome stores of jobs
+                submitted with persist_outcomes
+            max_outcome_stores: Outcome stores kept on disk (None for no limit)
+        """
+        if max_concurrent_jobs <= 0:
+            raise ValueError("max_concurrent_jobs must be positive")
 
-    def __init__(self):
         self._jobs: Dict[str, SimulationJob] = {}
         self._lock = threading.Lock()
+        self._job_available = threading.Condition(self._lock)
+        # Heap of (-priority, submission order, job)
+        self._queue: List[Tuple[int, int, SimulationJob]] = []
+        self._submission_order = itertools.count()
+        self._runners: List[threading.Thread] = []
+        self.num_workers = num_workers
+        self.shard_size = shard_size
+        self.retain_max_simulations = retain_max_simulations
+        self.exact_max_games = exact_max_games
+        self.result_callback = result_callback
+        self.result_cache = result_cache
+        self.max_concurrent_jobs = max_concurrent_jobs
+        self.max_queued_jobs = max_queued_jobs
+        self.max_simulations_per_job = max_simulations_per_job
+        self.max_finished_jobs = max_finished_jobs
+        self.finished_job_ttl = finished_job_ttl
+        self.outcome_cache = outcome_cache
+        self.max_outcome_stores = max_outcome_stores
+
+    @property
+    def workers_per_job(self) -> int:
+        """Worker processes each running job may use."""
+        return max(1, self.num_workers // self.max_concurrent_jobs)
+
+    def cache_key(
+        self,
+        games: List[Game],
+        teams: List[Team],
+        num_simulations: int,
+        random_seed: Optional[int],
+        win_probability_model: Optional[WinProbabilityModel] = None,
+        convergence: Optional[ConvergenceCriteria] = None,
+        sampling: str = SAMPLING_INDEPENDENT,
+        importance: Optional[ImportanceSampler] = None,
+    ) -> str:
+        """Result cache key for a run with this manager's settings."""
+        options: Dict[str, object] = {
+            "shard_size": self.shard_size,
+            "exact_max_games": self.exact_max_games,
+        }
+        # 50/50 models leave results (and existing keys) unchanged
+        if win_probability_model is not None and not win_probability_model.is_fair:
+            options["win_probability"] = win_probability_model.to_dict()
+        if convergence is not None:
+            options["convergence"] = convergence.to_dict()
+        if sampling != SAMPLING_INDEPENDENT:
+            options["sampling"] = sampling
+        if importance is not None:
+            options["importance"] = importance.to_dict()
+        return simulation_cache_key(games, teams, num_simulations, random_seed, **options)
 
     def start_job(
         self,
@@ -97,27 +373,106 @@ class SimulationJobManager:
         teams: List[Team],
         num_simulations: int,
         random_seed: Optional[int] = None,
+        num_workers: Optional[int] = None,
+        profile: bool = False,
+        win_probability_model: Optional[WinProbabilityModel] = None,
+        priority: int = 0,
+        convergence: Optional[ConvergenceCriteria] = None,
+        sampling: str = SAMPLING_INDEPENDENT,
+        importance: Optional[ImportanceSampler] = None,
+        persist_outcomes: bool = False,
     ) -> SimulationJob:
-        """Start a new simulation job."""
-        with self._lock:
-            if self._has_active_job_locked():
-                raise RuntimeError("Another simulation is already running")
-
-            job_id = str(uuid.uuid4())
-            job = SimulationJob(
-                id=job_id,
-                num_simulations=num_simulations,
-                random_seed=random_seed,
-                message=f"Queued {num_simulations:,} simulations",
-            )
-            self._jobs[job_id] = job
+        """
+        Submit a simulation job.
+
+        The job runs on a snapshot of the schedule taken now, so overrides made
+        while it waits do not affect it. Cached results complete the job
+        immediately; profiled jobs always run, since a cached result has no
+        profile, and unseeded or time-budgeted adaptive jobs are neither
+        looked up nor stored (see is_cacheable_run). Jobs persisting
+        their outcomes also always run, since cached results keep none.
+
+        Args:
+            games: List of all games in the season
+            teams: List of all teams
+            num_simulations: Simulations to run
+            random_seed: Optional run seed
+            num_workers: Worker processes (capped at the per-job share)
+            profile: Record stage timings on the result
+            win_probability_model: Optional per-game win-probability model
+            priority: Higher values leave the queue first
+            convergence: Optional criteria for stopping early
+            sampling: independent, antithetic or stratified home-win draws
+            importance: Optional importance sampler (outcomes are then never
+                retained for what-if updates)
+            persist_outcomes: Write every simulation's outcomes and seeding to
+                an outcome store (see src.simulation.outcome_store)
 
-            thread = threading.Thread(
-                target=self._run_job, args=(job, games, teams), daemon=True
+        Returns:
+            The submitted job (pending, or completed from the cache)
+
+        Raises:
+            ValueError: If the job exceeds max_simulations_per_job, the
+                sampling method is unknown, importance sampling is combined
+                with convergence or persist_outcomes, or outcomes are to be
+                persisted without an outcome cache
+            SimulationQueueFullError: If max_queued_jobs jobs are already waiting
+        """
+        if (
+            self.max_simulations_per_job is not None
+            and num_simulations > self.max_simulations_per_job
+        ):
+            raise ValueError(
+                f"At most {self.max_simulations_per_job:,} simulations per job"
             )
-            job._thread = thread
-            thread.start()
+        validate_sampling(sampling)
+        if importance is not None and convergence is not None:
+            raise ValueError("Importance sampling cannot be combined with convergence")
+        if persist_outcomes and (importance is not None or self.outcome_cache is None):
+            raise ValueError("Outcomes of this job cannot be persisted")
 
+        job = SimulationJob(
+            id=str(uuid.uuid4()),
+            num_simulations=num_simulations,
+            random_seed=random_seed,
+            num_workers=min(num_workers or self.workers_per_job, self.workers_per_job),
+            profile=profile,
+            win_probability_model=win_probability_model,
+            priority=priority,
+            convergence=convergence,
+            sampling=sampling,
+            importance=importance,
+            persist_outcomes=persist_outcomes,
+            message=f"Queued {num_simulations:,} simulations",
+            _games=[replace(game) for game in games],
+            _teams=list(teams),
+        )
+
+        # The lookup copies the cached result and completing a job runs the
+        # result callback, so neither happens while the manager is locked
+        cached = None
+        if self._is_cacheable(job) and not profile and not persist_outcomes:
+            cached = self.result_cache.get(self._job_cache_key(job))
+        if cached is not None:
+            job.started_at = time.time()
+            with self._lock:
+                self._evict_finished_locked()
+                self._jobs[job.id] = job
+            self._complete_job(job, cached, "Loaded cached result")
+            return job
+
+        with self._lock:
+            self._evict_finished_locked()
+            if len(self._queue) >= self.max_queued_jobs:
+                raise SimulationQueueFullError(
+                    f"Simulation queue is full ({self.max_queued_jobs} jobs waiting)"
+                )
+
+            self._jobs[job.id] = job
+            heapq.heappush(self._queue, (-priority, next(self._submission_order), job))
+            self._update_queue_positions_locked()
+            self._ensure_runners_locked()
+            self._job_available.notify()
             return job
 
     def get_job(self, job_id: str) -> Optional[SimulationJob]:
@@ -126,14 +481,33 @@ class SimulationJobManager:
             return self._jobs.get(job_id)
 
     def cancel_job(self, job_id: str) -> bool:
-        """Request cancellation of a running job."""
-        job = self.get_job(job_id)
-        if not job:
-            return False
+        """
+        Cancel a job.
+
+        A queued job is removed from the queue at once; a running job stops at
+        its next cancellation check.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if not job:
+                return False
 
-        job.cancel()
+            job.cancel()
+            if job.status == "pending":
+                self._queue = [entry for entry in self._queue if entry[2] is not job]
+                heapq.heapify(self._queue)
+                self._update_queue_positions_locked()
+                job.status = "cancelled"
+                job.message = "Simulation cancelled"
+                job.completed_at = time.time()
+                job.publish_status()
         return True
 
+    def queue_length(self) -> int:
+        """Number of jobs waiting to run."""
+        with self._lock:
+            return len(self._queue)
+
     def _has_active_job_locked(self) -> bool:
         return any(
             job.status in {"pending", "running"} for job in self._jobs.values()
@@ -143,29 +517,126 @@ class SimulationJobManager:
         with self._lock:
             return self._has_active_job_locked()
 
-    def _run_job(self, job: SimulationJob, games: List[Game], teams: List[Team]):
-        job.status = "running"
-        job.started_at = time.time()
-        job.message = f"Running {job.num_simulations:,} simulations..."
+    def _update_queue_positions_locked(self) -> None:
+        for position, (_, _, job) in enumerate(sorted(self._queue), start=1):
+            message = f"Queued ({position} of {len(self._queue)})"
+            if (job.queue_position, job.message) != (position, message):
+                job.queue_position = position
+                job.message = message
+                job.publish_status()
+
+    def _evict_finished_locked(self) -> None:
+        now = time.time()
+        finished = sorted(
+            (job for job in self._jobs.values() if job.is_finished),
+            key=lambda job: job.completed_at or 0.0,
+        )
+        excess = len(finished) - self.max_finished_jobs
+        for index, job in enumerate(finished):
+            if index < excess or now - (job.completed_at or now) > self.finished_job_ttl:
+                del self._jobs[job.id]
+
+    def _ensure_runners_locked(self) -> None:
+        # Runner threads are started on first use and then wait for work
+        while len(self._runners) < self.max_concurrent_jobs:
+            runner = threading.Thread(
+                target=self._runner_loop,
+                name=f"simulation-runner-{len(self._runners)}",
+                daemon=True,
+            )
+            self._runners.append(runner)
+            runner.start()
+
+    def _runner_loop(self) -> None:
+        while True:
+            with self._job_available:
+                while not self._queue:
+                    self._job_available.wait()
+                _, _, job = heapq.heappop(self._queue)
+                self._update_queue_positions_locked()
+                job.queue_position = None
+                job.status = "running"
+                job.started_at = time.time()
+                job.message = f"Running {job.num_simulations:,} simulations..."
+                job.publish_status()
+            self._run_job(job)
+            with self._lock:
+                self._evict_finished_locked()
+
+    def _job_cache_key(self, job: SimulationJob) -> str:
+        return self.cache_key(
+            job._games,
+            job._teams,
+            job.num_simulations,
+            job.random_seed,
+            job.win_probability_model,
+            job.convergence,
+            job.sampling,
+            job.importance,
+        )
+
+    def _is_cacheable(self, job: SimulationJob) -> bool:
+        return self.result_cache is not None and is_cacheable_run(
+            job.random_seed, job.convergence
+        )
 
+    def _complete_job(self, job: SimulationJob, result: SimulationResult, message: str):
+        job.result = result
+        job.progress = 100
+        job.status = "completed"
+        job.message = message
+        job.execution_time_seconds = result.execution_time_seconds
+        job.completed_at = time.time()
+        # Stream readers get the full result once, then the closing status
+        job.publish(RESULT_EVENT, job._serialize_result())
+        job.publish_status()
+        if self.result_callback:
+            self.result_callback(result)
+
+    def _run_job(self, job: SimulationJob):
         def progress_callback(pct: int):
             job.progress = pct
             job.message = f"{pct}% complete"
+            job.publish(PROGRESS_EVENT, {"progress": pct, "message": job.message})
+
+        def partial_callback(partial: SimulationResult):
+            job.publish(PARTIAL_EVENT, serialize_partial_result(partial))
 
         try:
-            result = simulate_season(
-                games=games,
-                teams=teams,
+            result = simulate_season_parallel(
+                games=job._games,
+                teams=job._teams,
                 num_simulations=job.num_simulations,
                 random_seed=job.random_seed,
+                num_workers=job.num_workers,
+                shard_size=self.shard_size,
                 progress_callback=progress_callback,
+                partial_callback=partial_callback,
                 cancel_callback=job.is_cancelled,
+                # What-if updates assume unweighted simulations
+                retain_outcomes=(
+                    job.importance is None
+                    and job.num_simulations <= self.retain_max_simulations
+                ),
+                exact_max_games=self.exact_max_games,
+                profile=job.profile,
+                win_probability_model=job.win_probability_model,
+                convergence=job.convergence,
+                sampling=job.sampling,
+                importance=job.importance,
+                # Shards write their rows into the store as they finish
+                outcome_store=(
+                    self.outcome_cache.outcome_store_path(job.id)
+                    if job.persist_outcomes else None
+                ),
             )
-            job.result = result
-            job.progress = 100
-            job.status = "completed"
-            job.message = "Simulation complete"
-            job.execution_time_seconds = result.execution_time_seconds
+            if job.persist_outcomes:
+                if self.max_outcome_stores is not None:
+                    self.outcome_cache.prune_outcome_stores(self.max_outcome_stores)
+                job.outcome_store_id = job.id
+            if self._is_cacheable(job):
+                self.result_cache.put(self._job_cache_key(job), result)
+            self._complete_job(job, result, "Simulation complete")
         except SimulationCancelledError:
             job.status = "cancelled"
             job.message = "Simulation cancelled"
@@ -175,6 +646,7 @@ class SimulationJobManager:
             job.error = str(exc)
             job.message = "Simulation failed"
         finally:
-            job.completed_at = time.time()
-
-
+            if job.completed_at is None:
+                job.completed_at = time.time()
+            if job.status != "completed":
+                job.publish_status()
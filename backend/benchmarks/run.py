@@ -0,0 +1,674 @@
+"""
+Benchmark suite for the simulation pipeline.
+
+Times the simulation entry points against the checked-in season data
+(data/schedule_2025.json and data/teams.json) in several season states and
+writes the measurements as JSON. A previous results file can be given as a
+baseline: any timing or peak memory that grew by more than the tolerance is
+reported as a regression and the command exits with status 1.
+
+Each sampling method (independent, antithetic, stratified) is also run
+several times with different seeds to measure the standard error of the
+playoff probabilities, reported against CPU time: the work-normalized error
+is the standard error times the square root of CPU seconds per run, so a
+method with half the variance at the same cost scores 2x relative efficiency.
+
+Late in the season, exact enumeration of the remaining games is timed against
+the sampler running the same number of rows (2**N for N remaining games). The
+cost of an enumerated row relative to a sampled one is compared against the
+baseline like any timing; it is what DEFAULT_EXACT_MAX_GAMES in
+src/simulation/exact.py is chosen from.
+
+Usage (from backend/):
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --save-baseline benchmarks/baseline.json
+    python -m benchmarks.run --baseline benchmarks/baseline.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, replace
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.data.cache_manager import CacheManager
+from src.data.models import Game, Team
+from src.simulation.exact import count_outcomes, enumerate_season
+from src.simulation.monte_carlo import simulate_season
+from src.simulation.result_cache import SimulationResultCache
+from src.simulation.scores import SAMPLING_INDEPENDENT, SAMPLING_METHODS
+from src.simulation.standings import calculate_standings
+from src.simulation.tiebreakers import (
+    determine_division_winners,
+    seed_conference_playoffs,
+)
+
+
+RESULTS_VERSION = 1
+
+DEFAULT_DATA_DIR = Path(__file__).resolve().parents[2] / "data"
+DEFAULT_SIMULATIONS = 2000
+DEFAULT_REPEAT = 3
+DEFAULT_ITERATIONS = 20
+DEFAULT_TOLERANCE = 0.25
+# Seeded runs per sampling method when measuring standard errors
+DEFAULT_SAMPLING_REPLICATES = 8
+# Remaining-game counts at which enumeration is timed against the sampler
+DEFAULT_EXACT_GAMES = [8, 10, 12]
+
+# Season states benchmarked: name -> last completed week (0 = nothing played)
+SEASON_STATES = {
+    "week_1": 0,
+    "mid_season": 9,
+    "week_17": 16,
+}
+
+# Metrics compared against a baseline (larger is worse for all)
+COMPARED_METRICS = ["seconds", "peak_memory_bytes"]
+COMPARED_EXACT_METRICS = ["relative_cost"]
+
+
+@dataclass
+class Measurement:
+    """Timing and memory of one benchmarked operation."""
+
+    name: str
+    seconds: float  # Best time per call across repeats
+    peak_memory_bytes: int  # Peak traced allocation during one call
+    operations: int = 1  # Work units per call (e.g. simulations)
+
+    @property
+    def operations_per_second(self) -> float:
+        """Work units completed per second."""
+        return self.operations / self.seconds if self.seconds > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        """Serialize for the results file."""
+        return {
+            "seconds": self.seconds,
+            "peak_memory_bytes": self.peak_memory_bytes,
+            "operations": self.operations,
+            "operations_per_second": self.operations_per_second,
+        }
+
+
+@dataclass
+class Regression:
+    """A metric that got worse than the baseline allows."""
+
+    name: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """Current value relative to the baseline."""
+        return self.current / self.baseline
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name} {self.metric}: {self.baseline:.6g} -> {self.current:.6g} "
+            f"({(self.ratio - 1) * 100:+.1f}%)"
+        )
+
+
+def season_state(games: List[Game], completed_through_week: int, seed: int = 0) -> List[Game]:
+    """
+    Copy of the season with exactly the games up to a week completed.
+
+    Real results are kept where the data has them. Games in completed weeks
+    that have not been played yet get deterministic pseudo-random scores, and
+    every later game is reset to unplayed.
+
+    Args:
+        games: Full season schedule
+        completed_through_week: Last completed week (0 for a season not yet started)
+        seed: Seed for the filled-in scores
+
+    Returns:
+        List of games in schedule order
+    """
+    rng = random.Random(seed)
+    state = []
+    for game in sorted(games, key=lambda g: (g.week, g.date, g.id)):
+        if game.week > completed_through_week:
+            game = replace(
+                game,
+                is_completed=False,
+                home_score=None,
+                away_score=None,
+                is_overridden=False,
+                override_home_score=None,
+                override_away_score=None,
+            )
+        elif not (game.is_completed and game.home_score is not None):
+            game = replace(
+                game,
+                is_completed=True,
+                home_score=rng.randint(3, 38),
+                away_score=rng.randint(3, 38),
+            )
+        state.append(game)
+    return state
+
+
+def remaining_games_state(games: List[Game], remaining: int, seed: int = 0) -> List[Game]:
+    """
+    Copy of the season with only its last games left to play.
+
+    Args:
+        games: Full season schedule
+        remaining: Number of games at the end of the schedule left unplayed
+        seed: Seed for the filled-in scores of earlier games
+
+    Returns:
+        List of games in schedule order
+    """
+    completed = season_state(games, max(game.week for game in games), seed)
+    cutoff = len(completed) - remaining
+    return [
+        replace(game, is_completed=False, home_score=None, away_score=None)
+        if index >= cutoff else game
+        for index, game in enumerate(completed)
+    ]
+
+
+def _measure(
+    name: str,
+    func: Callable[[], object],
+    repeat: int,
+    iterations: int = 1,
+    operations: int = 1,
+) -> Measurement:
+    """Best-of-repeat time per call, plus the peak memory of a separate call."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        best = min(best, (time.perf_counter() - start) / iterations)
+
+    # Traced separately: tracemalloc slows allocation-heavy code
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Measurement(
+        name=name, seconds=best, peak_memory_bytes=peak, operations=operations
+    )
+
+
+def measure_sampling_efficiency(
+    games: List[Game],
+    teams: List[Team],
+    num_simulations: int,
+    replicates: int,
+    random_seed: int = 42,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Standard error of playoff probabilities per CPU-second for each sampling method.
+
+    Args:
+        games: Schedule in the season state to measure
+        teams: List of all teams
+        num_simulations: Simulations per run
+        replicates: Seeded runs per method (at least 2)
+        random_seed: Seed of the first run; later runs add 1 each
+
+    Returns:
+        Method -> standard_error (root mean square over teams of the
+        across-run standard deviation), cpu_seconds (per run),
+        work_normalized_error and relative_efficiency (vs. independent)
+    """
+    if replicates < 2:
+        raise ValueError("replicates must be at least 2")
+
+    team_ids = [team.id for team in teams]
+    efficiency: Dict[str, Dict[str, float]] = {}
+    for method in SAMPLING_METHODS:
+        estimates = []
+        cpu_seconds = 0.0
+        for replicate in range(replicates):
+            start = time.process_time()
+            result = simulate_season(
+                games, teams, num_simulations=num_simulations,
+                random_seed=random_seed + replicate, sampling=method,
+            )
+            cpu_seconds += time.process_time() - start
+            estimates.append(
+                [result.team_stats[team_id].playoff_probability for team_id in team_ids]
+            )
+
+        standard_error = float(np.sqrt(np.mean(np.var(estimates, axis=0, ddof=1))))
+        cpu_seconds /= replicates
+        efficiency[method] = {
+            "standard_error": standard_error,
+            "cpu_seconds": cpu_seconds,
+            "work_normalized_error": standard_error * float(np.sqrt(cpu_seconds)),
+        }
+
+    reference = efficiency[SAMPLING_INDEPENDENT]["work_normalized_error"]
+    for metrics in efficiency.values():
+        error = metrics["work_normalized_error"]
+        metrics["relative_efficiency"] = (reference / error) ** 2 if error > 0 else 0.0
+    return efficiency
+
+
+def measure_exact_enumeration(
+    games: List[Game],
+    teams: List[Team],
+    exact_games: List[int],
+    repeat: int,
+    random_seed: int = 42,
+) -> Tuple[List[Measurement], Dict[str, Dict[str, float]]]:
+    """
+    Time exact enumeration against the sampler on the same number of rows.
+
+    Args:
+        games: Full season schedule
+        teams: List of all teams
+        exact_games: Remaining-game counts to measure
+        repeat: Timed repeats per benchmark (the best is kept)
+        random_seed: Seed for the sampler and coin-toss tiebreakers
+
+    Returns:
+        Tuple of (measurements, comparison): comparison maps the remaining-game
+        count to exact_seconds, sampler_seconds and relative_cost (enumerated
+        over sampled seconds per row)
+    """
+    measurements: List[Measurement] = []
+    comparison: Dict[str, Dict[str, float]] = {}
+    for remaining in exact_games:
+        state_games = remaining_games_state(games, remaining)
+        rows = count_outcomes(remaining)
+        exact = _measure(
+            f"enumerate_season/{remaining}_games",
+            lambda: enumerate_season(state_games, teams, random_seed=random_seed),
+            repeat,
+            operations=rows,
+        )
+        sampled = _measure(
+            f"simulate_season/{remaining}_games",
+            lambda: simulate_season(
+                state_games, teams, num_simulations=rows, random_seed=random_seed
+            ),
+            repeat,
+            operations=rows,
+        )
+        measurements.extend([exact, sampled])
+        comparison[str(remaining)] = {
+            "rows": rows,
+            "exact_seconds": exact.seconds,
+            "sampler_seconds": sampled.seconds,
+            "relative_cost": exact.seconds / sampled.seconds if sampled.seconds > 0 else 0.0,
+        }
+    return measurements, comparison
+
+
+def run_benchmarks(
+    games: List[Game],
+    teams: List[Team],
+    num_simulations: int = DEFAULT_SIMULATIONS,
+    repeat: int = DEFAULT_REPEAT,
+    iterations: int = DEFAULT_ITERATIONS,
+    states: Optional[Dict[str, int]] = None,
+    random_seed: int = 42,
+    sampling_replicates: int = DEFAULT_SAMPLING_REPLICATES,
+    exact_games: Optional[List[int]] = None,
+) -> Dict[str, object]:
+    """
+    Run the benchmark suite.
+
+    Args:
+        games: Full season schedule
+        teams: List of all teams
+        num_simulations: Simulations per simulate_season call
+        repeat: Timed repeats per benchmark (the best is kept)
+        iterations: Calls per repeat for the standings and tiebreaker benchmarks
+        states: Season states to run (default: SEASON_STATES)
+        random_seed: Seed for simulations
+        sampling_replicates: Runs per sampling method for the standard error
+            comparison, in the first season state (0 skips it)
+        exact_games: Remaining-game counts at which enumeration is timed
+            against the sampler (default: DEFAULT_EXACT_GAMES; empty skips it)
+
+    Returns:
+        Results dictionary (see write_results)
+    """
+    states = SEASON_STATES if states is None else states
+    measurements: List[Measurement] = []
+    cached_result = None
+
+    for state_name, week in states.items():
+        state_games = season_state(games, week)
+
+        measurement = _measure(
+            f"simulate_season/{state_name}",
+            lambda: simulate_season(
+                state_games, teams, num_simulations=num_simulations, random_seed=random_seed
+            ),
+            repeat,
+            operations=num_simulations,
+        )
+        measurements.append(measurement)
+
+        standings = calculate_standings(state_games, teams)
+        division_winners = determine_division_winners(teams, standings, state_games)
+
+        measurements.append(
+            _measure(
+                f"calculate_standings/{state_name}",
+                lambda: calculate_standings(state_games, teams),
+                repeat,
+                iterations,
+            )
+        )
+        measurements.append(
+            _measure(
+                f"determine_division_winners/{state_name}",
+                lambda: determine_division_winners(teams, standings, state_games),
+                repeat,
+                iterations,
+            )
+        )
+        measurements.append(
+            _measure(
+                f"seed_conference_playoffs/{state_name}",
+                lambda: [
+                    seed_conference_playoffs(
+                        teams, standings, state_games, conference,
+                        division_winners=division_winners,
+                    )
+                    for conference in ["AFC", "NFC"]
+                ],
+                repeat,
+                iterations,
+            )
+        )
+
+        if cached_result is None:
+            cached_result = simulate_season(
+                state_games, teams, num_simulations=num_simulations, random_seed=random_seed
+            )
+
+    sampling = {}
+    if sampling_replicates and states:
+        first_state = next(iter(states.values()))
+        sampling = measure_sampling_efficiency(
+            season_state(games, first_state), teams, num_simulations,
+            sampling_replicates, random_seed,
+        )
+
+    exact_games = DEFAULT_EXACT_GAMES if exact_games is None else exact_games
+    exact_measurements, exact = measure_exact_enumeration(
+        games, teams, exact_games, repeat, random_seed
+    )
+    measurements.extend(exact_measurements)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache_manager = CacheManager(cache_dir)
+        cache_manager.save_schedule(games)
+        measurements.append(
+            _measure("cache/save_schedule", lambda: cache_manager.save_schedule(games), repeat)
+        )
+        measurements.append(
+            _measure("cache/load_schedule", lambda: cache_manager.load_schedule(), repeat)
+        )
+        if cached_result is not None:
+            # Disk tier only, so every lookup reads and deserializes the file
+            disk_cache = SimulationResultCache(max_entries=0, cache_manager=cache_manager)
+            disk_cache.put("benchmark", cached_result)
+            measurements.append(
+                _measure(
+                    "cache/save_simulation_result",
+                    lambda: disk_cache.put("benchmark", cached_result),
+                    repeat,
+                )
+            )
+            measurements.append(
+                _measure(
+                    "cache/load_simulation_result",
+                    lambda: disk_cache.get("benchmark"),
+                    repeat,
+                )
+            )
+
+    return {
+        "version": RESULTS_VERSION,
+        "created_at": datetime.now().isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "config": {
+            "num_simulations": num_simulations,
+            "repeat": repeat,
+            "iterations": iterations,
+            "states": dict(states),
+            "random_seed": random_seed,
+            "sampling_replicates": sampling_replicates,
+            "exact_games": list(exact_games),
+        },
+        "benchmarks": {m.name: m.to_dict() for m in measurements},
+        "sampling": sampling,
+        "exact": exact,
+    }
+
+
+def compare_results(
+    current: Dict[str, object],
+    baseline: Dict[str, object],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> List[Regression]:
+    """
+    Find benchmarks that got slower or used more memory than a baseline.
+
+    The relative cost of exact enumeration over sampling is checked the same
+    way, as exact_vs_sampler/<N>_games. Entries missing from either side are
+    ignored.
+
+    Args:
+        current: Results from run_benchmarks
+        baseline: Earlier results to compare against
+        tolerance: Allowed relative increase (0.25 = 25%)
+
+    Returns:
+        List of regressions (empty if none)
+    """
+    regressions = []
+    baseline_benchmarks = baseline.get("benchmarks", {})
+    for name, metrics in current.get("benchmarks", {}).items():
+        previous = baseline_benchmarks.get(name)
+        if previous is None:
+            continue
+        for metric in COMPARED_METRICS:
+            before = previous.get(metric)
+            after = metrics.get(metric)
+            if not before or after is None:
+                continue
+            if after > before * (1 + tolerance):
+                regressions.append(
+                    Regression(name=name, metric=metric, baseline=before, current=after)
+                )
+
+    baseline_exact = baseline.get("exact", {})
+    for remaining, metrics in current.get("exact", {}).items():
+        previous = baseline_exact.get(remaining)
+        if previous is None:
+            continue
+        for metric in COMPARED_EXACT_METRICS:
+            before = previous.get(metric)
+            after = metrics.get(metric)
+            if not before or after is None:
+                continue
+            if after > before * (1 + tolerance):
+                regressions.append(
+                    Regression(
+                        name=f"exact_vs_sampler/{remaining}_games",
+                        metric=metric,
+                        baseline=before,
+                        current=after,
+                    )
+                )
+    return regressions
+
+
+def write_results(results: Dict[str, object], path: Path) -> None:
+    """
+    Write results as JSON.
+
+    Args:
+        results: Results from run_benchmarks
+        path: Output file
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+
+
+def load_results(path: Path) -> Dict[str, object]:
+    """
+    Read a results file.
+
+    Args:
+        path: File written by write_results
+
+    Returns:
+        Results dictionary
+    """
+    with open(path) as f:
+        return json.load(f)
+
+
+def format_results(results: Dict[str, object]) -> str:
+    """Human-readable table of results."""
+    lines = [f"{'benchmark':<40} {'time':>12} {'rate':>16} {'peak memory':>12}"]
+    for name, metrics in results["benchmarks"].items():
+        seconds = metrics["seconds"]
+        time_text = f"{seconds * 1000:.2f} ms" if seconds < 1 else f"{seconds:.2f} s"
+        if name.startswith(("simulate_season/", "enumerate_season/")):
+            rate_text = f"{metrics['operations_per_second']:,.0f} sims/s"
+        else:
+            rate_text = f"{metrics['operations_per_second']:,.1f} /s"
+        memory = metrics["peak_memory_bytes"] / 1024
+        memory_text = f"{memory / 1024:.1f} MB" if memory >= 1024 else f"{memory:.0f} KB"
+        lines.append(f"{name:<40} {time_text:>12} {rate_text:>16} {memory_text:>12}")
+
+    if results.get("sampling"):
+        lines.append("")
+        lines.append(
+            f"{'sampling':<40} {'std error':>12} {'cpu/run':>16} {'efficiency':>12}"
+        )
+        for method, metrics in results["sampling"].items():
+            lines.append(
+                f"{method:<40} {metrics['standard_error']:>12.5f} "
+                f"{metrics['cpu_seconds']:>14.3f} s {metrics['relative_efficiency']:>11.2f}x"
+            )
+
+    if results.get("exact"):
+        lines.append("")
+        lines.append(
+            f"{'exact vs sampler (same rows)':<40} {'exact':>12} {'sampler':>16} {'cost/row':>12}"
+        )
+        for remaining, metrics in results["exact"].items():
+            lines.append(
+                f"{remaining + ' games (' + format(metrics['rows'], ',') + ' rows)':<40} "
+                f"{metrics['exact_seconds']:>10.3f} s {metrics['sampler_seconds']:>14.3f} s "
+                f"{metrics['relative_cost']:>11.2f}x"
+            )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point.
+
+    Args:
+        argv: Arguments (default: sys.argv[1:])
+
+    Returns:
+        Exit status (1 if a regression against the baseline was found)
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the simulation pipeline")
+    parser.add_argument("--data-dir", type=Path, default=DEFAULT_DATA_DIR,
+                        help="Directory with schedule_2025.json and teams.json")
+    parser.add_argument("--simulations", type=int, default=DEFAULT_SIMULATIONS,
+                        help="Simulations per simulate_season call")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                        help="Timed repeats per benchmark (best is kept)")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS,
+                        help="Calls per repeat for standings and tiebreakers")
+    parser.add_argument("--states", nargs="+", choices=list(SEASON_STATES),
+                        default=list(SEASON_STATES), help="Season states to run")
+    parser.add_argument("--sampling-replicates", type=int,
+                        default=DEFAULT_SAMPLING_REPLICATES,
+                        help="Runs per sampling method for standard errors (0 skips)")
+    parser.add_argument("--exact-games", type=int, nargs="*", default=DEFAULT_EXACT_GAMES,
+                        help="Remaining-game counts to time enumeration against sampling")
+    parser.add_argument("--output", type=Path, help="Write results JSON here")
+    parser.add_argument("--baseline", type=Path, help="Compare against this results file")
+    parser.add_argument("--save-baseline", type=Path,
+                        help="Also write the results as a new baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed relative slowdown before flagging (default 0.25)")
+    args = parser.parse_args(argv)
+
+    # Simulation progress logging would swamp the report
+    logging.disable(logging.INFO)
+
+    cache_manager = CacheManager(args.data_dir)
+    games = cache_manager.load_schedule()
+    teams = cache_manager.load_teams()
+    if not games or not teams:
+        print(f"No schedule/teams data found in {args.data_dir}", file=sys.stderr)
+        return 2
+
+    results = run_benchmarks(
+        games,
+        teams,
+        num_simulations=args.simulations,
+        repeat=args.repeat,
+        iterations=args.iterations,
+        states={name: SEASON_STATES[name] for name in args.states},
+        sampling_replicates=args.sampling_replicates,
+        exact_games=args.exact_games,
+    )
+    print(format_results(results))
+
+    if args.output:
+        write_results(results, args.output)
+    if args.save_baseline:
+        write_results(results, args.save_baseline)
+
+    if args.baseline:
+        regressions = compare_results(results, load_results(args.baseline), args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) against {args.baseline}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"\nNo regressions against {args.baseline}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
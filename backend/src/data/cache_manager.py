@@ -1,10 +1,12 @@
 """
 Cache manager for storing and retrieving API data locally.
 
-Minimizes API calls by caching schedule, results, and teams data.
+Minimizes API calls by caching schedule, results, and teams data, and keeps
+finished simulation results so repeated runs can be served from disk.
 """
 
 import json
+import shutil
 import time
 from datetime import datetime
 from pathlib import Path
@@ -33,6 +35,8 @@ class CacheManager:
         self.results_cache = self.cache_dir / "results_current.json"
         self.teams_cache = self.cache_dir / "teams.json"
         self.overrides_cache = self.cache_dir / "user_overrides.json"
+        self.simulations_dir = self.cache_dir / "simulations"
+        self.outcomes_dir = self.cache_dir / "outcomes"
 
     # Schedule caching
     def save_schedule(self, games: list[Game], season: int = 2025) -> None:
@@ -227,6 +231,126 @@ class CacheManager:
             self.overrides_cache.unlink()
             self.logger.info("Cleared user overrides")
 
+    # Simulation results
+    def save_simulation_data(self, key: str, data: dict) -> None:
+        """
+        Save a serialized simulation result.
+
+        Results are (de)serialized by src.simulation.result_cache.
+
+        Args:
+            key: Cache key identifying the run (a hex digest)
+            data: JSON-serializable result
+        """
+        self.simulations_dir.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "saved_at": datetime.now().isoformat(),
+            "result": data,
+        }
+        self._write_json(self.simulations_dir / f"{key}.json", payload)
+        self.logger.debug(f"Saved simulation result {key[:12]}")
+
+    def load_simulation_data(
+        self, key: str, max_age_seconds: Optional[int] = None
+    ) -> Optional[dict]:
+        """
+        Load a saved, serialized simulation result.
+
+        Args:
+            key: Cache key identifying the run
+            max_age_seconds: Ignore results saved longer ago than this
+
+        Returns:
+            Serialized result, or None if not cached
+        """
+        filepath = self.simulations_dir / f"{key}.json"
+        if not filepath.exists():
+            return None
+        if max_age_seconds is not None and not self._is_cache_valid(
+            filepath, max_age_seconds
+        ):
+            return None
+
+        data = self._read_json(filepath)
+        if not data or "result" not in data:
+            return None
+        return data["result"]
+
+    def count_simulation_results(self) -> int:
+        """Number of simulation results saved on disk."""
+        if not self.simulations_dir.exists():
+            return 0
+        return sum(1 for _ in self.simulations_dir.glob("*.json"))
+
+    def prune_simulation_results(
+        self, max_results: int, max_age_seconds: Optional[int] = None
+    ) -> None:
+        """
+        Delete expired simulation results and the oldest beyond a limit.
+
+        Args:
+            max_results: Number of results to keep
+            max_age_seconds: Also delete results saved longer ago than this
+        """
+        if not self.simulations_dir.exists():
+            return
+        results = sorted(
+            self.simulations_dir.glob("*.json"), key=lambda path: path.stat().st_mtime
+        )
+        excess = len(results) - max_results
+        for index, path in enumerate(results):
+            if index < excess or (
+                max_age_seconds is not None and not self._is_cache_valid(path, max_age_seconds)
+            ):
+                path.unlink(missing_ok=True)
+
+    def clear_simulation_results(self) -> None:
+        """Delete all saved simulation results."""
+        if not self.simulations_dir.exists():
+            return
+        for f in self.simulations_dir.glob("*.json"):
+            f.unlink()
+        self.logger.info("Cleared cached simulation results")
+
+    # Per-simulation outcome stores
+    def outcome_store_path(self, store_id: str) -> Path:
+        """
+        Directory holding an outcome store.
+
+        Stores are written and read by src.simulation.outcome_store.
+
+        Args:
+            store_id: Identifier of the store (a file-name-safe string)
+
+        Returns:
+            Path of the store directory (which may not exist yet)
+        """
+        self.outcomes_dir.mkdir(parents=True, exist_ok=True)
+        return self.outcomes_dir / store_id
+
+    def prune_outcome_stores(self, max_stores: int) -> None:
+        """
+        Delete the oldest outcome stores beyond a limit.
+
+        Args:
+            max_stores: Number of stores to keep
+        """
+        if not self.outcomes_dir.exists():
+            return
+        stores = sorted(
+            (path for path in self.outcomes_dir.iterdir() if path.suffix != ".tmp"),
+            key=lambda path: path.stat().st_mtime,
+        )
+        for path in stores[:max(0, len(stores) - max_stores)]:
+            shutil.rmtree(path, ignore_errors=True)
+
+    def clear_outcome_stores(self) -> None:
+        """Delete all saved outcome stores."""
+        if not self.outcomes_dir.exists():
+            return
+        shutil.rmtree(self.outcomes_dir)
+        self.logger.info("Cleared outcome stores")
+
     # Utilities
     def get_last_schedule_update(self, season: int = 2025) -> Optional[datetime]:
         """
@@ -4,6 +4,7 @@ Data models for the NFL Monte Carlo simulation application.
 Defines core data structures for teams, games, and standings.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
@@ -135,7 +136,7 @@ class Game:
 
 
 
-@dataclass
+@dataclass(slots=True)
 class Standing:
     """Represents a team's standings information."""
 
@@ -161,9 +162,9 @@ class Standing:
     points_against: int = 0
 
     # Tiebreaker helpers (will be populated during calculation)
-    head_to_head_records: dict[str, tuple[int, int, int]] = field(
+    head_to_head_records: Mapping[str, tuple[int, int, int]] = field(
         default_factory=dict
-    )  # {team_id: (w, l, t)}
+    )  # {team_id: (w, l, t)}, a dict or a HeadToHeadMatrix view
     common_games_record: tuple[int, int, int] = (0, 0, 0)  # (w, l, t)
     strength_of_victory: float = 0.0
     strength_of_schedule: float = 0.0
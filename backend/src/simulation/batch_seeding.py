@@ -0,0 +1,392 @@
+"""
+Batched playoff seeding for Monte Carlo simulations.
+
+Most divisions and seed slots are settled by win percentage alone. This module
+ranks every simulation with NumPy, detects the (simulation, division) and
+(simulation, conference) cells that are genuinely tied, and runs the
+rule-by-rule tiebreakers only for those cells.
+
+Teams whose outcome clinch analysis has already decided (a clinched division
+or seed, or elimination from the playoffs) can be passed in as SeedingFacts.
+Their slots are filled directly, and they are left out of the rankings, tie
+detection and tied-cell resolution of the teams still in contention.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..data.models import Team, Game, Standing
+from ..utils.logger import setup_logger
+from .batch_standings import (
+    CONFERENCES,
+    BatchStandings,
+    SeasonBaseline,
+    create_simulation_games,
+    materialize_simulation_games,
+    standings_for_simulation,
+)
+from .profiling import stage
+from .scores import CompactOutcomes
+from .tiebreakers import (
+    break_division_tie_multi_teams,
+    seed_league,
+    track_score_rules,
+)
+
+logger = setup_logger(__name__)
+
+
+PLAYOFF_SEEDS_PER_CONFERENCE = 7
+DIVISION_WINNER_SEEDS = 4
+WILD_CARD_SEEDS = 3
+
+# Callback returning (standings_dict, games) for a simulation index
+SimulationResolver = Callable[[int], Tuple[Dict[str, Standing], List[Game]]]
+
+
+@dataclass
+class SeedingFacts:
+    """
+    Seeding results no remaining outcome can change (see clinch.seeding_facts).
+
+    Team indices refer to SeasonBaseline.team_ids; -1 marks an open slot.
+    """
+
+    division_winners: np.ndarray  # (num_divisions,) clinched winner or -1
+    seeds: np.ndarray  # (num_conferences × 7) team with a clinched seed or -1
+    eliminated: np.ndarray  # (num_teams,) bool, eliminated from the playoffs
+
+    @classmethod
+    def undecided(cls, baseline: SeasonBaseline) -> "SeedingFacts":
+        """Facts for a season in which nothing is decided yet."""
+        return cls(
+            division_winners=np.full(len(baseline.division_keys), -1, dtype=np.int64),
+            seeds=np.full(
+                (len(CONFERENCES), PLAYOFF_SEEDS_PER_CONFERENCE), -1, dtype=np.int64
+            ),
+            eliminated=np.zeros(baseline.num_teams, dtype=bool),
+        )
+
+    @property
+    def decided(self) -> np.ndarray:
+        """(num_teams,) bool: teams that are seeded or eliminated in every outcome."""
+        decided = self.eliminated.copy()
+        decided[self.seeds[self.seeds >= 0]] = True
+        return decided
+
+
+@dataclass
+class BatchSeeding:
+    """
+    Playoff seeding for many simulations, as team indices.
+
+    Team indices refer to SeasonBaseline.team_ids. Unfilled slots are -1.
+    """
+
+    division_winners: np.ndarray  # (num_simulations × num_divisions)
+    seeds: np.ndarray  # (num_simulations × num_conferences × 7)
+    tiebreak_cells: int = 0  # (simulation, group) cells resolved by tiebreakers
+    # (num_simulations,) bool: tiebreakers reached a points-based rule
+    score_dependent: Optional[np.ndarray] = None
+
+    @property
+    def num_simulations(self) -> int:
+        """Number of simulations (rows)."""
+        return self.division_winners.shape[0]
+
+
+def _has_adjacent_ties(sorted_pct: np.ndarray, num_positions: int) -> np.ndarray:
+    """
+    Flag rows where any of the first num_positions ranks is tied with its neighbour.
+
+    Args:
+        sorted_pct: (num_simulations × k) win percentages sorted descending
+        num_positions: Number of leading ranks that must be strictly ordered
+
+    Returns:
+        Boolean array (num_simulations,)
+    """
+    last = min(num_positions, sorted_pct.shape[1] - 1)
+    if last <= 0:
+        return np.zeros(sorted_pct.shape[0], dtype=bool)
+    return np.any(sorted_pct[:, :last] == sorted_pct[:, 1 : last + 1], axis=1)
+
+
+def seed_simulations_batch(
+    baseline: SeasonBaseline,
+    batch: BatchStandings,
+    teams: List[Team],
+    resolve_simulation: SimulationResolver,
+    facts: Optional[SeedingFacts] = None,
+) -> BatchSeeding:
+    """
+    Determine division winners and playoff seeds for every simulation.
+
+    Cells without a tie are decided by vectorized win-percentage ranking.
+    Tied cells are handed to the tiebreaker functions with the standings and
+    games returned by resolve_simulation, which is called at most once per
+    simulation and must return games in baseline.schedule_index order. A
+    conference containing a tied division is seeded with tiebreakers as a
+    whole, since its division winners are not yet known.
+
+    Clinched division winners and seeds in facts are copied into every
+    simulation. Only the open seed slots are ranked, among the teams that are
+    neither seeded nor eliminated; decided teams still count for tiebreakers
+    such as strength of victory, but never join a tie group.
+
+    Args:
+        baseline: Precomputed season structure
+        batch: Batch standings for the simulations
+        teams: List of all teams (same order as baseline.team_ids)
+        resolve_simulation: Callback building (standings_dict, games) for a simulation
+        facts: Optional clinched results for the season (default: none)
+
+    Returns:
+        BatchSeeding with per-simulation division winners and seeds
+    """
+    num_simulations = batch.num_simulations
+    team_ids = baseline.team_ids
+    pct = batch.win_percentage
+    sim_range = np.arange(num_simulations)
+    if facts is None:
+        facts = SeedingFacts.undecided(baseline)
+    decided = facts.decided
+    decided_ids = [team_ids[i] for i in np.flatnonzero(decided)]
+
+    # ------------------------------------------------------------------
+    # Division winners
+    # ------------------------------------------------------------------
+    num_divisions = len(baseline.division_keys)
+    division_members = [
+        np.flatnonzero(baseline.division_index == d) for d in range(num_divisions)
+    ]
+    division_winners = np.full((num_simulations, num_divisions), -1, dtype=np.int64)
+    division_tied = np.zeros((num_simulations, num_divisions), dtype=bool)
+
+    with stage("division_winners"):
+        for d, members in enumerate(division_members):
+            if facts.division_winners[d] >= 0:
+                # Clinched: the winner leads its division outright in every outcome
+                division_winners[:, d] = facts.division_winners[d]
+                continue
+            member_pct = pct[:, members]
+            best = member_pct.max(axis=1)
+            is_best = member_pct == best[:, None]
+            division_winners[:, d] = members[np.argmax(member_pct, axis=1)]
+            division_tied[:, d] = is_best.sum(axis=1) > 1
+
+    # Conference structure
+    conference_divisions = [
+        [
+            d
+            for d, key in enumerate(baseline.division_keys)
+            if key.startswith(f"{conference}_")
+        ]
+        for conference in CONFERENCES
+    ]
+    conference_members = [
+        np.flatnonzero(baseline.conference_index == c) for c in range(len(CONFERENCES))
+    ]
+
+    seeds = np.tile(facts.seeds, (num_simulations, 1, 1))
+
+    # Seed slots still open per conference, split into division-winner and
+    # wild-card slots (clinched seeds 1-4 always belong to division winners)
+    open_winner_slots: List[List[int]] = []
+    open_wild_card_slots: List[List[int]] = []
+    for c, divisions in enumerate(conference_divisions):
+        num_winner_seeds = min(len(divisions), DIVISION_WINNER_SEEDS)
+        num_wild_cards = min(
+            len(conference_members[c]) - len(divisions), WILD_CARD_SEEDS
+        )
+        open_slots = np.flatnonzero(facts.seeds[c] < 0)
+        open_winner_slots.append(
+            [slot for slot in open_slots.tolist() if slot < num_winner_seeds]
+        )
+        open_wild_card_slots.append(
+            [
+                slot for slot in open_slots.tolist()
+                if num_winner_seeds <= slot < num_winner_seeds + num_wild_cards
+            ]
+        )
+
+    def _winners_dict(sim_idx: int) -> Dict[str, str]:
+        return {
+            key: team_ids[division_winners[sim_idx, d]]
+            for d, key in enumerate(baseline.division_keys)
+        }
+
+    def _seed_conferences_python(
+        sim_idx: int,
+        conference_indices: List[int],
+        standings_dict: Dict[str, Standing],
+        games: List[Game],
+    ) -> None:
+        conferences = [CONFERENCES[c] for c in conference_indices]
+        try:
+            league = seed_league(
+                teams,
+                standings_dict,
+                games,
+                division_winners=_winners_dict(sim_idx),
+                schedule_index=baseline.schedule_index,
+                conferences=conferences,
+                excluded_team_ids=decided_ids,
+            )
+        except Exception as e:
+            logger.warning(f"Error in playoff seeding in sim {sim_idx}: {e}")
+            return
+
+        # Undecided teams fill the open slots in order
+        for c, conference in zip(conference_indices, conferences):
+            playoff_seeds = league.seeds.get(conference, [])
+            num_winners = len(playoff_seeds) - len(league.wild_cards.get(conference, []))
+            for slot, team_id in zip(open_winner_slots[c], playoff_seeds[:num_winners]):
+                seeds[sim_idx, c, slot] = baseline.team_index[team_id]
+            for slot, team_id in zip(open_wild_card_slots[c], playoff_seeds[num_winners:]):
+                seeds[sim_idx, c, slot] = baseline.team_index[team_id]
+
+    # ------------------------------------------------------------------
+    # Conference seeding (division winners are provisional where tied)
+    # ------------------------------------------------------------------
+    needs_tiebreak = np.zeros((num_simulations, len(CONFERENCES)), dtype=bool)
+
+    with stage("seeding"):
+        for c, divisions in enumerate(conference_divisions):
+            if not divisions:
+                continue
+
+            # Division winners without a clinched seed, ranked for the open slots
+            ranked_divisions = [
+                d for d in divisions
+                if facts.division_winners[d] < 0 or not decided[facts.division_winners[d]]
+            ]
+            winners = division_winners[:, ranked_divisions]
+            winner_pct = pct[sim_range[:, None], winners]
+            winner_order = np.argsort(-winner_pct, axis=1, kind="stable")
+            ranked_winners = np.take_along_axis(winners, winner_order, axis=1)
+            ranked_winner_pct = np.take_along_axis(winner_pct, winner_order, axis=1)
+
+            # Rank undecided non-winners (division winners pushed to the end)
+            candidates = conference_members[c][~decided[conference_members[c]]]
+            all_winners = division_winners[:, divisions]
+            candidate_pct = pct[:, candidates]
+            is_winner = (candidates[None, :, None] == all_winners[:, None, :]).any(axis=2)
+            masked_pct = np.where(is_winner, -np.inf, candidate_pct)
+            wild_card_order = np.argsort(-masked_pct, axis=1, kind="stable")
+            ranked_non_winners = candidates[wild_card_order]
+            ranked_non_winner_pct = np.take_along_axis(
+                masked_pct, wild_card_order, axis=1
+            )
+            # Every ranked division's winner is an undecided team
+            num_non_winners = len(candidates) - len(ranked_divisions)
+
+            needs_tiebreak[:, c] = (
+                division_tied[:, divisions].any(axis=1)
+                | _has_adjacent_ties(ranked_winner_pct, len(ranked_divisions))
+                | _has_adjacent_ties(
+                    ranked_non_winner_pct[:, :num_non_winners],
+                    len(open_wild_card_slots[c]),
+                )
+            )
+
+            clean = np.flatnonzero(~needs_tiebreak[:, c])
+            for rank, slot in enumerate(open_winner_slots[c]):
+                seeds[clean, c, slot] = ranked_winners[clean, rank]
+            for rank, slot in enumerate(open_wild_card_slots[c][:num_non_winners]):
+                seeds[clean, c, slot] = ranked_non_winners[clean, rank]
+
+    # ------------------------------------------------------------------
+    # Tied cells: one materialized simulation each, rule-by-rule tiebreakers
+    # ------------------------------------------------------------------
+    def _resolve_tied_simulation(sim_idx: int) -> int:
+        with stage("tied_standings"):
+            standings_dict, games = resolve_simulation(sim_idx)
+        cells = 0
+
+        with stage("division_tiebreakers"):
+            for d in np.flatnonzero(division_tied[sim_idx]).tolist():
+                members = division_members[d]
+                best = pct[sim_idx, members].max()
+                tied_for_first = [
+                    standings_dict[team_ids[m]]
+                    for m in members
+                    if pct[sim_idx, m] == best
+                ]
+                ordered = break_division_tie_multi_teams(
+                    tied_for_first,
+                    games,
+                    teams,
+                    standings_dict,
+                    baseline.schedule_index,
+                )
+                division_winners[sim_idx, d] = baseline.team_index[ordered[0]]
+                cells += 1
+
+        with stage("seeding_tiebreakers"):
+            tied_conferences = np.flatnonzero(needs_tiebreak[sim_idx]).tolist()
+            if tied_conferences:
+                # Both conferences share one set of resolved division winners
+                _seed_conferences_python(
+                    sim_idx, tied_conferences, standings_dict, games
+                )
+                cells += len(tied_conferences)
+
+        return cells
+
+    tiebreak_cells = 0
+    tied_sims = division_tied.any(axis=1) | needs_tiebreak.any(axis=1)
+    score_dependent = np.zeros(num_simulations, dtype=bool)
+
+    for sim_idx in np.flatnonzero(tied_sims).tolist():
+        with track_score_rules() as tracker:
+            tiebreak_cells += _resolve_tied_simulation(sim_idx)
+        score_dependent[sim_idx] = tracker.reached
+
+    return BatchSeeding(
+        division_winners=division_winners,
+        seeds=seeds,
+        tiebreak_cells=tiebreak_cells,
+        score_dependent=score_dependent,
+    )
+
+
+def seed_outcomes(
+    baseline: SeasonBaseline,
+    batch: BatchStandings,
+    teams: List[Team],
+    outcomes: CompactOutcomes,
+    simulation_games: Optional[List[Game]] = None,
+    facts: Optional[SeedingFacts] = None,
+) -> BatchSeeding:
+    """
+    Seed simulated outcomes, materializing tied simulations from their scores.
+
+    Args:
+        baseline: Precomputed season structure
+        batch: Batch standings computed from outcomes
+        teams: List of all teams (same order as baseline.team_ids)
+        outcomes: Compact outcomes for the remaining games
+        simulation_games: Optional reusable games from create_simulation_games
+        facts: Optional clinched results for the season (see SeedingFacts)
+
+    Returns:
+        BatchSeeding with per-simulation division winners and seeds
+    """
+    if simulation_games is None:
+        simulation_games = create_simulation_games(baseline)
+
+    # Tied cells are resolved with full tiebreakers on a materialized simulation,
+    # reusing the same game objects and just updating scores.
+    def resolve_simulation(sim_idx: int):
+        sim_games = materialize_simulation_games(
+            baseline, simulation_games, outcomes, sim_idx
+        )
+        standings_dict = standings_for_simulation(
+            baseline, batch, sim_idx, sim_games, outcomes
+        )
+        return standings_dict, sim_games
+
+    return seed_simulations_batch(baseline, batch, teams, resolve_simulation, facts)
@@ -0,0 +1,513 @@
+"""
+Batch standings engine for Monte Carlo simulations.
+
+Computes win-loss, division, conference and points records for every
+simulation at once using NumPy matrix operations. The results of games that
+are already decided are folded into a precomputed baseline, so each batch only
+has to process the remaining games.
+"""
+
+import hashlib
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from ..data.models import Team, Game, Standing
+from ..utils.logger import setup_logger
+from .schedule_index import ScheduleIndex
+from .scores import CompactOutcomes
+from .standings import (
+    HeadToHeadMatrix,
+    populate_head_to_head_records,
+    populate_strength_metrics,
+)
+
+logger = setup_logger(__name__)
+
+
+CONFERENCES = ["AFC", "NFC"]
+DIVISIONS = ["North", "South", "East", "West"]
+
+# Record fields tracked per team, in the order they are stored on BatchStandings
+RECORD_FIELDS = [
+    "wins",
+    "losses",
+    "ties",
+    "division_wins",
+    "division_losses",
+    "division_ties",
+    "conference_wins",
+    "conference_losses",
+    "conference_ties",
+    "points_for",
+    "points_against",
+]
+
+
+def _percentage(wins: np.ndarray, losses: np.ndarray, ties: np.ndarray) -> np.ndarray:
+    """Vectorized win percentage (ties count as 0.5 wins, 0.0 when no games)."""
+    total = wins + losses + ties
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct = (wins + 0.5 * ties) / total
+    return np.where(total == 0, 0.0, pct)
+
+
+@dataclass
+class BatchStandings:
+    """
+    Standings for many simulations stored as (num_simulations × num_teams) arrays.
+
+    Column order follows SeasonBaseline.team_ids.
+    """
+
+    wins: np.ndarray
+    losses: np.ndarray
+    ties: np.ndarray
+    division_wins: np.ndarray
+    division_losses: np.ndarray
+    division_ties: np.ndarray
+    conference_wins: np.ndarray
+    conference_losses: np.ndarray
+    conference_ties: np.ndarray
+    points_for: np.ndarray
+    points_against: np.ndarray
+
+    @property
+    def num_simulations(self) -> int:
+        """Number of simulations (rows)."""
+        return self.wins.shape[0]
+
+    @property
+    def win_percentage(self) -> np.ndarray:
+        """Win percentage per simulation and team (ties count as 0.5 wins)."""
+        return _percentage(self.wins, self.losses, self.ties)
+
+    @property
+    def division_win_percentage(self) -> np.ndarray:
+        """Division win percentage per simulation and team."""
+        return _percentage(
+            self.division_wins, self.division_losses, self.division_ties
+        )
+
+    @property
+    def conference_win_percentage(self) -> np.ndarray:
+        """Conference win percentage per simulation and team."""
+        return _percentage(
+            self.conference_wins, self.conference_losses, self.conference_ties
+        )
+
+    @property
+    def net_points(self) -> np.ndarray:
+        """Point differential per simulation and team."""
+        return self.points_for - self.points_against
+
+    def to_standings(self, sim_idx: int, team_ids: List[str]) -> Dict[str, Standing]:
+        """
+        Build Standing objects for a single simulation.
+
+        Only the record fields are filled in; tiebreaker helpers (head-to-head,
+        strength of victory/schedule) must be populated separately.
+
+        Args:
+            sim_idx: Simulation (row) index
+            team_ids: Team IDs in column order
+
+        Returns:
+            Dictionary mapping team_id to Standing object
+        """
+        # RECORD_FIELDS follow Standing's field order, so values pass positionally
+        columns = [getattr(self, name)[sim_idx].tolist() for name in RECORD_FIELDS]
+        return {
+            team_id: Standing(team_id, *values)
+            for team_id, values in zip(team_ids, zip(*columns))
+        }
+
+
+@dataclass
+class SeasonBaseline:
+    """
+    Season structure and decided-game records shared by every simulation.
+
+    Built once per run from the full schedule. Decided games (completed, or
+    overridden with both scores) are folded into the baseline records; the
+    remaining games are described by index arrays used to build incidence
+    matrices for the batch computation.
+    """
+
+    team_ids: List[str]
+    team_index: Dict[str, int]
+    conference_index: np.ndarray  # (num_teams,) index into CONFERENCES, -1 if unknown
+    division_index: np.ndarray  # (num_teams,) index into division_keys
+    division_keys: List[str]  # e.g. "AFC_North", ordered AFC then NFC
+    fixed_games: List[Game]  # decided games with effective results as real scores
+    remaining_games: List[Game]
+    home_index: np.ndarray  # (num_remaining,) team index of home team
+    away_index: np.ndarray  # (num_remaining,) team index of away team
+    is_division_game: np.ndarray  # (num_remaining,) bool
+    is_conference_game: np.ndarray  # (num_remaining,) bool
+    records: BatchStandings  # (1 × num_teams) records from fixed games
+    schedule_index: ScheduleIndex  # fixed_games + remaining_games, for tiebreakers
+    fixed_head_to_head: HeadToHeadMatrix  # head-to-head results of fixed games
+
+    @property
+    def num_teams(self) -> int:
+        """Number of teams."""
+        return len(self.team_ids)
+
+    @property
+    def num_remaining_games(self) -> int:
+        """Number of games left to simulate."""
+        return len(self.remaining_games)
+
+    @property
+    def fixed_signature(self) -> str:
+        """Digest of the decided games and their results (stable across processes)."""
+        digest = hashlib.sha1()
+        for game in self.fixed_games:
+            digest.update(f"{game.id}:{game.home_score}:{game.away_score};".encode())
+        return digest.hexdigest()
+
+
+def is_decided_game(game: Game) -> bool:
+    """
+    Check whether a game's result is fixed for simulation purposes.
+
+    Completed games are decided, as are upcoming games the user has
+    overridden with both scores.
+
+    Args:
+        game: Game to check
+
+    Returns:
+        True if the game should not be simulated
+    """
+    if game.is_completed:
+        return True
+    return (
+        game.is_overridden
+        and game.override_home_score is not None
+        and game.override_away_score is not None
+    )
+
+
+def _resolve_fixed_game(game: Game) -> Game:
+    """Return a completed copy of an overridden game with the override as its score."""
+    if not game.is_overridden:
+        return game
+
+    home_score, away_score = game.get_effective_scores()
+    return replace(
+        game,
+        is_completed=True,
+        home_score=home_score,
+        away_score=away_score,
+        is_overridden=False,
+        override_home_score=None,
+        override_away_score=None,
+    )
+
+
+def build_season_baseline(games: List[Game], teams: List[Team]) -> SeasonBaseline:
+    """
+    Precompute the season structure and decided-game records.
+
+    Args:
+        games: List of all games in the season
+        teams: List of all teams
+
+    Returns:
+        SeasonBaseline for use with calculate_batch_standings
+    """
+    team_ids = [team.id for team in teams]
+    team_index = {team_id: idx for idx, team_id in enumerate(team_ids)}
+    num_teams = len(teams)
+
+    conference_index = np.array(
+        [
+            CONFERENCES.index(t.conference) if t.conference in CONFERENCES else -1
+            for t in teams
+        ],
+        dtype=np.int64,
+    )
+
+    division_keys = []
+    for conference in CONFERENCES:
+        for division in DIVISIONS:
+            if any(t.conference == conference and t.division == division for t in teams):
+                division_keys.append(f"{conference}_{division}")
+    division_index = np.array(
+        [
+            division_keys.index(f"{t.conference}_{t.division}")
+            if f"{t.conference}_{t.division}" in division_keys
+            else -1
+            for t in teams
+        ],
+        dtype=np.int64,
+    )
+
+    fixed_games = []
+    remaining_games = []
+    for game in games:
+        if game.home_team_id not in team_index or game.away_team_id not in team_index:
+            logger.warning(
+                f"Game {game.id}: Missing team data "
+                f"(home: {game.home_team_id}, away: {game.away_team_id})"
+            )
+            continue
+        if is_decided_game(game):
+            fixed_games.append(_resolve_fixed_game(game))
+        else:
+            remaining_games.append(game)
+
+    home_index = np.array(
+        [team_index[g.home_team_id] for g in remaining_games], dtype=np.int64
+    )
+    away_index = np.array(
+        [team_index[g.away_team_id] for g in remaining_games], dtype=np.int64
+    )
+    is_division_game = (
+        (division_index[home_index] == division_index[away_index])
+        & (division_index[home_index] >= 0)
+    )
+    is_conference_game = (
+        (conference_index[home_index] == conference_index[away_index])
+        & (conference_index[home_index] >= 0)
+    )
+
+    # Fold decided games into the baseline records
+    records = {name: np.zeros((1, num_teams), dtype=np.int32) for name in RECORD_FIELDS}
+    for game in fixed_games:
+        home = team_index[game.home_team_id]
+        away = team_index[game.away_team_id]
+        same_division = (
+            division_index[home] == division_index[away] and division_index[home] >= 0
+        )
+        same_conference = (
+            conference_index[home] == conference_index[away]
+            and conference_index[home] >= 0
+        )
+
+        winner = game.get_winner()
+        if winner == "tie":
+            sides = [(home, "ties"), (away, "ties")]
+        elif winner == "home":
+            sides = [(home, "wins"), (away, "losses")]
+        else:
+            sides = [(home, "losses"), (away, "wins")]
+
+        for team, outcome in sides:
+            records[outcome][0, team] += 1
+            if same_division:
+                records[f"division_{outcome}"][0, team] += 1
+            if same_conference:
+                records[f"conference_{outcome}"][0, team] += 1
+
+        home_score, away_score = game.home_score, game.away_score
+        if home_score is not None and away_score is not None:
+            records["points_for"][0, home] += home_score
+            records["points_against"][0, home] += away_score
+            records["points_for"][0, away] += away_score
+            records["points_against"][0, away] += home_score
+
+    return SeasonBaseline(
+        team_ids=team_ids,
+        team_index=team_index,
+        conference_index=conference_index,
+        division_index=division_index,
+        division_keys=division_keys,
+        fixed_games=fixed_games,
+        remaining_games=remaining_games,
+        home_index=home_index,
+        away_index=away_index,
+        is_division_game=is_division_game,
+        is_conference_game=is_conference_game,
+        records=BatchStandings(**records),
+        schedule_index=ScheduleIndex(fixed_games + remaining_games, teams),
+        fixed_head_to_head=HeadToHeadMatrix.from_games(fixed_games, team_ids),
+    )
+
+
+def calculate_batch_standings(
+    baseline: SeasonBaseline,
+    outcomes: CompactOutcomes,
+) -> BatchStandings:
+    """
+    Calculate standings for every simulation at once.
+
+    Outcome columns follow baseline.remaining_games order. A game whose scores
+    are equal is counted as a tie regardless of its home-win flag.
+
+    Args:
+        baseline: Precomputed season structure and decided-game records
+        outcomes: Compact simulated outcomes for the remaining games
+
+    Returns:
+        BatchStandings with (num_simulations × num_teams) record arrays
+    """
+    num_simulations = outcomes.num_simulations
+    num_teams = baseline.num_teams
+
+    if baseline.num_remaining_games == 0:
+        return BatchStandings(
+            **{
+                name: np.repeat(getattr(baseline.records, name), num_simulations, axis=0)
+                for name in RECORD_FIELDS
+            }
+        )
+
+    # Incidence matrices (num_games × num_teams), stacked as [all | division | conference]
+    # so a single product yields overall, division and conference counts together.
+    game_range = np.arange(baseline.num_remaining_games)
+    home_onehot = np.zeros((baseline.num_remaining_games, num_teams), dtype=np.float32)
+    away_onehot = np.zeros((baseline.num_remaining_games, num_teams), dtype=np.float32)
+    home_onehot[game_range, baseline.home_index] = 1.0
+    away_onehot[game_range, baseline.away_index] = 1.0
+
+    division_mask = baseline.is_division_game[:, None]
+    conference_mask = baseline.is_conference_game[:, None]
+    home_stacked = np.hstack(
+        [home_onehot, home_onehot * division_mask, home_onehot * conference_mask]
+    )
+    away_stacked = np.hstack(
+        [away_onehot, away_onehot * division_mask, away_onehot * conference_mask]
+    )
+
+    home_wins = outcomes.home_wins
+    tie = outcomes.home_scores == outcomes.away_scores
+    home_won = home_wins & ~tie
+    away_won = ~home_wins & ~tie
+
+    home_won = home_won.astype(np.float32)
+    away_won = away_won.astype(np.float32)
+    tie = tie.astype(np.float32)
+
+    wins = home_won @ home_stacked + away_won @ away_stacked
+    losses = away_won @ home_stacked + home_won @ away_stacked
+    ties = tie @ (home_stacked + away_stacked)
+
+    home_scores = outcomes.home_scores.astype(np.float32)
+    away_scores = outcomes.away_scores.astype(np.float32)
+    points_for = home_scores @ home_onehot + away_scores @ away_onehot
+    points_against = away_scores @ home_onehot + home_scores @ away_onehot
+
+    def _split(stacked: np.ndarray) -> List[np.ndarray]:
+        return [
+            stacked[:, part * num_teams : (part + 1) * num_teams].astype(np.int32)
+            for part in range(3)
+        ]
+
+    wins_all, wins_div, wins_conf = _split(wins)
+    losses_all, losses_div, losses_conf = _split(losses)
+    ties_all, ties_div, ties_conf = _split(ties)
+
+    computed = {
+        "wins": wins_all,
+        "losses": losses_all,
+        "ties": ties_all,
+        "division_wins": wins_div,
+        "division_losses": losses_div,
+        "division_ties": ties_div,
+        "conference_wins": wins_conf,
+        "conference_losses": losses_conf,
+        "conference_ties": ties_conf,
+        "points_for": points_for.astype(np.int32),
+        "points_against": points_against.astype(np.int32),
+    }
+
+    return BatchStandings(
+        **{
+            name: computed[name] + getattr(baseline.records, name)
+            for name in RECORD_FIELDS
+        }
+    )
+
+
+def create_simulation_games(baseline: SeasonBaseline) -> List[Game]:
+    """
+    Create reusable copies of the remaining games for materializing simulations.
+
+    The copies are marked completed so that standings and tiebreaker code
+    treats their simulated scores as results.
+
+    Args:
+        baseline: Precomputed season structure
+
+    Returns:
+        List of Game copies in baseline.remaining_games order
+    """
+    return [
+        replace(
+            game,
+            is_completed=True,
+            is_overridden=False,
+            override_home_score=None,
+            override_away_score=None,
+        )
+        for game in baseline.remaining_games
+    ]
+
+
+def materialize_simulation_games(
+    baseline: SeasonBaseline,
+    simulation_games: List[Game],
+    outcomes: CompactOutcomes,
+    sim_idx: int,
+) -> List[Game]:
+    """
+    Apply one simulation's scores and return the full list of games.
+
+    Args:
+        baseline: Precomputed season structure
+        simulation_games: Reusable copies from create_simulation_games (modified in place)
+        outcomes: Compact simulated outcomes for the remaining games
+        sim_idx: Simulation (row) index in outcomes
+
+    Returns:
+        Decided games followed by the simulated games
+    """
+    for game, home_score, away_score in zip(
+        simulation_games,
+        outcomes.home_scores[sim_idx].tolist(),
+        outcomes.away_scores[sim_idx].tolist(),
+    ):
+        game.home_score = home_score
+        game.away_score = away_score
+
+    return baseline.fixed_games + simulation_games
+
+
+def standings_for_simulation(
+    baseline: SeasonBaseline,
+    batch: BatchStandings,
+    sim_idx: int,
+    sim_games: List[Game],
+    outcomes: Optional[CompactOutcomes] = None,
+) -> Dict[str, Standing]:
+    """
+    Build full Standing objects (including tiebreaker helpers) for one simulation.
+
+    Args:
+        baseline: Precomputed season structure
+        batch: Batch standings containing the simulation
+        sim_idx: Simulation (row) index in the batch
+        sim_games: Materialized games for this simulation
+        outcomes: Optional outcomes the batch was computed from; head-to-head
+            results are then taken from their arrays instead of sim_games
+
+    Returns:
+        Dictionary mapping team_id to Standing object
+    """
+    standings = batch.to_standings(sim_idx, baseline.team_ids)
+    if outcomes is not None:
+        matrix = baseline.fixed_head_to_head.with_results(
+            baseline.home_index,
+            baseline.away_index,
+            outcomes.home_scores[sim_idx],
+            outcomes.away_scores[sim_idx],
+        )
+    else:
+        matrix = HeadToHeadMatrix.from_games(sim_games, baseline.team_ids)
+    populate_head_to_head_records(standings, sim_games, matrix)
+    populate_strength_metrics(standings, sim_games, matrix)
+    return standings
@@ -0,0 +1,243 @@
+"""
+Clinch and elimination analysis.
+
+Every team's final win percentage lies between its worst case (losing all
+remaining games) and its best case (winning them all). Comparing those bounds
+across teams shows which results no remaining outcome can change: a team
+whose worst case beats a rival's best case finishes ahead of that rival in
+every simulation, without needing a tiebreaker.
+
+The analysis is deliberately conservative. Situations that would need a
+tiebreaker, or reasoning about which team wins a game two contenders play
+against each other, are treated as still open.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..data.models import Game, Team
+from .batch_seeding import PLAYOFF_SEEDS_PER_CONFERENCE, WILD_CARD_SEEDS, SeedingFacts
+from .batch_standings import CONFERENCES, SeasonBaseline, build_season_baseline
+
+
+@dataclass
+class ClinchStatus:
+    """What a team has clinched or been eliminated from."""
+
+    team_id: str
+    clinched_division: bool = False
+    clinched_playoffs: bool = False
+    eliminated_division: bool = False
+    eliminated_playoffs: bool = False
+    best_seed: Optional[int] = None  # None when eliminated from the playoffs
+    worst_seed: Optional[int] = None  # None unless a playoff spot is clinched
+
+    @property
+    def clinched_seed(self) -> Optional[int]:
+        """Seed the team is guaranteed, if it can only finish in one."""
+        if self.worst_seed is not None and self.best_seed == self.worst_seed:
+            return self.best_seed
+        return None
+
+    @property
+    def clinched_first_seed(self) -> bool:
+        """Whether the team has clinched the top seed (and the bye)."""
+        return self.clinched_seed == 1
+
+    @property
+    def eliminated_first_seed(self) -> bool:
+        """Whether the team can no longer finish as the top seed."""
+        return self.best_seed is None or self.best_seed > 1
+
+    def to_dict(self) -> Dict[str, object]:
+        """Serialize for API responses."""
+        return {
+            "clinched_division": self.clinched_division,
+            "clinched_playoffs": self.clinched_playoffs,
+            "clinched_first_seed": self.clinched_first_seed,
+            "clinched_seed": self.clinched_seed,
+            "eliminated_division": self.eliminated_division,
+            "eliminated_playoffs": self.eliminated_playoffs,
+            "eliminated_first_seed": self.eliminated_first_seed,
+            "best_seed": self.best_seed,
+            "worst_seed": self.worst_seed,
+        }
+
+
+def win_percentage_bounds(baseline: SeasonBaseline) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Lowest and highest final win percentage each team can reach.
+
+    Args:
+        baseline: Season structure with decided-game records
+
+    Returns:
+        Tuple of (worst, best) arrays indexed like baseline.team_ids
+    """
+    records = baseline.records
+    wins = records.wins[0].astype(np.float64)
+    losses = records.losses[0].astype(np.float64)
+    ties = records.ties[0].astype(np.float64)
+    remaining = np.bincount(
+        baseline.home_index, minlength=baseline.num_teams
+    ) + np.bincount(baseline.away_index, minlength=baseline.num_teams)
+
+    total = wins + losses + ties + remaining
+    with np.errstate(divide="ignore", invalid="ignore"):
+        worst = np.where(total > 0, (wins + 0.5 * ties) / total, 0.0)
+        best = np.where(total > 0, (wins + remaining + 0.5 * ties) / total, 0.0)
+    return worst, best
+
+
+def analyze_clinching(baseline: SeasonBaseline) -> List[ClinchStatus]:
+    """
+    Determine clinched and eliminated results from best/worst-case bounds.
+
+    Args:
+        baseline: Season structure with decided-game records
+
+    Returns:
+        ClinchStatus per team, in baseline.team_ids order
+    """
+    worst, best = win_percentage_bounds(baseline)
+    team_ids = baseline.team_ids
+    statuses = [ClinchStatus(team_id=team_id) for team_id in team_ids]
+
+    for c in range(len(CONFERENCES)):
+        members = np.flatnonzero(baseline.conference_index == c)
+        divisions = sorted({int(d) for d in baseline.division_index[members] if d >= 0})
+        if not divisions:
+            continue
+
+        division_members = {
+            d: members[baseline.division_index[members] == d] for d in divisions
+        }
+        # The division winner's percentage is at least the best worst case
+        winner_floor = {d: worst[m].max() for d, m in division_members.items()}
+        winner_ceiling = {d: best[m].max() for d, m in division_members.items()}
+
+        num_winner_seeds = len(divisions)
+        num_wild_cards = min(len(members) - len(divisions), WILD_CARD_SEEDS)
+        last_seed = min(num_winner_seeds + num_wild_cards, PLAYOFF_SEEDS_PER_CONFERENCE)
+
+        for i in members:
+            status = statuses[i]
+            own = int(baseline.division_index[i])
+            if own < 0:
+                continue
+            rivals = division_members[own][division_members[own] != i]
+            others = [d for d in divisions if d != own]
+
+            status.eliminated_division = bool(np.any(worst[rivals] > best[i]))
+            status.clinched_division = bool(np.all(worst[i] > best[rivals]))
+
+            # Conference teams certainly ahead of / possibly level with team i
+            ahead = members[(members != i) & (worst[members] > best[i])]
+            level = members[(members != i) & (best[members] >= worst[i])]
+
+            # Best case: as division winner, or else as the top possible wild card
+            if not status.eliminated_division:
+                status.best_seed = 1 + sum(winner_floor[d] > best[i] for d in others)
+            else:
+                # Each division supplies at most one winner among those ahead
+                non_winners_ahead = len(ahead) - len(
+                    {int(baseline.division_index[j]) for j in ahead}
+                )
+                best_wild_card = num_winner_seeds + 1 + non_winners_ahead
+                if best_wild_card <= last_seed:
+                    status.best_seed = best_wild_card
+                else:
+                    status.eliminated_playoffs = True
+
+            # Worst case as a wild card: non-winners that may finish level or ahead.
+            # If team i does not win its division, that division's winner is one of them.
+            possible_non_winners = max(
+                int(np.sum(baseline.division_index[level] == own)) - 1, 0
+            ) + sum(
+                min(
+                    int(np.sum(baseline.division_index[level] == d)),
+                    len(division_members[d]) - 1,
+                )
+                for d in others
+            )
+            worst_as_winner = 1 + sum(winner_ceiling[d] >= worst[i] for d in others)
+            worst_as_wild_card = num_winner_seeds + 1 + possible_non_winners
+
+            if status.clinched_division:
+                status.clinched_playoffs = True
+                status.worst_seed = worst_as_winner
+            elif worst_as_wild_card <= last_seed:
+                status.clinched_playoffs = True
+                status.worst_seed = worst_as_wild_card
+
+    return statuses
+
+
+def clinch_statuses(games: List[Game], teams: List[Team]) -> Dict[str, ClinchStatus]:
+    """
+    Clinch and elimination status for every team.
+
+    Args:
+        games: List of all games in the season
+        teams: List of all teams
+
+    Returns:
+        Dictionary mapping team_id to ClinchStatus
+    """
+    baseline = build_season_baseline(games, teams)
+    return {status.team_id: status for status in analyze_clinching(baseline)}
+
+
+def seeding_facts(baseline: SeasonBaseline, statuses: List[ClinchStatus]) -> SeedingFacts:
+    """
+    Clinched division winners and seeds, and eliminated teams, for batch seeding.
+
+    Args:
+        baseline: Season structure with decided-game records
+        statuses: Output of analyze_clinching for the baseline
+
+    Returns:
+        SeedingFacts with team indices of baseline.team_ids
+    """
+    facts = SeedingFacts.undecided(baseline)
+    for idx, status in enumerate(statuses):
+        if status.clinched_division:
+            facts.division_winners[baseline.division_index[idx]] = idx
+        if status.clinched_seed is not None:
+            facts.seeds[baseline.conference_index[idx], status.clinched_seed - 1] = idx
+        facts.eliminated[idx] = status.eliminated_playoffs
+    return facts
+
+
+def settled_seeding(
+    baseline: SeasonBaseline, statuses: List[ClinchStatus]
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Division winners and seeds, if no remaining outcome can change them.
+
+    Args:
+        baseline: Season structure with decided-game records
+        statuses: Output of analyze_clinching for the baseline
+
+    Returns:
+        Tuple of (division_winners (num_divisions,), seeds (num_conferences × 7))
+        as team indices with -1 for unfilled seeds, or None if anything is open
+    """
+    facts = seeding_facts(baseline, statuses)
+    # Every team must be seeded or out, and every division decided
+    if not np.all(facts.decided) or np.any(facts.division_winners < 0):
+        return None
+
+    for c in range(len(CONFERENCES)):
+        members = np.flatnonzero(baseline.conference_index == c)
+        num_divisions = len({int(d) for d in baseline.division_index[members] if d >= 0})
+        num_slots = min(
+            num_divisions + min(len(members) - num_divisions, WILD_CARD_SEEDS),
+            PLAYOFF_SEEDS_PER_CONFERENCE,
+        )
+        if np.any(facts.seeds[c, :num_slots] < 0):
+            return None
+
+    return facts.division_winners, facts.seeds
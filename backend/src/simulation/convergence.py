@@ -0,0 +1,261 @@
+"""
+Convergence-based early stopping for simulation runs.
+
+An adaptive run treats num_simulations as a ceiling. After every batch the
+monitor computes a confidence interval for each team's playoff, division and
+per-seed probability and stops the run once every interval is within the
+requested tolerance, or once the time budget is spent. Intervals use the
+Agresti-Coull adjustment, so estimates of 0% or 100% still have a non-zero
+width and a run cannot "converge" on a handful of simulations.
+
+The achieved intervals are returned on the result as a ConvergenceReport.
+"""
+
+import time
+from dataclasses import dataclass, field
+from statistics import NormalDist
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..utils.logger import setup_logger
+
+if TYPE_CHECKING:
+    from .monte_carlo import TeamSimulationStats
+
+logger = setup_logger(__name__)
+
+
+# Largest accepted half-width of any probability's interval (±1 point)
+DEFAULT_TOLERANCE = 0.01
+DEFAULT_CONFIDENCE = 0.95
+# Simulations run before convergence is first checked
+DEFAULT_MIN_SIMULATIONS = 1000
+# Simulations between convergence checks
+DEFAULT_BATCH_SIZE = 2000
+
+# Probabilities tracked for every team, in count-matrix column order
+TRACKED_PROBABILITIES = ("playoff", "division") + tuple(f"seed_{seed}" for seed in range(1, 8))
+
+STOP_TOLERANCE = "tolerance"
+STOP_TIME_BUDGET = "time_budget"
+STOP_MAX_SIMULATIONS = "max_simulations"
+
+
+@dataclass
+class ConvergenceCriteria:
+    """When an adaptive run may stop."""
+
+    tolerance: float = DEFAULT_TOLERANCE
+    confidence: float = DEFAULT_CONFIDENCE
+    # Wall-clock seconds after which the run stops unconverged (None: no limit)
+    time_budget_seconds: Optional[float] = None
+    min_simulations: int = DEFAULT_MIN_SIMULATIONS
+    batch_size: int = DEFAULT_BATCH_SIZE
+
+    def __post_init__(self):
+        if not 0.0 < self.tolerance < 0.5:
+            raise ValueError("tolerance must be between 0 and 0.5")
+        if not 0.0 < self.confidence < 1.0:
+            raise ValueError("confidence must be between 0 and 1")
+        if self.time_budget_seconds is not None and self.time_budget_seconds <= 0:
+            raise ValueError("time_budget_seconds must be positive")
+        if self.min_simulations < 1:
+            raise ValueError("min_simulations must be at least 1")
+        if self.batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+
+    @property
+    def z(self) -> float:
+        """Two-sided normal quantile for the confidence level."""
+        return NormalDist().inv_cdf((1.0 + self.confidence) / 2.0)
+
+    @property
+    def is_reproducible(self) -> bool:
+        """True if a seeded run always stops at the same point (no time budget)."""
+        return self.time_budget_seconds is None
+
+    def to_dict(self) -> Dict[str, object]:
+        """Serialize for API payloads and cache keys."""
+        return {
+            "tolerance": self.tolerance,
+            "confidence": self.confidence,
+            "time_budget_seconds": self.time_budget_seconds,
+            "min_simulations": self.min_simulations,
+            "batch_size": self.batch_size,
+        }
+
+
+def probability_intervals(
+    counts: np.ndarray, num_simulations: int, z: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Agresti-Coull confidence intervals for binomial proportions.
+
+    Args:
+        counts: Successes (any shape)
+        num_simulations: Trials behind every count
+        z: Normal quantile of the confidence level
+
+    Returns:
+        Tuple of (lower, upper) arrays shaped like counts, clipped to [0, 1]
+    """
+    centre, half_width = _adjusted_estimates(counts, num_simulations, z)
+    return np.clip(centre - half_width, 0.0, 1.0), np.clip(centre + half_width, 0.0, 1.0)
+
+
+def _adjusted_estimates(
+    counts: np.ndarray, num_simulations: int, z: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    # Add z²/2 successes and failures before estimating, then use the Wald width
+    adjusted_n = num_simulations + z * z
+    centre = (np.asarray(counts, dtype=np.float64) + z * z / 2.0) / adjusted_n
+    return centre, z * np.sqrt(centre * (1.0 - centre) / adjusted_n)
+
+
+def _count_matrix(team_stats: Dict[str, "TeamSimulationStats"]) -> Tuple[List[str], np.ndarray]:
+    team_ids = list(team_stats)
+    counts = np.array(
+        [
+            [stats.made_playoffs_count, stats.won_division_count]
+            + [stats.seed_counts.get(seed, 0) for seed in range(1, 8)]
+            for stats in team_stats.values()
+        ],
+        dtype=np.int64,
+    ).reshape(len(team_ids), len(TRACKED_PROBABILITIES))
+    return team_ids, counts
+
+
+def max_half_width(
+    team_stats: Dict[str, "TeamSimulationStats"], num_simulations: int, z: float
+) -> float:
+    """
+    Widest interval half-width over every team's tracked probabilities.
+
+    Args:
+        team_stats: Running statistics by team ID
+        num_simulations: Simulations aggregated into team_stats
+        z: Normal quantile of the confidence level
+
+    Returns:
+        Largest half-width (1.0 before any simulations)
+    """
+    if num_simulations <= 0 or not team_stats:
+        return 1.0
+    _, counts = _count_matrix(team_stats)
+    _, half_width = _adjusted_estimates(counts, num_simulations, z)
+    return float(np.max(half_width))
+
+
+@dataclass
+class ConvergenceReport:
+    """How an adaptive run ended and the intervals it achieved."""
+
+    converged: bool
+    stop_reason: str  # tolerance, time_budget or max_simulations
+    num_simulations: int
+    confidence: float
+    tolerance: float
+    max_half_width: float
+    # Team ID -> tracked probability name -> (lower, upper)
+    intervals: Dict[str, Dict[str, Tuple[float, float]]] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, object]:
+        """Serialize for API responses."""
+        return {
+            "converged": self.converged,
+            "stop_reason": self.stop_reason,
+            "num_simulations": self.num_simulations,
+            "confidence": self.confidence,
+            "tolerance": self.tolerance,
+            "max_half_width": self.max_half_width,
+            "intervals": {
+                team_id: {name: list(bounds) for name, bounds in team.items()}
+                for team_id, team in self.intervals.items()
+            },
+        }
+
+
+class ConvergenceMonitor:
+    """
+    Decides after each batch whether an adaptive run can stop.
+
+    Args:
+        criteria: Stopping criteria
+        max_simulations: Simulations the run stops at regardless
+    """
+
+    def __init__(self, criteria: ConvergenceCriteria, max_simulations: int):
+        self.criteria = criteria
+        self.max_simulations = max_simulations
+        self.num_simulations = 0
+        self.stop_reason = STOP_MAX_SIMULATIONS
+        self.converged = False
+        self._z = criteria.z
+        self._started = time.monotonic()
+
+    def should_stop(
+        self, team_stats: Dict[str, "TeamSimulationStats"], num_simulations: int
+    ) -> bool:
+        """
+        Check the running statistics after a batch.
+
+        Args:
+            team_stats: Statistics of every simulation so far
+            num_simulations: Simulations aggregated into team_stats
+
+        Returns:
+            True if the run should end now
+        """
+        self.num_simulations = num_simulations
+        if num_simulations >= self.criteria.min_simulations:
+            width = max_half_width(team_stats, num_simulations, self._z)
+            if width <= self.criteria.tolerance:
+                self.converged = True
+                self.stop_reason = STOP_TOLERANCE
+                logger.info(
+                    "Converged to ±%.4f after %s simulations", width, f"{num_simulations:,}"
+                )
+                return True
+
+        budget = self.criteria.time_budget_seconds
+        if budget is not None and time.monotonic() - self._started >= budget:
+            self.stop_reason = STOP_TIME_BUDGET
+            logger.info(
+                "Time budget of %.1fs spent after %s simulations",
+                budget,
+                f"{num_simulations:,}",
+            )
+            return True
+
+        return num_simulations >= self.max_simulations
+
+    def report(self, team_stats: Dict[str, "TeamSimulationStats"]) -> ConvergenceReport:
+        """
+        Summarize the run with the intervals it achieved.
+
+        Args:
+            team_stats: Final statistics of the run
+
+        Returns:
+            ConvergenceReport
+        """
+        intervals: Dict[str, Dict[str, Tuple[float, float]]] = {}
+        if team_stats and self.num_simulations > 0:
+            team_ids, counts = _count_matrix(team_stats)
+            lower, upper = probability_intervals(counts, self.num_simulations, self._z)
+            for row, team_id in enumerate(team_ids):
+                intervals[team_id] = {
+                    name: (float(lower[row, col]), float(upper[row, col]))
+                    for col, name in enumerate(TRACKED_PROBABILITIES)
+                }
+
+        return ConvergenceReport(
+            converged=self.converged,
+            stop_reason=self.stop_reason,
+            num_simulations=self.num_simulations,
+            confidence=self.criteria.confidence,
+            tolerance=self.criteria.tolerance,
+            max_half_width=max_half_width(team_stats, self.num_simulations, self._z),
+            intervals=intervals,
+        )
@@ -0,0 +1,335 @@
+"""
+Exact enumeration of the remaining season.
+
+Under the 50/50 model every combination of remaining results is equally
+likely, so once few games are left it is cheaper to visit each combination
+once than to sample. Outcome k of N remaining games sets game j to a home win
+when bit j of k is set. Outcomes are generated block by block and pushed
+through the same batch standings, seeding and tiebreaker pipeline as the
+sampler, so counts divided by 2**N are exact probabilities.
+
+Enumerated games get representative scores (EXACT_WINNER_SCORE to
+EXACT_LOSER_SCORE). Only the points-based tiebreakers look at scores; ties
+that reach them are settled with those scores or a seeded coin toss, the same
+rules the sampler applies. Such outcomes are counted on the result
+(score_dependent_simulations), and its probabilities are only reported as
+exact when there are none.
+
+A pruned enumeration fixes every remaining game between two teams that are
+already seeded or eliminated (see clinch.py) to a home win, since no result
+of such a game changes any seed. Each enumerated row then stands for all
+2**pruned results of those games: counters are scaled accordingly and the
+win histograms of the teams involved are spread binomially over their
+pruned games. Strength of victory and schedule read opponents' records,
+which the pruned games change, so outcomes whose tiebreakers reach them
+count as score-dependent. Games cannot be split into independent groups
+instead: seeding couples every team of a conference, and strength of
+victory and schedule couple the conferences.
+"""
+
+import time
+from collections import Counter
+from contextlib import nullcontext
+from dataclasses import replace
+from math import comb
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from ..data.models import Game, Team
+from ..utils.logger import setup_logger
+from .batch_standings import SeasonBaseline, build_season_baseline, is_decided_game
+from .clinch import analyze_clinching, seeding_facts
+from .monte_carlo import (
+    DEFAULT_CHUNK_SIZE,
+    WIN_HISTOGRAM_BINS,
+    OutcomeSink,
+    SimulationResult,
+    run_outcome_blocks,
+)
+from .profiling import profile_simulation, stage
+from .rng import simulation_streams, tiebreak_stream
+from .scores import CompactOutcomes
+from .tiebreakers import representative_results
+
+logger = setup_logger(__name__)
+
+
+# Largest number of remaining games enumerated automatically (2**16 outcomes).
+# An enumerated row costs 0.85-1.08x a sampled one at 8-16 remaining games
+# (benchmarks/run.py --exact-games), so enumeration is used whenever it needs
+# no more rows than the sampler; the cap is the largest count benchmarked
+# (about 23 s on one core).
+DEFAULT_EXACT_MAX_GAMES = 16
+
+# Representative final score of every enumerated game
+EXACT_WINNER_SCORE = 27
+EXACT_LOSER_SCORE = 20
+
+
+def count_outcomes(num_games: int) -> int:
+    """Number of win/loss combinations of num_games games."""
+    return 1 << num_games
+
+
+def count_remaining_games(games: List[Game], teams: List[Team]) -> int:
+    """
+    Number of games a run would simulate.
+
+    Args:
+        games: List of all games in the season
+        teams: List of all teams
+
+    Returns:
+        Count of undecided games between known teams
+    """
+    team_ids = {team.id for team in teams}
+    return sum(
+        1
+        for game in games
+        if game.home_team_id in team_ids
+        and game.away_team_id in team_ids
+        and not is_decided_game(game)
+    )
+
+
+def prunable_games(baseline: SeasonBaseline) -> np.ndarray:
+    """
+    Remaining games whose result cannot change any seed.
+
+    Args:
+        baseline: Season baseline of the run
+
+    Returns:
+        (num_remaining,) bool mask of games between two teams that are
+        seeded or eliminated in every outcome
+    """
+    decided = seeding_facts(baseline, analyze_clinching(baseline)).decided
+    return decided[baseline.home_index] & decided[baseline.away_index]
+
+
+def count_enumerated_games(games: List[Game], teams: List[Team]) -> int:
+    """
+    Number of games a pruned enumeration visits (see prunable_games).
+
+    Args:
+        games: List of all games in the season
+        teams: List of all teams
+
+    Returns:
+        Count of remaining games that are not pruned
+    """
+    baseline = build_season_baseline(games, teams)
+    return baseline.num_remaining_games - int(np.count_nonzero(prunable_games(baseline)))
+
+
+def _fix_pruned_games(games: List[Game], pruned: List[Game]) -> List[Game]:
+    """Copy of the schedule with the pruned games completed as home wins."""
+    pruned_ids = {game.id for game in pruned}
+    return [
+        replace(
+            game,
+            is_completed=True,
+            is_overridden=False,
+            home_score=EXACT_WINNER_SCORE,
+            away_score=EXACT_LOSER_SCORE,
+        )
+        if game.id in pruned_ids
+        else game
+        for game in games
+    ]
+
+
+def _expand_pruned_games(result: SimulationResult, pruned: List[Game]) -> None:
+    """Scale a pruned enumeration to every result of its pruned games, in place."""
+    factor = count_outcomes(len(pruned))
+    played = Counter()
+    home_wins = Counter()
+    for game in pruned:
+        played[game.home_team_id] += 1
+        played[game.away_team_id] += 1
+        home_wins[game.home_team_id] += 1
+
+    for team_id, stats in result.team_stats.items():
+        stats.made_playoffs_count *= factor
+        stats.won_division_count *= factor
+        stats.first_seed_count *= factor
+        stats.seed_counts = {seed: count * factor for seed, count in stats.seed_counts.items()}
+        stats.total_simulations *= factor
+
+        # Undo the representative home wins, then spread each row over the
+        # C(n, j) ways to win j of the team's n pruned games
+        num_played = played[team_id]
+        shift = 2 * home_wins[team_id]
+        base = np.zeros_like(stats.wins_histogram)
+        base[: WIN_HISTOGRAM_BINS - shift] = stats.wins_histogram[shift:]
+        spread = np.zeros(2 * num_played + 1, dtype=np.int64)
+        spread[::2] = [comb(num_played, wins) for wins in range(num_played + 1)]
+        stats.wins_histogram = (
+            np.convolve(base, spread)[:WIN_HISTOGRAM_BINS] * (factor >> num_played)
+        )
+
+    result.num_simulations *= factor
+    result.score_dependent_simulations *= factor
+
+
+def use_exact_enumeration(
+    num_remaining_games: int,
+    num_simulations: int,
+    max_games: int = DEFAULT_EXACT_MAX_GAMES,
+) -> bool:
+    """
+    Decide whether enumerating beats sampling for a requested run.
+
+    Enumeration is used when it needs no more outcome rows than the sampler
+    would simulate, and the enumerated game count is within max_games.
+
+    Args:
+        num_remaining_games: Games an enumeration would visit (games left to
+            play, less any pruned; see count_enumerated_games)
+        num_simulations: Simulations the caller asked for
+        max_games: Upper limit on enumerated games (0 disables enumeration)
+
+    Returns:
+        True if the season should be enumerated exactly
+    """
+    return (
+        num_remaining_games <= max_games
+        and count_outcomes(num_remaining_games) <= num_simulations
+    )
+
+
+def enumerate_outcomes(num_games: int, start: int, stop: int) -> CompactOutcomes:
+    """
+    Outcomes start..stop-1 of the full enumeration of num_games games.
+
+    Args:
+        num_games: Number of remaining games
+        start: First outcome index
+        stop: One past the last outcome index
+
+    Returns:
+        CompactOutcomes with one row per outcome index
+    """
+    index = np.arange(start, stop, dtype=np.uint64)
+    shifts = np.arange(num_games, dtype=np.uint64)
+    home_wins = ((index[:, None] >> shifts[None, :]) & np.uint64(1)).astype(bool)
+
+    home_scores = np.where(home_wins, EXACT_WINNER_SCORE, EXACT_LOSER_SCORE)
+    away_scores = np.where(home_wins, EXACT_LOSER_SCORE, EXACT_WINNER_SCORE)
+    return CompactOutcomes.from_arrays(home_wins, home_scores, away_scores)
+
+
+def enumerate_season(
+    games: List[Game],
+    teams: List[Team],
+    start: int = 0,
+    stop: Optional[int] = None,
+    random_seed: Optional[int] = None,
+    progress_callback: Optional[Callable[[int], None]] = None,
+    cancel_callback: Optional[Callable[[], bool]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    retain_outcomes: bool = False,
+    profile: bool = False,
+    outcome_sink: Optional[OutcomeSink] = None,
+    prune: bool = False,
+) -> SimulationResult:
+    """
+    Evaluate every outcome of the remaining games (or a contiguous range of them).
+
+    Each outcome counts once, so probabilities from the full range are exact.
+    Ranges can be evaluated separately and combined with SimulationResult.merge.
+    With prune, ranges index the outcomes of the games that are not pruned
+    (2**count_enumerated_games in all), and each stands for every result of
+    the pruned games.
+
+    Args:
+        games: List of all games in the season
+        teams: List of all teams
+        start: First outcome index
+        stop: One past the last outcome index (default: all outcomes)
+        random_seed: Optional seed for coin-toss tiebreakers
+        progress_callback: Optional callback receiving percentage complete (0-100)
+        cancel_callback: Optional function returning True when caller requests cancellation
+        chunk_size: Outcomes generated and aggregated per block
+        retain_outcomes: Keep per-outcome results for what-if updates
+        profile: Record per-stage timings and tiebreak rule counts on the result
+        outcome_sink: Optional callback receiving each seeded block of
+            outcomes, with rows counted from start
+        prune: Skip games that cannot change any seed (see prunable_games).
+            Rows then stand for many outcomes, so none are retained and
+            outcome_sink cannot be used.
+
+    Returns:
+        SimulationResult with exact=True and one "simulation" per outcome
+        (see SimulationResult.has_exact_probabilities)
+
+    Raises:
+        SimulationCancelledError: If cancellation was requested
+        ValueError: If the range is invalid, or prune is combined with outcome_sink
+    """
+    if prune and outcome_sink is not None:
+        raise ValueError("Pruned outcomes cannot be written to an outcome sink")
+
+    start_time = time.time()
+    # Only coin-toss tiebreakers are random when enumerating
+    streams = simulation_streams(random_seed)
+
+    profiler = profile_simulation() if profile else nullcontext()
+    with profiler as run_profile, tiebreak_stream(streams.tiebreaks):
+        with stage("baseline"):
+            baseline = build_season_baseline(games, teams)
+            pruned: List[Game] = []
+            if prune:
+                pruned = [
+                    game
+                    for game, skip in zip(baseline.remaining_games, prunable_games(baseline))
+                    if skip
+                ]
+            if pruned:
+                baseline = build_season_baseline(_fix_pruned_games(games, pruned), teams)
+        num_games = baseline.num_remaining_games
+        total = count_outcomes(num_games)
+        if stop is None:
+            stop = total
+        if not 0 <= start <= stop <= total:
+            raise ValueError(f"Outcome range [{start}, {stop}) outside 0..{total}")
+
+        logger.info(
+            f"Enumerating outcomes {start:,}-{stop:,} of {total:,} "
+            f"for {num_games} remaining games ({len(pruned)} pruned)"
+        )
+
+        with representative_results() if pruned else nullcontext():
+            team_stats, retained, score_dependent = run_outcome_blocks(
+                baseline,
+                teams,
+                stop - start,
+                lambda lo, hi: enumerate_outcomes(num_games, start + lo, start + hi),
+                chunk_size=chunk_size,
+                progress_callback=progress_callback,
+                cancel_callback=cancel_callback,
+                retain_outcomes=retain_outcomes and not pruned,
+                outcome_sink=outcome_sink,
+            )
+    if retained is not None:
+        retained.random_seed = random_seed
+
+    execution_time = time.time() - start_time
+    logger.info(
+        f"Enumeration complete in {execution_time:.2f}s "
+        f"({(stop - start) / max(execution_time, 1e-9):.0f} outcomes/sec)"
+    )
+
+    result = SimulationResult(
+        team_stats=team_stats,
+        num_simulations=stop - start,
+        execution_time_seconds=execution_time,
+        retained=retained,
+        exact=True,
+        score_dependent_simulations=score_dependent,
+        profile=run_profile,
+    )
+    if pruned:
+        _expand_pruned_games(result, pruned)
+    return result
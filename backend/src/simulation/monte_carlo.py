@@ -2,91 +2,301 @@
 Monte Carlo simulation engine for NFL season outcomes.
 
 Uses vectorized NumPy operations for high performance simulation of
-thousands of season outcomes using unbiased 50/50 coin flips for every remaining game.
+thousands of season outcomes. Remaining games are 50/50 coin flips unless a
+win-probability model (see win_probability.py) is given.
 Phase 3 includes tiebreaker-based playoff seeding.
 """
 
+from contextlib import nullcontext
 from dataclasses import dataclass, field
-from typing import Optional, Dict, List, Callable
-from copy import deepcopy
+from typing import Optional, Dict, List, Callable, Tuple
 
 import numpy as np
 
 from ..data.models import Game, Team, Standing
 from ..utils.logger import setup_logger
-from .scores import generate_game_score, DEFAULT_POINTS_MEAN
-from .standings import calculate_standings
-from .tiebreakers import seed_conference_playoffs, determine_division_winners
+from .scores import (
+    SAMPLING_INDEPENDENT,
+    CompactOutcomes,
+    generate_compact_outcomes,
+    validate_sampling,
+)
+from .batch_standings import (
+    BatchStandings,
+    SeasonBaseline,
+    build_season_baseline,
+    calculate_batch_standings,
+    create_simulation_games,
+)
+from .batch_seeding import BatchSeeding, SeedingFacts, seed_outcomes
+from .clinch import analyze_clinching, seeding_facts, settled_seeding
+from .convergence import ConvergenceCriteria, ConvergenceMonitor, ConvergenceReport
+from .importance import ImportanceSampler, likelihood_ratio_weights, proposal_probabilities
+from .profiling import SimulationProfile, profile_simulation, stage
+from .rng import simulation_streams, tiebreak_stream
+from .win_probability import WinProbabilityModel, home_win_probability_vector
 
 logger = setup_logger(__name__)
 
 
+# Simulations generated and aggregated per block in simulate_season
+DEFAULT_CHUNK_SIZE = 10000
+
+# Callback producing outcomes for simulations [start, stop) of a run
+OutcomeBlockGenerator = Callable[[int, int], CompactOutcomes]
+
+# Callback receiving each seeded block with the run row of its first simulation
+OutcomeSink = Callable[[int, "RetainedOutcomes"], None]
+
+
 class SimulationCancelledError(Exception):
     """Raised when a simulation run is cancelled early."""
 
 
+# Win totals from 0 to 17 in half-win steps (a tie counts as half a win).
+# Bin index is 2 * wins + ties.
+MAX_SEASON_GAMES = 17
+WIN_HISTOGRAM_BINS = 2 * MAX_SEASON_GAMES + 1
+WIN_HISTOGRAM_VALUES = np.arange(WIN_HISTOGRAM_BINS) / 2.0
+
+
+def _empty_win_histogram() -> np.ndarray:
+    return np.zeros(WIN_HISTOGRAM_BINS, dtype=np.int64)
+
+
 @dataclass
 class TeamSimulationStats:
     """Statistics for a single team across all simulations."""
 
     team_id: str
-    wins_distribution: List[int] = field(default_factory=list)
+    wins_histogram: np.ndarray = field(default_factory=_empty_win_histogram)
     made_playoffs_count: int = 0
     won_division_count: int = 0
     first_seed_count: int = 0  # Conference #1 seed (bye week)
     seed_counts: Dict[int, int] = field(default_factory=lambda: {i: 0 for i in range(1, 8)})  # Seeds 1-7
     total_simulations: int = 0
+    # Importance-sampled runs: counters and the histogram hold sums of
+    # likelihood-ratio weights, and probabilities are divided by total_weight
+    total_weight: Optional[float] = None
+    total_squared_weight: Optional[float] = None
+
+    @property
+    def is_weighted(self) -> bool:
+        """True if the counters are sums of importance-sampling weights."""
+        return self.total_weight is not None
+
+    def record_wins(
+        self,
+        wins: np.ndarray,
+        ties: Optional[np.ndarray] = None,
+        weight: int = 1,
+        simulation_weights: Optional[np.ndarray] = None,
+    ) -> None:
+        """
+        Add simulated season records to the win histogram.
+
+        Args:
+            wins: Win totals, one per simulation
+            ties: Optional tie totals aligned with wins (each counts as half a win)
+            weight: Count added per record (-1 removes previously recorded seasons)
+            simulation_weights: Optional likelihood-ratio weight of each record
+                (the histogram then holds float sums of weights)
+        """
+        bins = 2 * np.asarray(wins, dtype=np.int64)
+        if ties is not None:
+            bins = bins + np.asarray(ties, dtype=np.int64)
+        bins = np.clip(bins, 0, WIN_HISTOGRAM_BINS - 1)
+        counts = np.bincount(bins, weights=simulation_weights, minlength=WIN_HISTOGRAM_BINS)
+        if simulation_weights is not None and self.wins_histogram.dtype != np.float64:
+            self.wins_histogram = self.wins_histogram.astype(np.float64)
+        self.wins_histogram += weight * counts
+
+    @property
+    def _denominator(self) -> float:
+        return self.total_weight if self.total_weight is not None else self.total_simulations
+
+    @property
+    def effective_simulations(self) -> float:
+        """Kish effective sample size (total_simulations when unweighted)."""
+        if not self.is_weighted:
+            return float(self.total_simulations)
+        if not self.total_squared_weight:
+            return 0.0
+        return self.total_weight ** 2 / self.total_squared_weight
+
+    @property
+    def wins_distribution(self) -> Dict[float, float]:
+        """
+        Number of simulations ending at each win total (non-zero totals only).
+
+        Weighted (importance-sampled) runs report the summed weights as floats.
+        """
+        # Weighted histograms are float sums; truncating would drop weights below 1
+        convert = float if self.wins_histogram.dtype.kind == "f" else int
+        return {
+            (int(value) if value.is_integer() else float(value)): convert(count)
+            for value, count in zip(WIN_HISTOGRAM_VALUES, self.wins_histogram)
+            if count
+        }
 
     @property
     def playoff_probability(self) -> float:
         """Probability of making playoffs."""
-        if self.total_simulations == 0:
+        if not self._denominator:
             return 0.0
-        return self.made_playoffs_count / self.total_simulations
+        return self.made_playoffs_count / self._denominator
 
     @property
     def division_win_probability(self) -> float:
         """Probability of winning division."""
-        if self.total_simulations == 0:
+        if not self._denominator:
             return 0.0
-        return self.won_division_count / self.total_simulations
+        return self.won_division_count / self._denominator
 
     @property
     def first_seed_probability(self) -> float:
         """Probability of getting #1 seed (bye week)."""
-        if self.total_simulations == 0:
+        if not self._denominator:
             return 0.0
-        return self.first_seed_count / self.total_simulations
+        return self.first_seed_count / self._denominator
 
     @property
     def seed_probabilities(self) -> Dict[int, float]:
         """Probability of each playoff seed (1-7)."""
-        if self.total_simulations == 0:
+        if not self._denominator:
             return {i: 0.0 for i in range(1, 8)}
         return {
-            seed: count / self.total_simulations
+            seed: count / self._denominator
             for seed, count in self.seed_counts.items()
         }
 
     @property
     def average_wins(self) -> float:
         """Average number of wins across simulations."""
-        if not self.wins_distribution:
+        total = self.wins_histogram.sum()
+        if total == 0:
+            return 0.0
+        return float(self.wins_histogram @ WIN_HISTOGRAM_VALUES / total)
+
+    def wins_percentile(self, percentile: float) -> float:
+        """
+        Win total at a percentile, matching np.percentile's linear interpolation.
+
+        Args:
+            percentile: Percentile in [0, 100]
+
+        Returns:
+            Interpolated win total (0.0 when no simulations were recorded);
+            for weighted histograms, the smallest total whose cumulative
+            weight reaches the percentile
+        """
+        if self.wins_histogram.dtype == np.float64:
+            total_weight = self.wins_histogram.sum()
+            if total_weight <= 0:
+                return 0.0
+            cumulative = np.cumsum(self.wins_histogram) / total_weight
+            index = np.searchsorted(cumulative, percentile / 100.0 - 1e-12)
+            return float(WIN_HISTOGRAM_VALUES[min(index, WIN_HISTOGRAM_BINS - 1)])
+
+        total = int(self.wins_histogram.sum())
+        if total == 0:
             return 0.0
-        return np.mean(self.wins_distribution)
+
+        cumulative = np.cumsum(self.wins_histogram)
+        position = (total - 1) * percentile / 100.0
+        lower = int(np.floor(position))
+        upper = min(lower + 1, total - 1)
+        lower_value = WIN_HISTOGRAM_VALUES[np.searchsorted(cumulative, lower, side="right")]
+        upper_value = WIN_HISTOGRAM_VALUES[np.searchsorted(cumulative, upper, side="right")]
+        return float(lower_value + (position - lower) * (upper_value - lower_value))
 
     @property
     def wins_percentiles(self) -> Dict[int, float]:
         """Win distribution percentiles (10th, 25th, 50th, 75th, 90th)."""
-        if not self.wins_distribution:
+        if not self.wins_histogram.any():
             return {}
-        return {
-            10: np.percentile(self.wins_distribution, 10),
-            25: np.percentile(self.wins_distribution, 25),
-            50: np.percentile(self.wins_distribution, 50),
-            75: np.percentile(self.wins_distribution, 75),
-            90: np.percentile(self.wins_distribution, 90),
-        }
+        return {p: self.wins_percentile(p) for p in (10, 25, 50, 75, 90)}
+
+    def merge(self, other: "TeamSimulationStats") -> None:
+        """
+        Fold another set of counters for the same team into this one.
+
+        Args:
+            other: Statistics from a separate batch of simulations
+        """
+        if other.wins_histogram.dtype != self.wins_histogram.dtype:
+            self.wins_histogram = self.wins_histogram.astype(np.float64)
+        self.wins_histogram += other.wins_histogram
+        self.made_playoffs_count += other.made_playoffs_count
+        self.won_division_count += other.won_division_count
+        self.first_seed_count += other.first_seed_count
+        for seed, count in other.seed_counts.items():
+            self.seed_counts[seed] = self.seed_counts.get(seed, 0) + count
+        self.total_simulations += other.total_simulations
+        if other.is_weighted:
+            self.total_weight = (self.total_weight or 0.0) + other.total_weight
+            self.total_squared_weight = (
+                (self.total_squared_weight or 0.0) + other.total_squared_weight
+            )
+
+
+@dataclass
+class RetainedOutcomes:
+    """
+    Per-simulation outcomes and seeding kept from a run for what-if updates.
+
+    Columns of outcomes follow game_ids (the games simulated in the run).
+    Team indices in division_winners and seeds refer to the run's
+    SeasonBaseline.team_ids. Overrides applied since the run are recorded per
+    column; outcomes itself always holds the originally simulated values.
+    """
+
+    game_ids: List[str]
+    fixed_signature: str  # SeasonBaseline.fixed_signature of the run
+    outcomes: CompactOutcomes
+    division_winners: np.ndarray  # (num_simulations × num_divisions) int8
+    seeds: np.ndarray  # (num_simulations × num_conferences × 7) int8
+    score_dependent: np.ndarray  # (num_simulations,) bool, seeding depended on points
+    random_seed: Optional[int] = None
+    # Model the outcomes were drawn from (None for 50/50), for reruns
+    win_probability_model: Optional[WinProbabilityModel] = None
+    overrides: Dict[int, Tuple[int, int]] = field(default_factory=dict)
+
+    @property
+    def num_simulations(self) -> int:
+        """Number of retained simulations."""
+        return self.outcomes.num_simulations
+
+    @classmethod
+    def from_seeding(
+        cls,
+        baseline: SeasonBaseline,
+        outcomes: CompactOutcomes,
+        seeding: BatchSeeding,
+    ) -> "RetainedOutcomes":
+        """Retain one block of simulated outcomes with their seeding."""
+        return cls(
+            game_ids=[game.id for game in baseline.remaining_games],
+            fixed_signature=baseline.fixed_signature,
+            outcomes=outcomes,
+            division_winners=seeding.division_winners.astype(np.int8),
+            seeds=seeding.seeds.astype(np.int8),
+            score_dependent=seeding.score_dependent.copy(),
+        )
+
+    @classmethod
+    def concatenate(cls, parts: List["RetainedOutcomes"]) -> "RetainedOutcomes":
+        """Stack retained blocks from the same schedule in simulation order."""
+        return cls(
+            game_ids=parts[0].game_ids,
+            fixed_signature=parts[0].fixed_signature,
+            outcomes=CompactOutcomes.concatenate([p.outcomes for p in parts]),
+            division_winners=np.concatenate([p.division_winners for p in parts]),
+            seeds=np.concatenate([p.seeds for p in parts]),
+            score_dependent=np.concatenate([p.score_dependent for p in parts]),
+            random_seed=parts[0].random_seed,
+            win_probability_model=parts[0].win_probability_model,
+        )
 
 
 @dataclass
@@ -96,6 +306,58 @@ class SimulationResult:
     team_stats: Dict[str, TeamSimulationStats] = field(default_factory=dict)
     num_simulations: int = 0
     execution_time_seconds: float = 0.0
+    retained: Optional[RetainedOutcomes] = field(default=None, repr=False)
+    # True when every outcome of the remaining games was enumerated once
+    exact: bool = False
+    # Simulations whose seeding reached a points-based tiebreaker
+    score_dependent_simulations: int = 0
+    # Stage timings and tiebreak rule counts, when the run was profiled
+    profile: Optional[SimulationProfile] = None
+    # Stopping reason and achieved confidence intervals of adaptive runs
+    convergence: Optional[ConvergenceReport] = None
+
+    @classmethod
+    def merge(cls, results: List["SimulationResult"]) -> "SimulationResult":
+        """
+        Combine results from independent batches of simulations.
+
+        Counters are merged in the order given, so merging the same shards in
+        the same order always produces an identical result.
+
+        Args:
+            results: Results to combine
+
+        Returns:
+            New SimulationResult covering all simulations
+        """
+        merged = cls()
+        for result in results:
+            for team_id, stats in result.team_stats.items():
+                if team_id not in merged.team_stats:
+                    merged.team_stats[team_id] = TeamSimulationStats(team_id=team_id)
+                merged.team_stats[team_id].merge(stats)
+            merged.num_simulations += result.num_simulations
+            merged.score_dependent_simulations += result.score_dependent_simulations
+            merged.execution_time_seconds += result.execution_time_seconds
+
+        merged.exact = bool(results) and all(result.exact for result in results)
+        merged.profile = SimulationProfile.combine([result.profile for result in results])
+        if results and all(result.retained is not None for result in results):
+            merged.retained = RetainedOutcomes.concatenate(
+                [result.retained for result in results]
+            )
+        return merged
+
+    @property
+    def has_exact_probabilities(self) -> bool:
+        """
+        True if the probabilities are exact, not estimates.
+
+        Enumerated games all get the same representative score, so outcomes
+        whose seeding reached a points-based tiebreaker were settled with a
+        nominal score and the run is only approximately exact.
+        """
+        return self.exact and self.score_dependent_simulations == 0
 
     def get_team_stats(self, team_id: str) -> Optional[TeamSimulationStats]:
         """Get statistics for a specific team."""
@@ -122,6 +384,221 @@ class SimulationResult:
         }
 
 
+def accumulate_team_stats(
+    team_stats: Dict[str, TeamSimulationStats],
+    baseline: SeasonBaseline,
+    batch_standings: BatchStandings,
+    division_winners: np.ndarray,
+    seeds: np.ndarray,
+    weight: int = 1,
+    simulation_weights: Optional[np.ndarray] = None,
+) -> None:
+    """
+    Fold records and seeding of a block of simulations into team statistics.
+
+    Simulation totals are not changed; callers adjust total_simulations (and
+    total_weight for weighted blocks).
+
+    Args:
+        team_stats: Running statistics, updated in place
+        baseline: Season structure the block was simulated with
+        batch_standings: Records for the block
+        division_winners: (num_simulations × num_divisions) team indices
+        seeds: (num_simulations × num_conferences × 7) team indices, -1 if unfilled
+        weight: 1 to add the block, -1 to remove a previously added block
+        simulation_weights: Optional (num_simulations,) importance-sampling
+            weights; counters then grow by float sums of weights
+    """
+    num_teams = baseline.num_teams
+    # Counters stay exact integers unless the block is weighted
+    as_count = int if simulation_weights is None else float
+
+    def team_counts(indices: np.ndarray) -> np.ndarray:
+        filled = indices >= 0
+        weights = None
+        if simulation_weights is not None:
+            weights = np.broadcast_to(
+                simulation_weights.reshape((-1,) + (1,) * (indices.ndim - 1)), indices.shape
+            )[filled]
+        return np.bincount(indices[filled], weights=weights, minlength=num_teams)
+
+    division_counts = team_counts(division_winners)
+    seed_counts = [team_counts(seeds[:, :, seed_idx]) for seed_idx in range(seeds.shape[2])]
+
+    for team_idx, team_id in enumerate(baseline.team_ids):
+        stats = team_stats[team_id]
+        stats.record_wins(
+            batch_standings.wins[:, team_idx], batch_standings.ties[:, team_idx], weight,
+            simulation_weights,
+        )
+        stats.won_division_count += weight * as_count(division_counts[team_idx])
+        for seed_num, counts in enumerate(seed_counts, start=1):
+            stats.seed_counts[seed_num] += weight * as_count(counts[team_idx])
+            stats.made_playoffs_count += weight * as_count(counts[team_idx])
+        stats.first_seed_count += weight * as_count(seed_counts[0][team_idx])
+
+
+def _aggregate_block(
+    baseline: SeasonBaseline,
+    teams: List[Team],
+    outcomes: CompactOutcomes,
+    team_stats: Dict[str, TeamSimulationStats],
+    simulation_buffer_games: List[Game],
+    settled: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+    facts: Optional[SeedingFacts] = None,
+) -> BatchSeeding:
+    """
+    Seed one block of outcomes and fold it into the running team statistics.
+
+    Args:
+        baseline: Precomputed season structure
+        teams: List of all teams
+        outcomes: Outcomes of the remaining games for the block
+        team_stats: Running statistics, updated in place
+        simulation_buffer_games: Reusable game objects for tied simulations
+        settled: Optional (division_winners, seeds) already clinched for every
+            outcome, which skips seeding entirely
+        facts: Optional clinched results that seeding need not rank or resolve
+
+    Returns:
+        BatchSeeding for the block
+    """
+    # Records for every simulation in a handful of matrix operations
+    with stage("standings"):
+        batch_standings = calculate_batch_standings(baseline, outcomes)
+
+    if settled is not None:
+        num_simulations = outcomes.num_simulations
+        seeding = BatchSeeding(
+            division_winners=np.tile(settled[0], (num_simulations, 1)),
+            seeds=np.tile(settled[1], (num_simulations, 1, 1)),
+            score_dependent=np.zeros(num_simulations, dtype=bool),
+        )
+    else:
+        # Division winners and playoff seeds (tiebreakers only where records tie)
+        seeding = seed_outcomes(
+            baseline, batch_standings, teams, outcomes, simulation_buffer_games, facts
+        )
+
+    with stage("aggregation"):
+        weights = outcomes.weights
+        accumulate_team_stats(
+            team_stats, baseline, batch_standings, seeding.division_winners, seeding.seeds,
+            simulation_weights=weights,
+        )
+        for stats in team_stats.values():
+            stats.total_simulations += outcomes.num_simulations
+            if weights is not None:
+                stats.total_weight = (stats.total_weight or 0.0) + float(weights.sum())
+                stats.total_squared_weight = (
+                    (stats.total_squared_weight or 0.0) + float(np.square(weights).sum())
+                )
+
+    return seeding
+
+
+def run_outcome_blocks(
+    baseline: SeasonBaseline,
+    teams: List[Team],
+    num_simulations: int,
+    generate_block: OutcomeBlockGenerator,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress_callback: Optional[Callable[[int], None]] = None,
+    cancel_callback: Optional[Callable[[], bool]] = None,
+    retain_outcomes: bool = False,
+    stop_callback: Optional[Callable[[Dict[str, TeamSimulationStats], int], bool]] = None,
+    outcome_sink: Optional[OutcomeSink] = None,
+) -> Tuple[Dict[str, TeamSimulationStats], Optional[RetainedOutcomes], int]:
+    """
+    Seed and aggregate a run block by block.
+
+    Outcomes are requested from generate_block one chunk at a time, so peak
+    memory depends on chunk_size rather than num_simulations. Progress and
+    cancellation are checked between chunks. If clinching already fixes every
+    division winner and seed, seeding is skipped and only records are computed;
+    otherwise teams with a clinched seed or eliminated from the playoffs are
+    left out of ranking and tiebreaking.
+
+    Args:
+        baseline: Precomputed season structure
+        teams: List of all teams
+        num_simulations: Number of simulations (outcome rows) in the run
+        generate_block: Callback returning outcomes for rows [start, stop)
+        chunk_size: Rows generated and aggregated per block
+        progress_callback: Optional callback receiving percentage complete (0-100)
+        cancel_callback: Optional function returning True when caller requests cancellation
+        retain_outcomes: Keep per-simulation outcomes and seeding
+        stop_callback: Optional function called after each block with the
+            running statistics and simulations so far; returning True ends
+            the run early (team_stats then cover fewer than num_simulations)
+        outcome_sink: Optional callback receiving each block's outcomes and
+            seeding as soon as it is seeded (e.g. OutcomeStoreWriter.write)
+
+    Returns:
+        Tuple of (team_stats, retained outcomes or None, number of
+        simulations whose seeding reached a points-based tiebreaker)
+
+    Raises:
+        SimulationCancelledError: If cancellation was requested
+        ValueError: If chunk_size is not positive
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    team_stats = {team.id: TeamSimulationStats(team_id=team.id) for team in teams}
+    simulation_buffer_games = create_simulation_games(baseline)
+
+    with stage("clinching"):
+        statuses = analyze_clinching(baseline)
+        facts = seeding_facts(baseline, statuses)
+        settled = settled_seeding(baseline, statuses)
+    if settled is not None:
+        logger.info("All division winners and seeds are clinched; skipping seeding")
+
+    completed = 0
+    tiebreak_cells = 0
+    score_dependent = 0
+    retained_blocks: List[RetainedOutcomes] = []
+    while completed < num_simulations:
+        if cancel_callback and cancel_callback():
+            logger.info(
+                "Simulation cancelled after %s/%s simulations", completed, num_simulations
+            )
+            raise SimulationCancelledError("Simulation cancelled")
+
+        stop = min(completed + chunk_size, num_simulations)
+        with stage("outcomes"):
+            outcomes = generate_block(completed, stop)
+        seeding = _aggregate_block(
+            baseline, teams, outcomes, team_stats, simulation_buffer_games, settled, facts
+        )
+        tiebreak_cells += seeding.tiebreak_cells
+        score_dependent += int(np.count_nonzero(seeding.score_dependent))
+        if retain_outcomes or outcome_sink is not None:
+            with stage("aggregation"):
+                block = RetainedOutcomes.from_seeding(baseline, outcomes, seeding)
+                if outcome_sink is not None:
+                    outcome_sink(completed, block)
+                if retain_outcomes:
+                    retained_blocks.append(block)
+        completed = stop
+
+        stopping = stop_callback is not None and stop_callback(team_stats, completed)
+        if progress_callback:
+            progress_callback(100 if stopping else int(completed / num_simulations * 100))
+        if stopping:
+            break
+
+    logger.info(
+        f"Resolved {tiebreak_cells:,} tied division/conference cells with tiebreakers"
+    )
+
+    retained = None
+    if retain_outcomes and retained_blocks:
+        retained = RetainedOutcomes.concatenate(retained_blocks)
+    return team_stats, retained, score_dependent
+
+
 def simulate_season(
     games: List[Game],
     teams: List[Team],
@@ -129,16 +606,45 @@ def simulate_season(
     random_seed: Optional[int] = None,
     progress_callback: Optional[Callable[[int], None]] = None,
     cancel_callback: Optional[Callable[[], bool]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    retain_outcomes: bool = False,
+    profile: bool = False,
+    win_probability_model: Optional[WinProbabilityModel] = None,
+    rng: Optional[np.random.Generator] = None,
+    convergence: Optional[ConvergenceCriteria] = None,
+    sampling: str = SAMPLING_INDEPENDENT,
+    importance: Optional[ImportanceSampler] = None,
+    outcome_sink: Optional[OutcomeSink] = None,
 ) -> SimulationResult:
     """
     Run Monte Carlo simulation of NFL season using vectorized NumPy operations.
 
     This is the main entry point for simulations. It:
     1. Separates completed games (use actual results) from remaining games
-    2. Treats each remaining matchup as a 50/50 coin flip
-    3. Generates random outcomes for all remaining games across all simulations
-    4. Calculates standings for each simulation
-    5. Aggregates results into statistics
+    2. Prices each remaining matchup once with the win-probability model
+       (a 50/50 coin flip by default)
+    3. Generates random outcomes for a block of simulations at a time
+    4. Calculates standings for the whole block at once (batch engine)
+    5. Seeds every simulation by record, running tiebreakers only on tied cells
+    6. Folds the block into running statistics before generating the next one
+
+    With convergence criteria the run is adaptive: num_simulations becomes a
+    ceiling, blocks of convergence.batch_size simulations are run until every
+    team's playoff, division and seed probabilities are known to within the
+    tolerance (or the time budget runs out), and the achieved confidence
+    intervals are returned on result.convergence.
+
+    With an importance sampler, outcomes are drawn from a proposal tilted
+    towards the sampler's target team and every simulation is weighted by
+    its likelihood ratio (see importance.py). Team statistics then hold
+    weighted counters, which estimate rare events like long-shot playoff odds
+    far more precisely for the same number of simulations.
+
+    Peak memory depends on chunk_size rather than num_simulations. Progress
+    and cancellation are checked between chunks. Outcomes, scores and
+    coin-toss tiebreakers draw from separate streams spawned from the seed
+    (see rng.py); no global random state is touched, so concurrent runs are
+    independent and a seeded run is reproducible.
 
     Args:
         games: List of all games in the season
@@ -147,10 +653,34 @@ def simulate_season(
         random_seed: Optional random seed for reproducibility
         progress_callback: Optional callback function receiving percentage complete (0-100)
         cancel_callback: Optional function returning True when caller requests cancellation
+        chunk_size: Simulations generated and aggregated per block
+        retain_outcomes: Keep per-simulation outcomes and seeding on the result
+            (as RetainedOutcomes) so overrides can be applied incrementally
+        profile: Record per-stage timings and tiebreak rule counts on the result
+        win_probability_model: Optional model giving each remaining game's
+            home-win probability (default: 50/50)
+        rng: Optional generator to spawn the run's streams from (used
+            instead of random_seed)
+        convergence: Optional criteria for stopping early (see convergence.py)
+        sampling: How home-win flags are drawn: independent, antithetic or
+            stratified (variance reduction applied within each chunk; see
+            scores.py)
+        importance: Optional importance sampler (incompatible with
+            retain_outcomes, outcome_sink and convergence, which assume
+            unweighted simulations)
+        outcome_sink: Optional callback receiving each seeded block of
+            outcomes (e.g. OutcomeStoreWriter.write), so a run can be stored
+            without retaining it
 
     Returns:
         SimulationResult with aggregated statistics
 
+    Raises:
+        SimulationCancelledError: If cancellation was requested
+        ValueError: If chunk_size is not positive, sampling is unknown, or
+            importance sampling is combined with retain_outcomes,
+            outcome_sink or convergence
+
     Example:
         >>> result = simulate_season(games, teams, num_simulations=10000)
         >>> chiefs_stats = result.get_team_stats("12")  # Kansas City
@@ -160,131 +690,99 @@ def simulate_season(
     import time
 
     start_time = time.time()
-
-    if random_seed is not None:
-        np.random.seed(random_seed)
+    validate_sampling(sampling)
+    if importance is not None and (
+        retain_outcomes or outcome_sink is not None or convergence is not None
+    ):
+        raise ValueError(
+            "Importance sampling cannot be combined with retained outcomes or convergence"
+        )
+    streams = simulation_streams(rng if rng is not None else random_seed)
 
     logger.info(f"Starting {num_simulations:,} simulations with {len(games)} games")
 
-    # Separate completed and remaining games
-    completed_games = [g for g in games if g.is_completed]
-    remaining_games = [g for g in games if not g.is_completed]
-
-    logger.info(
-        f"Games: {len(completed_games)} completed, {len(remaining_games)} remaining"
-    )
-
-    # Extract probabilities for remaining games
-    # No per-game weighting is required—every matchup is treated as 50/50.
-
-    # Create probability matrix: (num_simulations × num_games)
-    if remaining_games:
-        # Generate ALL random outcomes at once (vectorized)
-        random_matrix = np.random.random((num_simulations, len(remaining_games)))
-
-        # Home wins = 1, Away wins = 0
-        home_wins_matrix = (random_matrix < 0.5).astype(int)
-
-        # Generate ALL random scores at once (vectorized)
-        # Generate random poisson scores for all games in all simulations
-        home_scores_matrix = np.random.poisson(DEFAULT_POINTS_MEAN, size=(num_simulations, len(remaining_games)))
-        away_scores_matrix = np.random.poisson(DEFAULT_POINTS_MEAN, size=(num_simulations, len(remaining_games)))
-
-        # Fix scores to match winners
-        # 1. Where home won but score <= away score
-        fix_home_wins = (home_wins_matrix == 1) & (away_scores_matrix >= home_scores_matrix)
-        home_scores_matrix[fix_home_wins] = away_scores_matrix[fix_home_wins] + 1
-
-        # 2. Where away won (home_wins == 0) but score <= home score
-        fix_away_wins = (home_wins_matrix == 0) & (home_scores_matrix >= away_scores_matrix)
-        away_scores_matrix[fix_away_wins] = home_scores_matrix[fix_away_wins] + 1
+    profiler = profile_simulation() if profile else nullcontext()
+    with profiler as run_profile, tiebreak_stream(streams.tiebreaks):
+        # Separate decided games (folded into a shared baseline) from remaining games
+        with stage("baseline"):
+            baseline = build_season_baseline(games, teams)
 
         logger.info(
-            f"Generated {num_simulations * len(remaining_games):,} random game outcomes"
+            f"Games: {len(baseline.fixed_games)} completed, "
+            f"{baseline.num_remaining_games} remaining"
         )
-    else:
-        # All games completed, no simulations needed
-        home_wins_matrix = np.zeros((num_simulations, 0), dtype=int)
-        home_scores_matrix = np.zeros((num_simulations, 0), dtype=int)
-        away_scores_matrix = np.zeros((num_simulations, 0), dtype=int)
-
-    # Initialize team stats
-    team_stats = {
-        team.id: TeamSimulationStats(
-            team_id=team.id, total_simulations=num_simulations
+
+        # Priced once per run and broadcast across every block
+        home_win_probabilities = home_win_probability_vector(
+            win_probability_model, baseline.remaining_games
         )
-        for team in teams
-    }
-
-    # Create team ID to index mapping
-    team_id_to_idx = {team.id: idx for idx, team in enumerate(teams)}
-
-    # Process each simulation
-    
-    # Pre-allocate simulation objects to avoid deepcopy overhead in loop
-    # We'll reuse these objects for every simulation, just updating scores
-    simulation_buffer_games = [deepcopy(g) for g in remaining_games]
-    for game in simulation_buffer_games:
-        game.is_completed = True
-        
-    # Progress reporting variables
-    last_progress_pct = -1
-    progress_interval = max(1, num_simulations // 100)  # Report every 1%
-    
-    for sim_idx in range(num_simulations):
-        if cancel_callback and cancel_callback():
-            logger.info("Simulation cancelled at %s/%s iterations", sim_idx, num_simulations)
-            raise SimulationCancelledError("Simulation cancelled")
-        # Report progress
-        if progress_callback and sim_idx % progress_interval == 0:
-            pct = int((sim_idx / num_simulations) * 100)
-            if pct > last_progress_pct:
-                progress_callback(pct)
-                last_progress_pct = pct
-                
-        # Create list of all games for this simulation (completed + simulated)
-        # optimization: construct list without deepcopying completed_games (they are read-only here)
-        sim_games = completed_games + simulation_buffer_games
-
-        # Apply pre-calculated scores to simulation games
-        if remaining_games:
-            for game_idx, sim_game in enumerate(simulation_buffer_games):
-                sim_game.home_score = int(home_scores_matrix[sim_idx, game_idx])
-                sim_game.away_score = int(away_scores_matrix[sim_idx, game_idx])
-
-        # Calculate full standings with tiebreaker data
-        standings_dict = calculate_standings(sim_games, teams)
-
-        # Store win totals
-        for team_id, standing in standings_dict.items():
-            team_stats[team_id].wins_distribution.append(standing.wins)
-
-        # Determine division winners (with tiebreakers)
-        division_winners = determine_division_winners(teams, standings_dict, sim_games)
-        for winner_id in division_winners.values():
-            team_stats[winner_id].won_division_count += 1
-
-        # Determine playoff seeding for each conference (with tiebreakers)
-        for conference in ["AFC", "NFC"]:
-            try:
-                playoff_seeds = seed_conference_playoffs(
-                    teams, standings_dict, sim_games, conference
-                )
 
-                # Track playoff appearances and seeds
-                for seed_num, team_id in enumerate(playoff_seeds, start=1):
-                    team_stats[team_id].made_playoffs_count += 1
-                    team_stats[team_id].seed_counts[seed_num] += 1
+        importance_shift = None
+        if importance is not None:
+            importance_shift = importance.log_odds_shift(baseline)
+            if home_win_probabilities is None:
+                home_win_probabilities = np.full(baseline.num_remaining_games, 0.5)
+
+        def generate_block(start: int, stop: int) -> CompactOutcomes:
+            probabilities = home_win_probabilities
+            if win_probability_model is not None and win_probability_model.varies_by_simulation:
+                # Per-simulation team strengths shift every game of that simulation
+                probabilities = win_probability_model.simulation_probabilities(
+                    home_win_probabilities,
+                    baseline.home_index,
+                    baseline.away_index,
+                    baseline.num_teams,
+                    stop - start,
+                    rng=streams.outcomes,
+                )
+            if importance_shift is None:
+                # Bit-packed winners with consistent uint8 scores
+                return generate_compact_outcomes(
+                    stop - start,
+                    baseline.num_remaining_games,
+                    rng=streams.outcomes,
+                    home_win_probabilities=probabilities,
+                    score_rng=streams.scores,
+                    sampling=sampling,
+                )
 
-                    if seed_num == 1:
-                        team_stats[team_id].first_seed_count += 1
-            except Exception as e:
-                logger.warning(f"Error in playoff seeding for {conference} in sim {sim_idx}: {e}")
-                # Fall back to simple method for this simulation
-                continue
+            # Draw from the tilted proposal, then weight back to the real model
+            proposal = proposal_probabilities(probabilities, importance_shift)
+            outcomes = generate_compact_outcomes(
+                stop - start,
+                baseline.num_remaining_games,
+                rng=streams.outcomes,
+                home_win_probabilities=proposal,
+                score_rng=streams.scores,
+                sampling=sampling,
+            )
+            outcomes.weights = likelihood_ratio_weights(
+                outcomes.home_wins, probabilities, proposal
+            )
+            return outcomes
+
+        monitor = None
+        if convergence is not None:
+            monitor = ConvergenceMonitor(convergence, num_simulations)
+            chunk_size = min(chunk_size, convergence.batch_size)
+
+        team_stats, retained, score_dependent = run_outcome_blocks(
+            baseline,
+            teams,
+            num_simulations,
+            generate_block,
+            chunk_size=chunk_size,
+            progress_callback=progress_callback,
+            cancel_callback=cancel_callback,
+            retain_outcomes=retain_outcomes,
+            stop_callback=monitor.should_stop if monitor is not None else None,
+            outcome_sink=outcome_sink,
+        )
 
-    if progress_callback:
-        progress_callback(100)
+    report = None
+    if monitor is not None:
+        report = monitor.report(team_stats)
+        num_simulations = report.num_simulations
 
     execution_time = time.time() - start_time
     logger.info(
@@ -292,10 +790,18 @@ def simulate_season(
         f"({num_simulations/execution_time:.0f} sims/sec)"
     )
 
+    if retained is not None:
+        retained.random_seed = random_seed
+        retained.win_probability_model = win_probability_model
+
     return SimulationResult(
         team_stats=team_stats,
         num_simulations=num_simulations,
         execution_time_seconds=execution_time,
+        retained=retained,
+        profile=run_profile,
+        convergence=report,
+        score_dependent_simulations=score_dependent,
     )
 
 
@@ -0,0 +1,540 @@
+"""
+On-disk, memory-mapped store of a run's per-simulation outcomes.
+
+A run made with retain_outcomes=True can be written to a directory of .npy
+arrays: the compact outcome matrix (packed home-win flags and scores) plus
+each simulation's division winners, playoff seeds and whether its seeding
+reached a points-based tiebreaker. Score matrices are stored column-major, so the outcomes of one game are contiguous on disk.
+
+A run can also stream into a store as it goes: OutcomeStoreWriter
+preallocates the arrays with np.lib.format.open_memmap before the run, and
+each block of outcomes is written into its rows as soon as it is seeded, so
+the full matrix never has to be held in memory.
+
+Opening a store memory-maps the arrays read-only. A conditional query such
+as "the Bills win week 15" reads only the conditioned games' columns to find
+the matching simulations, then recomputes standings for those rows alone and
+aggregates their stored seeding. Nothing is resimulated, and since every
+simulation keeps the seeding it was drawn with, conditioning is exact
+rejection sampling of the original run.
+"""
+
+import json
+import os
+import shutil
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional
+
+import numpy as np
+
+from ..data.cache_manager import CacheManager
+from ..data.models import Game, Team
+from ..utils.logger import setup_logger
+from .monte_carlo import (
+    DEFAULT_CHUNK_SIZE,
+    RetainedOutcomes,
+    SimulationResult,
+    TeamSimulationStats,
+    accumulate_team_stats,
+)
+from .batch_seeding import PLAYOFF_SEEDS_PER_CONFERENCE
+from .batch_standings import CONFERENCES, SeasonBaseline, calculate_batch_standings
+from .scores import CompactOutcomes
+from .win_probability import WinProbabilityModel
+from .what_if import _with_overrides, build_run_baseline
+
+logger = setup_logger(__name__)
+
+
+# Bump when the on-disk layout changes
+OUTCOME_STORE_VERSION = 3
+
+# Condition value meaning the game ends tied
+TIE = "tie"
+
+_METADATA_FILE = "metadata.json"
+_ARRAYS = (
+    "home_wins_packed",
+    "home_scores",
+    "away_scores",
+    "division_winners",
+    "seeds",
+    "score_dependent",
+)
+# Score matrices are column-major so a game's outcomes are contiguous
+_COLUMN_MAJOR = ("home_scores", "away_scores")
+
+
+class StaleOutcomeStoreError(ValueError):
+    """Raised when a store is queried against a schedule that has since changed."""
+
+
+def save_outcome_store(directory: Path | str, result: SimulationResult) -> Path:
+    """
+    Write a run's retained outcomes and seeding to a store directory.
+
+    Overrides applied to the run since it finished are written into the
+    outcome matrix, so stored outcomes always match the stored seeding. The
+    store is written next to its final location and renamed into place, so
+    readers never see a partial store.
+
+    Args:
+        directory: Store directory (replaced if it exists)
+        result: Result of a run made with retain_outcomes=True
+
+    Returns:
+        Path of the store
+
+    Raises:
+        ValueError: If the result has no retained outcomes
+    """
+    retained = result.retained
+    if retained is None:
+        raise ValueError("Only runs with retained outcomes can be stored")
+
+    directory = Path(directory)
+    staging = _staging_directory(directory)
+
+    outcomes = _with_overrides(retained.outcomes, retained.overrides)
+    arrays = {
+        "home_wins_packed": outcomes.home_wins_packed,
+        "home_scores": np.asfortranarray(outcomes.home_scores),
+        "away_scores": np.asfortranarray(outcomes.away_scores),
+        "division_winners": retained.division_winners,
+        "seeds": retained.seeds,
+        "score_dependent": retained.score_dependent,
+    }
+    for name, array in arrays.items():
+        np.save(staging / f"{name}.npy", array)
+
+    _publish(
+        staging,
+        directory,
+        num_simulations=retained.num_simulations,
+        num_games=outcomes.num_games,
+        game_ids=retained.game_ids,
+        team_ids=list(result.team_stats),
+        fixed_signature=retained.fixed_signature,
+        random_seed=retained.random_seed,
+        win_probability_model=retained.win_probability_model,
+        exact=result.exact,
+    )
+    return directory
+
+
+def _staging_directory(directory: Path) -> Path:
+    """Create an empty directory next to a store to write it in."""
+    staging = directory.with_name(directory.name + ".tmp")
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir(parents=True)
+    return staging
+
+
+def _publish(
+    staging: Path,
+    directory: Path,
+    num_simulations: int,
+    num_games: int,
+    game_ids: List[str],
+    team_ids: List[str],
+    fixed_signature: str,
+    random_seed: Optional[int],
+    win_probability_model: Optional[WinProbabilityModel],
+    exact: bool,
+) -> None:
+    """Write a staged store's metadata and rename it into place."""
+    metadata = {
+        "version": OUTCOME_STORE_VERSION,
+        "num_simulations": num_simulations,
+        "num_games": num_games,
+        "game_ids": game_ids,
+        "team_ids": team_ids,
+        "fixed_signature": fixed_signature,
+        "random_seed": random_seed,
+        "win_probability": (
+            win_probability_model.to_dict() if win_probability_model else None
+        ),
+        "exact": exact,
+        "saved_at": time.time(),
+    }
+    with open(staging / _METADATA_FILE, "w") as f:
+        json.dump(metadata, f)
+
+    shutil.rmtree(directory, ignore_errors=True)
+    os.replace(staging, directory)
+    logger.info(f"Stored {num_simulations:,} simulated outcomes in {directory}")
+
+
+class OutcomeStoreWriter:
+    """
+    Store whose arrays a run fills block by block while it runs.
+
+    Create one with OutcomeStoreWriter.create before the run, hand its write
+    method to the run as outcome_sink, then call commit with the result. The
+    writer is picklable, so worker processes can write their own rows: each
+    write reopens the preallocated files, fills the block's rows and closes
+    them again, and no file stays mapped between blocks.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        staging: Path,
+        game_ids: List[str],
+        team_ids: List[str],
+        fixed_signature: str,
+        offset: int = 0,
+    ):
+        self.directory = directory
+        self.staging = staging
+        self.game_ids = game_ids
+        self.team_ids = team_ids
+        self.fixed_signature = fixed_signature
+        self.offset = offset
+
+    @classmethod
+    def create(
+        cls, directory: Path | str, baseline: SeasonBaseline, num_simulations: int
+    ) -> "OutcomeStoreWriter":
+        """
+        Preallocate a store for up to num_simulations rows of a run.
+
+        Args:
+            directory: Final store directory (replaced on commit)
+            baseline: Season structure of the run
+            num_simulations: Rows to allocate; a run that stops early leaves
+                the rows past its last simulation unused
+
+        Returns:
+            OutcomeStoreWriter for the run's rows
+        """
+        directory = Path(directory)
+        staging = _staging_directory(directory)
+        num_games = baseline.num_remaining_games
+        shapes = {
+            "home_wins_packed": ((num_simulations, (num_games + 7) // 8), np.uint8),
+            "home_scores": ((num_simulations, num_games), np.uint8),
+            "away_scores": ((num_simulations, num_games), np.uint8),
+            "division_winners": (
+                (num_simulations, len(baseline.division_keys)), np.int8
+            ),
+            "seeds": (
+                (num_simulations, len(CONFERENCES), PLAYOFF_SEEDS_PER_CONFERENCE),
+                np.int8,
+            ),
+            "score_dependent": ((num_simulations,), bool),
+        }
+        for name, (shape, dtype) in shapes.items():
+            # Allocation only extends the file; rows are written as they come
+            array = np.lib.format.open_memmap(
+                staging / f"{name}.npy",
+                mode="w+",
+                dtype=dtype,
+                shape=shape,
+                fortran_order=name in _COLUMN_MAJOR,
+            )
+            del array
+        return cls(
+            directory=directory,
+            staging=staging,
+            game_ids=[game.id for game in baseline.remaining_games],
+            team_ids=list(baseline.team_ids),
+            fixed_signature=baseline.fixed_signature,
+        )
+
+    def for_rows(self, offset: int) -> "OutcomeStoreWriter":
+        """Writer for a sub-run (e.g. a shard) whose first row is offset."""
+        return OutcomeStoreWriter(
+            self.directory,
+            self.staging,
+            self.game_ids,
+            self.team_ids,
+            self.fixed_signature,
+            self.offset + offset,
+        )
+
+    def write(self, start: int, block: RetainedOutcomes) -> None:
+        """
+        Write one seeded block into rows start..start + block size (of this writer).
+
+        Args:
+            start: Row of the block's first simulation, relative to this writer
+            block: The block's outcomes and seeding
+        """
+        rows = slice(self.offset + start, self.offset + start + block.num_simulations)
+        values = {
+            "home_wins_packed": block.outcomes.home_wins_packed,
+            "home_scores": block.outcomes.home_scores,
+            "away_scores": block.outcomes.away_scores,
+            "division_winners": block.division_winners,
+            "seeds": block.seeds,
+            "score_dependent": block.score_dependent,
+        }
+        for name, value in values.items():
+            array = np.load(self.staging / f"{name}.npy", mmap_mode="r+")
+            array[rows] = value
+            array.flush()
+            del array
+
+    def commit(
+        self,
+        result: SimulationResult,
+        random_seed: Optional[int] = None,
+        win_probability_model: Optional[WinProbabilityModel] = None,
+    ) -> Path:
+        """
+        Publish the store once the run has finished.
+
+        Args:
+            result: The run's result; its first num_simulations rows are stored
+            random_seed: Run seed
+            win_probability_model: Model the outcomes were drawn from
+
+        Returns:
+            Path of the store
+        """
+        _publish(
+            self.staging,
+            self.directory,
+            num_simulations=result.num_simulations,
+            num_games=len(self.game_ids),
+            game_ids=self.game_ids,
+            team_ids=self.team_ids,
+            fixed_signature=self.fixed_signature,
+            random_seed=random_seed,
+            win_probability_model=win_probability_model,
+            exact=result.exact,
+        )
+        return self.directory
+
+    def discard(self) -> None:
+        """Delete the staged arrays of a run that failed or was cancelled."""
+        shutil.rmtree(self.staging, ignore_errors=True)
+
+
+def save_cached_outcome_store(
+    cache_manager: CacheManager,
+    store_id: str,
+    result: SimulationResult,
+    max_stores: Optional[int] = None,
+) -> Path:
+    """
+    Write a run's outcomes to a store in the cache directory.
+
+    Args:
+        cache_manager: Cache manager owning the store directories
+        store_id: Identifier of the store (a file-name-safe string)
+        result: Result of a run made with retain_outcomes=True
+        max_stores: Keep at most this many stores, deleting the oldest
+
+    Returns:
+        Path of the store
+
+    Raises:
+        ValueError: If the result has no retained outcomes
+    """
+    directory = save_outcome_store(cache_manager.outcome_store_path(store_id), result)
+    if max_stores is not None:
+        cache_manager.prune_outcome_stores(max_stores)
+    return directory
+
+
+def load_cached_outcome_store(
+    cache_manager: CacheManager, store_id: str
+) -> Optional["OutcomeStore"]:
+    """
+    Memory-map a store written by save_cached_outcome_store.
+
+    Args:
+        cache_manager: Cache manager owning the store directories
+        store_id: Identifier given to save_cached_outcome_store
+
+    Returns:
+        OutcomeStore, or None if not stored or unreadable
+    """
+    directory = cache_manager.outcome_store_path(store_id)
+    if not directory.is_dir():
+        return None
+    try:
+        return OutcomeStore.open(directory)
+    except Exception as e:
+        logger.error(f"Failed to open outcome store {store_id}: {e}")
+        return None
+
+
+@dataclass
+class OutcomeStore:
+    """
+    Read-only, memory-mapped view of a stored run.
+
+    Use OutcomeStore.open to load one. Arrays are numpy memmaps, so opening a
+    store reads only its metadata.
+    """
+
+    path: Path
+    game_ids: List[str]
+    team_ids: List[str]
+    fixed_signature: str
+    random_seed: Optional[int]
+    exact: bool
+    outcomes: CompactOutcomes
+    division_winners: np.ndarray  # (num_simulations × num_divisions) int8
+    seeds: np.ndarray  # (num_simulations × num_conferences × 7) int8
+    score_dependent: np.ndarray  # (num_simulations,) bool, seeding depended on points
+
+    @classmethod
+    def open(cls, directory: Path | str) -> "OutcomeStore":
+        """
+        Memory-map a store written by save_outcome_store.
+
+        Args:
+            directory: Store directory
+
+        Returns:
+            OutcomeStore
+
+        Raises:
+            FileNotFoundError: If the directory is not a store
+            ValueError: If the store was written in another format version
+        """
+        directory = Path(directory)
+        with open(directory / _METADATA_FILE) as f:
+            metadata = json.load(f)
+        if metadata.get("version") != OUTCOME_STORE_VERSION:
+            raise ValueError(f"Unsupported outcome store version {metadata.get('version')}")
+
+        # Streamed stores may hold unused rows past the last simulation
+        num_simulations = metadata["num_simulations"]
+        arrays = {
+            name: np.load(directory / f"{name}.npy", mmap_mode="r")[:num_simulations]
+            for name in _ARRAYS
+        }
+        return cls(
+            path=directory,
+            game_ids=metadata["game_ids"],
+            team_ids=metadata["team_ids"],
+            fixed_signature=metadata["fixed_signature"],
+            random_seed=metadata["random_seed"],
+            exact=metadata.get("exact", False),
+            outcomes=CompactOutcomes(
+                home_wins_packed=arrays["home_wins_packed"],
+                home_scores=arrays["home_scores"],
+                away_scores=arrays["away_scores"],
+                num_games=metadata["num_games"],
+            ),
+            division_winners=arrays["division_winners"],
+            seeds=arrays["seeds"],
+            score_dependent=arrays["score_dependent"],
+        )
+
+    @property
+    def num_simulations(self) -> int:
+        """Number of stored simulations."""
+        return self.outcomes.num_simulations
+
+    def matching_simulations(
+        self, winners: Mapping[str, str], games: List[Game]
+    ) -> np.ndarray:
+        """
+        Simulations in which every listed game had the given result.
+
+        Only the listed games' score columns are read from disk.
+
+        Args:
+            winners: Game ID -> winning team ID, or TIE
+            games: Schedule containing the listed games
+
+        Returns:
+            Sorted simulation (row) indices
+
+        Raises:
+            ValueError: If a game was not simulated in the run or a winner
+                did not play in it
+        """
+        columns = {game_id: column for column, game_id in enumerate(self.game_ids)}
+        games_by_id = {game.id: game for game in games}
+        mask = np.ones(self.num_simulations, dtype=bool)
+
+        for game_id, winner in winners.items():
+            column = columns.get(game_id)
+            game = games_by_id.get(game_id)
+            if column is None or game is None:
+                raise ValueError(f"Game {game_id} was not simulated in the stored run")
+
+            home = self.outcomes.home_scores[:, column]
+            away = self.outcomes.away_scores[:, column]
+            if winner == game.home_team_id:
+                mask &= home > away
+            elif winner == game.away_team_id:
+                mask &= home < away
+            elif winner == TIE:
+                mask &= home == away
+            else:
+                raise ValueError(f"Team {winner} did not play in game {game_id}")
+
+        return np.flatnonzero(mask)
+
+    def query(
+        self,
+        winners: Mapping[str, str],
+        games: List[Game],
+        teams: List[Team],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> SimulationResult:
+        """
+        Team statistics over the simulations matching the given results.
+
+        Args:
+            winners: Game ID -> winning team ID, or TIE (empty for the whole run)
+            games: Current schedule; its decided games must match the stored run
+            teams: List of all teams
+            chunk_size: Matching simulations aggregated at a time
+
+        Returns:
+            SimulationResult over the matching simulations (num_simulations
+            is the number matched; statistics are empty if none matched)
+
+        Raises:
+            StaleOutcomeStoreError: If the decided games, the simulated games
+                or the teams changed since the run
+            ValueError: If a condition is invalid
+        """
+        start_time = time.time()
+        baseline = build_run_baseline(self.game_ids, games, teams)
+        if (
+            [game.id for game in baseline.remaining_games] != self.game_ids
+            or baseline.fixed_signature != self.fixed_signature
+            or baseline.team_ids != self.team_ids
+        ):
+            raise StaleOutcomeStoreError("Schedule changed since the outcomes were stored")
+
+        rows = self.matching_simulations(winners, games)
+        team_stats: Dict[str, TeamSimulationStats] = {
+            team_id: TeamSimulationStats(team_id=team_id) for team_id in self.team_ids
+        }
+        for start in range(0, rows.size, chunk_size):
+            chunk = rows[start:start + chunk_size]
+            outcomes = self.outcomes.take(chunk)
+            accumulate_team_stats(
+                team_stats,
+                baseline,
+                calculate_batch_standings(baseline, outcomes),
+                np.asarray(self.division_winners[chunk]),
+                np.asarray(self.seeds[chunk]),
+            )
+        for stats in team_stats.values():
+            stats.total_simulations = int(rows.size)
+
+        logger.info(
+            f"Matched {rows.size:,} of {self.num_simulations:,} stored simulations "
+            f"in {time.time() - start_time:.3f}s"
+        )
+        return SimulationResult(
+            team_stats=team_stats,
+            num_simulations=int(rows.size),
+            execution_time_seconds=time.time() - start_time,
+            exact=self.exact,
+            score_dependent_simulations=int(np.count_nonzero(self.score_dependent[rows])),
+        )
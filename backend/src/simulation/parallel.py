@@ -0,0 +1,504 @@
+"""
+Multi-process sharded execution of Monte Carlo simulations.
+
+Splits a run into fixed-size shards, each with its own seed derived from the
+run's random seed via numpy.random.SeedSequence.spawn. Shards are executed in
+a process pool (or in-process for a single worker) and their counters are
+merged in shard order, so a seeded run gives the same result regardless of
+how many workers were used.
+
+When few games remain and every game is a 50/50 coin flip, the run
+enumerates every outcome exactly instead of sampling (see exact.py); shards
+then cover contiguous outcome ranges. When the full enumeration is too
+large, games that cannot change any seed are pruned from it and the choice
+is made again on the pruned outcome count.
+
+Adaptive runs (see convergence.py) check the stopping criteria on the
+leading run of finished shards, in shard order, and drop any shards finished
+beyond it, so a seeded run that converges stops at the same shard with any
+number of workers.
+
+A run given an outcome store directory preallocates the store before any
+shard starts, and every shard writes its own rows into it (see
+OutcomeStoreWriter), so persisting a run never gathers its outcomes in the
+parent process.
+
+Worker pools are long-lived and shared between runs with the same worker
+count. Each run pickles its schedule once and sends it with every shard;
+workers unpickle it only when it differs from the last schedule they saw.
+"""
+
+import hashlib
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+from dataclasses import replace
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from ..data.models import Game, Team
+from ..utils.logger import setup_logger
+from .batch_standings import build_season_baseline
+from .convergence import ConvergenceCriteria, ConvergenceMonitor
+from .exact import (
+    DEFAULT_EXACT_MAX_GAMES,
+    count_enumerated_games,
+    count_outcomes,
+    count_remaining_games,
+    enumerate_season,
+    use_exact_enumeration,
+)
+from .importance import ImportanceSampler
+from .monte_carlo import (
+    OutcomeSink,
+    SimulationResult,
+    SimulationCancelledError,
+    TeamSimulationStats,
+    simulate_season,
+)
+from .outcome_store import OutcomeStoreWriter
+from .scores import SAMPLING_INDEPENDENT, validate_sampling
+from .win_probability import WinProbabilityModel
+
+logger = setup_logger(__name__)
+
+
+DEFAULT_SHARD_SIZE = 10000
+
+# Per-process schedule, replaced when a shard brings a different one
+_worker_schedule_key: Optional[str] = None
+_worker_games: List[Game] = []
+_worker_teams: List[Team] = []
+
+# Long-lived pools keyed on worker count
+_pools: Dict[int, ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+
+def plan_shards(num_simulations: int, shard_size: int = DEFAULT_SHARD_SIZE) -> List[int]:
+    """
+    Split a run into shard sizes.
+
+    The split depends only on num_simulations and shard_size (never on the
+    worker count), which keeps seeded results reproducible.
+
+    Args:
+        num_simulations: Total number of simulations
+        shard_size: Maximum simulations per shard
+
+    Returns:
+        List of shard sizes summing to num_simulations
+    """
+    if shard_size <= 0:
+        raise ValueError("shard_size must be positive")
+
+    full, remainder = divmod(num_simulations, shard_size)
+    shards = [shard_size] * full
+    if remainder:
+        shards.append(remainder)
+    return shards
+
+
+def derive_shard_seeds(random_seed: Optional[int], num_shards: int) -> List[int]:
+    """
+    Derive independent per-shard seeds from a run seed.
+
+    Args:
+        random_seed: Run seed (None draws fresh entropy)
+        num_shards: Number of shards
+
+    Returns:
+        List of 32-bit integer seeds, one per shard
+    """
+    children = np.random.SeedSequence(random_seed).spawn(num_shards)
+    return [int(child.generate_state(1)[0]) for child in children]
+
+
+def _worker_pool(num_workers: int) -> ProcessPoolExecutor:
+    """Return the shared pool with num_workers processes, starting it if needed."""
+    with _pools_lock:
+        pool = _pools.get(num_workers)
+        if pool is None:
+            pool = ProcessPoolExecutor(
+                max_workers=num_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            _pools[num_workers] = pool
+        return pool
+
+
+def _discard_pool(num_workers: int, pool: ProcessPoolExecutor) -> None:
+    """Forget a broken pool so the next run starts a fresh one."""
+    with _pools_lock:
+        if _pools.get(num_workers) is pool:
+            del _pools[num_workers]
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_worker_pools() -> None:
+    """Stop every shared worker pool (e.g. on application shutdown)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _pack_schedule(games: List[Game], teams: List[Team]) -> tuple:
+    """Pickle a schedule once per run, keyed by a digest of its contents."""
+    payload = pickle.dumps((games, teams), protocol=pickle.HIGHEST_PROTOCOL)
+    return hashlib.sha1(payload).hexdigest(), payload
+
+
+def _load_schedule(schedule_key: str, payload: bytes) -> None:
+    """Install a shard's schedule in this worker unless it is already current."""
+    global _worker_schedule_key, _worker_games, _worker_teams
+    if schedule_key != _worker_schedule_key:
+        _worker_games, _worker_teams = pickle.loads(payload)
+        _worker_schedule_key = schedule_key
+
+
+def _simulate_shard(
+    games: List[Game],
+    teams: List[Team],
+    start: int,
+    stop: int,
+    shard_seed: int,
+    exact: bool,
+    retain_outcomes: bool = False,
+    cancel_callback: Optional[Callable[[], bool]] = None,
+    profile: bool = False,
+    win_probability_model: Optional[WinProbabilityModel] = None,
+    sampling: str = SAMPLING_INDEPENDENT,
+    importance: Optional[ImportanceSampler] = None,
+    outcome_sink: Optional[OutcomeSink] = None,
+    prune: bool = False,
+) -> SimulationResult:
+    """Sample stop - start simulations, or enumerate outcomes start..stop-1."""
+    if exact:
+        return enumerate_season(
+            games,
+            teams,
+            start=start,
+            stop=stop,
+            random_seed=shard_seed,
+            cancel_callback=cancel_callback,
+            retain_outcomes=retain_outcomes,
+            profile=profile,
+            outcome_sink=outcome_sink,
+            prune=prune,
+        )
+    return simulate_season(
+        games,
+        teams,
+        num_simulations=stop - start,
+        random_seed=shard_seed,
+        cancel_callback=cancel_callback,
+        retain_outcomes=retain_outcomes,
+        profile=profile,
+        win_probability_model=win_probability_model,
+        sampling=sampling,
+        importance=importance,
+        outcome_sink=outcome_sink,
+    )
+
+
+def _run_shard(
+    schedule_key: str,
+    schedule: bytes,
+    start: int,
+    stop: int,
+    shard_seed: int,
+    exact: bool,
+    retain_outcomes: bool = False,
+    profile: bool = False,
+    win_probability_model: Optional[WinProbabilityModel] = None,
+    sampling: str = SAMPLING_INDEPENDENT,
+    importance: Optional[ImportanceSampler] = None,
+    outcome_sink: Optional[OutcomeSink] = None,
+    prune: bool = False,
+) -> SimulationResult:
+    """Run one shard in a worker process."""
+    _load_schedule(schedule_key, schedule)
+    return _simulate_shard(
+        _worker_games,
+        _worker_teams,
+        start,
+        stop,
+        shard_seed,
+        exact,
+        retain_outcomes,
+        profile=profile,
+        win_probability_model=win_probability_model,
+        sampling=sampling,
+        importance=importance,
+        outcome_sink=outcome_sink,
+        prune=prune,
+    )
+
+
+def default_num_workers() -> int:
+    """Number of worker processes to use when none is specified."""
+    return os.cpu_count() or 1
+
+
+def simulate_season_parallel(
+    games: List[Game],
+    teams: List[Team],
+    num_simulations: int = 10000,
+    random_seed: Optional[int] = None,
+    num_workers: Optional[int] = None,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    progress_callback: Optional[Callable[[int], None]] = None,
+    cancel_callback: Optional[Callable[[], bool]] = None,
+    retain_outcomes: bool = False,
+    exact_max_games: int = DEFAULT_EXACT_MAX_GAMES,
+    profile: bool = False,
+    win_probability_model: Optional[WinProbabilityModel] = None,
+    partial_callback: Optional[Callable[[SimulationResult], None]] = None,
+    convergence: Optional[ConvergenceCriteria] = None,
+    sampling: str = SAMPLING_INDEPENDENT,
+    importance: Optional[ImportanceSampler] = None,
+    outcome_store: Optional[Path | str] = None,
+) -> SimulationResult:
+    """
+    Run a Monte Carlo simulation split into shards across worker processes.
+
+    If every remaining game is a 50/50 coin flip, enumerating every outcome
+    takes no more rows than num_simulations and at most exact_max_games games
+    are enumerated, the season is enumerated exactly instead and the result
+    has exact=True. If the full enumeration is too large, games that cannot
+    change any seed are pruned from it (see exact.prunable_games) and the
+    pruned outcome count decides instead; a pruned run retains no outcomes,
+    and runs with an outcome_store are never pruned.
+
+    Args:
+        games: List of all games in the season
+        teams: List of all teams
+        num_simulations: Number of Monte Carlo simulations to run
+        random_seed: Optional run seed; each shard gets a seed spawned from it
+        num_workers: Worker processes (default: CPU count; 1 runs in-process)
+        shard_size: Maximum simulations per shard
+        progress_callback: Optional callback receiving percentage complete (0-100)
+        cancel_callback: Optional function returning True when caller requests cancellation
+        retain_outcomes: Keep per-simulation outcomes on the merged result
+        exact_max_games: Most remaining games to enumerate (0 always samples)
+        profile: Record per-stage timings and tiebreak rule counts, summed over
+            shards (with several workers, stage times can exceed wall time)
+        win_probability_model: Optional model giving each remaining game's
+            home-win probability (default: 50/50)
+        partial_callback: Optional callback receiving the statistics of the
+            shards finished so far (without retained outcomes) after each
+            shard. Not called for exact enumeration, whose outcome ranges are
+            not representative until all have been evaluated.
+        convergence: Optional criteria for stopping a sampled run early;
+            num_simulations is then a ceiling and shards hold at most
+            convergence.batch_size simulations. Ignored for exact enumeration.
+        sampling: Variance reduction for sampled runs (independent,
+            antithetic or stratified), applied within each shard
+        importance: Optional importance sampler for rare events; the run is
+            always sampled and its team statistics hold weighted counters
+        outcome_store: Optional directory to write every simulation's
+            outcomes and seeding to as shards produce them (see
+            outcome_store.py); independent of retain_outcomes
+
+    Returns:
+        SimulationResult merged from all shards (or the leading shards of a
+        run that stopped early) in shard order
+
+    Raises:
+        SimulationCancelledError: If cancellation was requested
+        ValueError: If sampling is unknown, or importance sampling is combined
+            with convergence, retain_outcomes or outcome_store
+    """
+    start_time = time.time()
+    validate_sampling(sampling)
+    if importance is not None and convergence is not None:
+        raise ValueError("Importance sampling cannot be combined with convergence")
+    if importance is not None and outcome_store is not None:
+        raise ValueError("Importance-sampled outcomes cannot be stored")
+
+    num_remaining = count_remaining_games(games, teams)
+    # Enumerated outcomes are equally likely only under 50/50 games
+    fair = win_probability_model is None or win_probability_model.is_fair
+    exact = prune = False
+    if fair and importance is None:
+        num_enumerated = num_remaining
+        exact = use_exact_enumeration(num_enumerated, num_simulations, exact_max_games)
+        # Pruned rows stand for many outcomes (and flag more of them as
+        # inexact), so prune only when the full enumeration is too large
+        if not exact and outcome_store is None and exact_max_games > 0:
+            num_enumerated = count_enumerated_games(games, teams)
+            exact = prune = use_exact_enumeration(
+                num_enumerated, num_simulations, exact_max_games
+            )
+    total = count_outcomes(num_enumerated) if exact else num_simulations
+
+    monitor = None
+    if convergence is not None and not exact:
+        monitor = ConvergenceMonitor(convergence, total)
+        shard_size = min(shard_size, convergence.batch_size)
+
+    shards = plan_shards(total, shard_size)
+    starts = np.concatenate([[0], np.cumsum(shards)]).astype(int).tolist()
+    seeds = derive_shard_seeds(random_seed, len(shards))
+    workers = min(num_workers or default_num_workers(), max(len(shards), 1))
+
+    writer = None
+    if outcome_store is not None:
+        writer = OutcomeStoreWriter.create(
+            outcome_store, build_season_baseline(games, teams), total
+        )
+
+    def shard_sink(idx: int) -> Optional[OutcomeSink]:
+        return writer.for_rows(starts[idx]).write if writer is not None else None
+
+    logger.info(
+        f"Running {total:,} {'enumerated outcomes' if exact else 'simulations'} "
+        f"in {len(shards)} shards on {workers} worker(s)"
+    )
+
+    results: List[Optional[SimulationResult]] = [None] * len(shards)
+
+    def report(done: int) -> None:
+        if progress_callback and shards:
+            progress_callback(int(done / len(shards) * 100))
+
+    def add_stats(running: Optional[SimulationResult], shard_result: SimulationResult):
+        stats_only = replace(shard_result, retained=None, profile=None)
+        return stats_only if running is None else SimulationResult.merge([running, stats_only])
+
+    partial: Optional[SimulationResult] = None
+
+    def report_partial(shard_result: SimulationResult) -> None:
+        nonlocal partial
+        if partial_callback is None or exact:
+            return
+        partial = add_stats(partial, shard_result)
+        partial_callback(partial)
+
+    # Shards 0..leading-1 have finished; only they count towards convergence
+    leading = 0
+    leading_stats: Optional[SimulationResult] = None
+
+    def converged() -> bool:
+        nonlocal leading, leading_stats
+        if monitor is None or leading >= len(shards) or results[leading] is None:
+            return False
+        while leading < len(shards) and results[leading] is not None:
+            leading_stats = add_stats(leading_stats, results[leading])
+            leading += 1
+        return monitor.should_stop(leading_stats.team_stats, leading_stats.num_simulations)
+
+    try:
+        if workers <= 1:
+            for idx, seed in enumerate(seeds):
+                if cancel_callback and cancel_callback():
+                    logger.info(
+                        "Simulation cancelled after %s/%s shards", idx, len(shards)
+                    )
+                    raise SimulationCancelledError("Simulation cancelled")
+                results[idx] = _simulate_shard(
+                    games,
+                    teams,
+                    starts[idx],
+                    starts[idx + 1],
+                    seed,
+                    exact,
+                    retain_outcomes,
+                    cancel_callback,
+                    profile,
+                    win_probability_model,
+                    sampling,
+                    importance,
+                    shard_sink(idx),
+                    prune,
+                )
+                report_partial(results[idx])
+                if converged():
+                    break
+                report(idx + 1)
+        else:
+            schedule_key, schedule = _pack_schedule(games, teams)
+            executor = _worker_pool(workers)
+            futures = {}
+            try:
+                futures = {
+                    executor.submit(
+                        _run_shard,
+                        schedule_key,
+                        schedule,
+                        starts[idx],
+                        starts[idx + 1],
+                        seed,
+                        exact,
+                        retain_outcomes,
+                        profile,
+                        win_probability_model,
+                        sampling,
+                        importance,
+                        shard_sink(idx),
+                        prune,
+                    ): idx
+                    for idx, seed in enumerate(seeds)
+                }
+                pending = set(futures)
+                while pending:
+                    done, pending = wait(
+                        pending, timeout=0.25, return_when=FIRST_COMPLETED
+                    )
+                    for future in done:
+                        results[futures[future]] = future.result()
+                        report_partial(results[futures[future]])
+                    if done and converged():
+                        break
+                    if done:
+                        report(len(shards) - len(pending))
+                    if cancel_callback and cancel_callback():
+                        logger.info(
+                            "Simulation cancelled with %s/%s shards remaining",
+                            len(pending),
+                            len(shards),
+                        )
+                        raise SimulationCancelledError("Simulation cancelled")
+            except BrokenProcessPool:
+                _discard_pool(workers, executor)
+                raise
+            finally:
+                # The pool outlives the run; drop only this run's unstarted shards
+                for future in futures:
+                    future.cancel()
+    except BaseException:
+        if writer is not None:
+            writer.discard()
+        raise
+
+    if monitor is not None:
+        # Drop shards that finished beyond the point where the run stopped
+        results = results[:leading]
+        if progress_callback:
+            progress_callback(100)
+    merged = SimulationResult.merge([r for r in results if r is not None])
+    for team in teams:
+        merged.team_stats.setdefault(team.id, TeamSimulationStats(team_id=team.id))
+    if monitor is not None:
+        merged.convergence = monitor.report(merged.team_stats)
+
+    if merged.retained is not None:
+        merged.retained.random_seed = random_seed
+        merged.retained.win_probability_model = win_probability_model
+    if writer is not None:
+        writer.commit(merged, random_seed, win_probability_model)
+
+    merged.execution_time_seconds = time.time() - start_time
+    logger.info(
+        f"Parallel simulation complete in {merged.execution_time_seconds:.2f}s "
+        f"({total / max(merged.execution_time_seconds, 1e-9):.0f} sims/sec)"
+    )
+    return merged
@@ -0,0 +1,144 @@
+"""
+Optional per-stage profiling of simulation runs.
+
+A SimulationProfile collects wall time per pipeline stage and counts of the
+tiebreak rule that decided each tie. Profiling is switched on for a block of
+code with profile_simulation(); the pipeline reports into whichever profile
+is active through a context variable, so nothing has to be threaded through
+function signatures. With no active profile, stage() returns a shared no-op
+context manager and rule notes return after a single lookup.
+"""
+
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import ContextManager, Dict, Iterator, List, Optional
+
+
+@dataclass
+class SimulationProfile:
+    """Stage timings and tiebreak rule counts for a simulation run."""
+
+    stage_seconds: Dict[str, float] = field(default_factory=dict)
+    stage_calls: Dict[str, int] = field(default_factory=dict)
+    # Tiebreak rule name -> number of ties that rule decided
+    tiebreak_rules: Dict[str, int] = field(default_factory=dict)
+
+    def add_time(self, stage_name: str, seconds: float) -> None:
+        """Add elapsed time to a stage."""
+        self.stage_seconds[stage_name] = self.stage_seconds.get(stage_name, 0.0) + seconds
+        self.stage_calls[stage_name] = self.stage_calls.get(stage_name, 0) + 1
+
+    def count_rule(self, rule: str) -> None:
+        """Count a tie decided by a rule."""
+        self.tiebreak_rules[rule] = self.tiebreak_rules.get(rule, 0) + 1
+
+    def merge(self, other: "SimulationProfile") -> None:
+        """
+        Add another profile's timings and counts to this one.
+
+        Args:
+            other: Profile to fold in (unchanged)
+        """
+        for stage_name, seconds in other.stage_seconds.items():
+            self.stage_seconds[stage_name] = self.stage_seconds.get(stage_name, 0.0) + seconds
+        for stage_name, calls in other.stage_calls.items():
+            self.stage_calls[stage_name] = self.stage_calls.get(stage_name, 0) + calls
+        for rule, count in other.tiebreak_rules.items():
+            self.tiebreak_rules[rule] = self.tiebreak_rules.get(rule, 0) + count
+
+    @classmethod
+    def combine(cls, profiles: List[Optional["SimulationProfile"]]) -> Optional["SimulationProfile"]:
+        """
+        Merge several profiles (e.g. one per shard).
+
+        Args:
+            profiles: Profiles to merge; None entries are skipped
+
+        Returns:
+            Merged profile, or None if no profile was given
+        """
+        present = [profile for profile in profiles if profile is not None]
+        if not present:
+            return None
+        combined = cls()
+        for profile in present:
+            combined.merge(profile)
+        return combined
+
+    def to_dict(self) -> Dict[str, object]:
+        """Serialize for API responses."""
+        return {
+            "stage_seconds": dict(self.stage_seconds),
+            "stage_calls": dict(self.stage_calls),
+            "tiebreak_rules": dict(self.tiebreak_rules),
+        }
+
+
+_active_profile: ContextVar[Optional[SimulationProfile]] = ContextVar(
+    "simulation_profile", default=None
+)
+
+_NO_STAGE = nullcontext()
+
+
+class _StageTimer:
+    """Context manager adding its elapsed time to a profile stage."""
+
+    __slots__ = ("profile", "stage_name", "start")
+
+    def __init__(self, profile: SimulationProfile, stage_name: str):
+        self.profile = profile
+        self.stage_name = stage_name
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        self.profile.add_time(self.stage_name, time.perf_counter() - self.start)
+
+
+@contextmanager
+def profile_simulation(
+    profile: Optional[SimulationProfile] = None,
+) -> Iterator[SimulationProfile]:
+    """
+    Collect stage timings and tiebreak rule counts inside the block.
+
+    Args:
+        profile: Profile to add to (a new one is created if not given)
+
+    Yields:
+        The active SimulationProfile
+    """
+    profile = profile if profile is not None else SimulationProfile()
+    token = _active_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _active_profile.reset(token)
+
+
+def stage(stage_name: str) -> ContextManager[None]:
+    """
+    Time a pipeline stage if profiling is active.
+
+    Args:
+        stage_name: Stage to add the elapsed time to
+
+    Returns:
+        Context manager (a shared no-op when profiling is off)
+    """
+    profile = _active_profile.get()
+    if profile is None:
+        return _NO_STAGE
+    return _StageTimer(profile, stage_name)
+
+
+def note_tiebreak_rule(rule: str) -> None:
+    """Count a tie decided by a rule if profiling is active."""
+    profile = _active_profile.get()
+    if profile is not None:
+        profile.count_rule(rule)
@@ -0,0 +1,312 @@
+"""
+Cache of finished simulation results.
+
+A run is identified by a content hash of everything that determines its
+output: the effective schedule (results and overrides), the teams, and the
+run parameters. Results are kept in an in-memory LRU and written through to
+disk via CacheManager, so a repeated request is answered without simulating.
+
+The disk tier holds aggregated statistics only. The memory tier also keeps
+per-simulation outcomes (retained for what-if updates) for the most recent
+entries, up to a byte budget, so a cache hit can still take incremental
+override updates. Lookups return copies, since those updates modify a result
+in place.
+
+Only seeded runs are cached: an unseeded request asks for fresh samples.
+The disk tier keeps the most recently saved entries up to a count and drops
+entries past the age limit.
+"""
+
+import copy
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from ..data.cache_manager import CacheManager
+from ..data.models import Game, Team
+from ..utils.logger import setup_logger
+from .convergence import ConvergenceCriteria
+from .monte_carlo import SimulationResult, TeamSimulationStats
+
+logger = setup_logger(__name__)
+
+
+# Bump when a change to the simulation alters results for the same inputs
+RESULT_CACHE_VERSION = 4
+
+DEFAULT_MAX_ENTRIES = 32
+DEFAULT_MAX_DISK_ENTRIES = 256
+DEFAULT_MAX_RETAINED_BYTES = 256 * 1024 * 1024
+
+
+def is_cacheable_run(
+    random_seed: Optional[int], convergence: Optional[ConvergenceCriteria] = None
+) -> bool:
+    """
+    True if a run's result may be cached and served again.
+
+    Unseeded runs are expected to draw fresh samples on every call, and
+    time-budgeted adaptive runs stop at a load-dependent point.
+
+    Args:
+        random_seed: Run seed
+        convergence: Optional early-stopping criteria of the run
+
+    Returns:
+        True for seeded runs that always produce the same result
+    """
+    return random_seed is not None and (convergence is None or convergence.is_reproducible)
+
+
+def simulation_cache_key(
+    games: List[Game],
+    teams: List[Team],
+    num_simulations: int,
+    random_seed: Optional[int],
+    **options: object,
+) -> str:
+    """
+    Content hash identifying a simulation run.
+
+    Args:
+        games: List of all games in the season (including overrides)
+        teams: List of all teams
+        num_simulations: Number of simulations requested
+        random_seed: Run seed (see is_cacheable_run)
+        **options: Further parameters that change results (e.g. shard_size)
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    digest.update(
+        json.dumps(
+            {
+                "version": RESULT_CACHE_VERSION,
+                "num_simulations": num_simulations,
+                "random_seed": random_seed,
+                "options": options,
+            },
+            sort_keys=True,
+        ).encode()
+    )
+    for team in sorted(teams, key=lambda t: t.id):
+        digest.update(f"T{team.id}:{team.conference}:{team.division};".encode())
+    for game in sorted(games, key=lambda g: g.id):
+        digest.update(
+            (
+                f"G{game.id}:{game.home_team_id}:{game.away_team_id}:"
+                f"{game.is_completed}:{game.home_score}:{game.away_score}:"
+                f"{game.is_overridden}:{game.override_home_score}:"
+                f"{game.override_away_score};"
+            ).encode()
+        )
+    return digest.hexdigest()
+
+
+def detach_result(result: SimulationResult, keep_retained: bool = True) -> SimulationResult:
+    """Copy of a result that shares no mutable state with it."""
+    return replace(
+        result,
+        team_stats=copy.deepcopy(result.team_stats),
+        retained=copy.deepcopy(result.retained) if keep_retained else None,
+    )
+
+
+def serialize_cached_result(result: SimulationResult) -> Dict[str, object]:
+    """
+    Convert a result's aggregated counters to a JSON-serializable dict.
+
+    Per-simulation outcomes (result.retained) are not included.
+    """
+    return {
+        "num_simulations": result.num_simulations,
+        "execution_time_seconds": result.execution_time_seconds,
+        "exact": result.exact,
+        "score_dependent_simulations": result.score_dependent_simulations,
+        "team_stats": {
+            team_id: {
+                "wins_histogram": stats.wins_histogram.tolist(),
+                "made_playoffs_count": stats.made_playoffs_count,
+                "won_division_count": stats.won_division_count,
+                "first_seed_count": stats.first_seed_count,
+                "seed_counts": {str(k): v for k, v in stats.seed_counts.items()},
+                "total_simulations": stats.total_simulations,
+                "total_weight": stats.total_weight,
+                "total_squared_weight": stats.total_squared_weight,
+            }
+            for team_id, stats in result.team_stats.items()
+        },
+    }
+
+
+def deserialize_cached_result(data: Dict[str, object]) -> SimulationResult:
+    """Convert a dict from serialize_cached_result back to a SimulationResult."""
+    return SimulationResult(
+        team_stats={
+            team_id: TeamSimulationStats(
+                team_id=team_id,
+                # Importance-sampled runs store weighted (float) counters
+                wins_histogram=np.array(
+                    stats["wins_histogram"],
+                    dtype=np.float64 if stats.get("total_weight") is not None else np.int64,
+                ),
+                made_playoffs_count=stats["made_playoffs_count"],
+                won_division_count=stats["won_division_count"],
+                first_seed_count=stats["first_seed_count"],
+                seed_counts={int(k): v for k, v in stats["seed_counts"].items()},
+                total_simulations=stats["total_simulations"],
+                total_weight=stats.get("total_weight"),
+                total_squared_weight=stats.get("total_squared_weight"),
+            )
+            for team_id, stats in data["team_stats"].items()
+        },
+        num_simulations=data["num_simulations"],
+        execution_time_seconds=data["execution_time_seconds"],
+        exact=data.get("exact", False),
+        score_dependent_simulations=data.get("score_dependent_simulations", 0),
+    )
+
+
+def _retained_nbytes(result: SimulationResult) -> int:
+    retained = result.retained
+    if retained is None:
+        return 0
+    return (
+        retained.outcomes.nbytes
+        + retained.division_winners.nbytes
+        + retained.seeds.nbytes
+        + retained.score_dependent.nbytes
+    )
+
+
+class SimulationResultCache:
+    """In-memory LRU of simulation results, written through to disk."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        cache_manager: Optional[CacheManager] = None,
+        max_age_seconds: Optional[int] = None,
+        max_retained_bytes: int = DEFAULT_MAX_RETAINED_BYTES,
+        max_disk_entries: int = DEFAULT_MAX_DISK_ENTRIES,
+    ):
+        """
+        Args:
+            max_entries: Results kept in memory (0 disables the memory tier)
+            cache_manager: Optional CacheManager for the disk tier
+            max_age_seconds: Ignore (and delete) disk entries older than this
+            max_retained_bytes: Memory budget for retained per-simulation outcomes
+            max_disk_entries: Results kept on disk; the oldest are deleted first
+        """
+        self.max_entries = max_entries
+        self.cache_manager = cache_manager
+        self.max_age_seconds = max_age_seconds
+        self.max_retained_bytes = max_retained_bytes
+        self.max_disk_entries = max_disk_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, SimulationResult]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[SimulationResult]:
+        """
+        Look up a result.
+
+        Args:
+            key: Key from simulation_cache_key
+
+        Returns:
+            Copy of the cached result (safe to modify), or None on a miss
+        """
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+
+        if result is None and self.cache_manager is not None:
+            result = self._load_from_disk(key)
+            if result is not None:
+                self._remember(key, result)
+
+        with self._lock:
+            if result is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        logger.info(f"Simulation cache hit {key[:12]}")
+        return detach_result(result)
+
+    def put(self, key: str, result: SimulationResult) -> None:
+        """
+        Store a finished result.
+
+        Args:
+            key: Key from simulation_cache_key
+            result: Result to cache (a detached copy is stored)
+        """
+        keep_retained = _retained_nbytes(result) <= self.max_retained_bytes
+        # A profile describes the run that produced the result, not a cache hit
+        stored = replace(detach_result(result, keep_retained=keep_retained), profile=None)
+        self._remember(key, stored)
+        if self.cache_manager is not None:
+            try:
+                self.cache_manager.save_simulation_data(key, serialize_cached_result(stored))
+                self.cache_manager.prune_simulation_results(
+                    self.max_disk_entries, self.max_age_seconds
+                )
+            except Exception as e:
+                logger.warning(f"Failed to save simulation result to disk: {e}")
+
+    def _load_from_disk(self, key: str) -> Optional[SimulationResult]:
+        data = self.cache_manager.load_simulation_data(key, self.max_age_seconds)
+        if data is None:
+            return None
+        try:
+            return deserialize_cached_result(data)
+        except Exception as e:
+            logger.error(f"Failed to deserialize simulation result: {e}")
+            return None
+
+    def _remember(self, key: str, result: SimulationResult) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+            # Keep retained outcomes only on the most recent entries within budget
+            budget = self.max_retained_bytes
+            for entry_key in reversed(self._entries):
+                entry = self._entries[entry_key]
+                nbytes = _retained_nbytes(entry)
+                if nbytes > budget:
+                    self._entries[entry_key] = replace(entry, retained=None)
+                else:
+                    budget -= nbytes
+
+    def clear(self) -> None:
+        """Drop every cached result (memory and disk)."""
+        with self._lock:
+            self._entries.clear()
+        if self.cache_manager is not None:
+            self.cache_manager.clear_simulation_results()
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and entry counts."""
+        with self._lock:
+            stats = {
+                "hits": self.hits,
+                "misses": self.misses,
+                "memory_entries": len(self._entries),
+            }
+        if self.cache_manager is not None:
+            stats["disk_entries"] = self.cache_manager.count_simulation_results()
+        return stats
@@ -0,0 +1,102 @@
+"""
+Random number streams for simulation runs.
+
+Every run owns its generators instead of seeding numpy's or the stdlib's
+global state. A run seed is expanded with numpy.random.SeedSequence into
+independent PCG64 streams for game outcomes, scores and coin-toss
+tiebreakers, so changing how one stage draws numbers leaves the others
+untouched, and concurrent runs in one process do not interfere.
+
+Tiebreakers are called deep inside the seeding code, so the coin-toss stream
+is installed for a block of code with tiebreak_stream() and read through a
+context variable (per thread), like the active profile in profiling.py.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, Optional, Sequence, Union
+
+import numpy as np
+
+
+# Anything a run can be seeded from (None draws fresh entropy)
+SeedLike = Union[None, int, np.random.SeedSequence, np.random.Generator]
+
+
+@dataclass
+class SimulationStreams:
+    """Independent generators for the random stages of a run."""
+
+    outcomes: np.random.Generator  # game winners (and latent team strengths)
+    scores: np.random.Generator  # margins and totals
+    tiebreaks: np.random.Generator  # coin tosses
+
+
+def _generator(seed_sequence: np.random.SeedSequence) -> np.random.Generator:
+    return np.random.Generator(np.random.PCG64(seed_sequence))
+
+
+def simulation_streams(seed: SeedLike = None) -> SimulationStreams:
+    """
+    Spawn the streams of a run.
+
+    Args:
+        seed: Run seed, SeedSequence, or Generator to derive the streams from
+            (None draws fresh entropy)
+
+    Returns:
+        SimulationStreams (the same seed always gives the same streams)
+    """
+    if isinstance(seed, np.random.Generator):
+        seed = np.random.SeedSequence(seed.integers(0, 2**63, size=4))
+    elif not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    outcomes, scores, tiebreaks = seed.spawn(3)
+    return SimulationStreams(
+        outcomes=_generator(outcomes),
+        scores=_generator(scores),
+        tiebreaks=_generator(tiebreaks),
+    )
+
+
+_tiebreak_rng: ContextVar[Optional[np.random.Generator]] = ContextVar(
+    "tiebreak_rng", default=None
+)
+
+# Used for coin tosses outside a run (e.g. current standings)
+_unseeded_rng = np.random.default_rng()
+
+
+@contextmanager
+def tiebreak_stream(rng: np.random.Generator) -> Iterator[np.random.Generator]:
+    """
+    Draw coin-toss tiebreakers from rng inside the block.
+
+    Args:
+        rng: Generator for coin tosses
+
+    Yields:
+        The installed generator
+    """
+    token = _tiebreak_rng.set(rng)
+    try:
+        yield rng
+    finally:
+        _tiebreak_rng.reset(token)
+
+
+def coin_toss(team_ids: Sequence[str]) -> str:
+    """
+    Pick one team at random from the active tiebreak stream.
+
+    Args:
+        team_ids: Teams still tied
+
+    Returns:
+        Team ID of the winner
+    """
+    rng = _tiebreak_rng.get()
+    if rng is None:
+        rng = _unseeded_rng
+    return team_ids[int(rng.integers(len(team_ids)))]
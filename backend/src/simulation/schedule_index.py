@@ -0,0 +1,169 @@
+"""
+Precomputed schedule structure for tiebreakers.
+
+Who plays whom, which games are conference games and which opponents a set
+of teams has in common never changes between simulations; only the results
+do. A ScheduleIndex records that structure once, as integer team indices and
+game positions, so tiebreakers can look up the games they need instead of
+rescanning the full schedule for every tie in every simulation.
+
+The index refers to games by position. The games list passed to its lookups
+must be in the same order as the list the index was built from (for example
+SeasonBaseline.fixed_games + SeasonBaseline.remaining_games); the Game
+objects themselves may differ, which is how per-simulation results are read.
+"""
+
+from collections import defaultdict
+from typing import Dict, FrozenSet, List, Tuple
+
+import numpy as np
+
+from ..data.models import Game, Team
+
+
+class ScheduleIndex:
+    """Integer-indexed view of a season schedule, built once per season."""
+
+    def __init__(self, games: List[Game], teams: List[Team]):
+        """
+        Index the schedule structure.
+
+        Args:
+            games: Games in the order later lookups will receive them
+            teams: List of all teams
+        """
+        self.team_ids: List[str] = [team.id for team in teams]
+        self.team_index: Dict[str, int] = {
+            team_id: idx for idx, team_id in enumerate(self.team_ids)
+        }
+        self.teams_by_id: Dict[str, Team] = {team.id: team for team in teams}
+        self.conference_team_ids: Dict[str, List[str]] = defaultdict(list)
+        for team in teams:
+            self.conference_team_ids[team.conference].append(team.id)
+
+        self.num_games = len(games)
+        num_teams = len(self.team_ids)
+
+        # Game endpoints as team indices (-1 for teams not in the league)
+        self.home_index = np.array(
+            [self.team_index.get(g.home_team_id, -1) for g in games], dtype=np.int64
+        )
+        self.away_index = np.array(
+            [self.team_index.get(g.away_team_id, -1) for g in games], dtype=np.int64
+        )
+
+        # Game positions per team and per (unordered) pair of teams
+        self.team_games: List[List[int]] = [[] for _ in range(num_teams)]
+        self.pair_games: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        # Opponents as a boolean (num_teams × num_teams) matrix
+        self.opponents = np.zeros((num_teams, num_teams), dtype=bool)
+        # Games where the team's opponent is in its conference
+        self.conference_games: List[List[int]] = [[] for _ in range(num_teams)]
+
+        conferences = [team.conference for team in teams]
+        for pos, (home, away) in enumerate(zip(self.home_index, self.away_index)):
+            home, away = int(home), int(away)
+            for team, opponent in ((home, away), (away, home)):
+                if team < 0:
+                    continue
+                self.team_games[team].append(pos)
+                if opponent >= 0:
+                    self.opponents[team, opponent] = True
+                    if conferences[team] == conferences[opponent]:
+                        self.conference_games[team].append(pos)
+            if home >= 0 and away >= 0:
+                self.pair_games[(min(home, away), max(home, away))].append(pos)
+
+        # Common-game positions, filled lazily per set of tied teams
+        self._common_games: Dict[FrozenSet[int], List[int]] = {}
+
+    def _check_games(self, games: List[Game]) -> None:
+        if len(games) != self.num_games:
+            raise ValueError(
+                f"Schedule index covers {self.num_games} games, got {len(games)}"
+            )
+
+    def head_to_head_games(
+        self, team1_id: str, team2_id: str, games: List[Game]
+    ) -> List[Game]:
+        """
+        Games between two teams.
+
+        Args:
+            team1_id: First team ID
+            team2_id: Second team ID
+            games: Games in indexed order
+
+        Returns:
+            List of games the two teams played against each other
+        """
+        self._check_games(games)
+        team1 = self.team_index.get(team1_id)
+        team2 = self.team_index.get(team2_id)
+        if team1 is None or team2 is None:
+            return []
+        key = (min(team1, team2), max(team1, team2))
+        return [games[pos] for pos in self.pair_games.get(key, [])]
+
+    def common_game_positions(self, team_ids: List[str]) -> List[int]:
+        """
+        Positions of games the teams played against common opponents.
+
+        Args:
+            team_ids: Tied team IDs
+
+        Returns:
+            Sorted game positions
+        """
+        indices = frozenset(
+            self.team_index[tid] for tid in team_ids if tid in self.team_index
+        )
+        if indices not in self._common_games:
+            members = sorted(indices)
+            if not members:
+                self._common_games[indices] = []
+            else:
+                common = np.logical_and.reduce(self.opponents[members], axis=0)
+                is_member = np.zeros(len(self.team_ids), dtype=bool)
+                is_member[members] = True
+                home, away = self.home_index, self.away_index
+                valid = (home >= 0) & (away >= 0)
+                home_safe = np.where(valid, home, 0)
+                away_safe = np.where(valid, away, 0)
+                mask = valid & (
+                    (is_member[home_safe] & common[away_safe])
+                    | (is_member[away_safe] & common[home_safe])
+                )
+                self._common_games[indices] = np.flatnonzero(mask).tolist()
+        return self._common_games[indices]
+
+    def common_games(self, team_ids: List[str], games: List[Game]) -> List[Game]:
+        """
+        Games the teams played against common opponents.
+
+        Args:
+            team_ids: Tied team IDs
+            games: Games in indexed order
+
+        Returns:
+            List of common games
+        """
+        self._check_games(games)
+        return [games[pos] for pos in self.common_game_positions(team_ids)]
+
+    def conference_games_for(self, team_id: str, games: List[Game]) -> List[Game]:
+        """
+        Games a team played against conference opponents.
+
+        Args:
+            team_id: Team ID
+            games: Games in indexed order
+
+        Returns:
+            List of conference games
+        """
+        self._check_games(games)
+        team = self.team_index.get(team_id)
+        if team is None:
+            return []
+        return [games[pos] for pos in self.conference_games[team]]
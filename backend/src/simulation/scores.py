@@ -1,16 +1,114 @@
 """
 Score generation for Monte Carlo simulations.
 
-Provides Poisson-based score generation for simulating game outcomes.
+Provides Poisson-based score generation for simulating game outcomes, a
+margin-based generator used by the simulation engine, and a compact encoding
+for simulated outcomes (bit-packed home-win flags with uint8 scores).
+
+Home-win flags can be drawn with variance reduction. Antithetic sampling
+pairs every simulated season with its mirror image (each uniform draw u
+reused as 1 - u, which flips every 50/50 game), so luck in one half of the
+block cancels in the other. Stratified sampling is a Latin hypercube over
+games: within a block, each game's draws cover n equal strata of [0, 1)
+once, so every game's home-win count matches its probability to within one
+simulation. Both leave each simulation's outcome distribution unchanged, so
+every estimate stays unbiased.
 """
 
 import numpy as np
-from typing import Optional
+from dataclasses import dataclass
+from typing import List, Optional
 
 
 # NFL league averages (approximate)
 DEFAULT_POINTS_MEAN = 24.0  # Average points per team per game
 DEFAULT_POINTS_STDDEV = 10.0  # Standard deviation
+DEFAULT_TOTAL_POINTS_STDDEV = 13.5  # Spread of combined points per game
+
+# Approximate share of NFL games decided by each margin from 1 to 24 points,
+# with the key numbers 3 and 7 (and 10, 14, 17) standing out. Larger margins
+# get a geometrically decaying tail up to MAX_MARGIN.
+_KEY_MARGIN_WEIGHTS = np.array([
+    3.6, 2.7, 15.0, 5.0, 3.5, 5.6, 9.3, 4.2, 2.4, 5.3, 3.1, 2.0,
+    2.2, 4.6, 1.9, 2.5, 3.2, 1.7, 1.4, 1.6, 2.1, 1.0, 0.9, 1.5,
+])
+MAX_MARGIN = 45
+
+
+def _margin_distribution() -> tuple[np.ndarray, np.ndarray]:
+    tail = _KEY_MARGIN_WEIGHTS[-4:].mean() * 0.88 ** np.arange(
+        1, MAX_MARGIN - len(_KEY_MARGIN_WEIGHTS) + 1
+    )
+    weights = np.concatenate([_KEY_MARGIN_WEIGHTS, tail])
+    margins = np.arange(1, MAX_MARGIN + 1, dtype=np.uint8)
+    return margins, weights / weights.sum()
+
+
+MARGIN_VALUES, MARGIN_PROBABILITIES = _margin_distribution()
+
+# Simulations scored per pass of generate_margin_scores
+_SCORE_ROWS_PER_PASS = 1024
+
+# Largest score representable in the compact uint8 encoding
+MAX_COMPACT_SCORE = np.iinfo(np.uint8).max
+
+# Ways of drawing home-win flags for a block of simulations
+SAMPLING_INDEPENDENT = "independent"
+SAMPLING_ANTITHETIC = "antithetic"
+SAMPLING_STRATIFIED = "stratified"
+SAMPLING_METHODS = (SAMPLING_INDEPENDENT, SAMPLING_ANTITHETIC, SAMPLING_STRATIFIED)
+
+
+def validate_sampling(sampling: str) -> str:
+    """
+    Check a sampling method name.
+
+    Args:
+        sampling: One of SAMPLING_METHODS
+
+    Returns:
+        The name
+
+    Raises:
+        ValueError: If the method is unknown
+    """
+    if sampling not in SAMPLING_METHODS:
+        raise ValueError(
+            f"Unknown sampling method {sampling!r} (expected one of {', '.join(SAMPLING_METHODS)})"
+        )
+    return sampling
+
+
+def outcome_uniforms(
+    num_simulations: int,
+    num_games: int,
+    rng: np.random.Generator,
+    sampling: str = SAMPLING_INDEPENDENT,
+) -> np.ndarray:
+    """
+    Uniform draws compared against home-win probabilities.
+
+    Args:
+        num_simulations: Rows in the block
+        num_games: Columns (remaining games)
+        rng: Generator for the draws
+        sampling: independent, antithetic (rows paired as u and 1 - u) or
+            stratified (a Latin hypercube over each game's column)
+
+    Returns:
+        Float array (num_simulations × num_games) with values in [0, 1)
+    """
+    if sampling == SAMPLING_ANTITHETIC:
+        half = rng.random(((num_simulations + 1) // 2, num_games))
+        return np.concatenate([half, 1.0 - half])[:num_simulations]
+    if sampling == SAMPLING_STRATIFIED:
+        strata = rng.permuted(
+            np.tile(np.arange(num_simulations, dtype=np.float64), (num_games, 1)), axis=1
+        ).T
+        strata += rng.random((num_simulations, num_games))
+        strata /= max(num_simulations, 1)
+        return strata
+    return rng.random((num_simulations, num_games))
 
 
 def generate_game_score(
@@ -153,3 +251,229 @@ def generate_outcomes_with_scores_vectorized(
     away_scores[fix_away_wins] = home_scores[fix_away_wins] + 1
 
     return home_wins.astype(int), home_scores, away_scores
+
+
+@dataclass
+class CompactOutcomes:
+    """
+    Simulated outcomes for a block of simulations in compact form.
+
+    Home-win flags are bit-packed along the game axis (np.packbits, big-endian
+    bit order), so each simulation uses one bit per game. Scores are uint8.
+    Columns follow the order of the remaining games being simulated.
+    """
+
+    home_wins_packed: np.ndarray  # (num_simulations × ceil(num_games / 8)) uint8
+    home_scores: np.ndarray  # (num_simulations × num_games) uint8
+    away_scores: np.ndarray  # (num_simulations × num_games) uint8
+    num_games: int
+    # Likelihood-ratio weight of each simulation when importance sampled
+    weights: Optional[np.ndarray] = None
+
+    @property
+    def num_simulations(self) -> int:
+        """Number of simulations (rows)."""
+        return self.home_scores.shape[0]
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the encoded outcomes."""
+        return self.home_wins_packed.nbytes + self.home_scores.nbytes + self.away_scores.nbytes
+
+    @property
+    def home_wins(self) -> np.ndarray:
+        """Unpacked home-win flags as a boolean (num_simulations × num_games) array."""
+        return np.unpackbits(
+            self.home_wins_packed, axis=1, count=self.num_games
+        ).astype(bool)
+
+    def take(self, rows: np.ndarray) -> "CompactOutcomes":
+        """
+        Select a subset of simulations.
+
+        Args:
+            rows: Simulation (row) indices
+
+        Returns:
+            CompactOutcomes for the selected rows (copies)
+        """
+        return CompactOutcomes(
+            home_wins_packed=self.home_wins_packed[rows],
+            home_scores=self.home_scores[rows],
+            away_scores=self.away_scores[rows],
+            num_games=self.num_games,
+        )
+
+    @classmethod
+    def concatenate(cls, parts: List["CompactOutcomes"]) -> "CompactOutcomes":
+        """
+        Stack blocks of simulations over the same games.
+
+        Args:
+            parts: Blocks in simulation order
+
+        Returns:
+            CompactOutcomes covering all blocks
+        """
+        return cls(
+            home_wins_packed=np.concatenate([p.home_wins_packed for p in parts]),
+            home_scores=np.concatenate([p.home_scores for p in parts]),
+            away_scores=np.concatenate([p.away_scores for p in parts]),
+            num_games=parts[0].num_games,
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        home_wins: np.ndarray,
+        home_scores: np.ndarray,
+        away_scores: np.ndarray,
+    ) -> "CompactOutcomes":
+        """
+        Encode full-width outcome matrices.
+
+        Args:
+            home_wins: Nonzero where the home team won (num_simulations × num_games)
+            home_scores: Home team scores
+            away_scores: Away team scores
+
+        Returns:
+            CompactOutcomes (scores above 255 are clipped)
+        """
+        home_wins = np.asarray(home_wins)
+        return cls(
+            home_wins_packed=np.packbits(home_wins != 0, axis=1),
+            home_scores=_to_compact_scores(home_scores),
+            away_scores=_to_compact_scores(away_scores),
+            num_games=home_wins.shape[1],
+        )
+
+
+def _to_compact_scores(scores: np.ndarray) -> np.ndarray:
+    return np.minimum(np.asarray(scores), MAX_COMPACT_SCORE).astype(np.uint8)
+
+
+def generate_margin_scores(
+    home_wins: np.ndarray,
+    home_scores: np.ndarray,
+    away_scores: np.ndarray,
+    mean_score: float = DEFAULT_POINTS_MEAN,
+    total_stddev: float = DEFAULT_TOTAL_POINTS_STDDEV,
+    rng: Optional[np.random.Generator] = None,
+) -> None:
+    """
+    Fill score buffers from sampled winning margins and game totals.
+
+    Each game's winning margin is drawn from MARGIN_VALUES and its combined
+    score from a normal distribution around 2 * mean_score. The loser gets
+    half of what is left after the margin and the winner the loser's score
+    plus the margin, so scores always agree with the outcome and no repair
+    pass is needed.
+
+    Args:
+        home_wins: Boolean (num_simulations × num_games) home-win flags
+        home_scores: uint8 buffer of the same shape, overwritten in place
+        away_scores: uint8 buffer of the same shape, overwritten in place
+        mean_score: Average points per team
+        total_stddev: Standard deviation of combined points per game
+        rng: Generator to draw from (default: fresh entropy)
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    num_simulations = home_wins.shape[0]
+
+    # Work through row slices so the float temporaries stay small
+    for start in range(0, num_simulations, _SCORE_ROWS_PER_PASS):
+        rows = slice(start, min(start + _SCORE_ROWS_PER_PASS, num_simulations))
+        shape = home_wins[rows].shape
+
+        margins = rng.choice(MARGIN_VALUES, size=shape, p=MARGIN_PROBABILITIES)
+        losing_scores = rng.normal(2.0 * mean_score, total_stddev, size=shape)
+        losing_scores -= margins
+        losing_scores *= 0.5
+        np.rint(losing_scores, out=losing_scores)
+        # Keep the winner within uint8 (MAX_MARGIN plus half of a very high total)
+        np.clip(losing_scores, 0, MAX_COMPACT_SCORE - MAX_MARGIN, out=losing_scores)
+
+        home = home_scores[rows]
+        away = away_scores[rows]
+        home[...] = losing_scores
+        away[...] = home
+        np.add(home, margins, out=home, where=home_wins[rows])
+        np.add(away, margins, out=away, where=~home_wins[rows])
+
+
+def generate_compact_outcomes(
+    num_simulations: int,
+    num_games: int,
+    mean_score: float = DEFAULT_POINTS_MEAN,
+    rng: Optional[np.random.Generator] = None,
+    home_win_probabilities: Optional[np.ndarray] = None,
+    score_rng: Optional[np.random.Generator] = None,
+    sampling: str = SAMPLING_INDEPENDENT,
+) -> CompactOutcomes:
+    """
+    Generate outcomes with consistent scores directly in compact form.
+
+    For 50/50 games (no home_win_probabilities) home-win flags are drawn as
+    random bytes and used as packed bits, so no float matrix is created.
+    Otherwise one uniform draw per game is compared against the probabilities:
+    a (num_games,) vector is broadcast across the block, while a
+    (num_simulations × num_games) matrix prices each simulation separately.
+    Antithetic 50/50 blocks stay on random bytes, pairing each row with its
+    bitwise complement; stratified blocks always use uniform draws (see
+    outcome_uniforms). Scores are written into the uint8 buffers by
+    generate_margin_scores.
+
+    Args:
+        num_simulations: Number of simulation iterations
+        num_games: Number of games per simulation
+        mean_score: Average points per team
+        rng: Generator for winners (default: fresh entropy)
+        home_win_probabilities: Optional home-win probabilities, (num_games,)
+            or (num_simulations × num_games)
+        score_rng: Generator for scores (default: rng)
+        sampling: independent, antithetic or stratified home-win draws
+
+    Returns:
+        CompactOutcomes for the block
+
+    Raises:
+        ValueError: If the sampling method is unknown
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    validate_sampling(sampling)
+
+    if home_win_probabilities is None and sampling == SAMPLING_STRATIFIED:
+        home_win_probabilities = np.full(num_games, 0.5)
+
+    if home_win_probabilities is None:
+        num_bytes = (num_games + 7) // 8
+        num_rows = num_simulations
+        if sampling == SAMPLING_ANTITHETIC:
+            num_rows = (num_simulations + 1) // 2
+        home_wins_packed = rng.integers(0, 256, size=(num_rows, num_bytes), dtype=np.uint8)
+        if sampling == SAMPLING_ANTITHETIC:
+            home_wins_packed = np.concatenate(
+                [home_wins_packed, ~home_wins_packed]
+            )[:num_simulations]
+        if num_games % 8:
+            # Clear padding bits past the last game
+            home_wins_packed[:, -1] &= np.uint8((0xFF << (8 - num_games % 8)) & 0xFF)
+    else:
+        draws = outcome_uniforms(num_simulations, num_games, rng, sampling)
+        home_wins_packed = np.packbits(draws < home_win_probabilities, axis=1)
+
+    outcomes = CompactOutcomes(
+        home_wins_packed=home_wins_packed,
+        home_scores=np.empty((num_simulations, num_games), dtype=np.uint8),
+        away_scores=np.empty((num_simulations, num_games), dtype=np.uint8),
+        num_games=num_games,
+    )
+    generate_margin_scores(
+        outcomes.home_wins,
+        outcomes.home_scores,
+        outcomes.away_scores,
+        mean_score=mean_score,
+        rng=score_rng if score_rng is not None else rng,
+    )
+    return outcomes
@@ -5,8 +5,10 @@ Calculates win-loss records, division/conference records, and sorts standings.
 Phase 3 includes tiebreaker data: head-to-head records, strength metrics.
 """
 
-from typing import Dict, List, Tuple
-from collections import defaultdict
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
 
 from ..data.models import Team, Game, Standing
 from ..utils.logger import setup_logger
@@ -80,8 +82,8 @@ def calculate_standings(games: List[Game], teams: List[Team]) -> Dict[str, Stand
         )
 
     # Populate tiebreaker data (Phase 3)
-    populate_head_to_head_records(standings, games)
-    populate_strength_metrics(standings, games)
+    matrix = populate_head_to_head_records(standings, games)
+    populate_strength_metrics(standings, games, matrix)
 
     return standings
 
@@ -284,81 +286,212 @@ def get_conference_standings(
     return sort_standings_simple(conf_standings)
 
 
+class HeadToHeadMatrix:
+    """
+    Head-to-head results between teams, indexed by integer team position.
+
+    wins[i, j] counts the games team i won against team j and ties[i, j] the
+    tied games between them, so losses are wins.T. Standings read their
+    head-to-head records as views of this matrix (HeadToHeadRecords) rather
+    than holding a dictionary of tuples per team.
+    """
+
+    __slots__ = ("team_ids", "team_index", "wins", "ties")
+
+    def __init__(self, team_ids: List[str], wins: np.ndarray, ties: np.ndarray):
+        """
+        Args:
+            team_ids: Team IDs in row/column order
+            wins: (num_teams × num_teams) games won by the row team
+            ties: (num_teams × num_teams) symmetric tied games
+        """
+        self.team_ids = team_ids
+        self.team_index = {team_id: idx for idx, team_id in enumerate(team_ids)}
+        self.wins = wins
+        self.ties = ties
+
+    @classmethod
+    def from_games(cls, games: List[Game], team_ids: List[str]) -> "HeadToHeadMatrix":
+        """
+        Count head-to-head results from completed games.
+
+        Args:
+            games: List of games (games without results are skipped)
+            team_ids: Team IDs in row/column order (other teams are skipped)
+
+        Returns:
+            HeadToHeadMatrix for the teams
+        """
+        team_index = {team_id: idx for idx, team_id in enumerate(team_ids)}
+        winners: List[int] = []
+        losers: List[int] = []
+        tied: List[int] = []
+
+        for game in games:
+            # Skip games without results
+            if not game.is_completed:
+                continue
+
+            home = team_index.get(game.home_team_id)
+            away = team_index.get(game.away_team_id)
+            if home is None or away is None:
+                continue
+
+            winner = game.get_winner()
+            if winner == "home":
+                winners.append(home)
+                losers.append(away)
+            elif winner == "away":
+                winners.append(away)
+                losers.append(home)
+            else:
+                tied.extend((home, away))
+
+        num_teams = len(team_ids)
+        wins = np.zeros((num_teams, num_teams), dtype=np.int64)
+        np.add.at(wins, (winners, losers), 1)
+        ties = np.zeros((num_teams, num_teams), dtype=np.int64)
+        if tied:
+            pairs = np.array(tied, dtype=np.int64).reshape(-1, 2)
+            np.add.at(ties, (pairs[:, 0], pairs[:, 1]), 1)
+            np.add.at(ties, (pairs[:, 1], pairs[:, 0]), 1)
+        return cls(team_ids, wins, ties)
+
+    def with_results(
+        self,
+        home_index: np.ndarray,
+        away_index: np.ndarray,
+        home_scores: np.ndarray,
+        away_scores: np.ndarray,
+    ) -> "HeadToHeadMatrix":
+        """
+        Matrix with further game results added (this matrix is unchanged).
+
+        Args:
+            home_index: Team index of each game's home team
+            away_index: Team index of each game's away team
+            home_scores: Home team scores
+            away_scores: Away team scores
+
+        Returns:
+            New HeadToHeadMatrix including the games
+        """
+        home_won = home_scores > away_scores
+        away_won = away_scores > home_scores
+        tied = ~(home_won | away_won)
+
+        wins = self.wins.copy()
+        np.add.at(wins, (home_index[home_won], away_index[home_won]), 1)
+        np.add.at(wins, (away_index[away_won], home_index[away_won]), 1)
+        ties = self.ties
+        if tied.any():
+            ties = ties.copy()
+            np.add.at(ties, (home_index[tied], away_index[tied]), 1)
+            np.add.at(ties, (away_index[tied], home_index[tied]), 1)
+        return HeadToHeadMatrix(self.team_ids, wins, ties)
+
+    @property
+    def played(self) -> np.ndarray:
+        """Games played between each pair of teams."""
+        return self.wins + self.wins.T + self.ties
+
+    def record(self, team: int, opponent: int) -> Tuple[int, int, int]:
+        """
+        Record of one team against another.
+
+        Args:
+            team: Row team index
+            opponent: Column team index
+
+        Returns:
+            Tuple of (wins, losses, ties)
+        """
+        return (
+            int(self.wins[team, opponent]),
+            int(self.wins[opponent, team]),
+            int(self.ties[team, opponent]),
+        )
+
+    def records_for(self, team_id: str) -> "HeadToHeadRecords":
+        """
+        Head-to-head records of one team, keyed by opponent ID.
+
+        Args:
+            team_id: Team ID
+
+        Returns:
+            Read-only view of the team's row
+        """
+        return HeadToHeadRecords(self, self.team_index[team_id])
+
+
+class HeadToHeadRecords(Mapping):
+    """Read-only {opponent_id: (wins, losses, ties)} view of a HeadToHeadMatrix row."""
+
+    __slots__ = ("_matrix", "_row")
+
+    def __init__(self, matrix: HeadToHeadMatrix, row: int):
+        self._matrix = matrix
+        self._row = row
+
+    def __getitem__(self, opponent_id: str) -> Tuple[int, int, int]:
+        opponent = self._matrix.team_index.get(opponent_id)
+        if opponent is None:
+            raise KeyError(opponent_id)
+        record = self._matrix.record(self._row, opponent)
+        if record == (0, 0, 0):
+            raise KeyError(opponent_id)
+        return record
+
+    def _opponents(self) -> np.ndarray:
+        matrix = self._matrix
+        row = self._row
+        played = matrix.wins[row] + matrix.wins[:, row] + matrix.ties[row]
+        return np.flatnonzero(played)
+
+    def __iter__(self) -> Iterator[str]:
+        team_ids = self._matrix.team_ids
+        return (team_ids[idx] for idx in self._opponents().tolist())
+
+    def __len__(self) -> int:
+        return len(self._opponents())
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
 def populate_head_to_head_records(
-    standings: Dict[str, Standing], games: List[Game]
-) -> None:
+    standings: Dict[str, Standing],
+    games: List[Game],
+    matrix: Optional[HeadToHeadMatrix] = None,
+) -> HeadToHeadMatrix:
     """
     Populate head-to-head records for all teams in the standings.
 
-    For each team, creates a dictionary of records against every opponent
-    they've played: {opponent_id: (wins, losses, ties)}
+    Each team's records map every opponent it has played to
+    (wins, losses, ties), read from a shared HeadToHeadMatrix.
 
     Args:
         standings: Dictionary of standings to populate (modified in place)
         games: List of all games to process
-    """
-    for game in games:
-        # Skip games without results
-        if not game.is_completed and game.get_winner() == "tie":
-            continue
+        matrix: Optional head-to-head matrix already built from games
 
-        home_id = game.home_team_id
-        away_id = game.away_team_id
-
-        # Skip if teams not in standings
-        if home_id not in standings or away_id not in standings:
-            continue
-
-        winner = game.get_winner()
-
-        # Initialize head-to-head records if not present
-        if away_id not in standings[home_id].head_to_head_records:
-            standings[home_id].head_to_head_records[away_id] = (0, 0, 0)
-        if home_id not in standings[away_id].head_to_head_records:
-            standings[away_id].head_to_head_records[home_id] = (0, 0, 0)
+    Returns:
+        The HeadToHeadMatrix backing the records
+    """
+    if matrix is None:
+        matrix = HeadToHeadMatrix.from_games(games, list(standings))
 
-        # Get current records
-        home_vs_away = standings[home_id].head_to_head_records[away_id]
-        away_vs_home = standings[away_id].head_to_head_records[home_id]
+    for team_id, standing in standings.items():
+        standing.head_to_head_records = matrix.records_for(team_id)
 
-        # Update based on outcome
-        if winner == "home":
-            standings[home_id].head_to_head_records[away_id] = (
-                home_vs_away[0] + 1,  # wins
-                home_vs_away[1],  # losses
-                home_vs_away[2],  # ties
-            )
-            standings[away_id].head_to_head_records[home_id] = (
-                away_vs_home[0],  # wins
-                away_vs_home[1] + 1,  # losses
-                away_vs_home[2],  # ties
-            )
-        elif winner == "away":
-            standings[away_id].head_to_head_records[home_id] = (
-                away_vs_home[0] + 1,  # wins
-                away_vs_home[1],  # losses
-                away_vs_home[2],  # ties
-            )
-            standings[home_id].head_to_head_records[away_id] = (
-                home_vs_away[0],  # wins
-                home_vs_away[1] + 1,  # losses
-                home_vs_away[2],  # ties
-            )
-        elif winner == "tie":
-            standings[home_id].head_to_head_records[away_id] = (
-                home_vs_away[0],  # wins
-                home_vs_away[1],  # losses
-                home_vs_away[2] + 1,  # ties
-            )
-            standings[away_id].head_to_head_records[home_id] = (
-                away_vs_home[0],  # wins
-                away_vs_home[1],  # losses
-                away_vs_home[2] + 1,  # ties
-            )
+    return matrix
 
 
 def populate_strength_metrics(
-    standings: Dict[str, Standing], games: List[Game]
+    standings: Dict[str, Standing],
+    games: List[Game],
+    matrix: Optional[HeadToHeadMatrix] = None,
 ) -> None:
     """
     Calculate and populate strength of victory and strength of schedule.
@@ -369,57 +502,30 @@ def populate_strength_metrics(
     Args:
         standings: Dictionary of standings to populate (modified in place)
         games: List of all games to process
+        matrix: Optional head-to-head matrix already built from games
 
     Note:
         Must be called after basic standings (W-L records) are calculated,
         as it depends on win percentages.
     """
-    # Build opponent lists for each team
-    opponents_beaten = defaultdict(list)  # team_id -> list of beaten opponent_ids
-    all_opponents = defaultdict(list)  # team_id -> list of all opponent_ids
+    if matrix is None:
+        matrix = HeadToHeadMatrix.from_games(games, list(standings))
+
+    # Opponents are averaged once per game played (or won) against them
+    pct = np.array(
+        [standings[team_id].win_percentage for team_id in matrix.team_ids],
+        dtype=np.float64,
+    )
+    beaten = matrix.wins
+    played = matrix.played
+    num_beaten = beaten.sum(axis=1)
+    num_played = played.sum(axis=1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        strength_of_victory = np.where(num_beaten > 0, (beaten @ pct) / num_beaten, 0.0)
+        strength_of_schedule = np.where(num_played > 0, (played @ pct) / num_played, 0.0)
 
-    for game in games:
-        # Skip games without results
-        if not game.is_completed and game.get_winner() == "tie":
-            continue
-
-        home_id = game.home_team_id
-        away_id = game.away_team_id
-
-        # Skip if teams not in standings
-        if home_id not in standings or away_id not in standings:
-            continue
-
-        winner = game.get_winner()
-
-        # Track all opponents
-        all_opponents[home_id].append(away_id)
-        all_opponents[away_id].append(home_id)
-
-        # Track beaten opponents
-        if winner == "home":
-            opponents_beaten[home_id].append(away_id)
-        elif winner == "away":
-            opponents_beaten[away_id].append(home_id)
-
-    # Calculate strength metrics for each team
     for team_id, standing in standings.items():
-        # Strength of Victory
-        beaten_opponents = opponents_beaten.get(team_id, [])
-        if beaten_opponents:
-            total_win_pct = sum(
-                standings[opp_id].win_percentage for opp_id in beaten_opponents
-            )
-            standing.strength_of_victory = total_win_pct / len(beaten_opponents)
-        else:
-            standing.strength_of_victory = 0.0
-
-        # Strength of Schedule
-        all_opps = all_opponents.get(team_id, [])
-        if all_opps:
-            total_win_pct = sum(
-                standings[opp_id].win_percentage for opp_id in all_opps
-            )
-            standing.strength_of_schedule = total_win_pct / len(all_opps)
-        else:
-            standing.strength_of_schedule = 0.0
+        idx = matrix.team_index[team_id]
+        standing.strength_of_victory = float(strength_of_victory[idx])
+        standing.strength_of_schedule = float(strength_of_schedule[idx])
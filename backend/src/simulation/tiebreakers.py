@@ -11,23 +11,97 @@ References:
 - https://www.nfl.com/standings/tie-breaking-procedures
 """
 
-import random
-from typing import List, Dict, Optional, Set, Tuple
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Collection, Iterator, List, Dict, Optional, Set, Tuple
 from collections import defaultdict
 
 from ..data.models import Team, Game, Standing
 from ..utils.logger import setup_logger
+from .profiling import note_tiebreak_rule
+from .rng import coin_toss
+from .schedule_index import ScheduleIndex
 
 logger = setup_logger(__name__)
 
 
+class ScoreRuleTracker:
+    """Records whether tiebreaking reached a rule based on points rather than results."""
+
+    def __init__(self):
+        self.reached = False
+
+
+_score_rule_tracker: ContextVar[Optional[ScoreRuleTracker]] = ContextVar(
+    "score_rule_tracker", default=None
+)
+
+
+@contextmanager
+def track_score_rules() -> Iterator[ScoreRuleTracker]:
+    """
+    Track whether tiebreakers evaluated inside the block depended on points.
+
+    Rules up to strength of schedule use only game results; combined rankings,
+    net points and coin tosses come after them and can change with scores.
+
+    Yields:
+        ScoreRuleTracker whose reached flag is set once such a rule is evaluated
+    """
+    tracker = ScoreRuleTracker()
+    token = _score_rule_tracker.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _score_rule_tracker.reset(token)
+
+
+_representative_results: ContextVar[bool] = ContextVar("representative_results", default=False)
+
+
+@contextmanager
+def representative_results() -> Iterator[None]:
+    """
+    Count strength of victory and schedule as score rules inside the block.
+
+    Used when some games are fixed to one result on behalf of all their
+    results (see exact.py): those rules read opponents' records, which such
+    games change.
+    """
+    token = _representative_results.set(True)
+    try:
+        yield
+    finally:
+        _representative_results.reset(token)
+
+
+def _note_score_rule() -> None:
+    tracker = _score_rule_tracker.get()
+    if tracker is not None:
+        tracker.reached = True
+
+
+def _note_strength_rule() -> None:
+    if _representative_results.get():
+        _note_score_rule()
+
+
+def _decided(rule: str, winner: str) -> str:
+    note_tiebreak_rule(rule)
+    return winner
+
+
 # =============================================================================
 # HELPER FUNCTIONS - Head-to-Head, Common Games, Rankings
 # =============================================================================
 
 
 def calculate_head_to_head_record(
-    team1_id: str, team2_id: str, games: List[Game]
+    team1_id: str,
+    team2_id: str,
+    games: List[Game],
+    schedule_index: Optional[ScheduleIndex] = None,
 ) -> Tuple[int, int, int]:
     """
     Calculate head-to-head record between two teams.
@@ -36,10 +110,14 @@ def calculate_head_to_head_record(
         team1_id: First team ID
         team2_id: Second team ID
         games: List of all games
+        schedule_index: Optional index of games (only their meetings are scanned)
 
     Returns:
         Tuple of (wins, losses, ties) for team1 vs team2
     """
+    if schedule_index is not None:
+        games = schedule_index.head_to_head_games(team1_id, team2_id, games)
+
     wins, losses, ties = 0, 0, 0
 
     for game in games:
@@ -68,7 +146,10 @@ def calculate_head_to_head_record(
 
 
 def check_head_to_head_sweep(
-    team_ids: List[str], games: List[Game], standings_dict: Optional[Dict[str, Standing]] = None
+    team_ids: List[str],
+    games: List[Game],
+    standings_dict: Optional[Dict[str, Standing]] = None,
+    schedule_index: Optional[ScheduleIndex] = None,
 ) -> Optional[str]:
     """
     Check if one team has beaten (or lost to) all other teams in a multi-team tie.
@@ -77,6 +158,7 @@ def check_head_to_head_sweep(
         team_ids: List of tied team IDs
         games: List of all games
         standings_dict: Optional dictionary of standings (for optimized H2H lookup)
+        schedule_index: Optional index of games, used when standings are not provided
 
     Returns:
         Team ID of the team that swept all others, or None if no sweep
@@ -108,7 +190,7 @@ def check_head_to_head_sweep(
             for opponent_id in team_ids:
                 if team_id != opponent_id:
                     h2h_records[team_id][opponent_id] = calculate_head_to_head_record(
-                        team_id, opponent_id, games
+                        team_id, opponent_id, games, schedule_index
                     )
 
     # Check for sweep (team beat all others)
@@ -132,7 +214,11 @@ def check_head_to_head_sweep(
     return None
 
 
-def identify_common_games(team_ids: List[str], games: List[Game]) -> List[Game]:
+def identify_common_games(
+    team_ids: List[str],
+    games: List[Game],
+    schedule_index: Optional[ScheduleIndex] = None,
+) -> List[Game]:
     """
     Identify games that are common to all teams in the tie.
 
@@ -143,10 +229,15 @@ def identify_common_games(team_ids: List[str], games: List[Game]) -> List[Game]:
     Args:
         team_ids: List of tied team IDs
         games: List of all games
+        schedule_index: Optional index of games (common opponents are precomputed;
+            every indexed game is expected to have a result)
 
     Returns:
         List of common games (games against opponents all teams have played)
     """
+    if schedule_index is not None:
+        return schedule_index.common_games(team_ids, games)
+
     # Find all opponents for each team
     opponents_per_team = defaultdict(set)
     for game in games:
@@ -223,6 +314,7 @@ def calculate_combined_ranking(
     standings_dict: Dict[str, Standing],
     teams: List[Team],
     conference_only: bool = False,
+    schedule_index: Optional[ScheduleIndex] = None,
 ) -> int:
     """
     Calculate combined ranking (points scored rank + points allowed rank).
@@ -235,10 +327,21 @@ def calculate_combined_ranking(
         standings_dict: Dictionary of all standings
         teams: List of all teams
         conference_only: If True, rank within conference only
+        schedule_index: Optional index providing team and conference lookups
 
     Returns:
         Combined ranking (lower is better)
     """
+    if schedule_index is not None:
+        if conference_only:
+            team = schedule_index.teams_by_id.get(team_id)
+            if not team:
+                return 999  # Unknown team
+            relevant_team_ids = schedule_index.conference_team_ids[team.conference]
+        else:
+            relevant_team_ids = schedule_index.team_ids
+        return _combined_ranking(team_id, standings_dict, relevant_team_ids)
+
     # Filter teams by conference if needed
     if conference_only:
         team = next((t for t in teams if t.id == team_id), None)
@@ -249,6 +352,13 @@ def calculate_combined_ranking(
         relevant_teams = teams
 
     relevant_team_ids = [t.id for t in relevant_teams]
+    return _combined_ranking(team_id, standings_dict, relevant_team_ids)
+
+
+def _combined_ranking(
+    team_id: str, standings_dict: Dict[str, Standing], relevant_team_ids: List[str]
+) -> int:
+    """Points-scored rank plus points-allowed rank among the given teams."""
     relevant_standings = [
         standings_dict[tid] for tid in relevant_team_ids if tid in standings_dict
     ]
@@ -302,7 +412,12 @@ def calculate_net_points_in_games(
     return points_for - points_against
 
 
-def get_conference_games(team_id: str, all_games: List[Game], teams: List[Team]) -> List[Game]:
+def get_conference_games(
+    team_id: str,
+    all_games: List[Game],
+    teams: List[Team],
+    schedule_index: Optional[ScheduleIndex] = None,
+) -> List[Game]:
     """
     Get all conference games for a team.
 
@@ -310,10 +425,14 @@ def get_conference_games(team_id: str, all_games: List[Game], teams: List[Team])
         team_id: Team ID
         all_games: List of all games
         teams: List of all teams
+        schedule_index: Optional index of games (conference games are precomputed)
 
     Returns:
         List of games against conference opponents
     """
+    if schedule_index is not None:
+        return schedule_index.conference_games_for(team_id, all_games)
+
     team = next((t for t in teams if t.id == team_id), None)
     if not team:
         return []
@@ -363,6 +482,7 @@ def break_division_tie_two_teams(
     games: List[Game],
     teams: List[Team],
     standings_dict: Dict[str, Standing],
+    schedule_index: Optional[ScheduleIndex] = None,
 ) -> str:
     """
     Break a tie between two teams in the same division.
@@ -375,6 +495,7 @@ def break_division_tie_two_teams(
         games: List of all games
         teams: List of all teams
         standings_dict: Dictionary of all standings
+        schedule_index: Optional precomputed index of games
 
     Returns:
         Team ID of the winner
@@ -387,85 +508,95 @@ def break_division_tie_two_teams(
     if team2_id in team1_standing.head_to_head_records:
         h2h = team1_standing.head_to_head_records[team2_id]
     else:
-        h2h = calculate_head_to_head_record(team1_id, team2_id, games)
+        h2h = calculate_head_to_head_record(team1_id, team2_id, games, schedule_index)
         
     h2h_pct_1 = record_to_percentage(*h2h)
     h2h_pct_2 = record_to_percentage(*h2h[::-1])  # Reverse for team2's perspective
     if h2h_pct_1 > h2h_pct_2:
-        return team1_id
+        return _decided("head_to_head", team1_id)
     elif h2h_pct_2 > h2h_pct_1:
-        return team2_id
+        return _decided("head_to_head", team2_id)
 
     # 2. Division record
     if team1_standing.division_win_percentage > team2_standing.division_win_percentage:
-        return team1_id
+        return _decided("division_record", team1_id)
     elif team2_standing.division_win_percentage > team1_standing.division_win_percentage:
-        return team2_id
+        return _decided("division_record", team2_id)
 
     # 3. Common games (minimum 4 required)
-    common_games = identify_common_games([team1_id, team2_id], games)
+    common_games = identify_common_games([team1_id, team2_id], games, schedule_index)
     if len(common_games) >= 4:
         team1_common = calculate_common_games_record(team1_id, common_games)
         team2_common = calculate_common_games_record(team2_id, common_games)
         team1_common_pct = record_to_percentage(*team1_common)
         team2_common_pct = record_to_percentage(*team2_common)
         if team1_common_pct > team2_common_pct:
-            return team1_id
+            return _decided("common_games", team1_id)
         elif team2_common_pct > team1_common_pct:
-            return team2_id
+            return _decided("common_games", team2_id)
 
     # 4. Conference record
     if team1_standing.conference_win_percentage > team2_standing.conference_win_percentage:
-        return team1_id
+        return _decided("conference_record", team1_id)
     elif team2_standing.conference_win_percentage > team1_standing.conference_win_percentage:
-        return team2_id
+        return _decided("conference_record", team2_id)
 
     # 5. Strength of victory
+    _note_strength_rule()
     if team1_standing.strength_of_victory > team2_standing.strength_of_victory:
-        return team1_id
+        return _decided("strength_of_victory", team1_id)
     elif team2_standing.strength_of_victory > team1_standing.strength_of_victory:
-        return team2_id
+        return _decided("strength_of_victory", team2_id)
 
     # 6. Strength of schedule
     if team1_standing.strength_of_schedule > team2_standing.strength_of_schedule:
-        return team1_id
+        return _decided("strength_of_schedule", team1_id)
     elif team2_standing.strength_of_schedule > team1_standing.strength_of_schedule:
-        return team2_id
+        return _decided("strength_of_schedule", team2_id)
 
     # 7. Combined ranking in conference (points scored + points allowed)
-    rank1_conf = calculate_combined_ranking(team1_id, standings_dict, teams, conference_only=True)
-    rank2_conf = calculate_combined_ranking(team2_id, standings_dict, teams, conference_only=True)
+    _note_score_rule()
+    rank1_conf = calculate_combined_ranking(
+        team1_id, standings_dict, teams, conference_only=True, schedule_index=schedule_index
+    )
+    rank2_conf = calculate_combined_ranking(
+        team2_id, standings_dict, teams, conference_only=True, schedule_index=schedule_index
+    )
     if rank1_conf < rank2_conf:  # Lower is better
-        return team1_id
+        return _decided("conference_combined_ranking", team1_id)
     elif rank2_conf < rank1_conf:
-        return team2_id
+        return _decided("conference_combined_ranking", team2_id)
 
     # 8. Combined ranking among all teams
-    rank1_all = calculate_combined_ranking(team1_id, standings_dict, teams, conference_only=False)
-    rank2_all = calculate_combined_ranking(team2_id, standings_dict, teams, conference_only=False)
+    rank1_all = calculate_combined_ranking(
+        team1_id, standings_dict, teams, conference_only=False, schedule_index=schedule_index
+    )
+    rank2_all = calculate_combined_ranking(
+        team2_id, standings_dict, teams, conference_only=False, schedule_index=schedule_index
+    )
     if rank1_all < rank2_all:
-        return team1_id
+        return _decided("league_combined_ranking", team1_id)
     elif rank2_all < rank1_all:
-        return team2_id
+        return _decided("league_combined_ranking", team2_id)
 
     # 9. Net points in common games
     if len(common_games) >= 4:
         net1 = calculate_net_points_in_games(team1_id, common_games)
         net2 = calculate_net_points_in_games(team2_id, common_games)
         if net1 > net2:
-            return team1_id
+            return _decided("common_games_net_points", team1_id)
         elif net2 > net1:
-            return team2_id
+            return _decided("common_games_net_points", team2_id)
 
     # 10. Net points in all games
     if team1_standing.net_points > team2_standing.net_points:
-        return team1_id
+        return _decided("net_points", team1_id)
     elif team2_standing.net_points > team1_standing.net_points:
-        return team2_id
+        return _decided("net_points", team2_id)
 
     # 11. Coin toss (random)
     logger.info(f"Coin toss between {team1_id} and {team2_id}")
-    return random.choice([team1_id, team2_id])
+    return _decided("coin_toss", coin_toss([team1_id, team2_id]))
 
 
 def break_wild_card_tie_two_teams(
@@ -474,6 +605,7 @@ def break_wild_card_tie_two_teams(
     games: List[Game],
     teams: List[Team],
     standings_dict: Dict[str, Standing],
+    schedule_index: Optional[ScheduleIndex] = None,
 ) -> str:
     """
     Break a tie between two teams from different divisions (wild card).
@@ -484,6 +616,7 @@ def break_wild_card_tie_two_teams(
         games: List of all games
         teams: List of all teams
         standings_dict: Dictionary of all standings
+        schedule_index: Optional precomputed index of games
 
     Returns:
         Team ID of the winner
@@ -496,81 +629,91 @@ def break_wild_card_tie_two_teams(
     if team2_id in team1_standing.head_to_head_records:
         h2h = team1_standing.head_to_head_records[team2_id]
     else:
-        h2h = calculate_head_to_head_record(team1_id, team2_id, games)
+        h2h = calculate_head_to_head_record(team1_id, team2_id, games, schedule_index)
         
     if sum(h2h) > 0:  # They played each other
         h2h_pct_1 = record_to_percentage(*h2h)
         h2h_pct_2 = record_to_percentage(*h2h[::-1])
         if h2h_pct_1 > h2h_pct_2:
-            return team1_id
+            return _decided("head_to_head", team1_id)
         elif h2h_pct_2 > h2h_pct_1:
-            return team2_id
+            return _decided("head_to_head", team2_id)
 
     # 2. Conference record
     if team1_standing.conference_win_percentage > team2_standing.conference_win_percentage:
-        return team1_id
+        return _decided("conference_record", team1_id)
     elif team2_standing.conference_win_percentage > team1_standing.conference_win_percentage:
-        return team2_id
+        return _decided("conference_record", team2_id)
 
     # 3. Common games (minimum 4 required)
-    common_games = identify_common_games([team1_id, team2_id], games)
+    common_games = identify_common_games([team1_id, team2_id], games, schedule_index)
     if len(common_games) >= 4:
         team1_common = calculate_common_games_record(team1_id, common_games)
         team2_common = calculate_common_games_record(team2_id, common_games)
         team1_common_pct = record_to_percentage(*team1_common)
         team2_common_pct = record_to_percentage(*team2_common)
         if team1_common_pct > team2_common_pct:
-            return team1_id
+            return _decided("common_games", team1_id)
         elif team2_common_pct > team1_common_pct:
-            return team2_id
+            return _decided("common_games", team2_id)
 
     # 4. Strength of victory
+    _note_strength_rule()
     if team1_standing.strength_of_victory > team2_standing.strength_of_victory:
-        return team1_id
+        return _decided("strength_of_victory", team1_id)
     elif team2_standing.strength_of_victory > team1_standing.strength_of_victory:
-        return team2_id
+        return _decided("strength_of_victory", team2_id)
 
     # 5. Strength of schedule
     if team1_standing.strength_of_schedule > team2_standing.strength_of_schedule:
-        return team1_id
+        return _decided("strength_of_schedule", team1_id)
     elif team2_standing.strength_of_schedule > team1_standing.strength_of_schedule:
-        return team2_id
+        return _decided("strength_of_schedule", team2_id)
 
     # 6. Combined ranking in conference
-    rank1_conf = calculate_combined_ranking(team1_id, standings_dict, teams, conference_only=True)
-    rank2_conf = calculate_combined_ranking(team2_id, standings_dict, teams, conference_only=True)
+    _note_score_rule()
+    rank1_conf = calculate_combined_ranking(
+        team1_id, standings_dict, teams, conference_only=True, schedule_index=schedule_index
+    )
+    rank2_conf = calculate_combined_ranking(
+        team2_id, standings_dict, teams, conference_only=True, schedule_index=schedule_index
+    )
     if rank1_conf < rank2_conf:
-        return team1_id
+        return _decided("conference_combined_ranking", team1_id)
     elif rank2_conf < rank1_conf:
-        return team2_id
+        return _decided("conference_combined_ranking", team2_id)
 
     # 7. Combined ranking among all teams
-    rank1_all = calculate_combined_ranking(team1_id, standings_dict, teams, conference_only=False)
-    rank2_all = calculate_combined_ranking(team2_id, standings_dict, teams, conference_only=False)
+    rank1_all = calculate_combined_ranking(
+        team1_id, standings_dict, teams, conference_only=False, schedule_index=schedule_index
+    )
+    rank2_all = calculate_combined_ranking(
+        team2_id, standings_dict, teams, conference_only=False, schedule_index=schedule_index
+    )
     if rank1_all < rank2_all:
-        return team1_id
+        return _decided("league_combined_ranking", team1_id)
     elif rank2_all < rank1_all:
-        return team2_id
+        return _decided("league_combined_ranking", team2_id)
 
     # 8. Net points in conference games
-    conf_games_1 = get_conference_games(team1_id, games, teams)
-    conf_games_2 = get_conference_games(team2_id, games, teams)
+    conf_games_1 = get_conference_games(team1_id, games, teams, schedule_index)
+    conf_games_2 = get_conference_games(team2_id, games, teams, schedule_index)
     net1_conf = calculate_net_points_in_games(team1_id, conf_games_1)
     net2_conf = calculate_net_points_in_games(team2_id, conf_games_2)
     if net1_conf > net2_conf:
-        return team1_id
+        return _decided("conference_net_points", team1_id)
     elif net2_conf > net1_conf:
-        return team2_id
+        return _decided("conference_net_points", team2_id)
 
     # 9. Net points in all games
     if team1_standing.net_points > team2_standing.net_points:
-        return team1_id
+        return _decided("net_points", team1_id)
     elif team2_standing.net_points > team1_standing.net_points:
-        return team2_id
+        return _decided("net_points", team2_id)
 
     # 10. Coin toss
     logger.info(f"Coin toss between {team1_id} and {team2_id}")
-    return random.choice([team1_id, team2_id])
+    return _decided("coin_toss", coin_toss([team1_id, team2_id]))
 
 
 # =============================================================================
@@ -583,6 +726,7 @@ def break_division_tie_multi_teams(
     games: List[Game],
     teams: List[Team],
     standings_dict: Dict[str, Standing],
+    schedule_index: Optional[ScheduleIndex] = None,
 ) -> List[str]:
     """
     Break a tie between 3+ teams in the same division.
@@ -596,13 +740,14 @@ def break_division_tie_multi_teams(
         games: List of all games
         teams: List of all teams
         standings_dict: Dictionary of all standings
+        schedule_index: Optional precomputed index of games
 
     Returns:
         List of team IDs in order (best to worst)
     """
     if len(tied_standings) == 2:
         winner = break_division_tie_two_teams(
-            tied_standings[0], tied_standings[1], games, teams, standings_dict
+            tied_standings[0], tied_standings[1], games, teams, standings_dict, schedule_index
         )
         loser = [s.team_id for s in tied_standings if s.team_id != winner][0]
         return [winner, loser]
@@ -613,12 +758,13 @@ def break_division_tie_multi_teams(
     # NOTE: After each step, if only 2 teams remain, restart at step 1 for 2-team procedure
 
     # Step: Head-to-head sweep
-    sweep_winner = check_head_to_head_sweep(team_ids, games, standings_dict)
+    sweep_winner = check_head_to_head_sweep(team_ids, games, standings_dict, schedule_index)
     if sweep_winner:
+        note_tiebreak_rule("head_to_head_sweep")
         remaining = [tid for tid in team_ids if tid != sweep_winner]
         remaining_standings = [standings_dict[tid] for tid in remaining]
         rest_ordered = break_division_tie_multi_teams(
-            remaining_standings, games, teams, standings_dict
+            remaining_standings, games, teams, standings_dict, schedule_index
         )
         return [sweep_winner] + rest_ordered
 
@@ -627,6 +773,7 @@ def break_division_tie_multi_teams(
     # Full implementation would go through all 11 steps with proper cascading
 
     # Simplified: sort by win percentage
+    note_tiebreak_rule("multi_team_fallback")
     sorted_standings = sorted(tied_standings, key=lambda s: s.win_percentage, reverse=True)
     return [s.team_id for s in sorted_standings]
 
@@ -636,6 +783,7 @@ def break_wild_card_tie_multi_teams(
     games: List[Game],
     teams: List[Team],
     standings_dict: Dict[str, Standing],
+    schedule_index: Optional[ScheduleIndex] = None,
 ) -> List[str]:
     """
     Break a tie between 3+ teams from different divisions (wild card).
@@ -645,19 +793,23 @@ def break_wild_card_tie_multi_teams(
         games: List of all games
         teams: List of all teams
         standings_dict: Dictionary of all standings
+        schedule_index: Optional precomputed index of games
 
     Returns:
         List of team IDs in order (best to worst)
     """
     if len(tied_standings) == 2:
         winner = break_wild_card_tie_two_teams(
-            tied_standings[0], tied_standings[1], games, teams, standings_dict
+            tied_standings[0], tied_standings[1], games, teams, standings_dict, schedule_index
         )
         loser = [s.team_id for s in tied_standings if s.team_id != winner][0]
         return [winner, loser]
 
     team_ids = [s.team_id for s in tied_standings]
-    team_dict = {t.id: t for t in teams}
+    if schedule_index is not None:
+        team_dict = schedule_index.teams_by_id
+    else:
+        team_dict = {t.id: t for t in teams}
 
     # First: Apply division tiebreaker within each division represented
     # (eliminate all but highest-ranked team from each division)
@@ -674,7 +826,7 @@ def break_wild_card_tie_multi_teams(
             # Multiple teams from same division - apply division tiebreaker
             div_standings = [standings_dict[tid] for tid in div_teams]
             div_ordered = break_division_tie_multi_teams(
-                div_standings, games, teams, standings_dict
+                div_standings, games, teams, standings_dict, schedule_index
             )
             remaining_team_ids.append(div_ordered[0])  # Keep only best team
 
@@ -686,6 +838,7 @@ def break_wild_card_tie_multi_teams(
                 games,
                 teams,
                 standings_dict,
+                schedule_index,
             )
             loser = [tid for tid in remaining_team_ids if tid != winner][0]
             return [winner, loser]
@@ -693,6 +846,7 @@ def break_wild_card_tie_multi_teams(
 
     # Continue with wild card tiebreaker steps for remaining teams
     # Simplified: sort by conference record then win percentage
+    note_tiebreak_rule("multi_team_fallback")
     remaining_standings = [standings_dict[tid] for tid in remaining_team_ids]
     sorted_standings = sorted(
         remaining_standings,
@@ -708,7 +862,10 @@ def break_wild_card_tie_multi_teams(
 
 
 def determine_division_winners(
-    teams: List[Team], standings_dict: Dict[str, Standing], games: List[Game]
+    teams: List[Team],
+    standings_dict: Dict[str, Standing],
+    games: List[Game],
+    schedule_index: Optional[ScheduleIndex] = None,
 ) -> Dict[str, str]:
     """
     Determine division winners using tiebreaker rules.
@@ -717,6 +874,7 @@ def determine_division_winners(
         teams: List of all teams
         standings_dict: Dictionary of all standings
         games: List of all games
+        schedule_index: Optional precomputed index of games
 
     Returns:
         Dictionary mapping division key (e.g., "AFC_West") to winning team ID
@@ -751,7 +909,7 @@ def determine_division_winners(
             else:
                 # Multiple teams tied - apply tiebreaker
                 ordered = break_division_tie_multi_teams(
-                    tied_for_first, games, teams, standings_dict
+                    tied_for_first, games, teams, standings_dict, schedule_index
                 )
                 winner_id = ordered[0]
 
@@ -766,6 +924,9 @@ def determine_wild_card_teams(
     standings_dict: Dict[str, Standing],
     games: List[Game],
     division_winners: Dict[str, str],
+    schedule_index: Optional[ScheduleIndex] = None,
+    conferences: Optional[List[str]] = None,
+    excluded_team_ids: Optional[Collection[str]] = None,
 ) -> Dict[str, List[str]]:
     """
     Determine 3 wild card teams per conference.
@@ -775,22 +936,22 @@ def determine_wild_card_teams(
         standings_dict: Dictionary of all standings
         games: List of all games
         division_winners: Dictionary of division winners
+        schedule_index: Optional precomputed index of games
+        conferences: Conferences to process (default: AFC and NFC)
+        excluded_team_ids: Teams not competing for a wild card (e.g. with a
+            clinched seed or eliminated); they still count for tiebreakers
 
     Returns:
-        Dictionary mapping conference to list of 3 wild card team IDs
+        Dictionary mapping conference to list of up to 3 wild card team IDs
     """
     wild_cards = {}
+    division_winner_ids = set(division_winners.values()) | set(excluded_team_ids or ())
 
-    for conference in ["AFC", "NFC"]:
+    for conference in conferences or ["AFC", "NFC"]:
         # Get all teams in conference that are NOT division winners
         conf_teams = [t for t in teams if t.conference == conference]
         conf_team_ids = [t.id for t in conf_teams]
 
-        division_winner_ids = [
-            tid for tid in division_winners.values()
-            if any(t.id == tid and t.conference == conference for t in teams)
-        ]
-
         non_winners = [
             tid for tid in conf_team_ids if tid not in division_winner_ids
         ]
@@ -818,7 +979,7 @@ def determine_wild_card_teams(
             else:
                 # Multiple teams tied - apply wild card tiebreaker
                 ordered = break_wild_card_tie_multi_teams(
-                    tied_teams, games, teams, standings_dict
+                    tied_teams, games, teams, standings_dict, schedule_index
                 )
                 wild_card_teams.append(ordered[0])
 
@@ -827,42 +988,35 @@ def determine_wild_card_teams(
     return wild_cards
 
 
-def seed_conference_playoffs(
+@dataclass
+class LeagueSeeding:
+    """Division winners, wild cards and playoff seeds for one season outcome."""
+
+    division_winners: Dict[str, str]  # Division key (e.g., "AFC_West") -> team ID
+    wild_cards: Dict[str, List[str]]  # Conference -> wild card team IDs in order
+    seeds: Dict[str, List[str]]  # Conference -> team IDs in seed order (1-7)
+
+
+def _rank_division_winners(
     teams: List[Team],
     standings_dict: Dict[str, Standing],
     games: List[Game],
     conference: str,
+    division_winners: Dict[str, str],
+    schedule_index: Optional[ScheduleIndex] = None,
+    excluded_team_ids: Optional[Collection[str]] = None,
 ) -> List[str]:
-    """
-    Seed playoff teams 1-7 in a conference.
-
-    Seeds 1-4 are division winners (ranked by record + tiebreakers).
-    Seeds 5-7 are wild cards (already ordered by tiebreakers).
-
-    Args:
-        teams: List of all teams
-        standings_dict: Dictionary of all standings
-        games: List of all games
-        conference: Conference name ("AFC" or "NFC")
-
-    Returns:
-        List of 7 team IDs in playoff seed order (1-7)
-    """
-    # Get division winners
-    division_winners = determine_division_winners(teams, standings_dict, games)
-
-    # Get division winners in this conference
+    """Order a conference's division winners by record, breaking ties."""
+    excluded = set(excluded_team_ids or ())
     conf_div_winners = []
     for div in ["North", "South", "East", "West"]:
         key = f"{conference}_{div}"
-        if key in division_winners:
+        if key in division_winners and division_winners[key] not in excluded:
             conf_div_winners.append(division_winners[key])
 
-    # Rank division winners by record (with tiebreakers if tied)
     div_winner_standings = [standings_dict[tid] for tid in conf_div_winners]
     div_winner_standings.sort(key=lambda s: s.win_percentage, reverse=True)
 
-    # Check for ties in division winner rankings
     ranked_div_winners = []
     remaining = div_winner_standings[:]
 
@@ -875,19 +1029,104 @@ def seed_conference_playoffs(
         else:
             # Tie - apply wild card tiebreaker (different divisions)
             ordered = break_wild_card_tie_multi_teams(
-                tied, games, teams, standings_dict
+                tied, games, teams, standings_dict, schedule_index
             )
             ranked_div_winners.extend(ordered)
 
         remaining = [s for s in remaining if s.win_percentage < best_pct]
 
-    # Get wild cards
-    wild_cards_dict = determine_wild_card_teams(
-        teams, standings_dict, games, division_winners
+    return ranked_div_winners
+
+
+def seed_league(
+    teams: List[Team],
+    standings_dict: Dict[str, Standing],
+    games: List[Game],
+    division_winners: Optional[Dict[str, str]] = None,
+    schedule_index: Optional[ScheduleIndex] = None,
+    conferences: Optional[List[str]] = None,
+    excluded_team_ids: Optional[Collection[str]] = None,
+) -> LeagueSeeding:
+    """
+    Resolve division winners, wild cards and playoff seeds in one pass.
+
+    Division winners are determined once and shared by every conference, so
+    seeding both conferences does not repeat the division tiebreakers.
+
+    Args:
+        teams: List of all teams
+        standings_dict: Dictionary of all standings
+        games: List of all games
+        division_winners: Optional precomputed division winners
+            (determined with tiebreakers if not provided)
+        schedule_index: Optional precomputed index of games
+        conferences: Conferences to seed (default: AFC and NFC)
+        excluded_team_ids: Teams left out of the seeding (e.g. with a
+            clinched seed or eliminated); seeds then list only the remaining
+            division winners and wild cards, and the excluded teams still
+            count for tiebreakers such as combined ranking
+
+    Returns:
+        LeagueSeeding with division winners, wild cards and seeds
+    """
+    conferences = conferences or ["AFC", "NFC"]
+
+    if division_winners is None:
+        division_winners = determine_division_winners(
+            teams, standings_dict, games, schedule_index
+        )
+
+    wild_cards = determine_wild_card_teams(
+        teams, standings_dict, games, division_winners, schedule_index, conferences,
+        excluded_team_ids,
+    )
+
+    seeds = {}
+    for conference in conferences:
+        ranked_div_winners = _rank_division_winners(
+            teams, standings_dict, games, conference, division_winners, schedule_index,
+            excluded_team_ids,
+        )
+        # Combine: division winners (seeds 1-4) + wild cards (seeds 5-7)
+        seeds[conference] = ranked_div_winners[:4] + wild_cards.get(conference, [])[:3]
+
+    return LeagueSeeding(
+        division_winners=division_winners, wild_cards=wild_cards, seeds=seeds
     )
-    wild_cards = wild_cards_dict.get(conference, [])
 
-    # Combine: division winners (seeds 1-4) + wild cards (seeds 5-7)
-    playoff_seeds = ranked_div_winners[:4] + wild_cards[:3]
 
-    return playoff_seeds
+def seed_conference_playoffs(
+    teams: List[Team],
+    standings_dict: Dict[str, Standing],
+    games: List[Game],
+    conference: str,
+    division_winners: Optional[Dict[str, str]] = None,
+    schedule_index: Optional[ScheduleIndex] = None,
+) -> List[str]:
+    """
+    Seed playoff teams 1-7 in a conference.
+
+    Seeds 1-4 are division winners (ranked by record + tiebreakers).
+    Seeds 5-7 are wild cards (already ordered by tiebreakers).
+
+    Args:
+        teams: List of all teams
+        standings_dict: Dictionary of all standings
+        games: List of all games
+        conference: Conference name ("AFC" or "NFC")
+        division_winners: Optional precomputed division winners
+            (determined with tiebreakers if not provided)
+        schedule_index: Optional precomputed index of games
+
+    Returns:
+        List of 7 team IDs in playoff seed order (1-7)
+    """
+    league = seed_league(
+        teams,
+        standings_dict,
+        games,
+        division_winners=division_winners,
+        schedule_index=schedule_index,
+        conferences=[conference],
+    )
+    return league.seeds[conference]
@@ -0,0 +1,219 @@
+"""
+Incremental "what-if" updates of a finished Monte Carlo run.
+
+A run made with retain_outcomes=True keeps every simulation's outcomes and
+seeding. When the user overrides one of the games that run simulated, only
+that game's column changes: the overridden result is written into every
+simulation, and only simulations whose outcome actually changed (or whose
+seeding went through tiebreakers, where scores matter) have their standings
+and seeding recomputed. Their old contribution is removed from the team
+statistics and the new one added, so the result is updated in place at a
+fraction of the cost of a full run.
+"""
+
+import time
+from dataclasses import replace
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from ..data.models import Game, Team
+from ..utils.logger import setup_logger
+from .batch_seeding import seed_outcomes
+from .batch_standings import (
+    SeasonBaseline,
+    build_season_baseline,
+    calculate_batch_standings,
+    is_decided_game,
+)
+from .monte_carlo import RetainedOutcomes, SimulationResult, accumulate_team_stats
+from .rng import simulation_streams, tiebreak_stream
+from .scores import MAX_COMPACT_SCORE, CompactOutcomes
+
+logger = setup_logger(__name__)
+
+
+def _without_override(game: Game) -> Game:
+    """Copy of a game with any user override removed."""
+    if not game.is_overridden:
+        return game
+    return replace(
+        game,
+        is_overridden=False,
+        override_home_score=None,
+        override_away_score=None,
+    )
+
+
+def _with_overrides(
+    outcomes: CompactOutcomes, overrides: Dict[int, Tuple[int, int]]
+) -> CompactOutcomes:
+    """Copy of outcomes with fixed scores written into the overridden columns."""
+    if not overrides:
+        return outcomes
+
+    result = CompactOutcomes(
+        home_wins_packed=outcomes.home_wins_packed.copy(),
+        home_scores=outcomes.home_scores.copy(),
+        away_scores=outcomes.away_scores.copy(),
+        num_games=outcomes.num_games,
+    )
+    for column, (home_score, away_score) in overrides.items():
+        result.home_scores[:, column] = min(home_score, MAX_COMPACT_SCORE)
+        result.away_scores[:, column] = min(away_score, MAX_COMPACT_SCORE)
+
+        bit = np.uint8(0x80 >> (column % 8))
+        if home_score > away_score:
+            result.home_wins_packed[:, column // 8] |= bit
+        else:
+            result.home_wins_packed[:, column // 8] &= ~bit
+    return result
+
+
+def build_retained_baseline(
+    retained: RetainedOutcomes, games: List[Game], teams: List[Team]
+) -> SeasonBaseline:
+    """
+    Rebuild the season structure a retained run was simulated with.
+
+    Games the run simulated stay undecided even if they are now overridden.
+
+    Args:
+        retained: Outcomes kept from the run
+        games: Current schedule, including overrides
+        teams: List of all teams
+
+    Returns:
+        SeasonBaseline whose remaining games match the retained columns when
+        the schedule has not otherwise changed
+    """
+    return build_run_baseline(retained.game_ids, games, teams)
+
+
+def build_run_baseline(
+    game_ids: List[str], games: List[Game], teams: List[Team]
+) -> SeasonBaseline:
+    """
+    Rebuild the season structure of a run that simulated the given games.
+
+    Args:
+        game_ids: Games the run simulated, in column order
+        games: Current schedule, including overrides
+        teams: List of all teams
+
+    Returns:
+        SeasonBaseline with the simulated games left undecided
+    """
+    simulated = set(game_ids)
+    run_games = [
+        _without_override(game)
+        if game.id in simulated and not game.is_completed
+        else game
+        for game in games
+    ]
+    return build_season_baseline(run_games, teams)
+
+
+def apply_overrides(
+    result: SimulationResult, games: List[Game], teams: List[Team]
+) -> bool:
+    """
+    Bring a retained simulation result in line with the current overrides.
+
+    Only overrides on games the run simulated can be applied incrementally.
+    If the decided games, the simulated games or the teams have changed
+    since the run, nothing is modified and False is returned so the caller
+    can run a fresh simulation instead.
+
+    Args:
+        result: Result of a run made with retain_outcomes=True (updated in place)
+        games: Current schedule, including overrides
+        teams: List of all teams
+
+    Returns:
+        True if the result now reflects the current overrides
+    """
+    retained = result.retained
+    if retained is None:
+        return False
+
+    start_time = time.time()
+    columns = {game_id: column for column, game_id in enumerate(retained.game_ids)}
+
+    baseline = build_retained_baseline(retained, games, teams)
+    if (
+        [game.id for game in baseline.remaining_games] != retained.game_ids
+        or baseline.fixed_signature != retained.fixed_signature
+        or baseline.team_ids != list(result.team_stats)
+    ):
+        logger.info("Schedule changed since the retained run; incremental update not possible")
+        return False
+
+    desired: Dict[int, Tuple[int, int]] = {}
+    for game in games:
+        column = columns.get(game.id)
+        if column is not None and not game.is_completed and is_decided_game(game):
+            desired[column] = game.get_effective_scores()
+
+    changed = sorted(
+        column
+        for column in set(desired) | set(retained.overrides)
+        if desired.get(column) != retained.overrides.get(column)
+    )
+    if not changed:
+        return True
+
+    before = _with_overrides(retained.outcomes, retained.overrides)
+    after = _with_overrides(retained.outcomes, desired)
+
+    # Simulations whose winner (or tie) changed need new records and seeding;
+    # so do those whose tiebreakers reached a points-based rule.
+    before_home = before.home_scores[:, changed].astype(np.int16)
+    before_away = before.away_scores[:, changed].astype(np.int16)
+    after_home = after.home_scores[:, changed].astype(np.int16)
+    after_away = after.away_scores[:, changed].astype(np.int16)
+    outcome_changed = np.any(
+        np.sign(before_home - before_away) != np.sign(after_home - after_away), axis=1
+    )
+    scores_changed = np.any(
+        (before_home != after_home) | (before_away != after_away), axis=1
+    )
+    rows = np.flatnonzero(outcome_changed | (retained.score_dependent & scores_changed))
+
+    if rows.size:
+        old_outcomes = before.take(rows)
+        new_outcomes = after.take(rows)
+        old_batch = calculate_batch_standings(baseline, old_outcomes)
+        new_batch = calculate_batch_standings(baseline, new_outcomes)
+
+        # Coin tosses come from the run seed's tiebreak stream
+        with tiebreak_stream(simulation_streams(retained.random_seed).tiebreaks):
+            seeding = seed_outcomes(baseline, new_batch, teams, new_outcomes)
+
+        accumulate_team_stats(
+            result.team_stats,
+            baseline,
+            old_batch,
+            retained.division_winners[rows],
+            retained.seeds[rows],
+            weight=-1,
+        )
+        accumulate_team_stats(
+            result.team_stats,
+            baseline,
+            new_batch,
+            seeding.division_winners,
+            seeding.seeds,
+        )
+
+        retained.division_winners[rows] = seeding.division_winners
+        retained.seeds[rows] = seeding.seeds
+        retained.score_dependent[rows] = seeding.score_dependent
+        result.score_dependent_simulations = int(np.count_nonzero(retained.score_dependent))
+
+    retained.overrides = desired
+    logger.info(
+        f"Applied {len(changed)} override change(s) to {rows.size:,} of "
+        f"{retained.num_simulations:,} simulations in {time.time() - start_time:.3f}s"
+    )
+    return True
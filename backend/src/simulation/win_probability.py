@@ -0,0 +1,386 @@
+"""
+Per-game win-probability models for simulations.
+
+A model turns the remaining games of a run into a vector of home-win
+probabilities, one per game. The vector is computed once per run and
+broadcast across every simulated season, so the choice of model adds no
+per-simulation cost. LatentStrengthModel additionally draws a strength for
+every team in every simulation and shifts that simulation's probabilities
+by the strength difference, so a team's games are correlated within a
+season. Models round-trip through plain dicts (to_dict /
+win_probability_model_from_dict) for API requests and result cache keys.
+"""
+
+from typing import Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from ..data.models import Game
+
+
+# Elo points added to the home team's rating (about a 57% home win rate)
+DEFAULT_ELO_HOME_ADVANTAGE = 48.0
+DEFAULT_ELO_RATING = 1500.0
+
+# Spread of per-simulation team strength on the log-odds scale (about 85 Elo points)
+DEFAULT_LATENT_STRENGTH_SD = 0.5
+
+# Probabilities are clipped to this margin before taking log-odds
+_LOGIT_EPSILON = 1e-9
+
+
+def _validate_probability(probability: float) -> float:
+    probability = float(probability)
+    if not 0.0 <= probability <= 1.0:
+        raise ValueError(f"Win probability {probability} outside [0, 1]")
+    return probability
+
+
+class WinProbabilityModel:
+    """Base class for models assigning a home-win probability to each game."""
+
+    kind = ""
+    # True if probabilities are redrawn for every simulation
+    varies_by_simulation = False
+
+    @property
+    def is_fair(self) -> bool:
+        """True if every game is a 50/50 coin flip."""
+        return False
+
+    def home_win_probabilities(self, games: List[Game]) -> np.ndarray:
+        """
+        Home-win probability of each game.
+
+        Args:
+            games: Games to price (the remaining games of a run)
+
+        Returns:
+            Float array (len(games),) with values in [0, 1]
+        """
+        raise NotImplementedError
+
+    def to_dict(self) -> Dict[str, object]:
+        """Serialize for API payloads and cache keys."""
+        raise NotImplementedError
+
+
+class FixedProbabilityModel(WinProbabilityModel):
+    """Every home team wins with the same probability (50/50 by default)."""
+
+    kind = "fixed"
+
+    def __init__(self, home_win_probability: float = 0.5):
+        """
+        Args:
+            home_win_probability: Probability that the home team wins any game
+
+        Raises:
+            ValueError: If the probability is outside [0, 1]
+        """
+        self.home_win_probability = _validate_probability(home_win_probability)
+
+    @property
+    def is_fair(self) -> bool:
+        return self.home_win_probability == 0.5
+
+    def home_win_probabilities(self, games: List[Game]) -> np.ndarray:
+        return np.full(len(games), self.home_win_probability)
+
+    def to_dict(self) -> Dict[str, object]:
+        return {"kind": self.kind, "home_win_probability": self.home_win_probability}
+
+
+class EloModel(WinProbabilityModel):
+    """Win probabilities from team Elo ratings with a home-field bonus."""
+
+    kind = "elo"
+
+    def __init__(
+        self,
+        ratings: Mapping[str, float],
+        home_advantage: float = DEFAULT_ELO_HOME_ADVANTAGE,
+        default_rating: float = DEFAULT_ELO_RATING,
+    ):
+        """
+        Args:
+            ratings: Elo rating by team ID
+            home_advantage: Rating points added to the home team
+            default_rating: Rating of teams missing from ratings
+        """
+        self.ratings = {team_id: float(rating) for team_id, rating in ratings.items()}
+        self.home_advantage = float(home_advantage)
+        self.default_rating = float(default_rating)
+
+    def home_win_probabilities(self, games: List[Game]) -> np.ndarray:
+        home = np.array(
+            [self.ratings.get(g.home_team_id, self.default_rating) for g in games],
+            dtype=np.float64,
+        )
+        away = np.array(
+            [self.ratings.get(g.away_team_id, self.default_rating) for g in games],
+            dtype=np.float64,
+        )
+        return 1.0 / (1.0 + 10.0 ** ((away - home - self.home_advantage) / 400.0))
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "kind": self.kind,
+            "ratings": dict(self.ratings),
+            "home_advantage": self.home_advantage,
+            "default_rating": self.default_rating,
+        }
+
+
+class _PerGameModel(WinProbabilityModel):
+    """Probabilities looked up by game ID, with a fallback for other games."""
+
+    def __init__(self, fallback: Optional[WinProbabilityModel] = None):
+        if fallback is not None and fallback.varies_by_simulation:
+            raise ValueError("Fallback model must be fixed per run")
+        self.fallback = fallback if fallback is not None else FixedProbabilityModel()
+
+    def _known_probabilities(self) -> Dict[str, float]:
+        raise NotImplementedError
+
+    def home_win_probabilities(self, games: List[Game]) -> np.ndarray:
+        probabilities = self.fallback.home_win_probabilities(games)
+        known = self._known_probabilities()
+        for column, game in enumerate(games):
+            if game.id in known:
+                probabilities[column] = known[game.id]
+        return probabilities
+
+
+class GameProbabilityModel(_PerGameModel):
+    """User-supplied home-win probability per game."""
+
+    kind = "per_game"
+
+    def __init__(
+        self,
+        probabilities: Mapping[str, float],
+        fallback: Optional[WinProbabilityModel] = None,
+    ):
+        """
+        Args:
+            probabilities: Home-win probability by game ID
+            fallback: Model for games not in probabilities (default: 50/50)
+
+        Raises:
+            ValueError: If a probability is outside [0, 1]
+        """
+        super().__init__(fallback)
+        self.probabilities = {
+            game_id: _validate_probability(p) for game_id, p in probabilities.items()
+        }
+
+    def _known_probabilities(self) -> Dict[str, float]:
+        return self.probabilities
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "kind": self.kind,
+            "probabilities": dict(self.probabilities),
+            "fallback": self.fallback.to_dict(),
+        }
+
+
+def moneyline_to_probability(moneyline: float) -> float:
+    """
+    Implied win probability of an American moneyline (including the vig).
+
+    Args:
+        moneyline: e.g. -150 for a favourite, +130 for an underdog
+
+    Returns:
+        Implied probability
+    """
+    if moneyline < 0:
+        return -moneyline / (-moneyline + 100.0)
+    return 100.0 / (moneyline + 100.0)
+
+
+class MoneylineModel(_PerGameModel):
+    """Home-win probabilities implied by each game's moneylines, vig removed."""
+
+    kind = "moneyline"
+
+    def __init__(
+        self,
+        moneylines: Mapping[str, Tuple[float, float]],
+        fallback: Optional[WinProbabilityModel] = None,
+    ):
+        """
+        Args:
+            moneylines: (home_moneyline, away_moneyline) by game ID
+            fallback: Model for games without moneylines (default: 50/50)
+
+        Raises:
+            ValueError: If a moneyline is between -100 and +100
+        """
+        super().__init__(fallback)
+        self.moneylines: Dict[str, Tuple[float, float]] = {}
+        self._probabilities: Dict[str, float] = {}
+        for game_id, (home_line, away_line) in moneylines.items():
+            if abs(home_line) < 100 or abs(away_line) < 100:
+                raise ValueError(f"Invalid moneylines {home_line}/{away_line} for game {game_id}")
+            home = moneyline_to_probability(home_line)
+            away = moneyline_to_probability(away_line)
+            self.moneylines[game_id] = (float(home_line), float(away_line))
+            # Normalize the two implied probabilities to remove the bookmaker margin
+            self._probabilities[game_id] = home / (home + away)
+
+    def _known_probabilities(self) -> Dict[str, float]:
+        return self._probabilities
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "kind": self.kind,
+            "moneylines": {game_id: list(lines) for game_id, lines in self.moneylines.items()},
+            "fallback": self.fallback.to_dict(),
+        }
+
+
+class LatentStrengthModel(WinProbabilityModel):
+    """
+    Per-simulation team strengths layered on a base model.
+
+    Each simulation draws a strength for every team from a normal
+    distribution with standard deviation strength_sd. A game's log-odds are
+    the base model's log-odds plus the home team's strength minus the away
+    team's, so a team that is strong in one simulated season is strong in all
+    of its games, widening the spread of win totals.
+    """
+
+    kind = "latent_strength"
+    varies_by_simulation = True
+
+    def __init__(
+        self,
+        strength_sd: float = DEFAULT_LATENT_STRENGTH_SD,
+        base: Optional[WinProbabilityModel] = None,
+    ):
+        """
+        Args:
+            strength_sd: Standard deviation of team strength in log-odds
+            base: Model for the average probability of each game (default: 50/50)
+
+        Raises:
+            ValueError: If strength_sd is negative or base varies by simulation
+        """
+        if strength_sd < 0:
+            raise ValueError("strength_sd must be non-negative")
+        base = base if base is not None else FixedProbabilityModel()
+        if base.varies_by_simulation:
+            raise ValueError("Latent strength base model must be fixed per run")
+        self.strength_sd = float(strength_sd)
+        self.base = base
+
+    @property
+    def is_fair(self) -> bool:
+        return self.strength_sd == 0 and self.base.is_fair
+
+    def home_win_probabilities(self, games: List[Game]) -> np.ndarray:
+        return self.base.home_win_probabilities(games)
+
+    def simulation_probabilities(
+        self,
+        base_probabilities: np.ndarray,
+        home_index: np.ndarray,
+        away_index: np.ndarray,
+        num_teams: int,
+        num_simulations: int,
+        rng: Optional[np.random.Generator] = None,
+    ) -> np.ndarray:
+        """
+        Draw team strengths and price every game of a block of simulations.
+
+        Args:
+            base_probabilities: (num_games,) probabilities from home_win_probabilities
+            home_index: (num_games,) team index of each home team
+            away_index: (num_games,) team index of each away team
+            num_teams: Number of teams
+            num_simulations: Simulations in the block
+            rng: Generator for the strengths (default: fresh entropy)
+
+        Returns:
+            (num_simulations × num_games) home-win probabilities
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        strengths = rng.normal(0.0, self.strength_sd, size=(num_simulations, num_teams))
+
+        clipped = np.clip(base_probabilities, _LOGIT_EPSILON, 1.0 - _LOGIT_EPSILON)
+        log_odds = np.log(clipped / (1.0 - clipped))
+        log_odds = log_odds[None, :] + strengths[:, home_index] - strengths[:, away_index]
+        return 1.0 / (1.0 + np.exp(-log_odds))
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "kind": self.kind,
+            "strength_sd": self.strength_sd,
+            "base": self.base.to_dict(),
+        }
+
+
+def win_probability_model_from_dict(spec: Mapping[str, object]) -> WinProbabilityModel:
+    """
+    Build a model from its to_dict form (e.g. an API request).
+
+    Args:
+        spec: Dict with "kind" ("fixed", "elo", "moneyline", "per_game" or
+            "latent_strength") and that model's parameters
+
+    Returns:
+        WinProbabilityModel
+
+    Raises:
+        ValueError: If the kind is unknown or parameters are invalid
+    """
+    kind = spec.get("kind", FixedProbabilityModel.kind)
+    fallback = spec.get("fallback")
+    fallback_model = win_probability_model_from_dict(fallback) if fallback else None
+    try:
+        if kind == FixedProbabilityModel.kind:
+            return FixedProbabilityModel(spec.get("home_win_probability", 0.5))
+        if kind == EloModel.kind:
+            return EloModel(
+                spec["ratings"],
+                home_advantage=spec.get("home_advantage", DEFAULT_ELO_HOME_ADVANTAGE),
+                default_rating=spec.get("default_rating", DEFAULT_ELO_RATING),
+            )
+        if kind == MoneylineModel.kind:
+            return MoneylineModel(
+                {game_id: tuple(lines) for game_id, lines in spec["moneylines"].items()},
+                fallback=fallback_model,
+            )
+        if kind == GameProbabilityModel.kind:
+            return GameProbabilityModel(spec["probabilities"], fallback=fallback_model)
+        if kind == LatentStrengthModel.kind:
+            base = spec.get("base")
+            return LatentStrengthModel(
+                spec.get("strength_sd", DEFAULT_LATENT_STRENGTH_SD),
+                base=win_probability_model_from_dict(base) if base else None,
+            )
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Invalid {kind} win probability model: {e}") from e
+    raise ValueError(f"Unknown win probability model: {kind}")
+
+
+def home_win_probability_vector(
+    model: Optional[WinProbabilityModel],
+    games: List[Game],
+) -> Optional[np.ndarray]:
+    """
+    Probability vector for a run, or None for the 50/50 fast path.
+
+    Args:
+        model: Win-probability model (None means 50/50)
+        games: Remaining games in simulation column order
+
+    Returns:
+        Float array (len(games),), or None if every game is a coin flip
+    """
+    if model is None or model.is_fair:
+        return None
+    return np.asarray(model.home_win_probabilities(games), dtype=np.float64)
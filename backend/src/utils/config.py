@@ -27,6 +27,27 @@ class Config:
         self.CACHE_MAX_AGE_SCHEDULE: int = 86400  # 24 hours
         self.CACHE_MAX_AGE_RESULTS: int = 3600  # 1 hour
 
+        # Simulation
+        self.SIMULATION_WORKERS: int = os.cpu_count() or 1
+        self.SIMULATION_SHARD_SIZE: int = 10000
+        # Largest run whose per-simulation outcomes are kept for what-if updates
+        self.WHAT_IF_MAX_SIMULATIONS: int = 100000
+        # Enumerate every outcome exactly when at most this many games remain
+        # (see DEFAULT_EXACT_MAX_GAMES in src/simulation/exact.py)
+        self.EXACT_MAX_REMAINING_GAMES: int = 16
+        # Finished simulation results kept in memory / on disk for repeat requests
+        self.SIMULATION_CACHE_SIZE: int = 32
+        self.SIMULATION_CACHE_MAX_AGE: int = 86400  # 24 hours
+        self.SIMULATION_CACHE_DISK_SIZE: int = 256
+        # Simulation jobs run at once (sharing SIMULATION_WORKERS), queued, and kept
+        self.SIMULATION_CONCURRENT_JOBS: int = 2
+        self.SIMULATION_QUEUE_SIZE: int = 16
+        self.SIMULATION_JOB_HISTORY: int = 50
+        # Largest accepted job (0 for no limit)
+        self.SIMULATION_MAX_JOB_SIMULATIONS: int = 1000000
+        # Per-simulation outcome stores kept on disk for conditional queries
+        self.OUTCOME_STORE_MAX_COUNT: int = 8
+
         # Logging
         self.LOG_LEVEL: str = "INFO"
         self.LOG_FILE: str = "nfl_monte_carlo.log"
@@ -72,6 +93,44 @@ class Config:
         config.CACHE_MAX_AGE_RESULTS = int(
             os.getenv("CACHE_MAX_AGE_RESULTS", config.CACHE_MAX_AGE_RESULTS)
         )
+        # Simulation
+        config.SIMULATION_WORKERS = int(
+            os.getenv("SIMULATION_WORKERS", config.SIMULATION_WORKERS)
+        )
+        config.SIMULATION_SHARD_SIZE = int(
+            os.getenv("SIMULATION_SHARD_SIZE", config.SIMULATION_SHARD_SIZE)
+        )
+        config.WHAT_IF_MAX_SIMULATIONS = int(
+            os.getenv("WHAT_IF_MAX_SIMULATIONS", config.WHAT_IF_MAX_SIMULATIONS)
+        )
+        config.EXACT_MAX_REMAINING_GAMES = int(
+            os.getenv("EXACT_MAX_REMAINING_GAMES", config.EXACT_MAX_REMAINING_GAMES)
+        )
+        config.SIMULATION_CACHE_SIZE = int(
+            os.getenv("SIMULATION_CACHE_SIZE", config.SIMULATION_CACHE_SIZE)
+        )
+        config.SIMULATION_CACHE_MAX_AGE = int(
+            os.getenv("SIMULATION_CACHE_MAX_AGE", config.SIMULATION_CACHE_MAX_AGE)
+        )
+        config.SIMULATION_CACHE_DISK_SIZE = int(
+            os.getenv("SIMULATION_CACHE_DISK_SIZE", config.SIMULATION_CACHE_DISK_SIZE)
+        )
+        config.SIMULATION_CONCURRENT_JOBS = int(
+            os.getenv("SIMULATION_CONCURRENT_JOBS", config.SIMULATION_CONCURRENT_JOBS)
+        )
+        config.SIMULATION_QUEUE_SIZE = int(
+            os.getenv("SIMULATION_QUEUE_SIZE", config.SIMULATION_QUEUE_SIZE)
+        )
+        config.SIMULATION_JOB_HISTORY = int(
+            os.getenv("SIMULATION_JOB_HISTORY", config.SIMULATION_JOB_HISTORY)
+        )
+        config.SIMULATION_MAX_JOB_SIMULATIONS = int(
+            os.getenv("SIMULATION_MAX_JOB_SIMULATIONS", config.SIMULATION_MAX_JOB_SIMULATIONS)
+        )
+        config.OUTCOME_STORE_MAX_COUNT = int(
+            os.getenv("OUTCOME_STORE_MAX_COUNT", config.OUTCOME_STORE_MAX_COUNT)
+        )
+
         # Logging
         config.LOG_LEVEL = os.getenv("LOG_LEVEL", config.LOG_LEVEL)
         config.LOG_FILE = os.getenv("LOG_FILE", config.LOG_FILE)
@@ -122,6 +181,30 @@ class Config:
             errors.append("CACHE_MAX_AGE_SCHEDULE must be positive")
         if self.CACHE_MAX_AGE_RESULTS <= 0:
             errors.append("CACHE_MAX_AGE_RESULTS must be positive")
+        if self.SIMULATION_WORKERS <= 0:
+            errors.append("SIMULATION_WORKERS must be positive")
+        if self.SIMULATION_SHARD_SIZE <= 0:
+            errors.append("SIMULATION_SHARD_SIZE must be positive")
+        if self.WHAT_IF_MAX_SIMULATIONS < 0:
+            errors.append("WHAT_IF_MAX_SIMULATIONS must not be negative")
+        if self.EXACT_MAX_REMAINING_GAMES < 0:
+            errors.append("EXACT_MAX_REMAINING_GAMES must not be negative")
+        if self.SIMULATION_CACHE_SIZE < 0:
+            errors.append("SIMULATION_CACHE_SIZE must not be negative")
+        if self.SIMULATION_CACHE_MAX_AGE <= 0:
+            errors.append("SIMULATION_CACHE_MAX_AGE must be positive")
+        if self.SIMULATION_CACHE_DISK_SIZE < 0:
+            errors.append("SIMULATION_CACHE_DISK_SIZE must not be negative")
+        if self.SIMULATION_CONCURRENT_JOBS <= 0:
+            errors.append("SIMULATION_CONCURRENT_JOBS must be positive")
+        if self.SIMULATION_QUEUE_SIZE < 0:
+            errors.append("SIMULATION_QUEUE_SIZE must not be negative")
+        if self.SIMULATION_JOB_HISTORY < 0:
+            errors.append("SIMULATION_JOB_HISTORY must not be negative")
+        if self.SIMULATION_MAX_JOB_SIMULATIONS < 0:
+            errors.append("SIMULATION_MAX_JOB_SIMULATIONS must not be negative")
+        if self.OUTCOME_STORE_MAX_COUNT <= 0:
+            errors.append("OUTCOME_STORE_MAX_COUNT must be positive")
         # Validate log level
         try:
             get_log_level(self.LOG_LEVEL)
@@ -165,3 +165,86 @@ def mock_espn_game_detail():
     }
 
 
+@pytest.fixture
+def league_teams():
+    """Create a full 32-team league (2 conferences × 4 divisions × 4 teams)."""
+    teams = []
+    team_id = 1
+    for conference in ["AFC", "NFC"]:
+        for division in ["North", "South", "East", "West"]:
+            for i in range(4):
+                teams.append(
+                    Team(
+                        id=str(team_id),
+                        abbreviation=f"{conference[0]}{division[0]}{i + 1}",
+                        name=f"{conference} {division} Team {i + 1}",
+                        display_name=f"Team {team_id}",
+                        location="City",
+                        conference=conference,
+                        division=division,
+                    )
+                )
+                team_id += 1
+    return teams
+
+
+@pytest.fixture
+def league_games(league_teams):
+    """
+    Create a 17-week, 272-game schedule for the 32-team league.
+
+    Pairings use the circle method so every team plays once per week.
+    Weeks 1-10 are completed with deterministic pseudo-random scores.
+    """
+    import random
+
+    rng = random.Random(7)
+    team_ids = [t.id for t in league_teams]
+    rotation = team_ids[1:]
+    games = []
+
+    for week in range(1, 18):
+        order = [team_ids[0]] + rotation
+        for i in range(16):
+            home_id, away_id = order[i], order[31 - i]
+            if week % 2 == 0:
+                home_id, away_id = away_id, home_id
+
+            completed = week <= 10
+            home_score = away_score = None
+            if completed:
+                home_score = rng.randint(3, 40)
+                away_score = rng.randint(3, 40)
+                if home_score == away_score:
+                    away_score += 3
+
+            games.append(
+                Game(
+                    id=f"w{week}g{i}",
+                    week=week,
+                    season=2025,
+                    home_team_id=home_id,
+                    away_team_id=away_id,
+                    date=datetime(2025, 9, 7),
+                    is_completed=completed,
+                    home_score=home_score,
+                    away_score=away_score,
+                )
+            )
+        rotation = rotation[-1:] + rotation[:-1]
+
+    return games
+
+
+@pytest.fixture
+def late_season_games(league_games):
+    """The league schedule with only its last six games still to play."""
+    from dataclasses import replace
+
+    games = []
+    for idx, game in enumerate(league_games):
+        if not game.is_completed and idx < len(league_games) - 6:
+            home, away = (24, 17) if idx % 3 else (13, 20)
+            game = replace(game, is_completed=True, home_score=home, away_score=away)
+        games.append(game)
+    return games
@@ -0,0 +1,176 @@
+"""
+Tests for batched playoff seeding.
+"""
+
+import numpy as np
+import pytest
+from datetime import datetime
+
+from src.data.models import Team, Game
+from src.simulation import batch_seeding
+from src.simulation.batch_seeding import seed_simulations_batch
+from src.simulation.batch_standings import (
+    build_season_baseline,
+    calculate_batch_standings,
+    create_simulation_games,
+    materialize_simulation_games,
+    standings_for_simulation,
+)
+from src.simulation.clinch import analyze_clinching, seeding_facts
+from src.simulation.scores import CompactOutcomes
+from src.simulation.tiebreakers import (
+    determine_division_winners,
+    seed_conference_playoffs,
+)
+
+
+def _run_batch(games, teams, num_simulations, seed=0, facts=None):
+    """Simulate outcomes and seed them with the batched resolver."""
+    baseline = build_season_baseline(games, teams)
+    rng = np.random.default_rng(seed)
+    shape = (num_simulations, baseline.num_remaining_games)
+    home_wins = (rng.random(shape) < 0.5).astype(int)
+    loser_scores = rng.poisson(20, size=shape)
+    winner_scores = loser_scores + 1 + rng.poisson(8, size=shape)
+    home_scores = np.where(home_wins == 1, winner_scores, loser_scores)
+    away_scores = np.where(home_wins == 1, loser_scores, winner_scores)
+
+    outcomes = CompactOutcomes.from_arrays(home_wins, home_scores, away_scores)
+    batch = calculate_batch_standings(baseline, outcomes)
+    buffer = create_simulation_games(baseline)
+    resolved = []
+
+    def resolve(sim_idx):
+        resolved.append(sim_idx)
+        sim_games = materialize_simulation_games(baseline, buffer, outcomes, sim_idx)
+        return standings_for_simulation(baseline, batch, sim_idx, sim_games), sim_games
+
+    seeding = seed_simulations_batch(baseline, batch, teams, resolve, facts)
+    return baseline, batch, seeding, resolved, (resolve, buffer)
+
+
+@pytest.fixture
+def sample_teams():
+    """Six AFC teams across two divisions."""
+    return [
+        Team(id=str(i), abbreviation=f"T{i}", name=f"Team {i}", display_name=f"Team {i}",
+             location="City", conference="AFC", division="West" if i <= 4 else "East")
+        for i in range(1, 7)
+    ]
+
+
+@pytest.fixture
+def sample_games(sample_teams):
+    """A short schedule where every team plays twice."""
+    pairs = [("1", "2"), ("3", "4"), ("5", "6"), ("1", "5"), ("2", "6"), ("3", "4")]
+    return [
+        Game(id=f"g{i}", week=i // 3 + 1, season=2025, home_team_id=home,
+             away_team_id=away, date=datetime(2025, 9, 7), is_completed=False)
+        for i, (home, away) in enumerate(pairs)
+    ]
+
+
+class TestSeedSimulationsBatch:
+    """Tests for seed_simulations_batch."""
+
+    def test_matches_per_simulation_tiebreakers(self, league_teams, league_games):
+        """Test that batched seeding equals the per-simulation tiebreaker path."""
+        baseline, batch, seeding, _, (resolve, _) = _run_batch(
+            league_games, league_teams, 60
+        )
+
+        for sim_idx in range(60):
+            standings_dict, sim_games = resolve(sim_idx)
+            expected_winners = determine_division_winners(
+                league_teams, standings_dict, sim_games
+            )
+            for d, key in enumerate(baseline.division_keys):
+                assert (
+                    baseline.team_ids[seeding.division_winners[sim_idx, d]]
+                    == expected_winners[key]
+                )
+
+            for c, conference in enumerate(["AFC", "NFC"]):
+                expected_seeds = seed_conference_playoffs(
+                    league_teams, standings_dict, sim_games, conference
+                )
+                actual_seeds = [
+                    baseline.team_ids[idx] for idx in seeding.seeds[sim_idx, c] if idx >= 0
+                ]
+                assert actual_seeds == expected_seeds
+
+    def test_only_tied_simulations_are_resolved(self, league_teams, league_games):
+        """Test that simulations without ties never reach the tiebreaker code."""
+        baseline, batch, seeding, resolved, _ = _run_batch(
+            league_games, league_teams, 40, seed=3
+        )
+
+        # Each simulation is materialized at most once
+        assert len(resolved) == len(set(resolved))
+        assert seeding.tiebreak_cells >= len(resolved)
+
+        pct = batch.win_percentage
+        for sim_idx in set(range(40)) - set(resolved):
+            # Untied simulations: every division has a unique leader
+            for d in range(len(baseline.division_keys)):
+                members = np.flatnonzero(baseline.division_index == d)
+                leaders = pct[sim_idx, members] == pct[sim_idx, members].max()
+                assert leaders.sum() == 1
+
+    def test_decided_season_seeds_identically(self, league_teams, league_games):
+        """Test that a finished season gives the same seeds in every simulation."""
+        finished = [g for g in league_games if g.is_completed]
+        baseline = build_season_baseline(finished, league_teams)
+        empty = np.zeros((3, 0), dtype=int)
+        batch = calculate_batch_standings(
+            baseline, CompactOutcomes.from_arrays(empty, empty, empty)
+        )
+
+        calls = []
+
+        def resolve(sim_idx):
+            calls.append(sim_idx)
+            return standings_for_simulation(baseline, batch, sim_idx, finished), finished
+
+        seeding = seed_simulations_batch(baseline, batch, league_teams, resolve)
+
+        # Identical rows produce identical seeds and are either all tied or none
+        assert seeding.seeds.shape == (3, 2, 7)
+        np.testing.assert_array_equal(seeding.seeds[0], seeding.seeds[2])
+        assert len(calls) in (0, 3)
+
+    def test_clinch_facts_leave_seeding_unchanged(self, league_teams, late_season_games,
+                                                  monkeypatch):
+        """Test that decided teams are skipped without changing any seed."""
+        baseline = build_season_baseline(late_season_games, league_teams)
+        facts = seeding_facts(baseline, analyze_clinching(baseline))
+        decided_ids = {baseline.team_ids[i] for i in np.flatnonzero(facts.decided)}
+        assert decided_ids
+
+        excluded = []
+        seed_league = batch_seeding.seed_league
+
+        def recording_seed_league(*args, **kwargs):
+            excluded.append(set(kwargs["excluded_team_ids"]))
+            return seed_league(*args, **kwargs)
+
+        monkeypatch.setattr(batch_seeding, "seed_league", recording_seed_league)
+        _, _, plain, _, _ = _run_batch(late_season_games, league_teams, 300, seed=5)
+        _, _, pruned, _, _ = _run_batch(
+            late_season_games, league_teams, 300, seed=5, facts=facts
+        )
+
+        np.testing.assert_array_equal(pruned.division_winners, plain.division_winners)
+        np.testing.assert_array_equal(pruned.seeds, plain.seeds)
+        assert excluded and excluded[-1] == decided_ids
+
+    def test_partial_league(self, sample_teams, sample_games):
+        """Test conferences with fewer than four divisions and no NFC teams."""
+        baseline, _, seeding, _, _ = _run_batch(sample_games, sample_teams, 10)
+
+        assert seeding.division_winners.shape == (10, 2)
+        # AFC: 2 division winners + 3 wild cards (of 4 non-winners)
+        assert (seeding.seeds[:, 0, :5] >= 0).all()
+        assert (seeding.seeds[:, 0, 5:] == -1).all()
+        # No NFC teams
+        assert (seeding.seeds[:, 1] == -1).all()
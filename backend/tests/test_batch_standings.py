@@ -0,0 +1,193 @@
+"""
+Tests for the batch standings engine.
+"""
+
+import numpy as np
+import pytest
+from datetime import datetime
+
+from src.data.models import Game
+from src.simulation.batch_standings import (
+    RECORD_FIELDS,
+    build_season_baseline,
+    calculate_batch_standings,
+    create_simulation_games,
+    is_decided_game,
+    materialize_simulation_games,
+    standings_for_simulation,
+)
+from src.simulation.scores import CompactOutcomes
+from src.simulation.standings import calculate_standings
+
+
+def _random_outcomes(baseline, num_simulations, seed=0):
+    """Generate consistent winner flags and scores for the remaining games."""
+    rng = np.random.default_rng(seed)
+    shape = (num_simulations, baseline.num_remaining_games)
+    home_wins = (rng.random(shape) < 0.5).astype(int)
+    loser_scores = rng.integers(0, 30, size=shape)
+    winner_scores = loser_scores + rng.integers(1, 20, size=shape)
+    home_scores = np.where(home_wins == 1, winner_scores, loser_scores)
+    away_scores = np.where(home_wins == 1, loser_scores, winner_scores)
+    return CompactOutcomes.from_arrays(home_wins, home_scores, away_scores)
+
+
+class TestSeasonBaseline:
+    """Tests for baseline construction."""
+
+    def test_splits_decided_and_remaining_games(self, league_teams, league_games):
+        """Test that completed games are folded into the baseline."""
+        baseline = build_season_baseline(league_games, league_teams)
+
+        assert len(baseline.fixed_games) == 160
+        assert baseline.num_remaining_games == 112
+        assert baseline.num_teams == 32
+        assert len(baseline.division_keys) == 8
+
+    def test_baseline_records_match_completed_standings(
+        self, league_teams, league_games
+    ):
+        """Test that baseline records equal standings of completed games only."""
+        baseline = build_season_baseline(league_games, league_teams)
+        completed = [g for g in league_games if g.is_completed]
+        expected = calculate_standings(completed, league_teams)
+
+        for idx, team_id in enumerate(baseline.team_ids):
+            for name in RECORD_FIELDS:
+                assert getattr(baseline.records, name)[0, idx] == getattr(
+                    expected[team_id], name
+                )
+
+    def test_overridden_game_is_decided(self, league_teams, league_games):
+        """Test that an upcoming game with an override is treated as decided."""
+        game = next(g for g in league_games if not g.is_completed)
+        game.is_overridden = True
+        game.override_home_score = 10
+        game.override_away_score = 20
+
+        assert is_decided_game(game)
+        baseline = build_season_baseline(league_games, league_teams)
+        assert baseline.num_remaining_games == 111
+
+        resolved = next(g for g in baseline.fixed_games if g.id == game.id)
+        assert resolved.is_completed
+        assert resolved.get_winner() == "away"
+        assert resolved.home_score == 10
+
+
+class TestCalculateBatchStandings:
+    """Tests for calculate_batch_standings."""
+
+    def test_matches_per_simulation_standings(self, league_teams, league_games):
+        """Test that batch records equal calculate_standings for every simulation."""
+        baseline = build_season_baseline(league_games, league_teams)
+        outcomes = _random_outcomes(baseline, 25)
+
+        batch = calculate_batch_standings(baseline, outcomes)
+        assert batch.wins.shape == (25, 32)
+
+        sim_buffer = create_simulation_games(baseline)
+        for sim_idx in range(25):
+            sim_games = materialize_simulation_games(
+                baseline, sim_buffer, outcomes, sim_idx
+            )
+            expected = calculate_standings(sim_games, league_teams)
+
+            for idx, team_id in enumerate(baseline.team_ids):
+                for name in RECORD_FIELDS:
+                    assert getattr(batch, name)[sim_idx, idx] == getattr(
+                        expected[team_id], name
+                    ), f"{name} mismatch for team {team_id} in sim {sim_idx}"
+                assert batch.win_percentage[sim_idx, idx] == pytest.approx(
+                    expected[team_id].win_percentage
+                )
+
+    def test_equal_scores_count_as_tie(self, league_teams, league_games):
+        """Test that equal simulated scores are recorded as a tie."""
+        baseline = build_season_baseline(league_games, league_teams)
+        home_wins = np.ones((1, baseline.num_remaining_games), dtype=int)
+        home_scores = np.full((1, baseline.num_remaining_games), 20)
+        away_scores = np.full((1, baseline.num_remaining_games), 20)
+
+        outcomes = CompactOutcomes.from_arrays(home_wins, home_scores, away_scores)
+        batch = calculate_batch_standings(baseline, outcomes)
+        games_left = np.bincount(
+            np.concatenate([baseline.home_index, baseline.away_index]), minlength=32
+        )
+
+        np.testing.assert_array_equal(
+            batch.ties[0], baseline.records.ties[0] + games_left
+        )
+        np.testing.assert_array_equal(batch.wins[0], baseline.records.wins[0])
+
+    def test_no_remaining_games(self, league_teams, league_games):
+        """Test that a finished season repeats the baseline for every simulation."""
+        finished = [g for g in league_games if g.is_completed]
+        baseline = build_season_baseline(finished, league_teams)
+        empty = np.zeros((4, 0), dtype=int)
+
+        batch = calculate_batch_standings(
+            baseline, CompactOutcomes.from_arrays(empty, empty, empty)
+        )
+
+        assert batch.num_simulations == 4
+        for sim_idx in range(4):
+            np.testing.assert_array_equal(batch.wins[sim_idx], baseline.records.wins[0])
+
+    def test_standings_for_simulation_includes_tiebreak_data(
+        self, league_teams, league_games
+    ):
+        """Test that full Standing objects match calculate_standings."""
+        baseline = build_season_baseline(league_games, league_teams)
+        outcomes = _random_outcomes(baseline, 3, seed=5)
+        batch = calculate_batch_standings(baseline, outcomes)
+
+        sim_buffer = create_simulation_games(baseline)
+        sim_games = materialize_simulation_games(baseline, sim_buffer, outcomes, 2)
+        standings = standings_for_simulation(baseline, batch, 2, sim_games)
+        expected = calculate_standings(sim_games, league_teams)
+
+        for team_id, standing in standings.items():
+            assert standing.head_to_head_records == expected[team_id].head_to_head_records
+            assert standing.strength_of_victory == expected[team_id].strength_of_victory
+            assert standing.strength_of_schedule == expected[team_id].strength_of_schedule
+
+    def test_standings_from_outcome_arrays(self, league_teams, league_games):
+        """Test that head-to-head data read from outcomes matches the games path."""
+        baseline = build_season_baseline(league_games, league_teams)
+        sampled = _random_outcomes(baseline, 2, seed=9)
+        home_scores = sampled.home_scores.astype(int)
+        away_scores = sampled.away_scores.astype(int)
+        home_scores[:, 0] = away_scores[:, 0] = 17  # include a tie
+        outcomes = CompactOutcomes.from_arrays(
+            home_scores > away_scores, home_scores, away_scores
+        )
+        batch = calculate_batch_standings(baseline, outcomes)
+
+        sim_games = materialize_simulation_games(
+            baseline, create_simulation_games(baseline), outcomes, 1
+        )
+        from_arrays = standings_for_simulation(baseline, batch, 1, sim_games, outcomes)
+        from_games = standings_for_simulation(baseline, batch, 1, sim_games)
+
+        for team_id, standing in from_arrays.items():
+            expected = from_games[team_id]
+            assert dict(standing.head_to_head_records) == dict(expected.head_to_head_records)
+            assert standing.strength_of_victory == expected.strength_of_victory
+            assert standing.strength_of_schedule == expected.strength_of_schedule
+
+    def test_skips_games_with_unknown_teams(self, league_teams, league_games):
+        """Test that games referencing unknown teams are ignored."""
+        games = league_games + [
+            Game(
+                id="bad",
+                week=18,
+                season=2025,
+                home_team_id="999",
+                away_team_id="1",
+                date=datetime(2026, 1, 4),
+                is_completed=False,
+            )
+        ]
+        baseline = build_season_baseline(games, league_teams)
+        assert baseline.num_remaining_games == 112
@@ -0,0 +1,144 @@
+"""
+Tests for the benchmark suite.
+"""
+
+import pytest
+
+from benchmarks.run import (
+    compare_results,
+    load_results,
+    main,
+    remaining_games_state,
+    run_benchmarks,
+    season_state,
+    write_results,
+)
+
+
+def _results(**benchmarks):
+    return {"benchmarks": benchmarks}
+
+
+class TestSeasonState:
+    """Tests for building season states."""
+
+    def test_completed_weeks(self, league_games):
+        """Test that exactly the games up to the week are completed."""
+        for week in (0, 5, 16):
+            state = season_state(league_games, week)
+
+            assert len(state) == len(league_games)
+            for game in state:
+                assert game.is_completed == (game.week <= week)
+                if game.is_completed:
+                    assert game.home_score is not None and game.away_score is not None
+
+    def test_keeps_real_results(self, league_games):
+        """Test that played games keep their scores and filled scores are stable."""
+        state = {g.id: g for g in season_state(league_games, 16)}
+        for game in league_games:
+            if game.is_completed:
+                assert state[game.id].home_score == game.home_score
+
+        again = {g.id: g for g in season_state(league_games, 16)}
+        assert all(again[k].home_score == g.home_score for k, g in state.items())
+
+    def test_remaining_games(self, league_games):
+        """Test that only the last games of the schedule are left to play."""
+        state = remaining_games_state(league_games, 3)
+
+        assert [game.is_completed for game in state].count(False) == 3
+        assert not any(game.is_completed for game in state[-3:])
+
+
+class TestCompareResults:
+    """Tests for regression detection."""
+
+    def test_flags_slower_and_larger(self):
+        """Test that growth beyond the tolerance is flagged per metric."""
+        baseline = _results(a={"seconds": 1.0, "peak_memory_bytes": 100},
+                            b={"seconds": 1.0, "peak_memory_bytes": 100})
+        current = _results(a={"seconds": 1.3, "peak_memory_bytes": 100},
+                           b={"seconds": 1.1, "peak_memory_bytes": 200})
+
+        regressions = compare_results(current, baseline, tolerance=0.25)
+
+        assert [(r.name, r.metric) for r in regressions] == [
+            ("a", "seconds"), ("b", "peak_memory_bytes")
+        ]
+        assert regressions[0].ratio == 1.3
+
+    def test_ignores_new_and_improved(self):
+        """Test that faster runs and benchmarks without a baseline pass."""
+        baseline = _results(a={"seconds": 1.0, "peak_memory_bytes": 100})
+        current = _results(a={"seconds": 0.5, "peak_memory_bytes": 50},
+                           new={"seconds": 9.0, "peak_memory_bytes": 900})
+
+        assert compare_results(current, baseline) == []
+
+    def test_flags_costlier_enumeration(self):
+        """Test that enumeration getting costlier relative to sampling is flagged."""
+        baseline = {"exact": {"8": {"relative_cost": 1.0}, "10": {"relative_cost": 1.0}}}
+        current = {"exact": {"8": {"relative_cost": 1.5}, "10": {"relative_cost": 1.1}}}
+
+        regressions = compare_results(current, baseline, tolerance=0.25)
+
+        assert [(r.name, r.metric) for r in regressions] == [
+            ("exact_vs_sampler/8_games", "relative_cost")
+        ]
+
+
+class TestRunBenchmarks:
+    """Tests for running the suite."""
+
+    def test_small_run(self, league_teams, league_games, tmp_path):
+        """Test that a small run covers every benchmark and round-trips to disk."""
+        results = run_benchmarks(
+            league_games, league_teams, num_simulations=20, repeat=1, iterations=1,
+            states={"mid_season": 9}, sampling_replicates=2, exact_games=[3],
+        )
+
+        names = set(results["benchmarks"])
+        assert {
+            "simulate_season/mid_season",
+            "calculate_standings/mid_season",
+            "determine_division_winners/mid_season",
+            "seed_conference_playoffs/mid_season",
+            "cache/load_simulation_result",
+            "enumerate_season/3_games",
+            "simulate_season/3_games",
+        } <= names
+        simulate = results["benchmarks"]["simulate_season/mid_season"]
+        assert simulate["operations"] == 20
+        assert simulate["operations_per_second"] > 0
+        assert simulate["peak_memory_bytes"] > 0
+        assert set(results["sampling"]) == {"independent", "antithetic", "stratified"}
+        assert results["sampling"]["independent"]["relative_efficiency"] == pytest.approx(1.0)
+        assert all(m["standard_error"] >= 0 for m in results["sampling"].values())
+        assert results["exact"]["3"]["rows"] == 8
+        assert results["exact"]["3"]["relative_cost"] > 0
+
+        path = tmp_path / "results.json"
+        write_results(results, path)
+        assert compare_results(load_results(path), results) == []
+
+    def test_main_flags_regression(self, league_teams, league_games, cache_manager,
+                                   tmp_path, capsys):
+        """Test the command line exit status against a baseline."""
+        cache_manager.save_schedule(league_games)
+        cache_manager.save_teams(league_teams)
+        args = ["--data-dir", str(cache_manager.cache_dir), "--simulations", "10",
+                "--repeat", "1", "--iterations", "1", "--states", "week_17",
+                "--sampling-replicates", "2", "--exact-games", "3"]
+
+        baseline = tmp_path / "baseline.json"
+        assert main(args + ["--save-baseline", str(baseline)]) == 0
+
+        # A baseline that claims everything used to be instant
+        stored = load_results(baseline)
+        for metrics in stored["benchmarks"].values():
+            metrics["seconds"] = 1e-9
+        write_results(stored, baseline)
+
+        assert main(args + ["--baseline", str(baseline)]) == 1
+        assert "regression" in capsys.readouterr().out
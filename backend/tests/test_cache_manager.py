@@ -71,6 +71,18 @@ class TestCacheManager:
         assert loaded_games[0].home_score == 24
         assert loaded_games[0].away_score == 17
 
+    def test_save_and_load_simulation_data(self, cache_manager):
+        """Test serialized simulation result persistence."""
+        cache_manager.save_simulation_data("abc", {"num_simulations": 4})
+
+        assert cache_manager.load_simulation_data("abc") == {"num_simulations": 4}
+        assert cache_manager.count_simulation_results() == 1
+        assert cache_manager.load_simulation_data("missing") is None
+        assert cache_manager.load_simulation_data("abc", max_age_seconds=-1) is None
+
+        cache_manager.clear_simulation_results()
+        assert cache_manager.load_simulation_data("abc") is None
+
     def test_save_and_load_overrides(self, cache_manager):
         """Test user overrides persistence."""
         overrides = {"game_123": {"home_score": 30, "away_score": 20}}
@@ -0,0 +1,154 @@
+"""
+Tests for clinch and elimination analysis.
+"""
+
+from dataclasses import replace
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from src.data.models import Team, Game
+from src.simulation import monte_carlo
+from src.simulation.batch_standings import build_season_baseline
+from src.simulation.clinch import (
+    analyze_clinching,
+    clinch_statuses,
+    settled_seeding,
+    win_percentage_bounds,
+)
+from src.simulation.exact import enumerate_season
+
+
+@pytest.fixture
+def ladder_teams():
+    """Eight AFC teams in two divisions."""
+    return [
+        Team(id=str(i), abbreviation=f"T{i}", name=f"Team {i}", display_name=f"Team {i}",
+             location="City", conference="AFC", division="West" if i <= 4 else "East")
+        for i in range(1, 9)
+    ]
+
+
+@pytest.fixture
+def ladder_games(ladder_teams):
+    """
+    A completed round robin where the higher team ID always wins, so team k
+    finishes k-1 and 8-k, plus one unplayed game between the two worst teams.
+    """
+    games = []
+    for i in range(1, 9):
+        for j in range(i + 1, 9):
+            games.append(
+                Game(id=f"g{i}-{j}", week=1, season=2025, home_team_id=str(i),
+                     away_team_id=str(j), date=datetime(2025, 9, 7), is_completed=True,
+                     home_score=10, away_score=20)
+            )
+    games.append(
+        Game(id="extra", week=2, season=2025, home_team_id="1", away_team_id="2",
+             date=datetime(2025, 9, 14), is_completed=False)
+    )
+    return games
+
+
+class TestWinPercentageBounds:
+    """Tests for best/worst-case records."""
+
+    def test_bounds_bracket_remaining_games(self, ladder_teams, ladder_games):
+        """Test that only teams with games left have a range of outcomes."""
+        baseline = build_season_baseline(ladder_games, ladder_teams)
+        worst, best = win_percentage_bounds(baseline)
+
+        # Team 1: 0-7 with one game left; team 8: 7-0 and done
+        assert worst[0] == 0.0 and best[0] == pytest.approx(1 / 8)
+        assert worst[7] == best[7] == 1.0
+
+
+class TestAnalyzeClinching:
+    """Tests for clinch and elimination flags."""
+
+    def test_ladder_is_fully_decided(self, ladder_teams, ladder_games):
+        """Test flags and seeds when every result is already determined."""
+        statuses = clinch_statuses(ladder_games, ladder_teams)
+
+        # Division winners: 8 (East, 7-0) and 4 (West, 3-4)
+        assert statuses["8"].clinched_first_seed
+        assert statuses["4"].clinched_division and statuses["4"].clinched_seed == 2
+        # Wild cards: 7, 6, 5
+        assert [statuses[t].clinched_seed for t in ["7", "6", "5"]] == [3, 4, 5]
+        # Bottom three are out
+        for team_id in ["1", "2", "3"]:
+            assert statuses[team_id].eliminated_playoffs
+            assert statuses[team_id].best_seed is None
+            assert statuses[team_id].eliminated_first_seed
+
+    def test_open_season_has_no_flags(self, league_teams, league_games):
+        """Test that an early-season schedule leaves every team undecided."""
+        early = [
+            replace(game, is_completed=False, home_score=None, away_score=None)
+            if game.week > 1 else game
+            for game in league_games
+        ]
+        for status in clinch_statuses(early, league_teams).values():
+            assert not status.clinched_playoffs
+            assert not status.eliminated_playoffs
+            assert status.best_seed == 1
+
+    def test_flags_hold_in_every_outcome(self, league_teams, late_season_games):
+        """Test every clinch and elimination against exact enumeration."""
+        statuses = clinch_statuses(late_season_games, league_teams)
+        result = enumerate_season(late_season_games, league_teams, random_seed=0)
+        total = result.num_simulations
+
+        assert any(s.clinched_playoffs for s in statuses.values())
+        assert any(s.eliminated_playoffs for s in statuses.values())
+
+        for team_id, status in statuses.items():
+            stats = result.team_stats[team_id]
+            seeds = [seed for seed, count in stats.seed_counts.items() if count]
+            if status.clinched_division:
+                assert stats.won_division_count == total
+            if status.eliminated_division:
+                assert stats.won_division_count == 0
+            if status.clinched_playoffs:
+                assert stats.made_playoffs_count == total
+                assert max(seeds) <= status.worst_seed
+            if status.eliminated_playoffs:
+                assert stats.made_playoffs_count == 0
+            else:
+                assert min(seeds, default=status.best_seed) >= status.best_seed
+
+
+class TestSettledSeeding:
+    """Tests for skipping seeding when nothing is left to decide."""
+
+    def test_settled_seeding(self, ladder_teams, ladder_games):
+        """Test the fixed division winners and seeds of a decided season."""
+        baseline = build_season_baseline(ladder_games, ladder_teams)
+        winners, seeds = settled_seeding(baseline, analyze_clinching(baseline))
+
+        ids = baseline.team_ids
+        assert [ids[w] for w in winners] == ["8", "4"]
+        assert [ids[s] for s in seeds[0] if s >= 0] == ["8", "4", "7", "6", "5"]
+        assert np.all(seeds[1] == -1)
+
+    def test_open_season_is_not_settled(self, league_teams, late_season_games):
+        """Test that seeding is still computed while anything is open."""
+        baseline = build_season_baseline(late_season_games, league_teams)
+        assert settled_seeding(baseline, analyze_clinching(baseline)) is None
+
+    def test_simulation_skips_seeding(self, ladder_teams, ladder_games, monkeypatch):
+        """Test that a settled season never reaches the seeding code."""
+        def fail(*args, **kwargs):
+            raise AssertionError("seeding should be skipped")
+
+        monkeypatch.setattr(monte_carlo, "seed_outcomes", fail)
+        result = monte_carlo.simulate_season(
+            ladder_games, ladder_teams, num_simulations=50, random_seed=1
+        )
+
+        assert result.team_stats["8"].first_seed_count == 50
+        assert result.team_stats["4"].won_division_count == 50
+        assert result.team_stats["3"].made_playoffs_count == 0
+        # Records still vary with the unplayed game
+        assert 0 < result.team_stats["1"].average_wins < 1
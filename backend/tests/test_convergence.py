@@ -0,0 +1,103 @@
+"""
+Tests for convergence-based early stopping.
+"""
+
+import numpy as np
+import pytest
+
+from src.simulation.convergence import (
+    ConvergenceCriteria,
+    TRACKED_PROBABILITIES,
+    probability_intervals,
+)
+from src.simulation.monte_carlo import simulate_season
+from src.simulation.parallel import simulate_season_parallel
+
+
+def _criteria(tolerance=0.05, **kwargs):
+    return ConvergenceCriteria(tolerance=tolerance, min_simulations=200, batch_size=200, **kwargs)
+
+
+class TestIntervals:
+    """Tests for interval estimates and criteria validation."""
+
+    def test_agresti_coull(self):
+        """Test interval bounds, including non-zero width at 0% and 100%."""
+        z = ConvergenceCriteria().z
+        lower, upper = probability_intervals(np.array([0, 50, 100]), 100, z)
+
+        assert z == pytest.approx(1.96, abs=0.001)
+        assert lower[0] == 0.0 and upper[0] > 0.02
+        assert lower[2] < 0.98 and upper[2] == 1.0
+        assert (lower[1] + upper[1]) / 2 == pytest.approx(0.5)
+        assert upper[1] - lower[1] == pytest.approx(2 * z * 0.5 / np.sqrt(100 + z * z))
+
+    def test_validation(self):
+        """Test that invalid criteria are rejected."""
+        for kwargs in (
+            {"tolerance": 0}, {"confidence": 1.0}, {"time_budget_seconds": 0},
+            {"min_simulations": 0}, {"batch_size": 0},
+        ):
+            with pytest.raises(ValueError):
+                ConvergenceCriteria(**kwargs)
+        assert ConvergenceCriteria().is_reproducible
+        assert not ConvergenceCriteria(time_budget_seconds=5).is_reproducible
+
+
+class TestAdaptiveSimulation:
+    """Tests for runs that stop once estimates converge."""
+
+    def test_stops_at_tolerance(self, league_teams, league_games):
+        """Test that a run stops early with every interval inside the tolerance."""
+        result = simulate_season(league_games, league_teams, 20000, random_seed=1,
+                                 convergence=_criteria())
+        report = result.convergence
+
+        assert report.converged and report.stop_reason == "tolerance"
+        assert result.num_simulations == report.num_simulations < 20000
+        assert result.num_simulations % 200 == 0
+        assert report.max_half_width <= 0.05
+        for team_id, stats in result.team_stats.items():
+            assert stats.total_simulations == result.num_simulations
+            intervals = report.intervals[team_id]
+            assert set(intervals) == set(TRACKED_PROBABILITIES)
+            low, high = intervals["playoff"]
+            assert low <= stats.playoff_probability <= high
+            assert high - low <= 0.1 + 1e-9
+
+    def test_ceiling_and_time_budget(self, league_teams, league_games):
+        """Test runs that end unconverged at the ceiling or the time budget."""
+        capped = simulate_season(league_games, league_teams, 400, random_seed=1,
+                                 convergence=_criteria(tolerance=0.001))
+        assert capped.num_simulations == 400
+        assert not capped.convergence.converged
+        assert capped.convergence.stop_reason == "max_simulations"
+
+        timed = simulate_season(league_games, league_teams, 20000, random_seed=1,
+                                convergence=_criteria(tolerance=0.001, time_budget_seconds=1e-6))
+        assert timed.num_simulations == 200
+        assert timed.convergence.stop_reason == "time_budget"
+
+    def test_fixed_runs_unchanged(self, league_teams, league_games):
+        """Test that runs without criteria have no convergence report."""
+        result = simulate_season(league_games, league_teams, 100, random_seed=1)
+        assert result.convergence is None
+
+    def test_parallel_stops_on_leading_shards(self, league_teams, league_games,
+                                              late_season_games):
+        """Test sharded adaptive runs and that exact enumeration ignores criteria."""
+        progress = []
+        result = simulate_season_parallel(
+            league_games, league_teams, num_simulations=20000, num_workers=1,
+            random_seed=1, convergence=_criteria(), progress_callback=progress.append,
+        )
+        assert result.convergence.converged
+        assert result.num_simulations == result.convergence.num_simulations < 20000
+        assert progress[-1] == 100
+
+        exact = simulate_season_parallel(
+            late_season_games, league_teams, num_simulations=1000, num_workers=1,
+            convergence=_criteria(),
+        )
+        assert exact.exact
+        assert exact.convergence is None
@@ -0,0 +1,232 @@
+"""
+Tests for exact enumeration of the remaining season.
+"""
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from src.simulation.exact import (
+    EXACT_LOSER_SCORE,
+    EXACT_WINNER_SCORE,
+    count_enumerated_games,
+    count_remaining_games,
+    enumerate_outcomes,
+    enumerate_season,
+    use_exact_enumeration,
+)
+from src.simulation.monte_carlo import SimulationResult
+from src.simulation.parallel import simulate_season_parallel
+from src.simulation.standings import calculate_standings
+from src.simulation.tiebreakers import (
+    determine_division_winners,
+    seed_conference_playoffs,
+)
+
+
+# Games left in the late_season_games fixture
+REMAINING = 6
+
+# Games left in the final_games fixture, one of them between decided teams
+FINAL_REMAINING = 10
+
+
+@pytest.fixture
+def final_games(league_games):
+    """The league schedule with its last ten games still to play."""
+    games = []
+    for idx, game in enumerate(league_games):
+        if not game.is_completed and idx < len(league_games) - FINAL_REMAINING:
+            home, away = (24, 17) if idx % 3 else (13, 20)
+            game = replace(game, is_completed=True, home_score=home, away_score=away)
+        games.append(game)
+    return games
+
+
+def _brute_force(games, teams):
+    """Per-outcome reference using the original standings and tiebreaker path."""
+    remaining = [g for g in games if not g.is_completed]
+    playoffs = {team.id: 0 for team in teams}
+    divisions = {team.id: 0 for team in teams}
+
+    for k in range(2 ** len(remaining)):
+        results = {}
+        for j, game in enumerate(remaining):
+            home_win = (k >> j) & 1
+            results[game.id] = replace(
+                game,
+                is_completed=True,
+                home_score=EXACT_WINNER_SCORE if home_win else EXACT_LOSER_SCORE,
+                away_score=EXACT_LOSER_SCORE if home_win else EXACT_WINNER_SCORE,
+            )
+        season = [results.get(game.id, game) for game in games]
+        standings = calculate_standings(season, teams)
+
+        for team_id in determine_division_winners(teams, standings, season).values():
+            divisions[team_id] += 1
+        for conference in ["AFC", "NFC"]:
+            for team_id in seed_conference_playoffs(teams, standings, season, conference):
+                playoffs[team_id] += 1
+
+    return playoffs, divisions
+
+
+class TestEnumerateOutcomes:
+    """Tests for outcome enumeration."""
+
+    def test_every_combination_once(self):
+        """Test that the enumeration lists each win/loss combination exactly once."""
+        outcomes = enumerate_outcomes(5, 0, 32)
+        rows = {tuple(row) for row in outcomes.home_wins.astype(int)}
+
+        assert outcomes.num_simulations == 32
+        assert len(rows) == 32
+        # Scores agree with the winners
+        winners = outcomes.home_scores > outcomes.away_scores
+        np.testing.assert_array_equal(winners, outcomes.home_wins)
+
+    def test_ranges_concatenate_to_full_enumeration(self):
+        """Test that sub-ranges line up with the full enumeration."""
+        full = enumerate_outcomes(9, 0, 512)
+        parts = [enumerate_outcomes(9, lo, hi) for lo, hi in [(0, 100), (100, 512)]]
+        np.testing.assert_array_equal(
+            np.concatenate([p.home_wins for p in parts]), full.home_wins
+        )
+
+    def test_threshold(self):
+        """Test that enumeration is chosen only when it is no larger than the run."""
+        assert use_exact_enumeration(10, 1024)
+        assert not use_exact_enumeration(10, 1023)
+        assert not use_exact_enumeration(10, 10**6, max_games=8)
+        assert use_exact_enumeration(0, 1)
+
+
+class TestEnumerateSeason:
+    """Tests for exact season evaluation."""
+
+    def test_matches_brute_force(self, league_teams, late_season_games):
+        """Test exact counts against per-outcome standings and tiebreakers."""
+        result = enumerate_season(late_season_games, league_teams, random_seed=0)
+        playoffs, divisions = _brute_force(late_season_games, league_teams)
+
+        assert result.exact
+        assert result.num_simulations == 2**REMAINING
+        for team in league_teams:
+            stats = result.team_stats[team.id]
+            assert stats.made_playoffs_count == playoffs[team.id]
+            assert stats.won_division_count == divisions[team.id]
+
+    def test_ranges_merge_to_full_result(self, league_teams, late_season_games):
+        """Test that enumerating ranges separately gives the same counts."""
+        full = enumerate_season(late_season_games, league_teams, random_seed=0)
+        merged = SimulationResult.merge(
+            [
+                enumerate_season(late_season_games, league_teams, 0, 20, random_seed=0),
+                enumerate_season(late_season_games, league_teams, 20, None, random_seed=0),
+            ]
+        )
+
+        assert merged.exact
+        assert merged.num_simulations == full.num_simulations
+        for team_id, stats in full.team_stats.items():
+            assert merged.team_stats[team_id].made_playoffs_count == stats.made_playoffs_count
+            np.testing.assert_array_equal(
+                merged.team_stats[team_id].wins_histogram, stats.wins_histogram
+            )
+
+    def test_counts_score_dependent_outcomes(self, league_teams, late_season_games):
+        """Test that outcomes seeded with nominal scores make the result inexact."""
+        result = enumerate_season(
+            late_season_games, league_teams, random_seed=0, retain_outcomes=True
+        )
+
+        assert result.score_dependent_simulations == int(result.retained.score_dependent.sum())
+        assert result.has_exact_probabilities == (result.score_dependent_simulations == 0)
+        assert not replace(result, score_dependent_simulations=1).has_exact_probabilities
+
+    def test_rejects_out_of_range(self, league_teams, late_season_games):
+        """Test that ranges past the last outcome are rejected."""
+        with pytest.raises(ValueError):
+            enumerate_season(late_season_games, league_teams, 0, 2**REMAINING + 1)
+
+
+class TestPrunedEnumeration:
+    """Tests for enumerating without games that cannot change any seed."""
+
+    def test_matches_full_enumeration(self, league_teams, final_games):
+        """Test that pruned counts equal the full enumeration's."""
+        assert count_enumerated_games(final_games, league_teams) == FINAL_REMAINING - 1
+
+        full = enumerate_season(final_games, league_teams, random_seed=0)
+        pruned = enumerate_season(
+            final_games, league_teams, random_seed=0, retain_outcomes=True, prune=True
+        )
+
+        assert pruned.exact
+        assert pruned.retained is None
+        assert pruned.num_simulations == full.num_simulations == 2**FINAL_REMAINING
+        assert pruned.score_dependent_simulations >= full.score_dependent_simulations
+        for team_id, stats in full.team_stats.items():
+            other = pruned.team_stats[team_id]
+            assert other.total_simulations == stats.total_simulations
+            assert other.made_playoffs_count == stats.made_playoffs_count
+            assert other.won_division_count == stats.won_division_count
+            assert other.seed_counts == stats.seed_counts
+            np.testing.assert_array_equal(other.wins_histogram, stats.wins_histogram)
+
+    def test_rejects_outcome_sink(self, league_teams, final_games):
+        """Test that pruned rows are not passed to an outcome sink."""
+        with pytest.raises(ValueError):
+            enumerate_season(
+                final_games, league_teams, prune=True, outcome_sink=lambda start, block: None
+            )
+
+
+class TestAutomaticSwitch:
+    """Tests for choosing enumeration in the parallel entry point."""
+
+    def test_enumerates_when_few_games_remain(self, league_teams, late_season_games):
+        """Test that a small remaining schedule is enumerated exactly."""
+        assert count_remaining_games(late_season_games, league_teams) == REMAINING
+
+        result = simulate_season_parallel(
+            late_season_games, league_teams, num_simulations=1000, num_workers=1,
+            shard_size=16, random_seed=0,
+        )
+
+        assert result.exact
+        assert result.num_simulations == 2**REMAINING
+
+    def test_enumerates_pruned_outcome_count(self, league_teams, final_games):
+        """Test that the pruned outcome count decides whether to enumerate."""
+        result = simulate_season_parallel(
+            final_games, league_teams, num_simulations=2 ** (FINAL_REMAINING - 1),
+            num_workers=1, random_seed=0,
+        )
+
+        assert result.exact
+        assert result.num_simulations == 2**FINAL_REMAINING
+
+    def test_samples_when_disabled(self, league_teams, late_season_games):
+        """Test that exact_max_games=0 keeps the sampler."""
+        result = simulate_season_parallel(
+            late_season_games, league_teams, num_simulations=200, num_workers=1,
+            random_seed=0, exact_max_games=0,
+        )
+
+        assert not result.exact
+        assert result.num_simulations == 200
+
+    def test_sampler_agrees_with_exact(self, league_teams, late_season_games):
+        """Test that sampled playoff odds converge on the exact values."""
+        exact = enumerate_season(late_season_games, league_teams, random_seed=0)
+        sampled = simulate_season_parallel(
+            late_season_games, league_teams, num_simulations=4000, num_workers=1,
+            random_seed=3, exact_max_games=0,
+        )
+
+        for team_id, stats in exact.team_stats.items():
+            assert sampled.team_stats[team_id].playoff_probability == pytest.approx(
+                stats.playoff_probability, abs=0.05
+            )
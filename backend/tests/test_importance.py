@@ -0,0 +1,143 @@
+"""
+Tests for importance sampling.
+"""
+
+import numpy as np
+import pytest
+
+from src.simulation.batch_standings import build_season_baseline
+from src.simulation.convergence import ConvergenceCriteria
+from src.simulation.importance import (
+    ImportanceSampler,
+    importance_sampler_from_dict,
+    likelihood_ratio_weights,
+    proposal_probabilities,
+)
+from src.simulation.monte_carlo import (
+    SimulationResult,
+    TeamSimulationStats,
+    simulate_season,
+)
+from src.simulation.parallel import simulate_season_parallel
+
+
+class TestLikelihoodRatios:
+    """Tests for proposals and their weights."""
+
+    def test_weights_match_direct_products(self):
+        """Test vectorized weights for shared and per-simulation probabilities."""
+        rng = np.random.default_rng(0)
+        p = np.array([0.5, 0.3, 0.9])
+        q = proposal_probabilities(p, np.array([1.0, -0.5, 0.0]))
+        home_wins = rng.random((20, 3)) < q
+
+        expected = np.prod(np.where(home_wins, p / q, (1 - p) / (1 - q)), axis=1)
+        np.testing.assert_allclose(likelihood_ratio_weights(home_wins, p, q), expected)
+
+        per_simulation = np.tile(p, (20, 1))
+        np.testing.assert_allclose(
+            likelihood_ratio_weights(home_wins, per_simulation, np.tile(q, (20, 1))), expected
+        )
+        # No shift means every simulation counts once
+        np.testing.assert_allclose(likelihood_ratio_weights(home_wins, p, p), 1.0)
+
+    def test_log_odds_shift(self, league_teams, league_games):
+        """Test that the target's games and rivals' cross-conference games are tilted."""
+        baseline = build_season_baseline(league_games, league_teams)
+        target = baseline.team_index["1"]
+        shift = ImportanceSampler("1", tilt=1.0, rival_tilt=0.25).log_odds_shift(baseline)
+
+        home, away = baseline.home_index, baseline.away_index
+        np.testing.assert_allclose(shift[home == target], 1.0)
+        np.testing.assert_allclose(shift[away == target], -1.0)
+        conference = baseline.conference_index
+        rival_home = (conference[home] == 0) & (conference[away] == 1) & (home != target)
+        np.testing.assert_allclose(shift[rival_home], -0.25)
+        same_conference = (conference[home] == conference[away]) & (home != target) & (
+            away != target
+        )
+        np.testing.assert_allclose(shift[same_conference], 0.0)
+
+        with pytest.raises(ValueError):
+            ImportanceSampler("99").log_odds_shift(baseline)
+
+    def test_dict_round_trip(self):
+        """Test building a sampler from request options."""
+        sampler = ImportanceSampler("7", tilt=1.5, rival_tilt=0.5)
+        assert importance_sampler_from_dict(sampler.to_dict()) == sampler
+        with pytest.raises(ValueError):
+            importance_sampler_from_dict({"tilt": 1.0})
+        with pytest.raises(ValueError):
+            ImportanceSampler("7", tilt=float("inf"))
+
+
+class TestWeightedStats:
+    """Tests for weighted counters."""
+
+    def test_merge_and_probabilities(self):
+        """Test that weighted counters merge and normalize by total weight."""
+        first = TeamSimulationStats(team_id="1")
+        first.record_wins(np.array([10, 12]), simulation_weights=np.array([0.5, 1.5]))
+        first.made_playoffs_count = 1.5
+        first.total_simulations, first.total_weight, first.total_squared_weight = 2, 2.0, 2.5
+        second = TeamSimulationStats(team_id="1")
+        second.record_wins(np.array([11]))
+        second.made_playoffs_count = 1
+        second.total_simulations = 1
+
+        assert first.playoff_probability == pytest.approx(0.75)
+        assert first.average_wins == pytest.approx(11.5)
+        assert first.wins_percentile(50) == 12
+        assert first.effective_simulations == pytest.approx(1.6)
+        assert second.effective_simulations == 1.0
+
+        first.merge(second)
+        assert first.total_simulations == 3
+        assert first.wins_histogram.sum() == pytest.approx(2.0 + 1)
+
+
+class TestImportanceSampledRuns:
+    """Tests for simulations drawn from a tilted proposal."""
+
+    def test_reweighted_estimates_are_unbiased(self, league_teams, league_games):
+        """Test that weights undo the tilt towards the target's wins."""
+        target = "1"
+        baseline = build_season_baseline(league_games, league_teams)
+        index = baseline.team_index[target]
+        remaining = np.sum((baseline.home_index == index) | (baseline.away_index == index))
+        expected_wins = baseline.records.wins[0, index] + remaining / 2
+
+        result = simulate_season(league_games, league_teams, 4000, random_seed=3,
+                                 importance=ImportanceSampler(target, tilt=1.0))
+        stats = result.team_stats[target]
+
+        assert stats.is_weighted
+        assert stats.average_wins == pytest.approx(expected_wins, abs=0.15)
+        assert 0 < stats.effective_simulations < result.num_simulations
+        # Every simulation seeds 14 teams, whatever its weight
+        total_playoff = sum(s.playoff_probability for s in result.team_stats.values())
+        assert total_playoff == pytest.approx(14.0)
+
+    def test_incompatible_options(self, league_teams, league_games):
+        """Test that weighted runs refuse retained outcomes and convergence."""
+        with pytest.raises(ValueError):
+            simulate_season(league_games, league_teams, 10, retain_outcomes=True,
+                            importance=ImportanceSampler("1"))
+        with pytest.raises(ValueError):
+            simulate_season_parallel(league_games, league_teams, 10, num_workers=1,
+                                     convergence=ConvergenceCriteria(),
+                                     importance=ImportanceSampler("1"))
+
+    def test_parallel_runs_are_sampled(self, league_teams, late_season_games):
+        """Test that importance sampling skips exact enumeration and merges weights."""
+        result = simulate_season_parallel(
+            late_season_games, league_teams, num_simulations=300, num_workers=1,
+            shard_size=100, random_seed=2, importance=ImportanceSampler("1"),
+        )
+
+        assert not result.exact
+        stats = result.team_stats["1"]
+        assert stats.total_simulations == 300
+        assert stats.is_weighted
+        merged = SimulationResult.merge([result, result])
+        assert merged.team_stats["1"].total_weight == pytest.approx(2 * stats.total_weight)
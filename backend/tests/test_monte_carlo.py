@@ -2,6 +2,7 @@
 Tests for Monte Carlo simulation engine.
 """
 
+import numpy as np
 import pytest
 from datetime import datetime
 
@@ -11,6 +12,7 @@ from src.simulation.monte_carlo import (
     determine_division_winners_simple,
     TeamSimulationStats,
     SimulationResult,
+    SimulationCancelledError,
 )
 from src.data.models import Team, Game
 
@@ -41,21 +43,21 @@ class TestTeamSimulationStats:
 
     def test_average_wins(self):
         """Test average wins calculation."""
-        stats = TeamSimulationStats(
-            team_id="1", wins_distribution=[10, 11, 12, 10, 11]
-        )
+        stats = TeamSimulationStats(team_id="1")
+        stats.record_wins(np.array([10, 11, 12, 10, 11]))
         assert stats.average_wins == pytest.approx(10.8)
 
     def test_average_wins_empty(self):
         """Test average wins with empty distribution."""
-        stats = TeamSimulationStats(team_id="1", wins_distribution=[])
+        stats = TeamSimulationStats(team_id="1")
         assert stats.average_wins == 0.0
 
     def test_wins_percentiles(self):
         """Test wins percentiles calculation."""
         # Create distribution with 100 values for easy percentile calculation
         wins = list(range(0, 18)) * 6  # 108 values from 0-17 wins
-        stats = TeamSimulationStats(team_id="1", wins_distribution=wins)
+        stats = TeamSimulationStats(team_id="1")
+        stats.record_wins(np.array(wins))
 
         percentiles = stats.wins_percentiles
         assert 10 in percentiles
@@ -63,10 +65,44 @@ class TestTeamSimulationStats:
         assert 50 in percentiles
         assert 75 in percentiles
         assert 90 in percentiles
+        for p, value in percentiles.items():
+            assert value == pytest.approx(np.percentile(wins, p))
+
+    def test_wins_percentiles_with_ties(self):
+        """Test that ties count as half a win and percentiles match NumPy."""
+        wins = np.array([3, 7, 7, 10, 12, 4, 9])
+        ties = np.array([0, 1, 0, 0, 1, 0, 1])
+        stats = TeamSimulationStats(team_id="1")
+        stats.record_wins(wins, ties)
+
+        values = wins + ties / 2
+        assert stats.average_wins == pytest.approx(values.mean())
+        assert stats.wins_distribution[7.5] == 1
+        for p in (0, 10, 33, 50, 90, 100):
+            assert stats.wins_percentile(p) == pytest.approx(np.percentile(values, p))
+
+    def test_weighted_wins_distribution(self):
+        """Test that weighted histograms keep fractional weights."""
+        stats = TeamSimulationStats(team_id="1", total_simulations=3)
+        stats.record_wins(np.array([8, 9, 9]), simulation_weights=np.array([0.25, 0.5, 1.5]))
+
+        assert stats.wins_distribution == {8: 0.25, 9: 2.0}
+
+    def test_merge_adds_histograms(self):
+        """Test that merging stats adds their win histograms."""
+        first = TeamSimulationStats(team_id="1", total_simulations=2)
+        first.record_wins(np.array([8, 9]))
+        second = TeamSimulationStats(team_id="1", total_simulations=1)
+        second.record_wins(np.array([9]))
+
+        first.merge(second)
+
+        assert first.wins_distribution == {8: 1, 9: 2}
+        assert first.total_simulations == 3
 
     def test_wins_percentiles_empty(self):
         """Test wins percentiles with empty distribution."""
-        stats = TeamSimulationStats(team_id="1", wins_distribution=[])
+        stats = TeamSimulationStats(team_id="1")
         assert stats.wins_percentiles == {}
 
 
@@ -113,8 +149,10 @@ class TestSimulationResult:
 
     def test_get_average_wins(self):
         """Test extracting average wins."""
-        stats1 = TeamSimulationStats(team_id="1", wins_distribution=[10, 11, 12])
-        stats2 = TeamSimulationStats(team_id="2", wins_distribution=[5, 6, 7])
+        stats1 = TeamSimulationStats(team_id="1")
+        stats1.record_wins(np.array([10, 11, 12]))
+        stats2 = TeamSimulationStats(team_id="2")
+        stats2.record_wins(np.array([5, 6, 7]))
         result = SimulationResult(team_stats={"1": stats1, "2": stats2})
 
         avg_wins = result.get_average_wins()
@@ -231,7 +269,7 @@ class TestSimulateSeason:
         stats_team1 = result.get_team_stats("1")
 
         # Team 1 should win ~50% of simulations (coin flip)
-        wins = sum(1 for w in stats_team1.wins_distribution if w == 1)
+        wins = stats_team1.wins_distribution.get(1, 0)
         win_rate = wins / 10000
 
         # Allow some statistical variance (~2 standard deviations)
@@ -319,7 +357,53 @@ class TestSimulateSeason:
 
         for team_id, stats in result.team_stats.items():
             assert stats.total_simulations == 100
-            assert len(stats.wins_distribution) == 100
+            assert sum(stats.wins_distribution.values()) == 100
+
+    def test_simulate_season_chunked(self, sample_teams, sample_games):
+        """Test that chunks report progress and add up to the full run."""
+        progress = []
+        result = simulate_season(
+            sample_games,
+            sample_teams,
+            num_simulations=250,
+            random_seed=42,
+            progress_callback=progress.append,
+            chunk_size=100,
+        )
+
+        assert progress == [40, 80, 100]
+        for stats in result.team_stats.values():
+            assert stats.total_simulations == 250
+            assert sum(stats.wins_distribution.values()) == 250
+
+    def test_simulate_season_single_chunk_matches_default(self, sample_teams, sample_games):
+        """Test that a chunk covering the whole run reproduces the default result."""
+        default = simulate_season(
+            sample_games, sample_teams, num_simulations=100, random_seed=7
+        )
+        chunked = simulate_season(
+            sample_games, sample_teams, num_simulations=100, random_seed=7, chunk_size=100
+        )
+
+        for team_id, stats in default.team_stats.items():
+            assert stats.wins_distribution == chunked.team_stats[team_id].wins_distribution
+            assert stats.seed_counts == chunked.team_stats[team_id].seed_counts
+
+    def test_simulate_season_cancel_between_chunks(self, sample_teams, sample_games):
+        """Test that cancellation is honoured at the next chunk boundary."""
+        progress = []
+
+        with pytest.raises(SimulationCancelledError):
+            simulate_season(
+                sample_games,
+                sample_teams,
+                num_simulations=300,
+                progress_callback=progress.append,
+                cancel_callback=lambda: len(progress) >= 2,
+                chunk_size=100,
+            )
+
+        assert progress == [33, 66]
 
 
 class TestDeterminePlayoffTeamsSimple:
@@ -0,0 +1,188 @@
+"""
+Tests for the memory-mapped per-simulation outcome store.
+"""
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from src.simulation.convergence import ConvergenceCriteria
+from src.simulation.monte_carlo import SimulationCancelledError, simulate_season
+from src.simulation.outcome_store import (
+    TIE,
+    OutcomeStore,
+    StaleOutcomeStoreError,
+    load_cached_outcome_store,
+    save_cached_outcome_store,
+    save_outcome_store,
+)
+from src.simulation.parallel import simulate_season_parallel
+
+
+@pytest.fixture
+def stored_run(tmp_path, league_teams, league_games):
+    """A retained run written to a store, with the store opened."""
+    result = simulate_season(
+        league_games, league_teams, 400, random_seed=11, retain_outcomes=True
+    )
+    save_outcome_store(tmp_path / "run", result)
+    return result, OutcomeStore.open(tmp_path / "run")
+
+
+class TestOutcomeStore:
+    """Tests for writing, memory-mapping and querying stores."""
+
+    def test_unconditional_query_matches_run(self, stored_run, league_teams, league_games):
+        """Test that querying without conditions reproduces the run from disk."""
+        result, store = stored_run
+
+        assert isinstance(store.outcomes.home_scores, np.memmap)
+        assert store.outcomes.home_scores.flags.f_contiguous
+        assert store.num_simulations == 400
+        np.testing.assert_array_equal(store.seeds, result.retained.seeds)
+
+        queried = store.query({}, league_games, league_teams, chunk_size=150)
+        assert queried.num_simulations == 400
+        for team_id, stats in result.team_stats.items():
+            other = queried.team_stats[team_id]
+            np.testing.assert_array_equal(other.wins_histogram, stats.wins_histogram)
+            assert other.seed_counts == stats.seed_counts
+            assert other.won_division_count == stats.won_division_count
+
+    def test_conditional_query(self, stored_run, league_teams, league_games):
+        """Test that conditions filter the stored simulations by game result."""
+        result, store = stored_run
+        game = next(g for g in league_games if g.id == store.game_ids[0])
+        home_won = result.retained.outcomes.home_scores[:, 0] > (
+            result.retained.outcomes.away_scores[:, 0]
+        )
+
+        home = store.query({game.id: game.home_team_id}, league_games, league_teams)
+        away = store.query({game.id: game.away_team_id}, league_games, league_teams)
+        tie = store.matching_simulations({game.id: TIE}, league_games)
+
+        assert home.num_simulations == home_won.sum()
+        assert home.num_simulations + away.num_simulations + tie.size == 400
+        # Every matching simulation credits the home team with the win
+        assert (
+            home.team_stats[game.home_team_id].average_wins
+            > away.team_stats[game.home_team_id].average_wins
+        )
+
+        both = store.matching_simulations(
+            {game.id: game.home_team_id, store.game_ids[1]: TIE}, league_games
+        )
+        assert set(both) <= set(np.flatnonzero(home_won))
+
+    def test_invalid_queries(self, stored_run, league_teams, league_games):
+        """Test unknown games and teams, and a schedule that changed since the run."""
+        _, store = stored_run
+
+        with pytest.raises(ValueError):
+            store.query({"w1g0": "1"}, league_games, league_teams)
+        with pytest.raises(ValueError):
+            store.query({store.game_ids[0]: "not-a-team"}, league_games, league_teams)
+
+        changed = [
+            replace(g, home_score=g.away_score, away_score=g.home_score)
+            if g.id == "w1g0" else g
+            for g in league_games
+        ]
+        with pytest.raises(StaleOutcomeStoreError):
+            store.query({}, changed, league_teams)
+
+    def test_overrides_are_written(self, tmp_path, league_teams, late_season_games):
+        """Test that overrides applied to a run are part of its stored outcomes."""
+        from src.simulation.what_if import apply_overrides
+
+        result = simulate_season(
+            late_season_games, league_teams, 64, random_seed=2, retain_outcomes=True
+        )
+        game_id = result.retained.game_ids[0]
+        games = [
+            replace(g, is_overridden=True, override_home_score=30, override_away_score=10)
+            if g.id == game_id else g
+            for g in late_season_games
+        ]
+        assert apply_overrides(result, games, league_teams)
+
+        store = OutcomeStore.open(save_outcome_store(tmp_path / "run", result))
+        assert np.all(store.outcomes.home_scores[:, 0] == 30)
+        queried = store.query({}, games, league_teams)
+        for team_id, stats in result.team_stats.items():
+            assert queried.team_stats[team_id].seed_counts == stats.seed_counts
+
+
+class TestStreamedOutcomeStores:
+    """Tests for stores written block by block during a run."""
+
+    @pytest.mark.parametrize("num_workers", [1, 2])
+    def test_streamed_store_matches_retained_run(self, tmp_path, num_workers,
+                                                 league_teams, league_games):
+        """Test that shards write the same rows a retained run would keep."""
+        retained = simulate_season_parallel(
+            league_games, league_teams, 90, random_seed=6, num_workers=1,
+            shard_size=40, retain_outcomes=True,
+        ).retained
+        streamed = simulate_season_parallel(
+            league_games, league_teams, 90, random_seed=6, num_workers=num_workers,
+            shard_size=40, outcome_store=tmp_path / "run",
+        )
+
+        assert streamed.retained is None
+        store = OutcomeStore.open(tmp_path / "run")
+        assert store.num_simulations == 90
+        assert store.game_ids == retained.game_ids
+        np.testing.assert_array_equal(
+            store.outcomes.home_scores, retained.outcomes.home_scores
+        )
+        np.testing.assert_array_equal(
+            store.outcomes.home_wins_packed, retained.outcomes.home_wins_packed
+        )
+        np.testing.assert_array_equal(store.seeds, retained.seeds)
+        np.testing.assert_array_equal(store.score_dependent, retained.score_dependent)
+        assert not (tmp_path / "run.tmp").exists()
+
+    def test_stopped_run_stores_leading_rows(self, tmp_path, league_teams, league_games):
+        """Test that an adaptive run stores only the simulations it kept."""
+        result = simulate_season_parallel(
+            league_games, league_teams, 400, random_seed=3, num_workers=1,
+            convergence=ConvergenceCriteria(tolerance=0.2, batch_size=50, min_simulations=50),
+            outcome_store=tmp_path / "run",
+        )
+
+        store = OutcomeStore.open(tmp_path / "run")
+        assert result.num_simulations < 400
+        assert store.num_simulations == store.seeds.shape[0] == result.num_simulations
+
+    def test_cancelled_run_leaves_no_store(self, tmp_path, league_teams, league_games):
+        """Test that the staged arrays of a cancelled run are removed."""
+        with pytest.raises(SimulationCancelledError):
+            simulate_season_parallel(
+                league_games, league_teams, 40, num_workers=1, shard_size=10,
+                cancel_callback=lambda: True, outcome_store=tmp_path / "run",
+            )
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestCachedOutcomeStores:
+    """Tests for outcome stores kept in the cache directory."""
+
+    def test_save_load_and_prune(self, cache_manager, league_teams, late_season_games):
+        """Test that the oldest stores are removed beyond the limit."""
+        result = simulate_season(
+            late_season_games, league_teams, 32, random_seed=4, retain_outcomes=True
+        )
+        for store_id in ("a", "b", "c"):
+            save_cached_outcome_store(cache_manager, store_id, result, max_stores=2)
+
+        assert load_cached_outcome_store(cache_manager, "a") is None
+        assert load_cached_outcome_store(cache_manager, "c").num_simulations == 32
+
+        result.retained = None
+        with pytest.raises(ValueError):
+            save_cached_outcome_store(cache_manager, "d", result)
+
+        cache_manager.clear_outcome_stores()
+        assert load_cached_outcome_store(cache_manager, "c") is None
@@ -0,0 +1,142 @@
+"""
+Tests for the sharded parallel simulation executor.
+"""
+
+import numpy as np
+import pytest
+
+from src.simulation.monte_carlo import (
+    SimulationCancelledError,
+    SimulationResult,
+    simulate_season,
+)
+from src.simulation import parallel
+from src.simulation.parallel import (
+    derive_shard_seeds,
+    plan_shards,
+    simulate_season_parallel,
+)
+
+
+class TestPlanShards:
+    """Tests for shard planning and seeding."""
+
+    def test_splits_into_fixed_size_shards(self):
+        """Test that shards have fixed size with a smaller remainder."""
+        assert plan_shards(25, 10) == [10, 10, 5]
+        assert plan_shards(20, 10) == [10, 10]
+        assert plan_shards(0, 10) == []
+
+    def test_rejects_non_positive_shard_size(self):
+        """Test that a zero shard size is rejected."""
+        with pytest.raises(ValueError):
+            plan_shards(10, 0)
+
+    def test_shard_seeds_are_deterministic_and_distinct(self):
+        """Test that seeds derive reproducibly from the run seed."""
+        seeds = derive_shard_seeds(42, 4)
+
+        assert seeds == derive_shard_seeds(42, 4)
+        assert len(set(seeds)) == 4
+        # Extending the run keeps the earlier shard seeds
+        assert derive_shard_seeds(42, 6)[:4] == seeds
+
+
+class TestSimulationResultMerge:
+    """Tests for merging shard results."""
+
+    def test_merge_sums_counters(self, league_teams, league_games):
+        """Test that merged counters equal the sum of the shards."""
+        first = simulate_season(league_games, league_teams, num_simulations=20, random_seed=1)
+        second = simulate_season(league_games, league_teams, num_simulations=30, random_seed=2)
+
+        merged = SimulationResult.merge([first, second])
+
+        assert merged.num_simulations == 50
+        for team_id, stats in merged.team_stats.items():
+            a, b = first.team_stats[team_id], second.team_stats[team_id]
+            assert stats.total_simulations == 50
+            assert stats.made_playoffs_count == a.made_playoffs_count + b.made_playoffs_count
+            assert stats.won_division_count == a.won_division_count + b.won_division_count
+            np.testing.assert_array_equal(
+                stats.wins_histogram, a.wins_histogram + b.wins_histogram
+            )
+            for seed in range(1, 8):
+                assert stats.seed_counts[seed] == a.seed_counts[seed] + b.seed_counts[seed]
+
+
+class TestSimulateSeasonParallel:
+    """Tests for simulate_season_parallel."""
+
+    @staticmethod
+    def _snapshot(result):
+        return {
+            team_id: (
+                stats.wins_distribution,
+                stats.made_playoffs_count,
+                stats.won_division_count,
+                dict(stats.seed_counts),
+            )
+            for team_id, stats in result.team_stats.items()
+        }
+
+    def test_results_independent_of_worker_count(self, league_teams, league_games):
+        """Test that a seeded run is identical with one or two workers."""
+        single = simulate_season_parallel(
+            league_games, league_teams, num_simulations=60, random_seed=11,
+            num_workers=1, shard_size=25,
+        )
+        multi = simulate_season_parallel(
+            league_games, league_teams, num_simulations=60, random_seed=11,
+            num_workers=2, shard_size=25,
+        )
+
+        assert single.num_simulations == multi.num_simulations == 60
+        assert self._snapshot(single) == self._snapshot(multi)
+
+    def test_reports_progress_per_shard(self, league_teams, league_games):
+        """Test that progress advances once per completed shard."""
+        progress = []
+        simulate_season_parallel(
+            league_games, league_teams, num_simulations=30, random_seed=3,
+            num_workers=1, shard_size=10, progress_callback=progress.append,
+        )
+
+        assert progress == [33, 66, 100]
+
+    def test_cancellation_between_shards(self, league_teams, league_games):
+        """Test that cancellation stops the run at a shard boundary."""
+        progress = []
+
+        with pytest.raises(SimulationCancelledError):
+            simulate_season_parallel(
+                league_games, league_teams, num_simulations=30, random_seed=3,
+                num_workers=1, shard_size=10, progress_callback=progress.append,
+                cancel_callback=lambda: len(progress) >= 1,
+            )
+
+        assert progress == [33]
+
+    def test_worker_pool_reused_across_schedules(self, league_teams, league_games,
+                                                 late_season_games):
+        """Test that runs share one pool and each shard uses its own run's schedule."""
+        runs = {}
+        pools = []
+        for games in (league_games, late_season_games, league_games):
+            result = simulate_season_parallel(
+                games, league_teams, num_simulations=40, random_seed=5,
+                num_workers=2, shard_size=10, exact_max_games=0,
+            )
+            pools.append(parallel._pools[2])
+            runs.setdefault(id(games), []).append(self._snapshot(result))
+
+        assert pools[0] is pools[1] is pools[2]
+        for games in (league_games, late_season_games):
+            single = simulate_season_parallel(
+                games, league_teams, num_simulations=40, random_seed=5,
+                num_workers=1, shard_size=10, exact_max_games=0,
+            )
+            assert all(snapshot == self._snapshot(single) for snapshot in runs[id(games)])
+
+        parallel.shutdown_worker_pools()
+        assert parallel._pools == {}
@@ -0,0 +1,133 @@
+"""
+Tests for simulation profiling.
+"""
+
+from datetime import datetime
+
+from src.data.models import Game, Team
+from src.simulation.monte_carlo import SimulationResult, simulate_season
+from src.simulation.parallel import simulate_season_parallel
+from src.simulation.profiling import (
+    SimulationProfile,
+    note_tiebreak_rule,
+    profile_simulation,
+    stage,
+)
+from src.simulation.standings import calculate_standings
+from src.simulation.tiebreakers import break_division_tie_two_teams
+
+
+class TestSimulationProfile:
+    """Tests for the profile container and context."""
+
+    def test_inactive_by_default(self):
+        """Test that stages and rules are ignored outside profile_simulation."""
+        with stage("standings"):
+            pass
+        note_tiebreak_rule("head_to_head")
+
+        with profile_simulation() as profile:
+            with stage("standings"):
+                pass
+            note_tiebreak_rule("head_to_head")
+
+        assert profile.stage_calls == {"standings": 1}
+        assert profile.tiebreak_rules == {"head_to_head": 1}
+
+    def test_combine(self):
+        """Test that shard profiles add up and missing profiles are skipped."""
+        first = SimulationProfile(
+            stage_seconds={"outcomes": 1.0}, stage_calls={"outcomes": 2},
+            tiebreak_rules={"coin_toss": 1},
+        )
+        second = SimulationProfile(
+            stage_seconds={"outcomes": 0.5, "standings": 2.0},
+            stage_calls={"outcomes": 1, "standings": 1},
+            tiebreak_rules={"coin_toss": 2, "head_to_head": 4},
+        )
+
+        combined = SimulationProfile.combine([first, None, second])
+
+        assert combined.stage_seconds == {"outcomes": 1.5, "standings": 2.0}
+        assert combined.stage_calls == {"outcomes": 3, "standings": 1}
+        assert combined.tiebreak_rules == {"coin_toss": 3, "head_to_head": 4}
+        assert SimulationProfile.combine([None]) is None
+
+
+class TestTiebreakRuleCounts:
+    """Tests for counting the rule that decided a tie."""
+
+    def test_deciding_rule_is_counted(self):
+        """Test that each tie counts only the rule that settled it."""
+        teams = [
+            Team(id=str(i), abbreviation=f"T{i}", name=f"Team {i}", display_name=f"Team {i}",
+                 location="City", conference="AFC", division="West")
+            for i in range(1, 4)
+        ]
+        # Teams 1 and 2 each beat team 3 by the same score and never meet
+        games = [
+            Game(id=f"g{i}", week=i, season=2025, home_team_id=home, away_team_id="3",
+                 date=datetime(2025, 9, 7), is_completed=True, home_score=24, away_score=17)
+            for i, home in enumerate(["1", "2"], start=1)
+        ]
+        swept_games = games + [
+            Game(id="g3", week=3, season=2025, home_team_id="1", away_team_id="2",
+                 date=datetime(2025, 9, 21), is_completed=True, home_score=20, away_score=10),
+        ]
+        level = calculate_standings(games, teams)
+        swept = calculate_standings(swept_games, teams)
+
+        with profile_simulation() as profile:
+            break_division_tie_two_teams(swept["1"], swept["2"], swept_games, teams, swept)
+            # Identical records: settled past every record-based rule
+            break_division_tie_two_teams(level["1"], level["2"], games, teams, level)
+
+        assert profile.tiebreak_rules == {
+            "head_to_head": 1, "conference_combined_ranking": 1,
+        }
+
+
+class TestProfiledSimulation:
+    """Tests for profiles on simulation results."""
+
+    def test_profile_on_result(self, league_teams, league_games):
+        """Test that a profiled run reports every stage and its tiebreak rules."""
+        result = simulate_season(
+            league_games, league_teams, num_simulations=200, random_seed=4,
+            chunk_size=100, profile=True,
+        )
+        profile = result.profile
+
+        assert {"baseline", "outcomes", "standings", "division_winners", "seeding",
+                "aggregation"} <= set(profile.stage_seconds)
+        assert profile.stage_calls["outcomes"] == 2
+        assert all(seconds >= 0 for seconds in profile.stage_seconds.values())
+        # Tied simulations were resolved rule by rule
+        assert profile.stage_calls.get("tied_standings", 0) > 0
+        assert sum(profile.tiebreak_rules.values()) > 0
+
+    def test_unprofiled_by_default(self, league_teams, late_season_games):
+        """Test that results carry no profile unless requested."""
+        result = simulate_season(late_season_games, league_teams, num_simulations=20)
+        assert result.profile is None
+
+    def test_profiling_does_not_change_results(self, league_teams, league_games):
+        """Test that the same seed gives the same statistics with profiling on."""
+        plain = simulate_season(league_games, league_teams, 150, random_seed=8)
+        profiled = simulate_season(league_games, league_teams, 150, random_seed=8,
+                                   profile=True)
+
+        for team_id, stats in plain.team_stats.items():
+            assert profiled.team_stats[team_id].seed_counts == stats.seed_counts
+
+    def test_parallel_profiles_merge(self, league_teams, late_season_games):
+        """Test that shard profiles are merged, including for exact enumeration."""
+        result = simulate_season_parallel(
+            late_season_games, league_teams, num_simulations=1000, num_workers=1,
+            shard_size=16, random_seed=0, profile=True,
+        )
+
+        assert result.exact
+        assert result.profile.stage_calls["baseline"] == 4  # 64 outcomes, 4 shards
+        merged = SimulationResult.merge([result, result])
+        assert merged.profile.stage_calls["baseline"] == 8
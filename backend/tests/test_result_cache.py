@@ -0,0 +1,195 @@
+"""
+Tests for the simulation result cache.
+"""
+
+import os
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from src.simulation.convergence import ConvergenceCriteria
+from src.simulation.monte_carlo import SimulationResult, TeamSimulationStats, simulate_season
+from src.simulation.result_cache import (
+    SimulationResultCache,
+    deserialize_cached_result,
+    is_cacheable_run,
+    serialize_cached_result,
+    simulation_cache_key,
+)
+
+
+@pytest.fixture
+def small_result(league_teams, late_season_games):
+    """A small retained run."""
+    return simulate_season(
+        late_season_games, league_teams, num_simulations=30, random_seed=1,
+        retain_outcomes=True,
+    )
+
+
+class TestSimulationCacheKey:
+    """Tests for run fingerprints."""
+
+    def test_same_inputs_same_key(self, league_teams, league_games):
+        """Test that the key ignores game order and is reproducible."""
+        key = simulation_cache_key(league_games, league_teams, 1000, 5, shard_size=10)
+        assert key == simulation_cache_key(
+            list(reversed(league_games)), league_teams, 1000, 5, shard_size=10
+        )
+
+    def test_key_changes_with_inputs(self, league_teams, league_games):
+        """Test that results, overrides and parameters all change the key."""
+        base = simulation_cache_key(league_games, league_teams, 1000, 5)
+
+        upcoming = next(g for g in league_games if not g.is_completed)
+        overridden = [
+            replace(g, is_overridden=True, override_home_score=21, override_away_score=7)
+            if g.id == upcoming.id else g
+            for g in league_games
+        ]
+
+        assert simulation_cache_key(overridden, league_teams, 1000, 5) != base
+        assert simulation_cache_key(league_games, league_teams, 1001, 5) != base
+        assert simulation_cache_key(league_games, league_teams, 1000, None) != base
+        assert simulation_cache_key(league_games, league_teams, 1000, 5, shard_size=10) != base
+
+
+class TestIsCacheableRun:
+    """Tests for which runs may be cached."""
+
+    def test_requires_seed_and_reproducible_stop(self):
+        """Test that unseeded and time-budgeted runs are not cached."""
+        assert is_cacheable_run(7)
+        assert is_cacheable_run(0, ConvergenceCriteria())
+        assert not is_cacheable_run(None)
+        assert not is_cacheable_run(7, ConvergenceCriteria(time_budget_seconds=5))
+
+
+class TestCachedResultSerialization:
+    """Tests for the disk format of cached results."""
+
+    def test_round_trip(self):
+        """Test that counters survive serialization."""
+        stats = TeamSimulationStats(team_id="1", made_playoffs_count=3, total_simulations=4)
+        stats.record_wins([9, 10, 10, 12], ties=[0, 1, 0, 0])
+        stats.seed_counts[2] = 3
+        result = SimulationResult(team_stats={"1": stats}, num_simulations=4, exact=True)
+
+        loaded = deserialize_cached_result(serialize_cached_result(result))
+        assert loaded.num_simulations == 4
+        assert loaded.exact
+        assert loaded.team_stats["1"].wins_distribution == {9: 1, 10.5: 1, 10: 1, 12: 1}
+        assert loaded.team_stats["1"].seed_counts[2] == 3
+
+    def test_weighted_round_trip(self):
+        """Test that importance-sampled counters keep their weights."""
+        stats = TeamSimulationStats(team_id="1", made_playoffs_count=0.25, total_simulations=2)
+        stats.record_wins([9, 12], simulation_weights=[0.25, 1.5])
+        stats.total_weight, stats.total_squared_weight = 1.75, 2.3125
+        result = SimulationResult(team_stats={"1": stats}, num_simulations=2)
+
+        loaded = deserialize_cached_result(serialize_cached_result(result)).team_stats["1"]
+        assert loaded.is_weighted
+        assert loaded.playoff_probability == stats.playoff_probability
+        assert loaded.wins_histogram.sum() == 1.75
+        assert loaded.effective_simulations == stats.effective_simulations
+
+
+class TestSimulationResultCache:
+    """Tests for the memory and disk tiers."""
+
+    def test_hit_and_miss_counters(self, small_result):
+        """Test that lookups are counted and hits return the stored statistics."""
+        cache = SimulationResultCache()
+
+        assert cache.get("k") is None
+        cache.put("k", small_result)
+        hit = cache.get("k")
+
+        assert cache.stats() == {"hits": 1, "misses": 1, "memory_entries": 1}
+        assert hit.num_simulations == small_result.num_simulations
+        for team_id, stats in small_result.team_stats.items():
+            assert hit.team_stats[team_id].made_playoffs_count == stats.made_playoffs_count
+
+    def test_hits_are_independent_copies(self, small_result):
+        """Test that modifying a returned result leaves the cache intact."""
+        cache = SimulationResultCache()
+        cache.put("k", small_result)
+
+        first = cache.get("k")
+        team_id = next(iter(first.team_stats))
+        first.team_stats[team_id].made_playoffs_count += 100
+        first.retained.seeds[:] = -1
+
+        second = cache.get("k")
+        assert second.team_stats[team_id].made_playoffs_count == (
+            small_result.team_stats[team_id].made_playoffs_count
+        )
+        np.testing.assert_array_equal(second.retained.seeds, small_result.retained.seeds)
+
+    def test_lru_eviction(self, small_result):
+        """Test that the least recently used entry is evicted first."""
+        cache = SimulationResultCache(max_entries=2)
+        cache.put("a", small_result)
+        cache.put("b", small_result)
+        cache.get("a")
+        cache.put("c", small_result)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_retained_outcomes_within_budget(self, small_result):
+        """Test that only the newest entries keep per-simulation outcomes."""
+        nbytes = (
+            small_result.retained.outcomes.nbytes
+            + small_result.retained.division_winners.nbytes
+            + small_result.retained.seeds.nbytes
+            + small_result.retained.score_dependent.nbytes
+        )
+        cache = SimulationResultCache(max_retained_bytes=nbytes)
+        cache.put("old", small_result)
+        cache.put("new", small_result)
+
+        assert cache.get("new").retained is not None
+        assert cache.get("old").retained is None
+
+    def test_disk_tier(self, small_result, cache_manager):
+        """Test that results survive a new cache instance via CacheManager."""
+        SimulationResultCache(cache_manager=cache_manager).put("k", small_result)
+
+        fresh = SimulationResultCache(cache_manager=cache_manager)
+        loaded = fresh.get("k")
+
+        assert fresh.stats()["disk_entries"] == 1
+        assert loaded.retained is None
+        for team_id, stats in small_result.team_stats.items():
+            np.testing.assert_array_equal(
+                loaded.team_stats[team_id].wins_histogram, stats.wins_histogram
+            )
+            assert loaded.team_stats[team_id].seed_counts == stats.seed_counts
+
+    def test_disk_tier_pruned(self, small_result, cache_manager):
+        """Test that the disk tier keeps only the newest entries."""
+        cache = SimulationResultCache(
+            max_entries=0, cache_manager=cache_manager, max_disk_entries=2
+        )
+        for index, key in enumerate(("a", "b", "c")):
+            cache.put(key, small_result)
+            path = cache_manager.simulations_dir / f"{key}.json"
+            os.utime(path, (1000 + index, 1000 + index))
+        cache.put("d", small_result)
+
+        assert cache.stats()["disk_entries"] == 2
+        assert cache.get("a") is None and cache.get("b") is None
+        assert cache.get("d") is not None
+
+    def test_clear(self, small_result, cache_manager):
+        """Test that clearing empties both tiers."""
+        cache = SimulationResultCache(cache_manager=cache_manager)
+        cache.put("k", small_result)
+        cache.clear()
+
+        assert cache.get("k") is None
+        assert cache.stats()["disk_entries"] == 0
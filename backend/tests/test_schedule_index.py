@@ -0,0 +1,87 @@
+"""
+Tests for the precomputed schedule index used by tiebreakers.
+"""
+
+from dataclasses import replace
+
+import pytest
+
+from src.simulation.schedule_index import ScheduleIndex
+from src.simulation.tiebreakers import (
+    calculate_combined_ranking,
+    calculate_head_to_head_record,
+    get_conference_games,
+    identify_common_games,
+)
+from src.simulation.standings import calculate_standings
+
+
+@pytest.fixture
+def completed_games(league_games):
+    """League schedule restricted to games with results."""
+    return [g for g in league_games if g.is_completed]
+
+
+class TestScheduleIndex:
+    """Tests for ScheduleIndex lookups against the scanning implementations."""
+
+    def test_head_to_head_matches_scan(self, league_teams, completed_games):
+        """Test head-to-head records through the index."""
+        index = ScheduleIndex(completed_games, league_teams)
+
+        for team1 in league_teams[:8]:
+            for team2 in league_teams:
+                assert calculate_head_to_head_record(
+                    team1.id, team2.id, completed_games, index
+                ) == calculate_head_to_head_record(team1.id, team2.id, completed_games)
+
+    @pytest.mark.parametrize("team_ids", [["1", "2"], ["1", "5"], ["3", "4", "9"]])
+    def test_common_games_match_scan(self, league_teams, completed_games, team_ids):
+        """Test that common games are the same set as a full scan finds."""
+        index = ScheduleIndex(completed_games, league_teams)
+
+        indexed = identify_common_games(team_ids, completed_games, index)
+        scanned = identify_common_games(team_ids, completed_games)
+
+        assert sorted(g.id for g in indexed) == sorted(g.id for g in scanned)
+        # Cached on repeat lookups
+        assert identify_common_games(list(reversed(team_ids)), completed_games, index) == indexed
+
+    def test_conference_games_and_ranking_match_scan(self, league_teams, completed_games):
+        """Test conference games and combined rankings through the index."""
+        index = ScheduleIndex(completed_games, league_teams)
+        standings = calculate_standings(completed_games, league_teams)
+
+        for team in league_teams:
+            assert [g.id for g in get_conference_games(
+                team.id, completed_games, league_teams, index
+            )] == [g.id for g in get_conference_games(team.id, completed_games, league_teams)]
+            for conference_only in (True, False):
+                assert calculate_combined_ranking(
+                    team.id, standings, league_teams, conference_only, index
+                ) == calculate_combined_ranking(
+                    team.id, standings, league_teams, conference_only
+                )
+
+    def test_reads_results_from_the_games_passed(self, league_teams, completed_games):
+        """Test that lookups use the given game objects, not the indexed ones."""
+        index = ScheduleIndex(completed_games, league_teams)
+        game = completed_games[0]
+        flipped = list(completed_games)
+        flipped[0] = replace(game, home_score=game.away_score, away_score=game.home_score)
+
+        original = calculate_head_to_head_record(
+            game.home_team_id, game.away_team_id, completed_games, index
+        )
+        updated = calculate_head_to_head_record(
+            game.home_team_id, game.away_team_id, flipped, index
+        )
+        assert game.home_score != game.away_score
+        assert original != updated
+
+    def test_rejects_mismatched_games(self, league_teams, completed_games):
+        """Test that a games list of a different size is rejected."""
+        index = ScheduleIndex(completed_games, league_teams)
+
+        with pytest.raises(ValueError):
+            identify_common_games(["1", "2"], completed_games[:-1], index)
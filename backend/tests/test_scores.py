@@ -0,0 +1,148 @@
+"""
+Tests for score generation and the compact outcome encoding.
+"""
+
+import numpy as np
+import pytest
+
+from src.simulation.monte_carlo import simulate_season
+from src.simulation.scores import (
+    CompactOutcomes,
+    MARGIN_PROBABILITIES,
+    MARGIN_VALUES,
+    MAX_COMPACT_SCORE,
+    generate_compact_outcomes,
+    generate_margin_scores,
+    outcome_uniforms,
+)
+
+
+class TestCompactOutcomes:
+    """Tests for CompactOutcomes."""
+
+    def test_round_trips_home_win_flags(self):
+        """Test that packed flags unpack to the original matrix."""
+        rng = np.random.default_rng(0)
+        home_wins = rng.integers(0, 2, size=(4, 13))
+        scores = rng.integers(0, 40, size=(4, 13))
+
+        outcomes = CompactOutcomes.from_arrays(home_wins, scores, scores)
+
+        assert outcomes.home_wins_packed.shape == (4, 2)
+        assert outcomes.home_scores.dtype == np.uint8
+        np.testing.assert_array_equal(outcomes.home_wins, home_wins.astype(bool))
+
+    def test_clips_scores_to_uint8(self):
+        """Test that scores beyond the uint8 range are clipped."""
+        outcomes = CompactOutcomes.from_arrays(
+            np.ones((1, 1)), np.array([[300]]), np.array([[3]])
+        )
+        assert outcomes.home_scores[0, 0] == MAX_COMPACT_SCORE
+
+    def test_generated_scores_match_winners(self):
+        """Test that generated scores agree with the packed winner flags."""
+        outcomes = generate_compact_outcomes(
+            500, 11, rng=np.random.default_rng(1)
+        )
+        home_wins = outcomes.home_wins
+
+        assert outcomes.num_simulations == 500
+        assert (outcomes.home_scores[home_wins] > outcomes.away_scores[home_wins]).all()
+        assert (outcomes.away_scores[~home_wins] > outcomes.home_scores[~home_wins]).all()
+        # Padding bits past the 11th game stay clear
+        assert not (outcomes.home_wins_packed[:, -1] & 0x1F).any()
+        assert 0.45 < home_wins.mean() < 0.55
+
+    def test_compact_size(self):
+        """Test that the encoding uses one bit per flag and one byte per score."""
+        outcomes = generate_compact_outcomes(
+            100, 64, rng=np.random.default_rng(2)
+        )
+        assert outcomes.nbytes == 100 * (64 // 8 + 2 * 64)
+
+
+class TestMarginScores:
+    """Tests for the margin-based score generator."""
+
+    def test_fills_buffers_consistently(self):
+        """Test that scores are written in place and agree with every outcome."""
+        home_wins = np.random.default_rng(0).integers(0, 2, size=(3000, 9)).astype(bool)
+        home_scores = np.zeros(home_wins.shape, dtype=np.uint8)
+        away_scores = np.zeros(home_wins.shape, dtype=np.uint8)
+
+        generate_margin_scores(
+            home_wins, home_scores, away_scores, rng=np.random.default_rng(1)
+        )
+
+        margin = home_scores.astype(int) - away_scores.astype(int)
+        assert (margin[home_wins] > 0).all()
+        assert (margin[~home_wins] < 0).all()
+        assert np.abs(margin).max() <= MARGIN_VALUES.max()
+
+    def test_margin_and_total_distribution(self):
+        """Test that margins follow the key-number table and totals center on the mean."""
+        home_wins = np.ones((4000, 50), dtype=bool)
+        home_scores = np.empty(home_wins.shape, dtype=np.uint8)
+        away_scores = np.empty(home_wins.shape, dtype=np.uint8)
+
+        generate_margin_scores(
+            home_wins, home_scores, away_scores, mean_score=22.0,
+            rng=np.random.default_rng(2),
+        )
+
+        margins = (home_scores.astype(int) - away_scores).ravel()
+        share = np.bincount(margins, minlength=MARGIN_VALUES.max() + 1)[1:] / margins.size
+        np.testing.assert_allclose(share[:10], MARGIN_PROBABILITIES[:10], atol=0.005)
+        # Three-point games are the most common result
+        assert share.argmax() == 2
+        totals = home_scores.astype(int) + away_scores
+        assert abs(totals.mean() - 44.0) < 0.5
+
+
+class TestVarianceReduction:
+    """Tests for antithetic and stratified outcome draws."""
+
+    def test_antithetic_pairs_mirror(self):
+        """Test that the second half of a block mirrors the first."""
+        fair = generate_compact_outcomes(
+            7, 11, rng=np.random.default_rng(0), sampling="antithetic"
+        ).home_wins
+        np.testing.assert_array_equal(fair[4:], ~fair[:3])
+
+        uniforms = outcome_uniforms(6, 5, np.random.default_rng(1), "antithetic")
+        np.testing.assert_allclose(uniforms[3:], 1.0 - uniforms[:3])
+
+    def test_stratified_counts_match_probabilities(self):
+        """Test that every game's home-win count is within one of its expectation."""
+        probabilities = np.array([0.1, 0.5, 0.73, 0.5])
+        weighted = generate_compact_outcomes(
+            1000, 4, rng=np.random.default_rng(2), home_win_probabilities=probabilities,
+            sampling="stratified",
+        ).home_wins
+        assert np.all(np.abs(weighted.sum(axis=0) - probabilities * 1000) <= 1)
+
+        fair = generate_compact_outcomes(
+            500, 9, rng=np.random.default_rng(3), sampling="stratified"
+        ).home_wins
+        assert np.all(np.abs(fair.sum(axis=0) - 250) <= 1)
+        # Columns are shuffled independently, not copies of one another
+        assert not np.array_equal(fair[:, 0], fair[:, 1])
+
+    def test_unknown_method(self):
+        """Test that an unknown sampling method is rejected."""
+        with pytest.raises(ValueError):
+            generate_compact_outcomes(10, 3, sampling="sobol")
+
+    def test_simulation_estimates_agree(self, league_teams, league_games):
+        """Test that every method estimates the same probabilities."""
+        results = {
+            method: simulate_season(league_games, league_teams, 2000, random_seed=4,
+                                    sampling=method)
+            for method in ("independent", "antithetic", "stratified")
+        }
+        for team_id, stats in results["independent"].team_stats.items():
+            for method in ("antithetic", "stratified"):
+                other = results[method].team_stats[team_id]
+                assert other.total_simulations == 2000
+                assert abs(other.playoff_probability - stats.playoff_probability) < 0.08
+
@@ -0,0 +1,276 @@
+"""
+Tests for the simulation job queue.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from api import simulation_jobs
+from api.simulation_jobs import SimulationJobManager, SimulationQueueFullError
+from src.simulation.monte_carlo import SimulationCancelledError, SimulationResult
+from src.simulation.outcome_store import load_cached_outcome_store
+from src.simulation.result_cache import SimulationResultCache
+
+
+def _wait_for(condition, timeout=10.0):
+    deadline = time.time() + timeout
+    while not condition():
+        if time.time() > deadline:
+            raise AssertionError("Timed out waiting for job state")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def gated_runs(monkeypatch):
+    """Replace the simulation with one that waits for its job to be released."""
+    gates = {}
+    started = []
+
+    def fake_parallel(num_simulations, cancel_callback, **kwargs):
+        gate = gates.setdefault(num_simulations, threading.Event())
+        started.append(num_simulations)
+        while not gate.wait(0.01):
+            if cancel_callback():
+                raise SimulationCancelledError("Simulation cancelled")
+        return SimulationResult(num_simulations=num_simulations)
+
+    monkeypatch.setattr(simulation_jobs, "simulate_season_parallel", fake_parallel)
+
+    def release(num_simulations):
+        gates.setdefault(num_simulations, threading.Event()).set()
+
+    return started, release
+
+
+class TestSimulationJobQueue:
+    """Tests for scheduling, limits and eviction."""
+
+    def test_jobs_queue_behind_running_jobs(self, gated_runs, league_teams, league_games):
+        """Test that jobs beyond the concurrency limit wait in priority order."""
+        started, release = gated_runs
+        manager = SimulationJobManager(num_workers=4, max_concurrent_jobs=2)
+
+        jobs = [manager.start_job(league_games, league_teams, n) for n in (1, 2)]
+        _wait_for(lambda: sorted(started) == [1, 2])
+        jobs.append(manager.start_job(league_games, league_teams, 3))
+        urgent = manager.start_job(league_games, league_teams, 4, priority=5)
+
+        assert [job.status for job in jobs] == ["running", "running", "pending"]
+        assert urgent.to_dict()["queue_position"] == 1
+        assert jobs[2].queue_position == 2
+        # Each running job gets half of the worker processes
+        assert jobs[0].num_workers == 2
+
+        release(1)
+        _wait_for(lambda: len(started) == 3)
+        assert started[2] == 4
+        assert jobs[2].queue_position == 1
+
+        for n in (2, 3, 4):
+            release(n)
+        _wait_for(lambda: all(job.status == "completed" for job in jobs + [urgent]))
+        assert jobs[2].queue_position is None
+
+    def test_cancel_queued_job(self, gated_runs, league_teams, league_games):
+        """Test that a waiting job is cancelled without running."""
+        started, release = gated_runs
+        manager = SimulationJobManager(max_concurrent_jobs=1)
+
+        running = manager.start_job(league_games, league_teams, 1)
+        queued = manager.start_job(league_games, league_teams, 2)
+        _wait_for(lambda: running.status == "running")
+
+        assert manager.cancel_job(queued.id)
+        assert queued.status == "cancelled"
+        assert manager.queue_length() == 0
+
+        manager.cancel_job(running.id)
+        _wait_for(lambda: running.status == "cancelled")
+        assert started == [1]
+
+    def test_limits(self, gated_runs, league_teams, league_games):
+        """Test the per-job size limit and the queue bound."""
+        _, release = gated_runs
+        manager = SimulationJobManager(
+            max_concurrent_jobs=1, max_queued_jobs=1, max_simulations_per_job=10
+        )
+
+        with pytest.raises(ValueError):
+            manager.start_job(league_games, league_teams, 11)
+
+        running = manager.start_job(league_games, league_teams, 1)
+        _wait_for(lambda: running.status == "running")
+        manager.start_job(league_games, league_teams, 2)
+        with pytest.raises(SimulationQueueFullError):
+            manager.start_job(league_games, league_teams, 3)
+
+        release(1)
+        release(2)
+
+    def test_finished_jobs_evicted(self, gated_runs, league_teams, league_games):
+        """Test that only the most recent finished jobs are kept."""
+        _, release = gated_runs
+        manager = SimulationJobManager(max_finished_jobs=2)
+
+        jobs = []
+        for n in (1, 2, 3):
+            release(n)
+            jobs.append(manager.start_job(league_games, league_teams, n))
+            _wait_for(lambda: jobs[-1].status == "completed")
+        manager.start_job(league_games, league_teams, 4)
+
+        assert manager.get_job(jobs[0].id) is None
+        assert manager.get_job(jobs[2].id) is not None
+
+    def test_cache_hit_callback_may_reenter(self, gated_runs, league_teams, league_games):
+        """Test that a cached job completes outside the manager lock."""
+        _, release = gated_runs
+        release(5)
+        seen = []
+        manager = SimulationJobManager(
+            result_cache=SimulationResultCache(),
+            result_callback=lambda result: seen.append(manager.queue_length()),
+        )
+        first = manager.start_job(league_games, league_teams, 5, random_seed=1)
+        _wait_for(lambda: first.is_finished)
+
+        cached = manager.start_job(league_games, league_teams, 5, random_seed=1)
+
+        assert cached.status == "completed"
+        assert cached.message == "Loaded cached result"
+        assert manager.get_job(cached.id) is cached
+        assert seen == [0, 0]
+
+    def test_unseeded_jobs_not_cached(self, gated_runs, league_teams, league_games):
+        """Test that unseeded jobs always draw fresh samples."""
+        started, release = gated_runs
+        release(5)
+        manager = SimulationJobManager(result_cache=SimulationResultCache())
+        first = manager.start_job(league_games, league_teams, 5)
+        _wait_for(lambda: first.is_finished)
+
+        second = manager.start_job(league_games, league_teams, 5)
+        _wait_for(lambda: second.is_finished)
+
+        assert started == [5, 5]
+        assert second.message == "Simulation complete"
+
+    def test_runs_simulation(self, league_teams, late_season_games):
+        """Test a real job end to end, with the schedule snapshotted at submission."""
+        manager = SimulationJobManager(num_workers=1)
+        job = manager.start_job(late_season_games, league_teams, 64, random_seed=1)
+        late_season_games[-1].is_completed = True
+
+        _wait_for(lambda: job.is_finished)
+        assert job.status == "completed"
+        assert job.result.exact
+        assert not job._games[-1].is_completed
+
+    def test_persisted_outcomes(self, cache_manager, league_teams, late_season_games):
+        """Test that a job can write its outcomes to a store beyond the what-if limit."""
+        manager = SimulationJobManager(num_workers=1, outcome_cache=cache_manager)
+        job = manager.start_job(
+            late_season_games, league_teams, 64, random_seed=1, persist_outcomes=True
+        )
+        _wait_for(lambda: job.is_finished)
+
+        assert job.to_dict()["outcome_store_id"] == job.id
+        assert job.result.retained is None
+        store = load_cached_outcome_store(cache_manager, job.id)
+        assert store.num_simulations == job.result.num_simulations
+
+        with pytest.raises(ValueError):
+            SimulationJobManager().start_job(
+                late_season_games, league_teams, 64, persist_outcomes=True
+            )
+
+
+class TestSimulationJobEvents:
+    """Tests for the per-job event stream."""
+
+    def test_queued_job_event_sequence(self, gated_runs, league_teams, league_games):
+        """Test that a job streams queue, run, result and a closing status in order."""
+        started, release = gated_runs
+        manager = SimulationJobManager(max_concurrent_jobs=1)
+
+        first = manager.start_job(league_games, league_teams, 1)
+        _wait_for(lambda: started == [1])
+        second = manager.start_job(league_games, league_teams, 2)
+        release(1)
+        release(2)
+        _wait_for(lambda: second.is_finished)
+
+        events = second.events_since(0)
+        assert [event["id"] for event in events] == list(range(len(events)))
+        assert [event["event"] for event in events] == [
+            "status", "status", "result", "status",
+        ]
+        assert [event["data"]["status"] for event in events if event["event"] == "status"] == [
+            "pending", "running", "completed",
+        ]
+        assert events[0]["data"]["queue_position"] == 1
+        assert events[2]["data"] == second.to_dict()["result"]
+        assert first.events_since(0)[-1]["data"]["status"] == "completed"
+
+    def test_events_since_waits(self, gated_runs, league_teams, league_games):
+        """Test that readers block until the next event or the timeout."""
+        started, release = gated_runs
+        manager = SimulationJobManager()
+        job = manager.start_job(league_games, league_teams, 1)
+        _wait_for(lambda: started == [1])
+
+        seen = len(job.events_since(0))
+        assert job.events_since(seen, timeout=0.05) == []
+
+        threading.Timer(0.05, release, args=(1,)).start()
+        assert job.events_since(seen, timeout=10)[0]["event"] == "result"
+
+    def test_subscribers_woken_on_publish(self, gated_runs, league_teams, league_games):
+        """Test that asyncio readers are woken from the runner thread."""
+        started, release = gated_runs
+        manager = SimulationJobManager()
+        job = manager.start_job(league_games, league_teams, 1)
+        _wait_for(lambda: started == [1])
+
+        async def read_result():
+            published = job.subscribe()
+            seen = len(job.events_since(0))
+            threading.Timer(0.05, release, args=(1,)).start()
+            await asyncio.wait_for(published.wait(), 10)
+            job.unsubscribe(published)
+            return job.events_since(seen, timeout=0)
+
+        assert asyncio.run(read_result())[0]["event"] == "result"
+        assert job._subscribers == []
+
+    def test_cancel_queued_job_closes_stream(self, gated_runs, league_teams, league_games):
+        """Test that cancelling a waiting job publishes its final status."""
+        _, release = gated_runs
+        manager = SimulationJobManager(max_concurrent_jobs=1)
+        manager.start_job(league_games, league_teams, 1)
+        queued = manager.start_job(league_games, league_teams, 2)
+
+        manager.cancel_job(queued.id)
+        release(1)
+
+        last = queued.events_since(0)[-1]
+        assert last["event"] == "status"
+        assert last["data"]["status"] == "cancelled"
+
+    def test_partial_estimates(self, league_teams, league_games):
+        """Test that sampled runs stream growing partial estimates before the result."""
+        manager = SimulationJobManager(num_workers=1, shard_size=50)
+        job = manager.start_job(league_games, league_teams, 150, random_seed=3)
+        _wait_for(lambda: job.is_finished)
+
+        events = job.events_since(0)
+        partials = [event["data"] for event in events if event["event"] == "partial"]
+        assert [partial["num_simulations"] for partial in partials] == [50, 100, 150]
+        final = partials[-1]["team_stats"]
+        for team_id, stats in job.result.team_stats.items():
+            assert final[team_id]["playoff_probability"] == stats.playoff_probability
+        assert [event["event"] for event in events[-2:]] == ["result", "status"]
+        assert sum(event["event"] == "result" for event in events) == 1
@@ -6,6 +6,7 @@ import pytest
 from datetime import datetime
 
 from src.simulation.standings import (
+    HeadToHeadMatrix,
     calculate_standings,
     update_standing_from_game,
     is_division_game,
@@ -433,6 +434,63 @@ class TestCalculateStandings:
         assert standings["2"].wins == 0
 
 
+class TestHeadToHeadMatrix:
+    """Tests for integer-indexed head-to-head records."""
+
+    @pytest.fixture
+    def games(self):
+        """Team 1 sweeps team 2, ties team 3; team 3 beats team 2; one unplayed game."""
+        results = [("1", "2", 24, 10), ("2", "1", 13, 20), ("1", "3", 17, 17),
+                   ("3", "2", 21, 3)]
+        games = [
+            Game(id=f"g{i}", week=i + 1, season=2025, home_team_id=home,
+                 away_team_id=away, date=datetime(2025, 9, 7), is_completed=True,
+                 home_score=home_score, away_score=away_score)
+            for i, (home, away, home_score, away_score) in enumerate(results)
+        ]
+        games.append(
+            Game(id="g9", week=9, season=2025, home_team_id="2", away_team_id="3",
+                 date=datetime(2025, 11, 2), is_completed=False)
+        )
+        return games
+
+    def test_records(self, games):
+        """Test wins, losses and ties between each pair of teams."""
+        matrix = HeadToHeadMatrix.from_games(games, ["1", "2", "3"])
+
+        assert matrix.record(0, 1) == (2, 0, 0)
+        assert matrix.record(1, 0) == (0, 2, 0)
+        assert matrix.record(0, 2) == (0, 0, 1)
+        assert matrix.record(2, 1) == (1, 0, 0)
+        assert matrix.played.tolist() == [[0, 2, 1], [2, 0, 1], [1, 1, 0]]
+
+    def test_records_view(self, games):
+        """Test that a team's view lists only opponents it has played."""
+        matrix = HeadToHeadMatrix.from_games(games, ["1", "2", "3", "4"])
+        records = matrix.records_for("1")
+
+        assert dict(records) == {"2": (2, 0, 0), "3": (0, 0, 1)}
+        assert "4" not in records
+        with pytest.raises(KeyError):
+            records["4"]
+
+    def test_calculate_standings_uses_matrix(self, games):
+        """Test head-to-head and strength metrics in calculated standings."""
+        teams = [
+            Team(id=str(i), abbreviation=f"T{i}", name=f"Team {i}",
+                 display_name=f"Team {i}", location="City", conference="AFC",
+                 division="West")
+            for i in range(1, 4)
+        ]
+        standings = calculate_standings(games, teams)
+
+        assert standings["2"].head_to_head_records == {"1": (0, 2, 0), "3": (0, 1, 0)}
+        # Team 3 (1-0-1, .750) beat only team 2 (0-3, .000)
+        assert standings["3"].strength_of_victory == 0.0
+        # Team 2 played team 1 (2-0-1, .833) twice and team 3 once
+        assert standings["2"].strength_of_schedule == pytest.approx((2 * 5 / 6 + 0.75) / 3)
+
+
 class TestSortStandingsSimple:
     """Tests for simple standings sorting."""
 
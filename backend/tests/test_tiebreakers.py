@@ -22,7 +22,9 @@ from src.simulation.tiebreakers import (
     determine_division_winners,
     determine_wild_card_teams,
     seed_conference_playoffs,
+    seed_league,
 )
+from src.simulation import tiebreakers
 from src.simulation.standings import calculate_standings
 
 
@@ -260,6 +262,54 @@ class TestPlayoffSeeding:
             pytest.skip(f"Playoff seeding requires full NFL setup: {e}")
 
 
+class TestSeedLeague:
+    """Tests for the single-pass league seeding entry point."""
+
+    def test_matches_per_conference_seeding(self, league_teams, league_games):
+        """Test that seed_league agrees with the per-conference functions."""
+        standings_dict = calculate_standings(league_games, league_teams)
+        league = seed_league(league_teams, standings_dict, league_games)
+
+        winners = determine_division_winners(league_teams, standings_dict, league_games)
+        assert league.division_winners == winners
+        assert league.wild_cards == determine_wild_card_teams(
+            league_teams, standings_dict, league_games, winners
+        )
+        for conference in ["AFC", "NFC"]:
+            seeds = seed_conference_playoffs(
+                league_teams, standings_dict, league_games, conference
+            )
+            assert league.seeds[conference] == seeds
+            assert len(seeds) == 7
+
+    def test_division_winners_resolved_once(self, league_teams, league_games, monkeypatch):
+        """Test that seeding both conferences determines division winners once."""
+        calls = []
+        original = tiebreakers.determine_division_winners
+
+        def counting(*args, **kwargs):
+            calls.append(1)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(tiebreakers, "determine_division_winners", counting)
+        standings_dict = calculate_standings(league_games, league_teams)
+        league = seed_league(league_teams, standings_dict, league_games)
+
+        assert len(calls) == 1
+        assert set(league.seeds) == {"AFC", "NFC"}
+
+    def test_restrict_to_one_conference(self, league_teams, league_games):
+        """Test that only the requested conferences are seeded."""
+        standings_dict = calculate_standings(league_games, league_teams)
+        league = seed_league(
+            league_teams, standings_dict, league_games, conferences=["NFC"]
+        )
+
+        assert list(league.seeds) == ["NFC"]
+        assert list(league.wild_cards) == ["NFC"]
+        assert len(league.division_winners) == 8
+
+
 class TestScoreGeneration:
     """Tests for score generation (from scores.py)."""
 
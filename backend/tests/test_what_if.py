@@ -0,0 +1,143 @@
+"""
+Tests for incremental what-if updates of retained simulation runs.
+"""
+
+import numpy as np
+import pytest
+
+from src.simulation.batch_seeding import seed_outcomes
+from src.simulation.batch_standings import calculate_batch_standings
+from src.simulation.monte_carlo import (
+    TeamSimulationStats,
+    accumulate_team_stats,
+    simulate_season,
+)
+from src.simulation.what_if import (
+    _with_overrides,
+    apply_overrides,
+    build_retained_baseline,
+)
+
+
+def _snapshot(result):
+    return {
+        team_id: (
+            stats.wins_histogram.tolist(),
+            stats.made_playoffs_count,
+            stats.won_division_count,
+            stats.first_seed_count,
+            dict(stats.seed_counts),
+        )
+        for team_id, stats in result.team_stats.items()
+    }
+
+
+def _recompute(result, games, teams):
+    """Aggregate every retained simulation from scratch with overrides applied."""
+    retained = result.retained
+    baseline = build_retained_baseline(retained, games, teams)
+    outcomes = _with_overrides(retained.outcomes, retained.overrides)
+    batch = calculate_batch_standings(baseline, outcomes)
+    seeding = seed_outcomes(baseline, batch, teams, outcomes)
+    stats = {team.id: TeamSimulationStats(team_id=team.id) for team in teams}
+    accumulate_team_stats(stats, baseline, batch, seeding.division_winners, seeding.seeds)
+    return stats
+
+
+@pytest.fixture
+def retained_run(league_teams, league_games):
+    return simulate_season(
+        league_games, league_teams, num_simulations=200, random_seed=5,
+        retain_outcomes=True,
+    )
+
+
+class TestApplyOverrides:
+    """Tests for apply_overrides."""
+
+    def test_run_retains_outcomes(self, retained_run):
+        """Test that a retained run keeps one row per simulation."""
+        retained = retained_run.retained
+
+        assert retained.num_simulations == 200
+        assert len(retained.game_ids) == 112
+        assert retained.seeds.shape == (200, 2, 7)
+
+    def test_without_retained_outcomes(self, league_teams, league_games):
+        """Test that results without retained outcomes are not updated."""
+        result = simulate_season(league_games, league_teams, num_simulations=10)
+        assert apply_overrides(result, league_games, league_teams) is False
+
+    def test_override_updates_counters(self, retained_run, league_teams, league_games):
+        """Test that an override forces the result in every simulation."""
+        game = next(g for g in league_games if not g.is_completed)
+        before = retained_run.team_stats[game.home_team_id].average_wins
+
+        game.is_overridden = True
+        game.override_home_score = 31
+        game.override_away_score = 10
+        assert apply_overrides(retained_run, league_games, league_teams)
+
+        home_stats = retained_run.team_stats[game.home_team_id]
+        assert home_stats.average_wins > before
+        assert home_stats.wins_histogram.sum() == 200
+        column = retained_run.retained.game_ids.index(game.id)
+        assert retained_run.retained.overrides == {column: (31, 10)}
+
+        # Every simulated season now includes the home win
+        outcomes = _with_overrides(
+            retained_run.retained.outcomes, retained_run.retained.overrides
+        )
+        assert outcomes.home_wins[:, column].all()
+
+    def test_matches_full_recomputation(self, retained_run, league_teams, league_games):
+        """Test that incremental counters equal re-aggregating every simulation."""
+        pending = [g for g in league_games if not g.is_completed]
+        for game, (home, away) in zip(pending[:3], [(20, 17), (3, 27), (14, 14)]):
+            game.is_overridden = True
+            game.override_home_score = home
+            game.override_away_score = away
+            assert apply_overrides(retained_run, league_games, league_teams)
+
+        expected = _recompute(retained_run, league_games, league_teams)
+        for team_id, stats in retained_run.team_stats.items():
+            np.testing.assert_array_equal(
+                stats.wins_histogram, expected[team_id].wins_histogram
+            )
+            assert stats.won_division_count == expected[team_id].won_division_count
+            assert stats.seed_counts == expected[team_id].seed_counts
+
+    def test_clearing_override_restores_result(self, league_teams, league_games):
+        """Test that removing an override returns to the original counters."""
+        result = simulate_season(
+            league_games, league_teams, num_simulations=200, random_seed=5,
+            retain_outcomes=True,
+        )
+        original = _snapshot(result)
+        game = next(g for g in league_games if not g.is_completed)
+
+        game.is_overridden = True
+        game.override_home_score = 0
+        game.override_away_score = 35
+        assert apply_overrides(result, league_games, league_teams)
+        assert _snapshot(result) != original
+
+        game.is_overridden = False
+        game.override_home_score = None
+        game.override_away_score = None
+        assert apply_overrides(result, league_games, league_teams)
+        assert _snapshot(result) == original
+        assert result.retained.overrides == {}
+
+    def test_changed_decided_games_need_full_run(
+        self, retained_run, league_teams, league_games
+    ):
+        """Test that overriding an already completed game is not applied incrementally."""
+        game = next(g for g in league_games if g.is_completed)
+        game.is_overridden = True
+        game.override_home_score = (game.away_score or 0) + 10
+        game.override_away_score = game.away_score
+
+        original = _snapshot(retained_run)
+        assert apply_overrides(retained_run, league_games, league_teams) is False
+        assert _snapshot(retained_run) == original
@@ -0,0 +1,208 @@
+"""
+Tests for per-game win-probability models.
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from src.data.models import Game
+from src.simulation.monte_carlo import WIN_HISTOGRAM_VALUES, simulate_season
+from src.simulation.parallel import simulate_season_parallel
+from src.simulation.scores import generate_compact_outcomes
+from src.simulation.win_probability import (
+    EloModel,
+    FixedProbabilityModel,
+    GameProbabilityModel,
+    LatentStrengthModel,
+    MoneylineModel,
+    home_win_probability_vector,
+    moneyline_to_probability,
+    win_probability_model_from_dict,
+)
+
+
+def _game(game_id, home, away):
+    return Game(id=game_id, week=1, season=2025, home_team_id=home, away_team_id=away,
+                date=datetime(2025, 9, 7), is_completed=False)
+
+
+GAMES = [_game("g1", "A", "B"), _game("g2", "B", "A"), _game("g3", "C", "A")]
+
+
+class TestModels:
+    """Tests for the probability each model assigns."""
+
+    def test_fixed(self):
+        """Test that a fixed model prices every game the same."""
+        np.testing.assert_allclose(
+            FixedProbabilityModel(0.6).home_win_probabilities(GAMES), [0.6, 0.6, 0.6]
+        )
+        assert FixedProbabilityModel().is_fair
+        with pytest.raises(ValueError):
+            FixedProbabilityModel(1.5)
+
+    def test_elo(self):
+        """Test Elo expectations with and without home advantage."""
+        model = EloModel({"A": 1600, "B": 1400}, home_advantage=0)
+        p = model.home_win_probabilities(GAMES)
+
+        assert p[0] == pytest.approx(1 / (1 + 10 ** (-200 / 400)))
+        assert p[1] == pytest.approx(1 - p[0])
+        # Team C is unrated and plays at the default rating
+        assert p[2] == pytest.approx(1 / (1 + 10 ** (100 / 400)))
+
+        assert EloModel({}).home_win_probabilities(GAMES)[0] > 0.5
+
+    def test_moneyline_removes_vig(self):
+        """Test that implied probabilities are normalized and missing games fall back."""
+        assert moneyline_to_probability(-150) == pytest.approx(0.6)
+        assert moneyline_to_probability(150) == pytest.approx(0.4)
+
+        model = MoneylineModel({"g1": (-110, -110), "g2": (-200, 170)})
+        p = model.home_win_probabilities(GAMES)
+
+        assert p[0] == pytest.approx(0.5)
+        implied_home, implied_away = 200 / 300, 100 / 270
+        assert p[1] == pytest.approx(implied_home / (implied_home + implied_away))
+        assert p[2] == 0.5
+        with pytest.raises(ValueError):
+            MoneylineModel({"g1": (-50, 120)})
+
+    def test_per_game_with_fallback(self):
+        """Test that supplied probabilities override the fallback model."""
+        model = GameProbabilityModel({"g2": 0.9}, fallback=FixedProbabilityModel(0.3))
+        np.testing.assert_allclose(model.home_win_probabilities(GAMES), [0.3, 0.9, 0.3])
+
+    def test_dict_round_trip(self):
+        """Test that every model rebuilds from its dict form."""
+        models = [
+            FixedProbabilityModel(0.55),
+            EloModel({"A": 1550}, home_advantage=30),
+            MoneylineModel({"g1": (-130, 110)}, fallback=EloModel({"B": 1450})),
+            GameProbabilityModel({"g3": 0.2}),
+            LatentStrengthModel(0.4, base=EloModel({"C": 1600})),
+        ]
+        for model in models:
+            rebuilt = win_probability_model_from_dict(model.to_dict())
+            assert rebuilt.to_dict() == model.to_dict()
+            np.testing.assert_allclose(
+                rebuilt.home_win_probabilities(GAMES), model.home_win_probabilities(GAMES)
+            )
+
+        with pytest.raises(ValueError):
+            win_probability_model_from_dict({"kind": "unknown"})
+        with pytest.raises(ValueError):
+            win_probability_model_from_dict({"kind": "elo"})
+
+    def test_fair_models_use_coin_flip_path(self):
+        """Test that 50/50 models produce no probability vector."""
+        assert home_win_probability_vector(None, GAMES) is None
+        assert home_win_probability_vector(FixedProbabilityModel(), GAMES) is None
+        assert home_win_probability_vector(FixedProbabilityModel(0.7), GAMES).shape == (3,)
+
+
+class TestWeightedOutcomes:
+    """Tests for outcomes drawn from a probability vector."""
+
+    def test_win_rates_follow_probabilities(self):
+        """Test per-game home-win rates and winner-consistent scores."""
+        probabilities = np.array([0.0, 0.2, 0.5, 0.9, 1.0] * 3)
+        outcomes = generate_compact_outcomes(
+            20000, len(probabilities),
+            rng=np.random.default_rng(3),
+            home_win_probabilities=probabilities,
+        )
+        home_wins = outcomes.home_wins
+
+        np.testing.assert_allclose(home_wins.mean(axis=0), probabilities, atol=0.015)
+        assert np.all((outcomes.home_scores > outcomes.away_scores) == home_wins)
+
+
+class TestLatentStrength:
+    """Tests for per-simulation team strengths."""
+
+    def test_probabilities_shift_by_strength(self):
+        """Test that one draw of strengths prices all of a simulation's games."""
+        model = LatentStrengthModel(0.8)
+        home_index = np.array([0, 1, 2])
+        away_index = np.array([1, 0, 0])
+        p = model.simulation_probabilities(
+            np.full(3, 0.5), home_index, away_index, num_teams=3, num_simulations=5000,
+            rng=np.random.default_rng(0),
+        )
+
+        assert p.shape == (5000, 3)
+        # Games 0 and 1 are the same pairing with home and away swapped
+        np.testing.assert_allclose(p[:, 0], 1 - p[:, 1])
+        assert np.corrcoef(p[:, 0], p[:, 2])[0, 1] < -0.3
+        assert p.mean() == pytest.approx(0.5, abs=0.02)
+
+    def test_fairness_and_validation(self):
+        """Test when the model reduces to coin flips, and invalid settings."""
+        assert LatentStrengthModel(0.0).is_fair
+        assert not LatentStrengthModel(0.5).is_fair
+        with pytest.raises(ValueError):
+            LatentStrengthModel(-1.0)
+        with pytest.raises(ValueError):
+            LatentStrengthModel(0.5, base=LatentStrengthModel(0.5))
+
+    def test_win_totals_spread(self, league_teams, league_games):
+        """Test that correlated strengths widen the distribution of win totals."""
+        def win_spread(result):
+            variances = [
+                np.sum(stats.wins_histogram * (WIN_HISTOGRAM_VALUES - stats.average_wins) ** 2)
+                / result.num_simulations
+                for stats in result.team_stats.values()
+            ]
+            return np.mean(np.sqrt(variances))
+
+        plain = simulate_season(league_games, league_teams, 2000, random_seed=9)
+        latent = simulate_season(league_games, league_teams, 2000, random_seed=9,
+                                 win_probability_model=LatentStrengthModel(1.0))
+
+        assert latent.num_simulations == 2000
+        assert win_spread(latent) > win_spread(plain) * 1.1
+
+
+class TestSimulationWithModel:
+    """Tests for runs using a win-probability model."""
+
+    def test_fair_model_matches_default(self, league_teams, league_games):
+        """Test that an explicit 50/50 model reproduces the default run."""
+        plain = simulate_season(league_games, league_teams, 200, random_seed=2)
+        fair = simulate_season(league_games, league_teams, 200, random_seed=2,
+                               win_probability_model=FixedProbabilityModel(0.5))
+
+        for team_id, stats in plain.team_stats.items():
+            assert fair.team_stats[team_id].seed_counts == stats.seed_counts
+
+    def test_strong_rating_raises_odds(self, league_teams, league_games):
+        """Test that a highly rated team wins more and makes the playoffs more."""
+        favourite = league_teams[0].id
+        plain = simulate_season(league_games, league_teams, 300, random_seed=5)
+        rated = simulate_season(
+            league_games, league_teams, 300, random_seed=5,
+            win_probability_model=EloModel({favourite: 2200}),
+        )
+
+        assert rated.team_stats[favourite].average_wins > plain.team_stats[favourite].average_wins
+        assert (rated.team_stats[favourite].playoff_probability
+                >= plain.team_stats[favourite].playoff_probability)
+
+    def test_weighted_run_is_sampled(self, league_teams, late_season_games):
+        """Test that a non-uniform model skips exact enumeration and is kept for reruns."""
+        model = FixedProbabilityModel(0.7)
+        fair = simulate_season_parallel(
+            late_season_games, league_teams, num_simulations=500, num_workers=1
+        )
+        weighted = simulate_season_parallel(
+            late_season_games, league_teams, num_simulations=500, num_workers=1,
+            retain_outcomes=True, win_probability_model=model,
+        )
+
+        assert fair.exact
+        assert not weighted.exact
+        assert weighted.num_simulations == 500
+        assert weighted.retained.win_probability_model is model
@@ -3,12 +3,16 @@ import {
   startSimulationJob,
   getSimulationJob,
   cancelSimulationJob,
+  streamSimulationJob,
+  type PartialSimulationResult,
   type SimulationResult,
   type SimulationJob,
 } from '../lib/api';
 
 interface SimulationContextType {
   result: SimulationResult | null;
+  // Estimates from the part of the running job finished so far
+  partialResult: PartialSimulationResult | null;
   jobData: SimulationJob | null;
   jobId: string | null;
   jobError: string | null;
@@ -17,6 +21,7 @@ interface SimulationContextType {
   startSimulation: (numSimulations: number) => Promise<void>;
   cancelSimulation: () => Promise<void>;
   clearResult: () => void;
+  updateResult: (result: SimulationResult) => void;
 }
 
 const SimulationContext = createContext<SimulationContextType | undefined>(undefined);
@@ -31,6 +36,7 @@ export const useSimulation = () => {
 
 export const SimulationProvider: React.FC<{ children: React.ReactNode }> = ({ children }) => {
   const [result, setResult] = useState<SimulationResult | null>(null);
+  const [partialResult, setPartialResult] = useState<PartialSimulationResult | null>(null);
   const [jobData, setJobData] = useState<SimulationJob | null>(null);
   const [jobId, setJobId] = useState<string | null>(null);
   const [jobError, setJobError] = useState<string | null>(null);
@@ -42,6 +48,11 @@ export const SimulationProvider: React.FC<{ children: React.ReactNode }> = ({ ch
       setSimulatedAt(null);
   }, []);
 
+  const updateResult = useCallback((updated: SimulationResult) => {
+      setResult(updated);
+      setSimulatedAt(new Date());
+  }, []);
+
   const startSimulation = useCallback(async (numSimulations: number) => {
     if (jobData?.status === 'pending' || jobData?.status === 'running') return;
     try {
@@ -50,6 +61,7 @@ export const SimulationProvider: React.FC<{ children: React.ReactNode }> = ({ ch
       // Requirement says: "persist until the user initiates a new simulation"
       // So we should probably clear it when starting a new one.
       setResult(null); 
+      setPartialResult(null);
       setSimulatedAt(null);
       
       const job = await startSimulationJob(numSimulations);
@@ -76,22 +88,33 @@ export const SimulationProvider: React.FC<{ children: React.ReactNode }> = ({ ch
     if (!jobId) return;
 
     let active = true;
+    let intervalId: number | undefined;
+
+    const finish = (latest: Pick<SimulationJob, 'status' | 'error'>) => {
+      if (latest.status === 'completed') {
+        setPartialResult(null);
+        setSimulatedAt(new Date());
+        setJobId(null);
+      } else if (latest.status === 'cancelled') {
+        setPartialResult(null);
+        setJobId(null);
+      } else if (latest.status === 'error') {
+        setPartialResult(null);
+        setJobError(latest.error ?? 'Simulation failed.');
+        setJobId(null);
+      }
+    };
+
+    // Fallback when the event stream is unavailable
     const pollStatus = async () => {
       try {
         const latest = await getSimulationJob(jobId);
         if (!active) return;
         setJobData(latest);
-
         if (latest.status === 'completed') {
           setResult(latest.result ?? null);
-          setSimulatedAt(new Date());
-          setJobId(null);
-        } else if (latest.status === 'cancelled') {
-          setJobId(null);
-        } else if (latest.status === 'error') {
-          setJobError(latest.error ?? 'Simulation failed.');
-          setJobId(null);
         }
+        finish(latest);
       } catch {
         if (!active) return;
         setJobError('Failed to fetch simulation progress.');
@@ -99,12 +122,44 @@ export const SimulationProvider: React.FC<{ children: React.ReactNode }> = ({ ch
       }
     };
 
-    pollStatus();
-    const intervalId = window.setInterval(pollStatus, 1000);
+    const closeStream = streamSimulationJob(jobId, {
+      onStatus: (event) => {
+        if (!active) return;
+        setJobData((prev) =>
+          prev
+            ? {
+                ...prev,
+                status: event.status,
+                message: event.message,
+                progress: event.progress,
+                queue_position: event.queue_position,
+                error: event.error ?? undefined,
+              }
+            : prev
+        );
+        finish({ status: event.status, error: event.error ?? undefined });
+      },
+      onProgress: (event) => {
+        if (!active) return;
+        setJobData((prev) => (prev ? { ...prev, ...event } : prev));
+      },
+      onPartial: (partial) => {
+        if (active) setPartialResult(partial);
+      },
+      onResult: (latest) => {
+        if (active) setResult(latest);
+      },
+      onError: () => {
+        if (!active) return;
+        pollStatus();
+        intervalId = window.setInterval(pollStatus, 1000);
+      },
+    });
 
     return () => {
       active = false;
-      window.clearInterval(intervalId);
+      closeStream();
+      if (intervalId !== undefined) window.clearInterval(intervalId);
     };
   }, [jobId]);
 
@@ -119,6 +174,7 @@ export const SimulationProvider: React.FC<{ children: React.ReactNode }> = ({ ch
     <SimulationContext.Provider
       value={{
         result,
+        partialResult,
         jobData,
         jobId,
         jobError,
@@ -126,7 +182,8 @@ export const SimulationProvider: React.FC<{ children: React.ReactNode }> = ({ ch
         simulatedAt,
         startSimulation,
         cancelSimulation,
-        clearResult
+        clearResult,
+        updateResult
       }}
     >
       {children}
@@ -53,20 +53,117 @@ export interface Standing {
   points_for: number;
   points_against: number;
   net_points: number;
+  // Clinch/elimination from best- and worst-case records
+  clinched_division: boolean;
+  clinched_playoffs: boolean;
+  clinched_first_seed: boolean;
+  clinched_seed: number | null;
+  eliminated_division: boolean;
+  eliminated_playoffs: boolean;
+  eliminated_first_seed: boolean;
+  best_seed: number | null;
+  worst_seed: number | null;
 }
 
 export interface SimulationResult {
   num_simulations: number;
   execution_time: number;
+  // True when the probabilities are exact (enumerated, with no nominal-score tiebreaks)
+  exact?: boolean;
+  // True when every remaining outcome was enumerated instead of sampled
+  enumerated?: boolean;
+  // Outcomes whose seeding reached a points-based tiebreaker; enumerated
+  // games all use a nominal score, so these make an enumerated run approximate
+  score_dependent_simulations?: number;
+  // Present when the run was started with profiling enabled
+  profile?: SimulationProfile | null;
+  // Present for adaptive runs that stop once estimates converge
+  convergence?: ConvergenceReport | null;
+  // Present when the run's outcomes were stored for conditional queries
+  outcome_store_id?: string;
   team_stats: Record<string, TeamSimulationStats>;
 }
 
+// Odds over the stored simulations matching a query's game results
+export interface OutcomeQueryResult extends SimulationResult {
+  stored_simulations: number;
+}
+
+// How home-win flags are drawn; antithetic and stratified reduce variance
+export type SamplingMethod = 'independent' | 'antithetic' | 'stratified';
+
+// Tilts outcomes towards one team to estimate long-shot odds; results are reweighted
+export interface ImportanceSampler {
+  target_team_id: string;
+  // Log-odds added in the target's favour (negative tilts against it)
+  tilt?: number;
+  // Log-odds pushing conference rivals towards losses against the other conference
+  rival_tilt?: number;
+}
+
+// Early stopping for a run; num_simulations becomes a ceiling
+export interface ConvergenceCriteria {
+  // Largest accepted confidence-interval half-width (0.01 = ±1 point)
+  tolerance?: number;
+  confidence?: number;
+  time_budget_seconds?: number | null;
+  min_simulations?: number;
+  batch_size?: number;
+}
+
+export interface ConvergenceReport {
+  converged: boolean;
+  stop_reason: 'tolerance' | 'time_budget' | 'max_simulations';
+  num_simulations: number;
+  confidence: number;
+  tolerance: number;
+  max_half_width: number;
+  // team_id -> probability (playoff, division, seed_1..seed_7) -> [lower, upper]
+  intervals: Record<string, Record<string, [number, number]>>;
+}
+
+export interface SimulationProfile {
+  stage_seconds: Record<string, number>;
+  stage_calls: Record<string, number>;
+  // Tiebreak rule name -> ties decided by that rule
+  tiebreak_rules: Record<string, number>;
+}
+
+// Per-game home-win probability model for a run (omit for 50/50 coin flips)
+export type WinProbabilityModel =
+  | { kind: 'fixed'; home_win_probability: number }
+  | {
+      kind: 'elo';
+      ratings: Record<string, number>;
+      home_advantage?: number;
+      default_rating?: number;
+    }
+  | {
+      kind: 'moneyline';
+      // game_id -> [home_moneyline, away_moneyline]
+      moneylines: Record<string, [number, number]>;
+      fallback?: WinProbabilityModel;
+    }
+  | {
+      kind: 'per_game';
+      probabilities: Record<string, number>;
+      fallback?: WinProbabilityModel;
+    }
+  | {
+      // Per-simulation team strengths (log-odds) on top of a base model
+      kind: 'latent_strength';
+      strength_sd?: number;
+      base?: WinProbabilityModel;
+    };
+
 export interface TeamSimulationStats {
   playoff_probability: number;
   division_win_probability: number;
   first_seed_probability: number;
   average_wins: number;
   seed_probabilities: Record<number, number>;
+  // Kish effective sample size, present for importance-sampled runs
+  effective_simulations?: number;
 }
 
 export type SimulationJobStatus =
@@ -79,10 +176,19 @@ export type SimulationJobStatus =
 export interface SimulationJob {
   job_id: string;
   status: SimulationJobStatus;
+  // 1-based place in the queue while pending
+  queue_position?: number | null;
+  priority?: number;
   progress: number;
   message: string;
   num_simulations: number;
   random_seed?: number;
+  win_probability?: WinProbabilityModel | null;
+  convergence?: ConvergenceCriteria | null;
+  sampling?: SamplingMethod;
+  importance?: ImportanceSampler | null;
+  persist_outcomes?: boolean;
+  outcome_store_id?: string | null;
   result?: SimulationResult | null;
   error?: string;
   execution_time?: number;
@@ -91,6 +197,35 @@ export interface SimulationJob {
   completed_at?: number;
 }
 
+// Headline probabilities from the shards of a sampled job finished so far
+export interface PartialSimulationResult {
+  num_simulations: number;
+  team_stats: Record<
+    string,
+    Pick<
+      TeamSimulationStats,
+      'playoff_probability' | 'division_win_probability' | 'first_seed_probability'
+    >
+  >;
+}
+
+export interface SimulationJobStatusEvent {
+  status: SimulationJobStatus;
+  message: string;
+  progress: number;
+  queue_position: number | null;
+  error: string | null;
+}
+
+export interface SimulationJobStreamHandlers {
+  onStatus?: (event: SimulationJobStatusEvent) => void;
+  onProgress?: (event: { progress: number; message: string }) => void;
+  onPartial?: (partial: PartialSimulationResult) => void;
+  onResult?: (result: SimulationResult) => void;
+  // Connection lost before the job finished
+  onError?: () => void;
+}
+
 export const api = axios.create({
   baseURL: API_BASE_URL,
 });
@@ -112,21 +247,55 @@ export const getStandings = async (): Promise<Standing[]> => {
 
 export const runSimulation = async (
   numSimulations: number,
-  randomSeed?: number
+  randomSeed?: number,
+  winProbability?: WinProbabilityModel,
+  convergence?: ConvergenceCriteria,
+  sampling?: SamplingMethod,
+  importance?: ImportanceSampler,
+  persistOutcomes?: boolean
 ): Promise<SimulationResult> => {
-  const payload: { num_simulations: number; random_seed?: number } = {
+  const payload: {
+    num_simulations: number;
+    random_seed?: number;
+    win_probability?: WinProbabilityModel;
+    convergence?: ConvergenceCriteria;
+    sampling?: SamplingMethod;
+    importance?: ImportanceSampler;
+    persist_outcomes?: boolean;
+  } = {
     num_simulations: numSimulations,
   };
 
   if (typeof randomSeed === 'number') {
     payload.random_seed = randomSeed;
   }
+  if (winProbability) {
+    payload.win_probability = winProbability;
+  }
+  if (convergence) {
+    payload.convergence = convergence;
+  }
+  if (sampling) {
+    payload.sampling = sampling;
+  }
+  if (importance) {
+    payload.importance = importance;
+  }
+  if (persistOutcomes) {
+    payload.persist_outcomes = true;
+  }
 
   const response = await api.post('/simulate', payload);
   return response.data;
 };
 
-interface OverrideResponse {
+interface OverrideUpdate {
+  // Last simulation run updated for the new overrides, when the server could do so
+  simulation?: SimulationResult | null;
+  incremental?: boolean;
+}
+
+interface OverrideResponse extends OverrideUpdate {
   status: string;
   game: Game;
 }
@@ -150,7 +319,7 @@ export const setOverride = async (
   return response.data;
 };
 
-export const resetOverrides = async (): Promise<{ status: string; message: string }> => {
+export const resetOverrides = async (): Promise<{ status: string; message: string } & OverrideUpdate> => {
   const response = await api.post('/overrides/reset');
   return response.data;
 };
@@ -167,25 +336,97 @@ export const getScheduleStatus = async (): Promise<ScheduleStatus> => {
 
 export const startSimulationJob = async (
   numSimulations: number,
-  randomSeed?: number
+  randomSeed?: number,
+  winProbability?: WinProbabilityModel,
+  convergence?: ConvergenceCriteria,
+  sampling?: SamplingMethod,
+  importance?: ImportanceSampler,
+  persistOutcomes?: boolean
 ): Promise<SimulationJob> => {
-  const payload: { num_simulations: number; random_seed?: number } = {
+  const payload: {
+    num_simulations: number;
+    random_seed?: number;
+    win_probability?: WinProbabilityModel;
+    convergence?: ConvergenceCriteria;
+    sampling?: SamplingMethod;
+    importance?: ImportanceSampler;
+    persist_outcomes?: boolean;
+  } = {
     num_simulations: numSimulations,
   };
 
   if (typeof randomSeed === 'number') {
     payload.random_seed = randomSeed;
   }
+  if (winProbability) {
+    payload.win_probability = winProbability;
+  }
+  if (convergence) {
+    payload.convergence = convergence;
+  }
+  if (sampling) {
+    payload.sampling = sampling;
+  }
+  if (importance) {
+    payload.importance = importance;
+  }
+  if (persistOutcomes) {
+    payload.persist_outcomes = true;
+  }
 
   const response = await api.post('/simulation-jobs', payload);
   return response.data;
 };
 
+// winners: game_id -> winning team ID, or 'tie'
+export const queryStoredOutcomes = async (
+  storeId: string,
+  winners: Record<string, string>
+): Promise<OutcomeQueryResult> => {
+  const response = await api.post(`/simulation-outcomes/${storeId}/query`, { winners });
+  return response.data;
+};
+
 export const getSimulationJob = async (jobId: string): Promise<SimulationJob> => {
   const response = await api.get(`/simulation-jobs/${jobId}`);
   return response.data;
 };
 
+// Subscribe to a job's server-sent events; returns a function closing the stream
+export const streamSimulationJob = (
+  jobId: string,
+  handlers: SimulationJobStreamHandlers
+): (() => void) => {
+  const source = new EventSource(`${API_BASE_URL}/simulation-jobs/${jobId}/events`);
+  let finished = false;
+
+  source.addEventListener('status', (event) => {
+    const data: SimulationJobStatusEvent = JSON.parse((event as MessageEvent).data);
+    if (data.status === 'completed' || data.status === 'cancelled' || data.status === 'error') {
+      // The server ends the stream here; stop EventSource from reconnecting
+      finished = true;
+      source.close();
+    }
+    handlers.onStatus?.(data);
+  });
+  source.addEventListener('progress', (event) => {
+    handlers.onProgress?.(JSON.parse((event as MessageEvent).data));
+  });
+  source.addEventListener('partial', (event) => {
+    handlers.onPartial?.(JSON.parse((event as MessageEvent).data));
+  });
+  source.addEventListener('result', (event) => {
+    handlers.onResult?.(JSON.parse((event as MessageEvent).data));
+  });
+  source.onerror = () => {
+    if (finished) return;
+    source.close();
+    handlers.onError?.();
+  };
+
+  return () => source.close();
+};
+
 export async function cancelSimulationJob(jobId: string): Promise<SimulationJob> {
   const response = await api.delete(`/simulation-jobs/${jobId}`);
   return response.data;
@@ -3,10 +3,12 @@ import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { getSchedule, getTeams, setOverride, resetOverrides, getScheduleStatus, type Game, type Team } from '../lib/api';
 import { ChevronLeft, ChevronRight, Save, RotateCcw, Calendar, CheckCircle2, Trash2 } from 'lucide-react';
 import clsx from 'clsx';
+import { useSimulation } from '../context/SimulationContext';
 
 export const Schedule = () => {
   const [week, setWeek] = useState(1);
   const queryClient = useQueryClient();
+  const { updateResult } = useSimulation();
 
   const { data: games, isLoading: isLoadingGames } = useQuery({
     queryKey: ['schedule', week],
@@ -32,7 +34,8 @@ export const Schedule = () => {
   const overrideMutation = useMutation({
     mutationFn: ({ gameId, homeScore, awayScore, isOverridden }: { gameId: string; homeScore?: number; awayScore?: number; isOverridden: boolean }) =>
       setOverride(gameId, homeScore, awayScore, isOverridden),
-    onSuccess: () => {
+    onSuccess: (data) => {
+      if (data.simulation) updateResult(data.simulation);
       queryClient.invalidateQueries({ queryKey: ['schedule'] });
       queryClient.invalidateQueries({ queryKey: ['scheduleStatus'] });
     },
@@ -40,7 +43,8 @@ export const Schedule = () => {
 
   const resetMutation = useMutation({
     mutationFn: resetOverrides,
-    onSuccess: () => {
+    onSuccess: (data) => {
+      if (data.simulation) updateResult(data.simulation);
       queryClient.invalidateQueries({ queryKey: ['schedule'] });
       queryClient.invalidateQueries({ queryKey: ['scheduleStatus'] });
     },
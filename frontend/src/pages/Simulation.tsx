@@ -28,6 +28,7 @@ export const Simulation = () => {
 
   const {
     result,
+    partialResult,
     jobData,
     jobError,
     isCancelling,
@@ -55,6 +56,14 @@ export const Simulation = () => {
   const isJobActive = jobData?.status === 'pending' || jobData?.status === 'running';
   const progressValue = jobData ? jobData.progress ?? 0 : 0;
 
+  // Teams with the best playoff odds so far, while a sampled job runs
+  const partialLeaders = React.useMemo(() => {
+    if (!partialResult) return [];
+    return Object.entries(partialResult.team_stats)
+      .sort(([, a], [, b]) => b.playoff_probability - a.playoff_probability)
+      .slice(0, 5);
+  }, [partialResult]);
+
   const handleStartSimulation = () => {
     startSimulation(numSimulations);
   };
@@ -182,6 +191,8 @@ export const Simulation = () => {
                   ? 'Simulation Cancelled'
                   : jobData.status === 'error'
                   ? 'Simulation Failed'
+                  : jobData.queue_position
+                  ? 'Simulation Queued'
                   : 'Simulation In Progress'}
               </h3>
               <p className="text-sm text-gray-400">
@@ -213,13 +224,47 @@ export const Simulation = () => {
               </div>
             </div>
           )}
+
+          {isJobActive && partialResult && (
+            <div className="text-xs text-gray-400">
+              <p className="mb-1">
+                Early playoff odds from {partialResult.num_simulations.toLocaleString()} simulations:
+              </p>
+              <div className="flex flex-wrap gap-3">
+                {partialLeaders.map(([teamId, stats]) => (
+                  <span key={teamId}>
+                    {teamMap[teamId]?.abbreviation ?? teamId}{' '}
+                    <span className="text-gray-200">
+                      {(stats.playoff_probability * 100).toFixed(1)}%
+                    </span>
+                  </span>
+                ))}
+              </div>
+            </div>
+          )}
         </div>
       )}
 
       {result && (
         <div className="space-y-6">
           <div className="flex items-center justify-between text-sm text-gray-400">
-            <span>Simulated {result.num_simulations.toLocaleString()} seasons in {result.execution_time.toFixed(2)}s</span>
+            {result.exact ? (
+              <span>Enumerated all {result.num_simulations.toLocaleString()} remaining outcomes exactly in {result.execution_time.toFixed(2)}s</span>
+            ) : result.enumerated ? (
+              <span>
+                Enumerated all {result.num_simulations.toLocaleString()} remaining outcomes in {result.execution_time.toFixed(2)}s
+                {' '}({(result.score_dependent_simulations ?? 0).toLocaleString()} decided by points-based tiebreakers using a nominal score)
+              </span>
+            ) : (
+              <span>Simulated {result.num_simulations.toLocaleString()} seasons in {result.execution_time.toFixed(2)}s</span>
+            )}
+            {result.convergence && (
+              <span>
+                {result.convergence.converged ? 'Converged' : 'Stopped'} at ±
+                {(result.convergence.max_half_width * 100).toFixed(1)} pts (
+                {Math.round(result.convergence.confidence * 100)}% confidence)
+              </span>
+            )}
           </div>
 
           <div className="overflow-x-auto rounded-lg border border-gray-800 bg-[#1E1E1E]">
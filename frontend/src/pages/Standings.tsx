@@ -1,11 +1,20 @@
 import React, { useState, useMemo } from 'react';
 import { useQuery } from '@tanstack/react-query';
-import { getStandings, getTeams, getScheduleStatus, type Team } from '../lib/api';
+import { getStandings, getTeams, getScheduleStatus, type Standing, type Team } from '../lib/api';
 import clsx from 'clsx';
 import { AlertCircle } from 'lucide-react';
 
 type ViewMode = 'division' | 'conference' | 'league';
 
+// NFL-style clinch markers: z = top seed, y = division, x = playoff berth, e = eliminated
+const clinchMarker = (stat: Standing): string | null => {
+  if (stat.clinched_first_seed) return 'z';
+  if (stat.clinched_division) return 'y';
+  if (stat.clinched_playoffs) return 'x';
+  if (stat.eliminated_playoffs) return 'e';
+  return null;
+};
+
 export const Standings = () => {
   const [viewMode, setViewMode] = useState<ViewMode>('division');
 
@@ -147,7 +156,12 @@ export const Standings = () => {
                               />
                             )}
                             <div className="flex flex-col">
-                              <span className="font-bold text-white">{team?.display_name || stat.team_name}</span>
+                              <span className="font-bold text-white">
+                                {team?.display_name || stat.team_name}
+                                {clinchMarker(stat) && (
+                                  <span className="ml-1 text-xs font-normal text-gray-400">- {clinchMarker(stat)}</span>
+                                )}
+                              </span>
                               <span className="text-xs text-gray-500">{team?.abbreviation}</span>
                             </div>
                           </div>